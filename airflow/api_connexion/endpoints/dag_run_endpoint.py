@@ -14,7 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from typing import List, Optional, Tuple
+from typing import List, Optional
 
 import pendulum
 from connexion import NoContent
@@ -26,6 +26,12 @@ from sqlalchemy.orm import Query, Session
 from airflow.api.common.mark_tasks import set_dag_run_state_to_failed, set_dag_run_state_to_success
 from airflow.api_connexion import security
 from airflow.api_connexion.exceptions import AlreadyExists, BadRequest, NotFound
+from airflow.api_connexion.pagination import (
+    apply_keyset_pagination,
+    fetch_page,
+    should_stream,
+    stream_collection,
+)
 from airflow.api_connexion.parameters import apply_sorting, check_limit, format_datetime, format_parameters
 from airflow.api_connexion.schemas.dag_run_schema import (
     DAGRunCollection,
@@ -86,7 +92,9 @@ def _fetch_dag_runs(
     limit: Optional[int],
     offset: Optional[int],
     order_by: str,
-) -> Tuple[List[DagRun], int]:
+    cursor: Optional[str],
+    include_total_entries: bool,
+) -> APIResponse:
     if start_date_gte:
         query = query.filter(DagRun.start_date >= start_date_gte)
     if start_date_lte:
@@ -102,7 +110,7 @@ def _fetch_dag_runs(
     if end_date_lte:
         query = query.filter(DagRun.end_date <= end_date_lte)
 
-    total_entries = query.count()
+    total_entries = query.count() if include_total_entries else None
     to_replace = {"dag_run_id": "run_id"}
     allowed_filter_attrs = [
         "id",
@@ -115,8 +123,29 @@ def _fetch_dag_runs(
         "external_trigger",
         "conf",
     ]
-    query = apply_sorting(query, order_by, to_replace, allowed_filter_attrs)
-    return query.offset(offset).limit(limit).all(), total_entries
+    # Pages sorted by id can start after the id of the last run of the previous page
+    cursor_key = None
+    if order_by.lstrip('-') == "id":
+        query = apply_keyset_pagination(query, [DagRun.id], cursor, descending=order_by.startswith('-'))
+        cursor_key = _dag_run_key
+    elif cursor is not None:
+        raise BadRequest(detail="Only pages of DAG runs ordered by 'id' can start after a cursor")
+    else:
+        query = apply_sorting(query, order_by, to_replace, allowed_filter_attrs)
+    query = query.offset(offset)
+
+    if should_stream(limit):
+        return stream_collection(
+            query, dagrun_schema, "dag_runs", limit=limit, total_entries=total_entries, cursor_key=cursor_key
+        )
+    dag_runs, next_cursor = fetch_page(query, limit=limit, cursor_key=cursor_key)
+    return dagrun_collection_schema.dump(
+        DAGRunCollection(dag_runs=dag_runs, total_entries=total_entries, next_cursor=next_cursor)
+    )
+
+
+def _dag_run_key(dag_run: DagRun) -> List[int]:
+    return [dag_run.id]
 
 
 @security.requires_access(
@@ -150,6 +179,8 @@ def get_dag_runs(
     offset: Optional[int] = None,
     limit: Optional[int] = None,
     order_by: str = "id",
+    cursor: Optional[str] = None,
+    include_total_entries: bool = True,
     session: Session = NEW_SESSION,
 ):
     """Get all DAG Runs."""
@@ -165,7 +196,7 @@ def get_dag_runs(
     if state:
         query = query.filter(DagRun.state.in_(state))
 
-    dag_run, total_entries = _fetch_dag_runs(
+    return _fetch_dag_runs(
         query,
         end_date_gte=end_date_gte,
         end_date_lte=end_date_lte,
@@ -176,8 +207,9 @@ def get_dag_runs(
         limit=limit,
         offset=offset,
         order_by=order_by,
+        cursor=cursor,
+        include_total_entries=include_total_entries,
     )
-    return dagrun_collection_schema.dump(DAGRunCollection(dag_runs=dag_run, total_entries=total_entries))
 
 
 @security.requires_access(
@@ -208,7 +240,7 @@ def get_dag_runs_batch(*, session: Session = NEW_SESSION) -> APIResponse:
     if states:
         query = query.filter(DagRun.state.in_(states))
 
-    dag_runs, total_entries = _fetch_dag_runs(
+    return _fetch_dag_runs(
         query,
         end_date_gte=data["end_date_gte"],
         end_date_lte=data["end_date_lte"],
@@ -219,10 +251,10 @@ def get_dag_runs_batch(*, session: Session = NEW_SESSION) -> APIResponse:
         limit=data["page_limit"],
         offset=data["page_offset"],
         order_by=data.get("order_by", "id"),
+        cursor=data["page_cursor"],
+        include_total_entries=data["include_total_entries"],
     )
 
-    return dagrun_collection_schema.dump(DAGRunCollection(dag_runs=dag_runs, total_entries=total_entries))
-
 
 @security.requires_access(
     [
@@ -15,13 +15,19 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import Optional
+from typing import List, Optional
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from airflow.api_connexion import security
-from airflow.api_connexion.exceptions import NotFound
+from airflow.api_connexion.exceptions import BadRequest, NotFound
+from airflow.api_connexion.pagination import (
+    apply_keyset_pagination,
+    fetch_page,
+    should_stream,
+    stream_collection,
+)
 from airflow.api_connexion.parameters import apply_sorting, check_limit, format_parameters
 from airflow.api_connexion.schemas.event_log_schema import (
     EventLogCollection,
@@ -52,6 +58,8 @@ def get_event_logs(
     limit: int,
     offset: Optional[int] = None,
     order_by: str = "event_log_id",
+    cursor: Optional[str] = None,
+    include_total_entries: bool = True,
     session: Session = NEW_SESSION,
 ) -> APIResponse:
     """Get all log entries from event log"""
@@ -66,10 +74,33 @@ def get_event_logs(
         "owner",
         "extra",
     ]
-    total_entries = session.query(func.count(Log.id)).scalar()
+    total_entries = session.query(func.count(Log.id)).scalar() if include_total_entries else None
     query = session.query(Log)
-    query = apply_sorting(query, order_by, to_replace, allowed_filter_attrs)
-    event_logs = query.offset(offset).limit(limit).all()
+    # Pages sorted by id can start after the id of the last entry of the previous page
+    cursor_key = None
+    if order_by.lstrip('-') == "event_log_id":
+        query = apply_keyset_pagination(query, [Log.id], cursor, descending=order_by.startswith('-'))
+        cursor_key = _event_log_key
+    elif cursor is not None:
+        raise BadRequest(detail="Only pages of event logs ordered by 'event_log_id' can start after a cursor")
+    else:
+        query = apply_sorting(query, order_by, to_replace, allowed_filter_attrs)
+    query = query.offset(offset)
+
+    if should_stream(limit):
+        return stream_collection(
+            query,
+            event_log_schema,
+            "event_logs",
+            limit=limit,
+            total_entries=total_entries,
+            cursor_key=cursor_key,
+        )
+    event_logs, next_cursor = fetch_page(query, limit=limit, cursor_key=cursor_key)
     return event_log_collection_schema.dump(
-        EventLogCollection(event_logs=event_logs, total_entries=total_entries)
+        EventLogCollection(event_logs=event_logs, total_entries=total_entries, next_cursor=next_cursor)
     )
+
+
+def _event_log_key(event_log: Log) -> List[int]:
+    return [event_log.id]
@@ -25,6 +25,12 @@ from sqlalchemy.sql import ClauseElement
 
 from airflow.api_connexion import security
 from airflow.api_connexion.exceptions import BadRequest, NotFound
+from airflow.api_connexion.pagination import (
+    apply_keyset_pagination,
+    fetch_page,
+    should_stream,
+    stream_collection,
+)
 from airflow.api_connexion.parameters import format_datetime, format_parameters
 from airflow.api_connexion.schemas.task_instance_schema import (
     TaskInstanceCollection,
@@ -115,6 +121,60 @@ def _apply_range_filter(query: Query, key: ClauseElement, value_range: Tuple[T,
     return query
 
 
+def _task_instance_key(row: Tuple[TI, Optional[SlaMiss], Optional[RTIF]]) -> Tuple[str, str, str, int]:
+    ti = row[0]
+    return ti.dag_id, ti.task_id, ti.run_id, ti.map_index
+
+
+def _get_task_instances_page(
+    base_query: Query,
+    *,
+    limit: Optional[int],
+    offset: Optional[int],
+    cursor: Optional[str],
+    include_total_entries: bool,
+) -> APIResponse:
+    """Get a page of the task instances of the query, sorted by their primary key."""
+    # Count elements before joining extra columns
+    total_entries = base_query.with_entities(func.count('*')).scalar() if include_total_entries else None
+    # Add join
+    base_query = base_query.join(
+        SlaMiss,
+        and_(
+            SlaMiss.dag_id == TI.dag_id,
+            SlaMiss.task_id == TI.task_id,
+            SlaMiss.execution_date == DR.execution_date,
+        ),
+        isouter=True,
+    ).add_entity(SlaMiss)
+    ti_query = base_query.outerjoin(
+        RTIF,
+        and_(
+            RTIF.dag_id == TI.dag_id,
+            RTIF.task_id == TI.task_id,
+            RTIF.execution_date == DR.execution_date,
+        ),
+    ).add_entity(RTIF)
+    ti_query = apply_keyset_pagination(ti_query, [TI.dag_id, TI.task_id, TI.run_id, TI.map_index], cursor)
+    ti_query = ti_query.offset(offset)
+
+    if should_stream(limit):
+        return stream_collection(
+            ti_query,
+            task_instance_schema,
+            "task_instances",
+            limit=limit,
+            total_entries=total_entries,
+            cursor_key=_task_instance_key,
+        )
+    task_instances, next_cursor = fetch_page(ti_query, limit=limit, cursor_key=_task_instance_key)
+    return task_instance_collection_schema.dump(
+        TaskInstanceCollection(
+            task_instances=task_instances, total_entries=total_entries, next_cursor=next_cursor
+        )
+    )
+
+
 @format_parameters(
     {
         "execution_date_gte": format_datetime,
@@ -150,6 +210,8 @@ def get_task_instances(
     pool: Optional[List[str]] = None,
     queue: Optional[List[str]] = None,
     offset: Optional[int] = None,
+    cursor: Optional[str] = None,
+    include_total_entries: bool = True,
     session: Session = NEW_SESSION,
 ) -> APIResponse:
     """Get list of task instances."""
@@ -176,30 +238,12 @@ def get_task_instances(
     base_query = _apply_array_filter(base_query, key=TI.pool, values=pool)
     base_query = _apply_array_filter(base_query, key=TI.queue, values=queue)
 
-    # Count elements before joining extra columns
-    total_entries = base_query.with_entities(func.count('*')).scalar()
-    # Add join
-    base_query = base_query.join(
-        SlaMiss,
-        and_(
-            SlaMiss.dag_id == TI.dag_id,
-            SlaMiss.task_id == TI.task_id,
-            SlaMiss.execution_date == DR.execution_date,
-        ),
-        isouter=True,
-    ).add_entity(SlaMiss)
-    ti_query = base_query.outerjoin(
-        RTIF,
-        and_(
-            RTIF.dag_id == TI.dag_id,
-            RTIF.task_id == TI.task_id,
-            RTIF.execution_date == DR.execution_date,
-        ),
-    ).add_entity(RTIF)
-    task_instances = ti_query.offset(offset).limit(limit).all()
-
-    return task_instance_collection_schema.dump(
-        TaskInstanceCollection(task_instances=task_instances, total_entries=total_entries)
+    return _get_task_instances_page(
+        base_query,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_total_entries=include_total_entries,
     )
 
 
@@ -242,30 +286,13 @@ def get_task_instances_batch(session: Session = NEW_SESSION) -> APIResponse:
     base_query = _apply_array_filter(base_query, key=TI.pool, values=data["pool"])
     base_query = _apply_array_filter(base_query, key=TI.queue, values=data["queue"])
 
-    # Count elements before joining extra columns
-    total_entries = base_query.with_entities(func.count('*')).scalar()
-    # Add join
-    base_query = base_query.join(
-        SlaMiss,
-        and_(
-            SlaMiss.dag_id == TI.dag_id,
-            SlaMiss.task_id == TI.task_id,
-            SlaMiss.execution_date == DR.execution_date,
-        ),
-        isouter=True,
-    ).add_entity(SlaMiss)
-    ti_query = base_query.outerjoin(
-        RTIF,
-        and_(
-            RTIF.dag_id == TI.dag_id,
-            RTIF.task_id == TI.task_id,
-            RTIF.execution_date == DR.execution_date,
-        ),
-    ).add_entity(RTIF)
-    task_instances = ti_query.all()
-
-    return task_instance_collection_schema.dump(
-        TaskInstanceCollection(task_instances=task_instances, total_entries=total_entries)
+    # All the matching task instances are returned unless a page limit is given
+    return _get_task_instances_page(
+        base_query,
+        limit=data["page_limit"],
+        offset=data["page_offset"],
+        cursor=data["page_cursor"],
+        include_total_entries=data["include_total_entries"],
     )
 
 
@@ -0,0 +1,145 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Keyset pagination and streaming of the collections returned by the API.
+
+With keyset pagination, a page starts after the sort key of the last entry of the previous page,
+given as an opaque cursor, instead of skipping the entries of all the previous pages, so that deep
+pages are as fast to get as the first one.
+"""
+import base64
+import binascii
+import json
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from flask import Response, json as flask_json, stream_with_context
+from marshmallow import Schema
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+
+from airflow.api_connexion.exceptions import BadRequest
+from airflow.configuration import conf
+from airflow.utils.session import create_session
+
+# Number of rows fetched from the database at a time when streaming a page
+STREAM_BATCH_SIZE = 1000
+
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """Encode the sort key of the last entry of a page as the cursor to the next page."""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode()
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> List[Any]:
+    """Decode a cursor to the values of the sort key ``columns`` it starts after."""
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError):
+        raise BadRequest("Invalid cursor", detail=f"Cursor '{cursor}' could not be decoded")
+    if (
+        not isinstance(key, list)
+        or len(key) != len(columns)
+        or not all(isinstance(value, column.type.python_type) for value, column in zip(key, columns))
+    ):
+        raise BadRequest("Invalid cursor", detail=f"Cursor '{cursor}' does not match the sort order")
+    return key
+
+
+def apply_keyset_pagination(
+    query: Query, columns: Sequence[Any], cursor: Optional[str], descending: bool = False
+) -> Query:
+    """
+    Sort the query by the unique key ``columns`` and, if a cursor is given, only keep the rows after
+    the key it holds.
+    """
+    if cursor is not None:
+        key = decode_cursor(cursor, columns)
+        # (a, b) > (x, y) is written as a > x OR (a = x AND b > y), as not all the databases
+        # support comparing row values
+        after_key = []
+        for i, (column, value) in enumerate(zip(columns, key)):
+            after = column < value if descending else column > value
+            after_key.append(and_(*(c == v for c, v in zip(columns[:i], key[:i])), after))
+        query = query.filter(or_(*after_key))
+    return query.order_by(*(column.desc() if descending else column.asc() for column in columns))
+
+
+def should_stream(limit: Optional[int]) -> bool:
+    """Whether a page of at most ``limit`` entries is large enough to be streamed."""
+    threshold = conf.getint("api", "page_streaming_threshold", fallback=1000)
+    return threshold > 0 and (limit is None or limit > threshold)
+
+
+def fetch_page(
+    query: Query,
+    *,
+    limit: Optional[int],
+    cursor_key: Optional[Callable[[Any], Sequence[Any]]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Get the entries of a page, and the cursor to the next page if the query is sorted by the key
+    returned by ``cursor_key`` and there is one.
+    """
+    if limit is None:
+        return query.all(), None
+    # One more entry is fetched to know whether there is a next page
+    entries = query.limit(limit + 1).all()
+    if len(entries) <= limit:
+        return entries, None
+    entries = entries[:limit]
+    return entries, encode_cursor(cursor_key(entries[-1])) if cursor_key else None
+
+
+def stream_collection(
+    query: Query,
+    schema: Schema,
+    name: str,
+    *,
+    limit: Optional[int],
+    total_entries: Optional[int],
+    cursor_key: Optional[Callable[[Any], Sequence[Any]]] = None,
+) -> Response:
+    """
+    Stream a page of a collection, serializing its entries with ``schema`` as they are read from the
+    database instead of building the whole response in memory first.
+
+    The response has the same content as the one of the collection schema, with ``total_entries``
+    and, if ``cursor_key`` is given, ``next_cursor``.
+    """
+    if limit is not None:
+        query = query.limit(limit + 1)
+
+    def generate() -> Iterator[str]:
+        # The session of the endpoint is closed once it returns
+        with create_session() as session:
+            yield f'{{{flask_json.dumps(name)}: ['
+            last_entry, next_cursor = None, None
+            for count, entry in enumerate(query.with_session(session).yield_per(STREAM_BATCH_SIZE)):
+                if limit is not None and count == limit:
+                    if cursor_key:
+                        next_cursor = encode_cursor(cursor_key(last_entry))
+                    break
+                yield f'{"," if count else ""}{flask_json.dumps(schema.dump(entry))}'
+                last_entry = entry
+        yield f'], "total_entries": {flask_json.dumps(total_entries)}'
+        if cursor_key:
+            yield f', "next_cursor": {flask_json.dumps(next_cursor)}'
+        yield '}'
+
+    # Passing the response through also tells Connexion not to read it to validate it
+    return Response(stream_with_context(generate()), mimetype="application/json", direct_passthrough=True)
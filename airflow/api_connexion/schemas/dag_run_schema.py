@@ -16,7 +16,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import json
-from typing import List, NamedTuple
+from typing import List, NamedTuple, Optional
 
 from marshmallow import fields, post_dump, pre_load, validate
 from marshmallow.schema import Schema
@@ -115,7 +115,8 @@ class DAGRunCollection(NamedTuple):
     """List of DAGRuns with metadata"""
 
     dag_runs: List[DagRun]
-    total_entries: int
+    total_entries: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class DAGRunCollectionSchema(Schema):
@@ -123,6 +124,7 @@ class DAGRunCollectionSchema(Schema):
 
     dag_runs = fields.List(fields.Nested(DAGRunSchema))
     total_entries = fields.Int()
+    next_cursor = fields.Str()
 
 
 class DagRunsBatchFormSchema(Schema):
@@ -137,6 +139,8 @@ class DagRunsBatchFormSchema(Schema):
     order_by = fields.String()
     page_offset = fields.Int(load_default=0, validate=Range(min=0))
     page_limit = fields.Int(load_default=100, validate=Range(min=1))
+    page_cursor = fields.Str(load_default=None)
+    include_total_entries = fields.Bool(load_default=True)
     dag_ids = fields.List(fields.Str(), load_default=None)
     states = fields.List(fields.Str(), load_default=None)
     execution_date_gte = fields.DateTime(load_default=None, validate=validate_istimezone)
@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import List, NamedTuple
+from typing import List, NamedTuple, Optional
 
 from marshmallow import Schema, fields
 from marshmallow_sqlalchemy import SQLAlchemySchema, auto_field
@@ -45,7 +45,8 @@ class EventLogCollection(NamedTuple):
     """List of import errors with metadata"""
 
     event_logs: List[Log]
-    total_entries: int
+    total_entries: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class EventLogCollectionSchema(Schema):
@@ -53,6 +54,7 @@ class EventLogCollectionSchema(Schema):
 
     event_logs = fields.List(fields.Nested(EventLogSchema))
     total_entries = fields.Int()
+    next_cursor = fields.Str()
 
 
 event_log_schema = EventLogSchema()
@@ -77,7 +77,8 @@ class TaskInstanceCollection(NamedTuple):
     """List of task instances with metadata"""
 
     task_instances: List[Tuple[TaskInstance, Optional[SlaMiss]]]
-    total_entries: int
+    total_entries: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class TaskInstanceCollectionSchema(Schema):
@@ -85,13 +86,16 @@ class TaskInstanceCollectionSchema(Schema):
 
     task_instances = fields.List(fields.Nested(TaskInstanceSchema))
     total_entries = fields.Int()
+    next_cursor = fields.Str()
 
 
 class TaskInstanceBatchFormSchema(Schema):
     """Schema for the request form passed to Task Instance Batch endpoint"""
 
     page_offset = fields.Int(load_default=0, validate=validate.Range(min=0))
-    page_limit = fields.Int(load_default=100, validate=validate.Range(min=1))
+    page_limit = fields.Int(load_default=None, validate=validate.Range(min=1))
+    page_cursor = fields.Str(load_default=None)
+    include_total_entries = fields.Bool(load_default=True)
     dag_ids = fields.List(fields.Str(), load_default=None)
     execution_date_gte = fields.DateTime(load_default=None, validate=validate_istimezone)
     execution_date_lte = fields.DateTime(load_default=None, validate=validate_istimezone)
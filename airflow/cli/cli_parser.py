@@ -425,6 +425,22 @@ ARG_DB_DRY_RUN = Arg(
     help="Perform a dry run",
     action="store_true",
 )
+ARG_DB_BATCH_SIZE = Arg(
+    ("--batch-size",),
+    help="Number of rows to delete in each transaction. By default, all the rows of a table are deleted "
+    "in one transaction",
+    type=positive_int(allow_zero=False),
+)
+ARG_DB_SLEEP_BETWEEN_BATCHES = Arg(
+    ("--sleep-between-batches",),
+    help="Number of seconds to sleep between two batches of deletes, to throttle the load on the database",
+    type=float,
+    default=0,
+)
+ARG_DB_ARCHIVE_DIR = Arg(
+    ("--archive-dir",),
+    help="Directory in which the rows are appended to a CSV file per table before they are deleted",
+)
 
 
 # pool
@@ -815,6 +831,11 @@ ARG_ANONYMIZE = Arg(
 ARG_FILE_IO = Arg(
     ('--file-io',), help='Send output to file.io service and returns link.', action='store_true'
 )
+ARG_IMPORT_TIMES = Arg(
+    ('--import-times',),
+    help='Also show how long importing airflow takes, and which packages take the longest to import.',
+    action='store_true',
+)
 
 # config
 ARG_SECTION = Arg(
@@ -882,6 +903,14 @@ ARG_CAPACITY = Arg(
     type=positive_int(allow_zero=False),
     help="The maximum number of triggers that a Triggerer will run at one time.",
 )
+ARG_TRIGGERER_SHARDS = Arg(
+    ("--shards",),
+    type=positive_int(allow_zero=False),
+    help=(
+        "The number of Triggerer processes to run on this host, each claiming its own share of the "
+        "triggers. Defaults to [triggerer] shards."
+    ),
+)
 
 # reserialize
 ARG_CLEAR_ONLY = Arg(
@@ -1396,6 +1425,9 @@ DB_COMMANDS = (
             ARG_DB_TABLES,
             ARG_DB_DRY_RUN,
             ARG_DB_CLEANUP_TIMESTAMP,
+            ARG_DB_BATCH_SIZE,
+            ARG_DB_SLEEP_BETWEEN_BATCHES,
+            ARG_DB_ARCHIVE_DIR,
             ARG_VERBOSE,
             ARG_YES,
         ),
@@ -1810,6 +1842,7 @@ airflow_commands: List[CLICommand] = [
             ARG_STDERR,
             ARG_LOG_FILE,
             ARG_CAPACITY,
+            ARG_TRIGGERER_SHARDS,
         ),
     ),
     ActionCommand(
@@ -1869,6 +1902,7 @@ airflow_commands: List[CLICommand] = [
         args=(
             ARG_ANONYMIZE,
             ARG_FILE_IO,
+            ARG_IMPORT_TIMES,
             ARG_VERBOSE,
             ARG_OUTPUT,
         ),
@@ -160,6 +160,8 @@ def worker(args):
         options.append('--without-mingle')
     if args.without_gossip:
         options.append('--without-gossip')
+    if conf.getboolean("celery", "sync_with_task_events", fallback=False):
+        options.append('--task-events')
 
     if conf.has_option("celery", "pool"):
         pool = conf.get("celery", "pool")
@@ -163,4 +163,7 @@ def cleanup_tables(args):
         clean_before_timestamp=args.clean_before_timestamp,
         verbose=args.verbose,
         confirm=not args.yes,
+        batch_size=args.batch_size,
+        sleep_between_batches=args.sleep_between_batches,
+        archive_dir=args.archive_dir,
     )
@@ -21,7 +21,8 @@ import os
 import platform
 import subprocess
 import sys
-from typing import List, Optional
+from collections import Counter
+from typing import List, Optional, Tuple
 from urllib.parse import urlsplit, urlunsplit
 
 import httpx
@@ -178,11 +179,52 @@ _MACHINE_TO_ARCHITECTURE = {
 }
 
 
+def profile_import_times(statement: str = "import airflow") -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Runs ``statement`` in a new Python interpreter, with ``-X importtime``.
+
+    Returns the time taken by the statement and the time taken to import the modules of each package
+    while running it, slowest first, in seconds. The modules of Airflow are grouped by subpackage.
+    """
+    marker = "airflow-import-times-start"
+    code = "\n".join(
+        [
+            "import sys, time",
+            f"print({marker!r}, file=sys.stderr, flush=True)",
+            "start = time.perf_counter()",
+            statement,
+            "print(time.perf_counter() - start)",
+        ]
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    package_times: Counter = Counter()
+    # Imports done while starting the interpreter are listed before the marker
+    lines = proc.stderr.split(marker, 1)[-1].splitlines()
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, module = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        module = module.strip()
+        parts = module.split(".")
+        package = ".".join(parts[:3] if parts[0] == "airflow" else parts[:1])
+        package_times[package] += int(self_us) / 1_000_000
+    total = float(proc.stdout.strip().splitlines()[-1])
+    return total, package_times.most_common()
+
+
 class AirflowInfo:
     """Renders information about Airflow instance"""
 
-    def __init__(self, anonymizer):
+    # Number of the slowest packages to import to show
+    IMPORT_TIMES_LIMIT = 15
+
+    def __init__(self, anonymizer, import_times: bool = False):
         self.anonymizer = anonymizer
+        self.import_times = import_times
 
     @staticmethod
     def _get_version(cmd: List[str], grep: Optional[bytes] = None):
@@ -306,6 +348,13 @@ class AirflowInfo:
     def _providers_info(self):
         return [(p.provider_info['package-name'], p.version) for p in ProvidersManager().providers.values()]
 
+    @property
+    def _import_times_info(self):
+        total, package_times = profile_import_times()
+        return [("import airflow", f"{total:.3f}s")] + [
+            (package, f"{seconds:.3f}s") for package, seconds in package_times[: self.IMPORT_TIMES_LIMIT]
+        ]
+
     def show(self, output: str, console: Optional[AirflowConsole] = None) -> None:
         """Shows information about Airflow instance"""
         all_info = {
@@ -315,6 +364,8 @@ class AirflowInfo:
             "Paths info": self._paths_info,
             "Providers info": self._providers_info,
         }
+        if self.import_times:
+            all_info["Import times"] = self._import_times_info
 
         console = console or AirflowConsole(show_header=False)
         if output in ("table", "plain"):
@@ -376,7 +427,7 @@ def show_info(args):
     """Show information related to Airflow, system and other."""
     # Enforce anonymization, when file_io upload is tuned on.
     anonymizer = PiiAnonymizer() if args.anonymize or args.file_io else NullAnonymizer()
-    info = AirflowInfo(anonymizer)
+    info = AirflowInfo(anonymizer, import_times=args.import_times)
     if args.file_io:
         _send_report_to_fileio(info.render_text(args.output))
     else:
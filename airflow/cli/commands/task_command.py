@@ -22,9 +22,11 @@ import json
 import logging
 import os
 import textwrap
+import time
 from contextlib import contextmanager, redirect_stderr, redirect_stdout
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import psutil
 from pendulum.parsing.exceptions import ParserError
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.orm.session import Session
@@ -40,6 +42,7 @@ from airflow.models.baseoperator import BaseOperator
 from airflow.models.dag import DAG
 from airflow.models.dagrun import DagRun
 from airflow.models.xcom import IN_MEMORY_RUN_ID
+from airflow.stats import Stats
 from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.dependencies_deps import SCHEDULER_QUEUED_DEPS
 from airflow.utils import cli as cli_utils
@@ -47,6 +50,7 @@ from airflow.utils.cli import (
     get_dag,
     get_dag_by_file_location,
     get_dag_by_pickle,
+    get_dag_for_task,
     get_dags,
     suppress_logs_and_warning,
 )
@@ -273,6 +277,27 @@ def _capture_task_logs(ti):
             root_logger.handlers[:] = orig_handlers
 
 
+@contextmanager
+def _startup_phase(timings: Dict[str, float], phase: str):
+    """Record the time taken by a phase of the start of a task, in seconds."""
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        timings[phase] = time.monotonic() - start
+
+
+def _report_startup_timings(ti: TaskInstance, timings: Dict[str, float]) -> None:
+    """Log how long the phases of the start of a task took, and send them as metrics."""
+    ti.log.info(
+        "Task started in %.3fs (%s)",
+        sum(timings.values()),
+        ", ".join(f"{phase}: {seconds:.3f}s" for phase, seconds in timings.items()),
+    )
+    for phase, seconds in timings.items():
+        Stats.timing(f"task_startup.{phase}", seconds * 1000)
+
+
 @cli_utils.action_cli(check_db=False)
 def task_run(args, dag=None):
     """Run a single task instance.
@@ -317,27 +342,35 @@ def task_run(args, dag=None):
 
     settings.MASK_SECRETS_IN_LOGS = True
 
-    # IMPORTANT, have to re-configure ORM with the NullPool, otherwise, each "run" command may leave
-    # behind multiple open sleeping connections while heartbeating, which could
-    # easily exceed the database connection limit when
-    # processing hundreds of simultaneous tasks.
-    settings.reconfigure_orm(disable_connection_pool=True)
-
-    if args.pickle:
-        print(f'Loading pickle id: {args.pickle}')
-        dag = get_dag_by_pickle(args.pickle)
-    elif not dag:
-        dag = get_dag(args.subdir, args.dag_id)
-    else:
-        # Use DAG from parameter
-        pass
-    task = dag.get_task(task_id=args.task_id)
-    ti = _get_ti(task, args.execution_date_or_run_id, args.map_index)
-    ti.init_run_context(raw=args.raw)
+    startup_timings = {"process": time.time() - psutil.Process().create_time()}
+    with _startup_phase(startup_timings, "configure"):
+        # IMPORTANT, have to re-configure ORM with the NullPool, otherwise, each "run" command may leave
+        # behind multiple open sleeping connections while heartbeating, which could
+        # easily exceed the database connection limit when
+        # processing hundreds of simultaneous tasks.
+        settings.reconfigure_orm(disable_connection_pool=True)
+
+    with _startup_phase(startup_timings, "load_dag"):
+        if args.pickle:
+            print(f'Loading pickle id: {args.pickle}')
+            dag = get_dag_by_pickle(args.pickle)
+        elif not dag:
+            if conf.getboolean('core', 'fast_task_start'):
+                dag = get_dag_for_task(args.subdir, args.dag_id)
+            else:
+                dag = get_dag(args.subdir, args.dag_id)
+        else:
+            # Use DAG from parameter
+            pass
+    with _startup_phase(startup_timings, "load_task_instance"):
+        task = dag.get_task(task_id=args.task_id)
+        ti = _get_ti(task, args.execution_date_or_run_id, args.map_index)
+        ti.init_run_context(raw=args.raw)
 
     hostname = get_hostname()
 
     print(f"Running {ti} on host {hostname}")
+    _report_startup_timings(ti, startup_timings)
 
     if args.interactive:
         _run_task_by_selected_method(args, dag, ti)
@@ -16,23 +16,74 @@
 # under the License.
 
 """Triggerer command"""
+import logging
+import multiprocessing
 import signal
+import time
+from typing import List, Optional
 
 import daemon
 from daemon.pidfile import TimeoutPIDLockFile
 
 from airflow import settings
+from airflow.configuration import conf
 from airflow.jobs.triggerer_job import TriggererJob
 from airflow.utils import cli as cli_utils
 from airflow.utils.cli import setup_locations, setup_logging, sigint_handler, sigquit_handler
 
+log = logging.getLogger(__name__)
+
+
+def _run_shard(capacity: Optional[int], shard: int, shards: int) -> None:
+    signal.signal(signal.SIGINT, sigint_handler)
+    signal.signal(signal.SIGTERM, sigint_handler)
+    # Do not share the database connections of the parent process
+    settings.configure_orm()
+    TriggererJob(capacity=capacity, shard=shard, shards=shards).run()
+
+
+def _run_shards(capacity: Optional[int], shards: int) -> None:
+    """Run ``shards`` triggerers in child processes, restarting the ones that die, until stopped."""
+    processes: List[Optional[multiprocessing.Process]] = [None] * shards
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for process in processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGQUIT, sigquit_handler)
+    while not stopping:
+        for shard, process in enumerate(processes):
+            if process is not None and process.is_alive():
+                continue
+            if process is not None:
+                log.error("Triggerer shard %d exited with code %s, restarting it", shard, process.exitcode)
+            process = multiprocessing.Process(
+                target=_run_shard, args=(capacity, shard, shards), name=f"triggerer-shard-{shard}"
+            )
+            process.start()
+            processes[shard] = process
+        time.sleep(1)
+    for process in processes:
+        if process is not None:
+            process.join()
+
 
 @cli_utils.action_cli
 def triggerer(args):
     """Starts Airflow Triggerer"""
     settings.MASK_SECRETS_IN_LOGS = True
     print(settings.HEADER)
-    job = TriggererJob(capacity=args.capacity)
+    shards = args.shards or conf.getint('triggerer', 'shards', fallback=1)
+    if shards > 1:
+        job = None
+    else:
+        job = TriggererJob(capacity=args.capacity)
 
     if args.daemon:
         pid, stdout, stderr, log_file = setup_locations(
@@ -47,10 +98,15 @@ def triggerer(args):
                 stderr=stderr_handle,
             )
             with ctx:
-                job.run()
+                if job:
+                    job.run()
+                else:
+                    _run_shards(args.capacity, shards)
 
-    else:
+    elif job:
         signal.signal(signal.SIGINT, sigint_handler)
         signal.signal(signal.SIGTERM, sigint_handler)
         signal.signal(signal.SIGQUIT, sigquit_handler)
         job.run()
+    else:
+        _run_shards(args.capacity, shards)
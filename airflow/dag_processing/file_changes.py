@@ -0,0 +1,215 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Detect which DAG files changed since they were last parsed."""
+import ast
+import hashlib
+import os
+import threading
+from typing import Dict, Iterable, Optional, Set, Tuple, Union
+
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+# Map from path to the content hash of the file
+FileHashes = Dict[str, Optional[str]]
+
+
+class DagFileChangeTracker(LoggingMixin):
+    """
+    Tracks the content of DAG files, and of the modules in the DAG folder they import, to tell
+    whether a DAG file needs to be parsed again.
+
+    Hashes are only recomputed when the modification time or the size of a file changes, so asking
+    whether an unchanged file changed costs one ``stat`` call per file and per imported module.
+
+    :param dag_directory: Directory where DAG definitions are kept. Modules imported by DAG files
+        are looked up in this directory, as it is on ``sys.path`` when DAG files are parsed.
+    """
+
+    def __init__(self, dag_directory: Union[str, "os.PathLike[str]"]):
+        super().__init__()
+        self._dag_directory = os.fspath(dag_directory)
+        # Map from path to the (mtime, size, hash) of the file when it was last hashed
+        self._hash_cache: Dict[str, Tuple[float, int, Optional[str]]] = {}
+        # Map from DAG file path to the hashes of the file and its local imports when last parsed
+        self._parsed: Dict[str, FileHashes] = {}
+        # Map from DAG file path to the hashes captured when its current parse started
+        self._parsing: Dict[str, FileHashes] = {}
+
+    def content_hash(self, path: str) -> Optional[str]:
+        """Hash of the content of ``path``, or None if it does not exist."""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._hash_cache.pop(path, None)
+            return None
+        cached = self._hash_cache.get(path)
+        if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+            return cached[2]
+
+        digest = hashlib.sha1()
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        content_hash = digest.hexdigest()
+        self._hash_cache[path] = (stat.st_mtime, stat.st_size, content_hash)
+        return content_hash
+
+    def _local_imports(self, file_path: str) -> Set[str]:
+        """Paths of the modules in the DAG directory imported by ``file_path``."""
+        if not file_path.endswith(".py"):
+            return set()
+        try:
+            with open(file_path, "rb") as f:
+                tree = ast.parse(f.read(), filename=file_path)
+        except (OSError, SyntaxError, ValueError):
+            return set()
+
+        module_names: Set[str] = set()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                module_names.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                module_names.add(node.module)
+                module_names.update(f"{node.module}.{alias.name}" for alias in node.names)
+
+        paths = set()
+        for module_name in module_names:
+            parts = module_name.split(".")
+            # Every package on the way is imported too, so they are all dependencies
+            for i in range(1, len(parts) + 1):
+                base = os.path.join(self._dag_directory, *parts[:i])
+                for candidate in (f"{base}.py", os.path.join(base, "__init__.py")):
+                    if candidate != file_path and os.path.isfile(candidate):
+                        paths.add(candidate)
+        return paths
+
+    def _current_hashes(self, file_path: str, dependencies: Iterable[str]) -> FileHashes:
+        hashes = {path: self.content_hash(path) for path in dependencies}
+        hashes[file_path] = self.content_hash(file_path)
+        return hashes
+
+    def has_changed(self, file_path: str) -> bool:
+        """Whether ``file_path`` or a module it imports changed since it was last parsed successfully."""
+        parsed = self._parsed.get(file_path)
+        if parsed is None:
+            return True
+        return any(self.content_hash(path) != content_hash for path, content_hash in parsed.items())
+
+    def dependents(self, paths: Iterable[str]) -> Set[str]:
+        """DAG files that are in ``paths``, or imported a module in ``paths`` when last parsed."""
+        paths = set(paths)
+        return {file_path for file_path, hashes in self._parsed.items() if not paths.isdisjoint(hashes)}
+
+    def start_parsing(self, file_path: str) -> None:
+        """Record the content that is about to be parsed for ``file_path``."""
+        self._parsing[file_path] = self._current_hashes(file_path, self._local_imports(file_path))
+
+    def finish_parsing(self, file_path: str, success: bool) -> None:
+        """
+        Record that the content captured by :meth:`start_parsing` was parsed. Unless ``success`` is
+        True, e.g. because the file had import errors, the file counts as changed until its next
+        successful parse.
+        """
+        hashes = self._parsing.pop(file_path, None)
+        if success and hashes is not None:
+            self._parsed[file_path] = hashes
+        else:
+            self._parsed.pop(file_path, None)
+
+    def retain(self, file_paths: Iterable[str]) -> None:
+        """Forget about the DAG files not in ``file_paths``, e.g. because they were deleted."""
+        file_paths = set(file_paths)
+        self._parsed = {path: hashes for path, hashes in self._parsed.items() if path in file_paths}
+        self._parsing = {path: hashes for path, hashes in self._parsing.items() if path in file_paths}
+
+
+class DagDirectoryWatcher(LoggingMixin):
+    """
+    Collects the files changed under the DAG directory from filesystem notifications.
+
+    Uses ``watchdog``, which relies on inotify on Linux. If ``watchdog`` is not installed the
+    watcher does not start, and changes are only noticed by the regular DAG directory listing.
+
+    :param dag_directory: Directory where DAG definitions are kept
+    """
+
+    def __init__(self, dag_directory: Union[str, "os.PathLike[str]"]):
+        super().__init__()
+        self._dag_directory = os.fspath(dag_directory)
+        self._lock = threading.Lock()
+        self._modified: Set[str] = set()
+        self._files_added_or_removed = False
+        self._observer = None
+
+    def start(self) -> bool:
+        """Start watching the DAG directory. Returns whether the watcher could be started."""
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            self.log.warning(
+                "The watchdog package is not installed, DAG directory changes will only be picked "
+                "up by listing %s every dag_dir_list_interval",
+                self._dag_directory,
+            )
+            return False
+
+        watcher = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                watcher._record(event.event_type, event.src_path, getattr(event, "dest_path", None))
+
+        self._observer = Observer()
+        self._observer.daemon = True
+        self._observer.schedule(_Handler(), self._dag_directory, recursive=True)
+        self._observer.start()
+        self.log.info("Watching %s for changes", self._dag_directory)
+        return True
+
+    def stop(self) -> None:
+        if self._observer:
+            self._observer.stop()
+            self._observer = None
+
+    def _record(self, event_type: str, src_path: str, dest_path: Optional[str]) -> None:
+        with self._lock:
+            if event_type == "modified" or event_type == "closed":
+                self._modified.add(src_path)
+            elif event_type in ("created", "deleted", "moved"):
+                self._files_added_or_removed = True
+                self._modified.add(src_path)
+                if dest_path:
+                    self._modified.add(dest_path)
+
+    def pop_changes(self) -> Tuple[Set[str], bool]:
+        """
+        Get the changes seen since the last call.
+
+        :return: The paths that changed, and whether files were added, removed or renamed (in which
+            case the DAG directory needs to be listed again)
+        """
+        with self._lock:
+            modified, self._modified = self._modified, set()
+            files_added_or_removed, self._files_added_or_removed = self._files_added_or_removed, False
+        return modified, files_added_or_removed
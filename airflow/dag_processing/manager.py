@@ -39,7 +39,9 @@ from tabulate import tabulate
 import airflow.models
 from airflow.callbacks.callback_requests import CallbackRequest
 from airflow.configuration import conf
+from airflow.dag_processing.file_changes import DagDirectoryWatcher, DagFileChangeTracker
 from airflow.dag_processing.processor import DagFileProcessorProcess
+from airflow.dag_processing.worker_pool import DagFileProcessorWorkerPool, PooledDagFileProcessorProcess
 from airflow.models import DagModel, errors
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.stats import Stats
@@ -407,7 +409,7 @@ class DagFileProcessorManager(LoggingMixin):
         self.print_stats_interval = conf.getint('scheduler', 'print_stats_interval')
 
         # Map from file path to the processor
-        self._processors: Dict[str, DagFileProcessorProcess] = {}
+        self._processors: Dict[str, Union[DagFileProcessorProcess, PooledDagFileProcessorProcess]] = {}
 
         self._num_run = 0
 
@@ -433,6 +435,29 @@ class DagFileProcessorManager(LoggingMixin):
             self._signal_conn: self._signal_conn,
         }
 
+        # Only parse files again if they (or the modules they import from the DAG folder) changed
+        self._skip_unchanged_files = conf.getboolean('scheduler', 'skip_unchanged_dag_files', fallback=False)
+        self._file_change_tracker = DagFileChangeTracker(dag_directory)
+        # Pick up changed files from filesystem notifications rather than waiting for the next listing
+        self._dag_dir_watcher: Optional[DagDirectoryWatcher] = None
+        if conf.getboolean('scheduler', 'watch_dag_dir', fallback=False):
+            self._dag_dir_watcher = DagDirectoryWatcher(dag_directory)
+
+        # Map from file path to when it was queued for processing, for the queue latency metric
+        self._file_queued_time: Dict[str, float] = {}
+        # Number of files processed since the file path queue was last prepared
+        self._num_files_processed = 0
+
+        # Long-lived processes parsing one file after the other, instead of one process per file
+        self._worker_pool: Optional[DagFileProcessorWorkerPool] = None
+        if conf.getboolean('scheduler', 'parsing_worker_pool', fallback=False):
+            pre_import_modules = conf.get('scheduler', 'parsing_worker_pre_import_modules', fallback='')
+            self._worker_pool = DagFileProcessorWorkerPool(
+                pre_import_modules=[name.strip() for name in pre_import_modules.split(',') if name.strip()],
+                max_files_per_worker=conf.getint('scheduler', 'parsing_worker_max_files', fallback=100),
+                max_worker_memory_mb=conf.getint('scheduler', 'parsing_worker_max_memory_mb', fallback=0),
+            )
+
     def register_exit_signals(self):
         """Register signals that stop child processes"""
         signal.signal(signal.SIGINT, self._exit_gracefully)
@@ -466,6 +491,8 @@ class DagFileProcessorManager(LoggingMixin):
         self.log.info(
             "Checking for new files in %s every %s seconds", self._dag_directory, self.dag_dir_list_interval
         )
+        if self._dag_dir_watcher and not self._dag_dir_watcher.start():
+            self._dag_dir_watcher = None
 
         return self._run_parsing_loop()
 
@@ -602,12 +629,47 @@ class DagFileProcessorManager(LoggingMixin):
                 file_path for file_path in self._file_path_queue if file_path != request.full_filepath
             ]
         self._file_path_queue.insert(0, request.full_filepath)
+        self._file_queued_time.setdefault(request.full_filepath, time.monotonic())
+
+    def _queue_watched_changes(self) -> bool:
+        """
+        Queue the files reported as changed by the DAG directory watcher, ahead of their
+        ``min_file_process_interval``.
+
+        :return: whether files were added to or removed from the DAG directory
+        """
+        if not self._dag_dir_watcher:
+            return False
+        changed_paths, files_added_or_removed = self._dag_dir_watcher.pop_changes()
+        if not changed_paths:
+            return files_added_or_removed
+
+        # Only the reported paths, and the DAG files importing them, can have changed
+        candidates = self._file_change_tracker.dependents(changed_paths)
+        candidates.update(changed_paths)
+        file_paths_queued = set(self._file_path_queue)
+        file_paths_to_queue = [
+            file_path
+            for file_path in self._file_paths
+            if file_path in candidates
+            and file_path not in file_paths_queued
+            and file_path not in self._processors
+            and self._file_change_tracker.has_changed(file_path)
+        ]
+        if file_paths_to_queue:
+            self.log.debug("Queuing changed files:\n\t%s", "\n\t".join(file_paths_to_queue))
+            self._file_path_queue.extend(file_paths_to_queue)
+            now = time.monotonic()
+            for file_path in file_paths_to_queue:
+                self._file_queued_time.setdefault(file_path, now)
+        return files_added_or_removed
 
     def _refresh_dag_dir(self):
         """Refresh file paths from dag dir if we haven't done it for too long."""
         now = timezone.utcnow()
         elapsed_time_since_refresh = (now - self.last_dag_dir_refresh_time).total_seconds()
-        if elapsed_time_since_refresh > self.dag_dir_list_interval:
+        files_added_or_removed = self._queue_watched_changes()
+        if files_added_or_removed or elapsed_time_since_refresh > self.dag_dir_list_interval:
             # Build up a list of Python files that could contain DAGs
             self.log.info("Searching for files in %s", self._dag_directory)
             self._file_paths = list_py_file_paths(self._dag_directory)
@@ -828,6 +890,12 @@ class DagFileProcessorManager(LoggingMixin):
                 processor.terminate()
                 self._file_stats.pop(file_path)
         self._processors = filtered_processors
+        self._file_queued_time = {
+            file_path: queued_time
+            for file_path, queued_time in self._file_queued_time.items()
+            if file_path in new_file_paths
+        }
+        self._file_change_tracker.retain(new_file_paths)
 
     def wait_until_finished(self):
         """Sleeps until all the processors are done."""
@@ -840,6 +908,11 @@ class DagFileProcessorManager(LoggingMixin):
         Stats.decr('dag_processing.processes')
         last_finish_time = timezone.utcnow()
 
+        self._num_files_processed += 1
+        # Files with import errors are parsed again, e.g. once a missing package is installed
+        self._file_change_tracker.finish_parsing(
+            processor.file_path, success=processor.result is not None and processor.result[1] == 0
+        )
         if processor.result is not None:
             num_dags, count_import_errors = processor.result
         else:
@@ -894,12 +967,28 @@ class DagFileProcessorManager(LoggingMixin):
                 continue
 
             callback_to_execute_for_file = self._callback_to_execute[file_path]
-            processor = self._create_process(
-                file_path, self._pickle_dags, self._dag_ids, callback_to_execute_for_file
-            )
+            if self._worker_pool is not None:
+                processor = PooledDagFileProcessorProcess(
+                    self._worker_pool,
+                    file_path,
+                    self._pickle_dags,
+                    self._dag_ids,
+                    callback_to_execute_for_file,
+                )
+            else:
+                processor = self._create_process(
+                    file_path, self._pickle_dags, self._dag_ids, callback_to_execute_for_file
+                )
 
             del self._callback_to_execute[file_path]
             Stats.incr('dag_processing.processes')
+            if self._skip_unchanged_files or self._dag_dir_watcher:
+                self._file_change_tracker.start_parsing(file_path)
+            queued_time = self._file_queued_time.pop(file_path, None)
+            if queued_time is not None:
+                Stats.timing(
+                    'dag_processing.file_queue_latency', timedelta(seconds=time.monotonic() - queued_time)
+                )
 
             processor.start()
             self.log.debug("Started a process (PID: %s) to generate tasks for %s", processor.pid, file_path)
@@ -909,6 +998,7 @@ class DagFileProcessorManager(LoggingMixin):
     def prepare_file_path_queue(self):
         """Generate more file paths to process. Result are saved in _file_path_queue."""
         self._parsing_start_time = time.perf_counter()
+        self._num_files_processed = 0
         # If the file path is already being processed, or if a file was
         # processed recently, wait until the next batch
         file_paths_in_progress = self._processors.keys()
@@ -978,6 +1068,9 @@ class DagFileProcessorManager(LoggingMixin):
                 processor.start_time.isoformat(),
             )
 
+        if self._skip_unchanged_files:
+            files_paths_to_queue = self._skip_unchanged(files_paths_to_queue)
+
         self.log.debug("Queuing the following files for processing:\n\t%s", "\n\t".join(files_paths_to_queue))
 
         for file_path in files_paths_to_queue:
@@ -987,6 +1080,35 @@ class DagFileProcessorManager(LoggingMixin):
                 )
 
         self._file_path_queue.extend(files_paths_to_queue)
+        queued_time = time.monotonic()
+        for file_path in files_paths_to_queue:
+            self._file_queued_time.setdefault(file_path, queued_time)
+
+    def _skip_unchanged(self, file_paths: List[str]) -> List[str]:
+        """
+        Filter out files that were parsed successfully and did not change since, unless they have
+        callbacks to run. Their serialized DAGs are kept as they are, and they count as processed.
+        """
+        now = timezone.utcnow()
+        file_paths_to_queue = []
+        num_skipped = 0
+        for file_path in file_paths:
+            stat = self._file_stats.get(file_path)
+            if (
+                stat is None
+                or stat.last_finish_time is None
+                or self._callback_to_execute.get(file_path)
+                or self._file_change_tracker.has_changed(file_path)
+            ):
+                file_paths_to_queue.append(file_path)
+                continue
+            num_skipped += 1
+            self._file_stats[file_path] = stat._replace(last_finish_time=now, run_count=stat.run_count + 1)
+
+        if num_skipped:
+            self.log.debug("Skipping %d unchanged files", num_skipped)
+            Stats.incr('dag_processing.unchanged_files_skipped', num_skipped)
+        return file_paths_to_queue
 
     def _kill_timed_out_processors(self):
         """Kill any file processors that timeout to defend against process hangs."""
@@ -1031,9 +1153,13 @@ class DagFileProcessorManager(LoggingMixin):
         Kill all child processes on exit since we don't want to leave
         them as orphaned.
         """
+        if self._dag_dir_watcher:
+            self._dag_dir_watcher.stop()
         pids_to_kill = self.get_all_pids()
         if pids_to_kill:
             kill_child_processes_by_pids(pids_to_kill)
+        if self._worker_pool is not None:
+            self._worker_pool.stop()
 
     def emit_metrics(self):
         """
@@ -1044,6 +1170,8 @@ class DagFileProcessorManager(LoggingMixin):
         """
         parse_time = time.perf_counter() - self._parsing_start_time
         Stats.gauge('dag_processing.total_parse_time', parse_time)
+        if parse_time > 0:
+            Stats.gauge('dag_processing.files_processed_per_second', self._num_files_processed / parse_time)
         Stats.gauge('dagbag_size', sum(stat.num_dags for stat in self._file_stats.values()))
         Stats.gauge(
             'dag_processing.import_errors', sum(stat.import_errors for stat in self._file_stats.values())
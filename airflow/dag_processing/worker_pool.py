@@ -0,0 +1,463 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Pool of long-lived processes parsing DAG files."""
+import datetime
+import importlib
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+from contextlib import redirect_stderr, redirect_stdout, suppress
+from multiprocessing.connection import Connection as MultiprocessingConnection
+from typing import List, Optional, Set, Tuple
+
+import psutil
+from setproctitle import setproctitle
+
+from airflow import settings
+from airflow.callbacks.callback_requests import CallbackRequest
+from airflow.dag_processing.processor import DagFileProcessor
+from airflow.exceptions import AirflowException
+from airflow.stats import Stats
+from airflow.utils import timezone
+from airflow.utils.log.logging_mixin import LoggingMixin, StreamLogWriter, set_context
+from airflow.utils.mixins import MultiprocessingStartMethodMixin
+from airflow.utils.module_loading import unload_modules_from
+
+# What is sent to a worker to process a file: file_path, pickle_dags, dag_ids, callback_requests
+ParsingRequest = Tuple[str, bool, Optional[List[str]], List[CallbackRequest]]
+
+
+class DagFileProcessorWorker(LoggingMixin, MultiprocessingStartMethodMixin):
+    """
+    A process that imports a list of modules once, then parses the DAG files it is sent one after
+    the other, sending back the result of each over the same pipe.
+
+    :param pre_import_modules: Modules to import when the worker starts
+    """
+
+    # Counter that increments every time an instance of this class is created
+    class_creation_counter = 0
+
+    def __init__(self, pre_import_modules: List[str]):
+        super().__init__()
+        self._pre_import_modules = pre_import_modules
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._parent_channel: Optional[MultiprocessingConnection] = None
+        # Number of files sent to this worker
+        self.files_processed = 0
+        self._instance_id = DagFileProcessorWorker.class_creation_counter
+        DagFileProcessorWorker.class_creation_counter += 1
+
+    @staticmethod
+    def _pre_import(module_names: List[str], log: logging.Logger) -> None:
+        for module_name in module_names:
+            try:
+                importlib.import_module(module_name)
+            except Exception:
+                log.exception("Failed to pre-import %s", module_name)
+
+    @staticmethod
+    def _run_worker(
+        channel: MultiprocessingConnection,
+        parent_channel: MultiprocessingConnection,
+        pre_import_modules: List[str],
+        thread_name: str,
+    ) -> None:
+        """
+        Process the files received on ``channel`` until None is received or the pipe is closed.
+
+        :param channel: the connection to receive requests from and send the results to
+        :param parent_channel: the parent end of the channel to close in the child
+        :param pre_import_modules: the modules to import before processing any file
+        :param thread_name: the name to use for the process that is launched
+        """
+        # This helper runs in the newly created process
+        log: logging.Logger = logging.getLogger("airflow.processor")
+
+        # Since we share all open FDs from the parent, we need to close the parent side of the pipe here in
+        # the child, else it won't get closed properly until we exit.
+        parent_channel.close()
+        del parent_channel
+
+        setproctitle("airflow scheduler - DagFileProcessor worker")
+        # Change the thread name to differentiate log lines. This is really a separate process,
+        # but changing the name of the process doesn't work, so changing the thread name instead.
+        threading.current_thread().name = thread_name
+
+        try:
+            # Re-configure the ORM engine as there are issues with multiple processes
+            settings.configure_orm()
+            DagFileProcessorWorker._pre_import(pre_import_modules, log)
+
+            while True:
+                try:
+                    request: Optional[ParsingRequest] = channel.recv()
+                except EOFError:
+                    break
+                if request is None:
+                    break
+                file_path, pickle_dags, dag_ids, callback_requests = request
+                # The modules of the DAG folder imported while parsing the previous files may have
+                # changed since, and DAG files must be parsed against their current content
+                unload_modules_from(settings.DAGS_FOLDER)
+
+                set_context(log, file_path)
+                setproctitle(f"airflow scheduler - DagFileProcessor {file_path}")
+                with redirect_stdout(StreamLogWriter(log, logging.INFO)), redirect_stderr(
+                    StreamLogWriter(log, logging.WARN)
+                ), Stats.timer() as timer:
+                    log.info("Worker (PID=%s) started to work on %s", os.getpid(), file_path)
+                    dag_file_processor = DagFileProcessor(dag_ids=dag_ids, log=log)
+                    result: Tuple[int, int] = dag_file_processor.process_file(
+                        file_path=file_path,
+                        pickle_dags=pickle_dags,
+                        callback_requests=callback_requests,
+                    )
+                    channel.send(result)
+                log.info("Processing %s took %.3f seconds", file_path, timer.duration)
+        except Exception:
+            # Log exceptions through the logging framework. The worker exits, so whatever state the
+            # failed file left behind is not carried over to the next one.
+            log.exception("Got an exception! Propagating...")
+            raise
+        finally:
+            # We re-initialized the ORM within this Process above so we need to
+            # tear it down manually here
+            settings.dispose_orm()
+
+            channel.close()
+
+    def start(self) -> None:
+        """Launch the worker process."""
+        start_method = self._get_multiprocessing_start_method()
+        context = multiprocessing.get_context(start_method)
+
+        _parent_channel, _child_channel = context.Pipe(duplex=True)
+        process = context.Process(
+            target=type(self)._run_worker,
+            args=(
+                _child_channel,
+                _parent_channel,
+                self._pre_import_modules,
+                f"DagFileProcessorWorker{self._instance_id}",
+            ),
+            name=f"DagFileProcessorWorker{self._instance_id}-Process",
+        )
+        self._process = process
+        process.start()
+
+        # Close the child side of the pipe now the subprocess has started -- otherwise this would prevent it
+        # from closing in some cases
+        _child_channel.close()
+        del _child_channel
+
+        self._parent_channel = _parent_channel
+
+    def send(self, request: ParsingRequest) -> None:
+        """Send a file to process to the worker."""
+        if self._parent_channel is None:
+            raise AirflowException("Tried to send a file to a worker before starting it!")
+        self.files_processed += 1
+        self._parent_channel.send(request)
+
+    @property
+    def channel(self) -> MultiprocessingConnection:
+        """The pipe the results of the worker are received on."""
+        if self._parent_channel is None:
+            raise AirflowException("Tried to get the channel of a worker before starting it!")
+        return self._parent_channel
+
+    @property
+    def pid(self) -> int:
+        if self._process is None or self._process.pid is None:
+            raise AirflowException("Tried to get PID before starting!")
+        return self._process.pid
+
+    @property
+    def exit_code(self) -> Optional[int]:
+        if self._process is None:
+            raise AirflowException("Tried to get exit code before starting!")
+        return self._process.exitcode
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        if self._process is not None:
+            self._process.join(timeout=timeout)
+
+    def memory_usage(self) -> Optional[int]:
+        """Resident memory of the worker process in bytes, if it can be read."""
+        try:
+            return psutil.Process(self.pid).memory_info().rss
+        except (psutil.Error, AirflowException):
+            return None
+
+    def kill(self) -> None:
+        """Kill the worker. The pipe is left open so a pending read sees the end of the stream."""
+        if self._process is None:
+            raise AirflowException("Tried to kill process before starting!")
+        if self._process.is_alive() and self._process.pid:
+            self.log.warning("Killing DagFileProcessorWorker (PID=%d)", self._process.pid)
+            os.kill(self._process.pid, signal.SIGKILL)
+
+    def terminate(self, sigkill: bool = False) -> None:
+        """
+        Terminate (and then kill) the worker.
+
+        :param sigkill: whether to issue a SIGKILL if SIGTERM doesn't work.
+        """
+        if self._process is None:
+            raise AirflowException("Tried to call terminate before starting!")
+        self._process.terminate()
+        # Arbitrarily wait 5s for the process to die
+        self._process.join(timeout=5)
+        if sigkill:
+            self.kill()
+        self.close()
+
+    def stop(self) -> None:
+        """Ask an idle worker to exit, and kill it if it does not."""
+        if self._parent_channel is not None and not self._parent_channel.closed:
+            with suppress(OSError):
+                self._parent_channel.send(None)
+        self.join(timeout=5)
+        if self.is_alive():
+            self.kill()
+            self.join()
+        self.close()
+
+    def close(self) -> None:
+        if self._parent_channel is not None:
+            self._parent_channel.close()
+
+
+class DagFileProcessorWorkerPool(LoggingMixin):
+    """
+    Hands out idle :class:`DagFileProcessorWorker`, starting new ones when none is available.
+
+    A worker goes back to the pool when it is done with a file, unless it died, processed
+    ``max_files_per_worker`` files or uses more than ``max_worker_memory_mb`` -- then it is replaced
+    by a new worker the next time one is needed.
+
+    :param pre_import_modules: Modules every worker imports when it starts
+    :param max_files_per_worker: Number of files a worker processes before being replaced
+    :param max_worker_memory_mb: Resident memory above which a worker is replaced, 0 for no limit
+    """
+
+    def __init__(self, pre_import_modules: List[str], max_files_per_worker: int, max_worker_memory_mb: int):
+        super().__init__()
+        self._pre_import_modules = pre_import_modules
+        self._max_files_per_worker = max_files_per_worker
+        self._max_worker_memory = max_worker_memory_mb * 1024 * 1024
+        self._idle_workers: List[DagFileProcessorWorker] = []
+        self._workers: Set[DagFileProcessorWorker] = set()
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+    def acquire(self) -> DagFileProcessorWorker:
+        """Get an idle worker, starting a new one if there is none."""
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.is_alive():
+                return worker
+            self.discard(worker)
+
+        worker = DagFileProcessorWorker(self._pre_import_modules)
+        worker.start()
+        self._workers.add(worker)
+        self.log.debug("Started DAG parsing worker (PID=%s)", worker.pid)
+        return worker
+
+    def _should_recycle(self, worker: DagFileProcessorWorker) -> bool:
+        if self._max_files_per_worker and worker.files_processed >= self._max_files_per_worker:
+            self.log.debug(
+                "DAG parsing worker (PID=%s) processed %d files", worker.pid, worker.files_processed
+            )
+            return True
+        if self._max_worker_memory:
+            memory_usage = worker.memory_usage()
+            if memory_usage is not None and memory_usage > self._max_worker_memory:
+                self.log.debug("DAG parsing worker (PID=%s) uses %d bytes", worker.pid, memory_usage)
+                return True
+        return False
+
+    def release(self, worker: DagFileProcessorWorker) -> None:
+        """Give back a worker that is done with its file."""
+        if not worker.is_alive():
+            self.discard(worker)
+        elif self._should_recycle(worker):
+            Stats.incr('dag_processing.workers_recycled')
+            worker.stop()
+            self._workers.discard(worker)
+        else:
+            self._idle_workers.append(worker)
+
+    def discard(self, worker: DagFileProcessorWorker) -> None:
+        """Forget a worker that was killed or died."""
+        worker.join(timeout=5)
+        worker.close()
+        self._workers.discard(worker)
+
+    def stop(self) -> None:
+        """Stop all the workers."""
+        for worker in self._workers:
+            worker.stop()
+        self._workers.clear()
+        self._idle_workers.clear()
+
+
+class PooledDagFileProcessorProcess(LoggingMixin):
+    """
+    Processes a DAG file in a worker of a :class:`DagFileProcessorWorkerPool`.
+
+    Offers the same interface as :class:`~airflow.dag_processing.processor.DagFileProcessorProcess`,
+    so the DagFileProcessorManager handles both the same way. Killing it kills the worker.
+
+    :param pool: the pool to get a worker from
+    :param file_path: a Python file containing Airflow DAG definitions
+    :param pickle_dags: whether to serialize the DAG objects to the DB
+    :param dag_ids: If specified, only look at these DAG ID's
+    :param callback_requests: failure callback to execute
+    """
+
+    def __init__(
+        self,
+        pool: DagFileProcessorWorkerPool,
+        file_path: str,
+        pickle_dags: bool,
+        dag_ids: Optional[List[str]],
+        callback_requests: List[CallbackRequest],
+    ):
+        super().__init__()
+        self._pool = pool
+        self._file_path = file_path
+        self._pickle_dags = pickle_dags
+        self._dag_ids = dag_ids
+        self._callback_requests = callback_requests
+
+        self._worker: Optional[DagFileProcessorWorker] = None
+        self._result: Optional[Tuple[int, int]] = None
+        self._done = False
+        self._start_time: Optional[datetime.datetime] = None
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    def start(self) -> None:
+        """Send the file to an idle worker of the pool."""
+        self._worker = self._pool.acquire()
+        self._start_time = timezone.utcnow()
+        self._worker.send((self._file_path, self._pickle_dags, self._dag_ids, self._callback_requests))
+
+    def kill(self) -> None:
+        """Kill the worker processing the file."""
+        if self._worker is None:
+            raise AirflowException("Tried to kill before starting!")
+        self._worker.kill()
+
+    def terminate(self, sigkill: bool = False) -> None:
+        """
+        Terminate (and then kill) the worker processing the file.
+
+        :param sigkill: whether to issue a SIGKILL if SIGTERM doesn't work.
+        """
+        if self._worker is None:
+            raise AirflowException("Tried to call terminate before starting!")
+        self._worker.terminate(sigkill)
+        self._done = True
+        self._pool.discard(self._worker)
+
+    @property
+    def pid(self) -> int:
+        if self._worker is None:
+            raise AirflowException("Tried to get PID before starting!")
+        return self._worker.pid
+
+    @property
+    def exit_code(self) -> Optional[int]:
+        if self._worker is None:
+            raise AirflowException("Tried to get exit code before starting!")
+        if not self._done:
+            raise AirflowException("Tried to call retcode before process was finished!")
+        return self._worker.exit_code
+
+    @property
+    def done(self) -> bool:
+        """
+        Check if the worker is done processing the file.
+
+        :return: whether the file was processed
+        :rtype: bool
+        """
+        if self._worker is None:
+            raise AirflowException("Tried to see if it's done before starting!")
+
+        if self._done:
+            return True
+
+        if self._worker.channel.poll():
+            try:
+                self._result = self._worker.channel.recv()
+            except (EOFError, ConnectionError):
+                # The worker exited (or was killed) without sending a result
+                self._worker.join(timeout=5)
+                if self._worker.is_alive():
+                    self._worker.kill()
+                    self._worker.join()
+            self._finish()
+            return True
+
+        if not self._worker.is_alive():
+            self._finish()
+            return True
+
+        return False
+
+    def _finish(self) -> None:
+        self._done = True
+        if self._worker is not None:
+            self._pool.release(self._worker)
+
+    @property
+    def result(self) -> Optional[Tuple[int, int]]:
+        """
+        :return: result of running DagFileProcessor.process_file()
+        :rtype: tuple[int, int] or None
+        """
+        if not self.done:
+            raise AirflowException("Tried to get the result before it's done!")
+        return self._result
+
+    @property
+    def start_time(self) -> datetime.datetime:
+        """
+        :return: when this started to process the file
+        :rtype: datetime
+        """
+        if self._start_time is None:
+            raise AirflowException("Tried to get start time before it started!")
+        return self._start_time
+
+    @property
+    def waitable_handle(self):
+        return self._worker.channel if self._worker else None
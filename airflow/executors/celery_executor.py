@@ -26,7 +26,9 @@ import logging
 import math
 import operator
 import os
+import queue
 import subprocess
+import threading
 import time
 import traceback
 from collections import OrderedDict
@@ -49,6 +51,7 @@ from airflow.exceptions import AirflowException, AirflowTaskTimeout
 from airflow.executors.base_executor import BaseExecutor, CommandType, EventBufferValueType
 from airflow.models.taskinstance import TaskInstance, TaskInstanceKey
 from airflow.stats import Stats
+from airflow.utils.cli import preload_dag_for_task
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.net import get_hostname
 from airflow.utils.session import NEW_SESSION, provide_session
@@ -96,6 +99,8 @@ def execute_command(command_to_exec: CommandType) -> None:
 
 
 def _execute_in_fork(command_to_exec: CommandType, celery_task_id: Optional[str] = None) -> None:
+    if conf.getboolean('core', 'fast_task_start'):
+        preload_dag_for_task(command_to_exec)
     pid = os.fork()
     if pid:
         # In parent, wait for the child
@@ -244,8 +249,22 @@ class CeleryExecutor(BaseExecutor):
         self.task_publish_retries: Dict[TaskInstanceKey, int] = OrderedDict()
         self.task_publish_max_retries = conf.getint('celery', 'task_publish_max_retries', fallback=3)
 
+        self.task_event_listener: Optional[CeleryTaskEventListener] = None
+        if conf.getboolean('celery', 'sync_with_task_events', fallback=False):
+            self.task_event_listener = CeleryTaskEventListener()
+        self.task_events_reconcile_interval = conf.getfloat(
+            'celery', 'task_events_reconcile_interval', fallback=60.0
+        )
+        self.task_events_reconcile_batch_size = conf.getint(
+            'celery', 'task_events_reconcile_batch_size', fallback=1000
+        )
+        self._last_reconcile_time = time.monotonic()
+        self._reconcile_offset = 0
+
     def start(self) -> None:
         self.log.debug('Starting Celery Executor using %s processes for syncing', self._sync_parallelism)
+        if self.task_event_listener is not None:
+            self.task_event_listener.start()
 
     def _num_tasks_per_send_process(self, to_send_count: int) -> int:
         """
@@ -341,7 +360,12 @@ class CeleryExecutor(BaseExecutor):
         if not self.tasks:
             self.log.debug("No task to query celery, skipping sync")
             return
-        self.update_all_task_states()
+        if self.task_event_listener is not None and self.task_event_listener.connected:
+            self.update_task_states_from_events()
+            if time.monotonic() - self._last_reconcile_time > self.task_events_reconcile_interval:
+                self.reconcile_task_states()
+        else:
+            self.update_all_task_states()
 
         if self.adopted_task_timeouts:
             self._check_for_stalled_adopted_tasks()
@@ -450,15 +474,50 @@ class CeleryExecutor(BaseExecutor):
 
     def update_all_task_states(self) -> None:
         """Updates states of the tasks."""
-        self.log.debug("Inquiring about %s celery task(s)", len(self.tasks))
-        state_and_info_by_celery_task_id = self.bulk_state_fetcher.get_many(self.tasks.values())
+        self._update_task_states(list(self.tasks))
+
+    def _update_task_states(self, keys: List[TaskInstanceKey]) -> None:
+        self.log.debug("Inquiring about %s celery task(s)", len(keys))
+        state_and_info_by_celery_task_id = self.bulk_state_fetcher.get_many([self.tasks[key] for key in keys])
 
         self.log.debug("Inquiries completed.")
-        for key, async_result in list(self.tasks.items()):
+        for key in keys:
+            async_result = self.tasks.get(key)
+            if async_result is None:
+                continue
             state, info = state_and_info_by_celery_task_id.get(async_result.task_id)
             if state:
                 self.update_task_state(key, state, info)
 
+    def update_task_states_from_events(self) -> None:
+        """Updates states of the tasks Celery workers sent events about since the last call."""
+        events = self.task_event_listener.get_events()
+        if not events:
+            return
+        keys_by_celery_task_id = {async_result.task_id: key for key, async_result in self.tasks.items()}
+        for celery_task_id, state, _ in events:
+            key = keys_by_celery_task_id.get(celery_task_id)
+            if key is not None and key in self.tasks:
+                self.update_task_state(key, state, None)
+        self.log.debug("Processed %d Celery task event(s)", len(events))
+
+    def reconcile_task_states(self) -> None:
+        """
+        Polls the result backend for the states of a batch of tasks.
+
+        Each call takes the next batch of ``task_events_reconcile_batch_size``
+        tasks, so that every task is eventually checked -- in case its events
+        were lost, or sent while the listener was reconnecting.
+        """
+        self._last_reconcile_time = time.monotonic()
+        keys = list(self.tasks)
+        if not keys:
+            return
+        start = self._reconcile_offset % len(keys)
+        batch = keys[start : start + self.task_events_reconcile_batch_size]
+        self._reconcile_offset = start + len(batch)
+        self._update_task_states(batch)
+
     def change_state(self, key: TaskInstanceKey, state: str, info=None) -> None:
         super().change_state(key, state, info)
         self.tasks.pop(key, None)
@@ -486,6 +545,8 @@ class CeleryExecutor(BaseExecutor):
             while any(task.state not in celery_states.READY_STATES for task in self.tasks.values()):
                 time.sleep(5)
         self.sync()
+        if self.task_event_listener is not None:
+            self.task_event_listener.stop()
 
     def execute_async(
         self,
@@ -498,7 +559,8 @@ class CeleryExecutor(BaseExecutor):
         raise AirflowException("No Async execution for Celery executor.")
 
     def terminate(self):
-        pass
+        if self.task_event_listener is not None:
+            self.task_event_listener.stop()
 
     def try_adopt_task_instances(self, tis: List[TaskInstance]) -> List[TaskInstance]:
         # See which of the TIs are still alive (or have finished even!)
@@ -664,3 +726,78 @@ class BulkStateFetcher(LoggingMixin):
                 else:
                     states_and_info_by_task_id[task_id] = state_or_exception, info
         return states_and_info_by_task_id
+
+
+class CeleryTaskEventListener(LoggingMixin):
+    """
+    Receives the task events sent by Celery workers, in a background thread.
+
+    Workers only send task events when started with ``--task-events``, or when
+    ``worker_send_task_events`` is set in the Celery configuration.
+
+    :param celery_app: The Celery app to receive the events of.
+    """
+
+    # Task event types, and the state of the task they report
+    EVENT_STATES = {
+        'task-started': celery_states.STARTED,
+        'task-succeeded': celery_states.SUCCESS,
+        'task-failed': celery_states.FAILURE,
+        'task-revoked': celery_states.REVOKED,
+    }
+
+    def __init__(self, celery_app: Celery = app):
+        super().__init__()
+        self._app = celery_app
+        self._events: "queue.SimpleQueue[Tuple[str, str, float]]" = queue.SimpleQueue()
+        self._receiver = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Whether events are being received. While not, they could be missed.
+        self.connected = False
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="celery-task-events", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._receiver is not None:
+            self._receiver.should_stop = True
+        if self._thread is not None:
+            self._thread.join(timeout=OPERATION_TIMEOUT + 1)
+        self.connected = False
+
+    def _run(self) -> None:
+        handlers = {event_type: self.on_event for event_type in self.EVENT_STATES}
+        while not self._stopped.is_set():
+            try:
+                with self._app.connection_for_read() as connection:
+                    self._receiver = self._app.events.Receiver(connection, handlers=handlers)
+                    self.connected = True
+                    self.log.info("Receiving Celery task events")
+                    self._receiver.capture(limit=None, timeout=None, wakeup=False)
+            except Exception:
+                self.log.exception("Error receiving Celery task events, polling task states instead")
+            finally:
+                self.connected = False
+            self._stopped.wait(OPERATION_TIMEOUT)
+
+    def on_event(self, event: Dict[str, Any]) -> None:
+        """Queue a task event, to be processed by :meth:`get_events`."""
+        self._events.put(
+            (event['uuid'], self.EVENT_STATES[event['type']], event.get('timestamp', time.time()))
+        )
+
+    def get_events(self) -> List[Tuple[str, str, float]]:
+        """Celery task id, task state and time of every event received since the last call."""
+        Stats.gauge('celery.task_events.backlog', self._events.qsize())
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except queue.Empty:
+                break
+        if events:
+            Stats.gauge('celery.task_events.lag', max(0.0, time.time() - min(t for _, _, t in events)))
+        return events
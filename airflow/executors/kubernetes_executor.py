@@ -22,13 +22,16 @@ KubernetesExecutor
     :ref:`executor:KubernetesExecutor`
 """
 
+import copy
 import functools
 import json
 import multiprocessing
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from queue import Empty, Queue
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from kubernetes import client, watch
 from kubernetes.client import Configuration, models as k8s
@@ -226,6 +229,194 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
             )
 
 
+class WorkerPodCache(LoggingMixin):
+    """
+    In-process cache of the worker pods of KubernetesExecutors, in the manner of a Kubernetes informer.
+
+    The pods are listed once, then kept up to date by a thread watching them. Pods are indexed by
+    their ``dag_id`` and ``task_id`` labels so the pods of a task instance are found without scanning
+    all of them.
+
+    :param kube_client: client for the Kubernetes API
+    :param namespace: namespace the pods are in, unless ``multi_namespace_mode`` is set
+    :param multi_namespace_mode: whether to follow the pods of all the namespaces
+    :param kube_client_request_args: extra arguments of the calls to the Kubernetes API
+    """
+
+    label_selector = 'kubernetes_executor=True'
+
+    def __init__(
+        self,
+        kube_client: client.CoreV1Api,
+        namespace: Optional[str],
+        multi_namespace_mode: bool,
+        kube_client_request_args: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__()
+        self.kube_client = kube_client
+        self.namespace = namespace
+        self.multi_namespace_mode = multi_namespace_mode
+        self.kube_client_request_args = kube_client_request_args or {}
+        # Whether the cache reflects the pods of the cluster, it does not while the watch reconnects
+        self.synced = False
+        self.resource_version: Optional[str] = None
+        self._lock = threading.Lock()
+        # (namespace, name) -> pod
+        self._pods: Dict[Tuple[str, str], k8s.V1Pod] = {}
+        # (dag_id label, task_id label) -> (namespace, name) of its pods
+        self._by_task: Dict[Tuple[str, str], Set[Tuple[str, str]]] = {}
+        self._stop = threading.Event()
+        self._watch: Optional[watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _list_call(self, **kwargs) -> Tuple[Any, tuple, Dict[str, Any]]:
+        kwargs = {'label_selector': self.label_selector, **self.kube_client_request_args, **kwargs}
+        if self.multi_namespace_mode:
+            return self.kube_client.list_pod_for_all_namespaces, (), kwargs
+        return self.kube_client.list_namespaced_pod, (self.namespace,), kwargs
+
+    @staticmethod
+    def _task_of(pod: k8s.V1Pod) -> Tuple[str, str]:
+        labels = pod.metadata.labels or {}
+        return labels.get('dag_id', ''), labels.get('task_id', '')
+
+    def _add(self, pod: k8s.V1Pod) -> None:
+        key = (pod.metadata.namespace, pod.metadata.name)
+        self._discard(key)
+        self._pods[key] = pod
+        self._by_task.setdefault(self._task_of(pod), set()).add(key)
+
+    def _discard(self, key: Tuple[str, str]) -> None:
+        pod = self._pods.pop(key, None)
+        if pod is None:
+            return
+        task = self._task_of(pod)
+        keys = self._by_task.get(task)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_task[task]
+
+    def resync(self) -> None:
+        """Replace the content of the cache with the pods listed from the Kubernetes API."""
+        list_pods, args, kwargs = self._list_call()
+        pod_list = list_pods(*args, **kwargs)
+        with self._lock:
+            self._pods.clear()
+            self._by_task.clear()
+            for pod in pod_list.items:
+                self._add(pod)
+            self.resource_version = pod_list.metadata.resource_version
+            self.synced = True
+        self.log.debug("Worker pod cache holds %d pods at %s", len(pod_list.items), self.resource_version)
+
+    def apply_event(self, event_type: str, pod: k8s.V1Pod) -> None:
+        """
+        Apply a watch event to the cache.
+
+        :param event_type: ``ADDED``, ``MODIFIED`` or ``DELETED``
+        :param pod: the pod the event is about
+        """
+        with self._lock:
+            if event_type == 'DELETED':
+                self._discard((pod.metadata.namespace, pod.metadata.name))
+            else:
+                self._add(pod)
+            if pod.metadata.resource_version:
+                self.resource_version = pod.metadata.resource_version
+
+    def get_pods(
+        self, labels: Dict[str, str], namespace: Optional[str] = None, phase: Optional[str] = None
+    ) -> List[k8s.V1Pod]:
+        """
+        Copies of the cached pods having all the given labels.
+
+        :param labels: label values the pods must have, as in a label selector
+        :param namespace: only return the pods of this namespace
+        :param phase: only return the pods in this phase, as in ``status.phase`` field selector
+        """
+        with self._lock:
+            if 'dag_id' in labels and 'task_id' in labels:
+                keys = self._by_task.get((labels['dag_id'], labels['task_id']), ())
+                candidates = [self._pods[key] for key in keys]
+            else:
+                candidates = list(self._pods.values())
+        pods = []
+        for pod in candidates:
+            if namespace is not None and pod.metadata.namespace != namespace:
+                continue
+            if phase is not None and (pod.status is None or pod.status.phase != phase):
+                continue
+            pod_labels = pod.metadata.labels or {}
+            if all(pod_labels.get(name) == value for name, value in labels.items()):
+                pods.append(copy.deepcopy(pod))
+        return pods
+
+    def start(self) -> None:
+        """List the pods, then follow their changes from a thread."""
+        self.resync()
+        self._thread = threading.Thread(target=self._run, name="worker-pod-cache", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop following the changes of the pods."""
+        self._stop.set()
+        self.synced = False
+        if self._watch is not None:
+            self._watch.stop()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                if not self.synced:
+                    self.resync()
+                self._follow()
+            except Exception:
+                self.log.warning("Error watching worker pods, listing them again", exc_info=True)
+                self.synced = False
+                self._stop.wait(1)
+
+    def _follow(self) -> None:
+        self._watch = watch.Watch()
+        list_pods, args, kwargs = self._list_call(resource_version=self.resource_version)
+        for event in self._watch.stream(list_pods, *args, **kwargs):
+            if event['type'] == 'ERROR':
+                # Most likely the resource version is too old (410)
+                self.log.info("Worker pod watch failed with %s, listing them again", event['raw_object'])
+                self.synced = False
+                return
+            self.apply_event(event['type'], event['object'])
+            if self._stop.is_set():
+                return
+
+
+class PodCreationRateLimiter:
+    """
+    Spaces out the creation of pods so that at most ``rate`` pods per second are created in a namespace.
+
+    It is shared by the threads creating pods.
+
+    :param rate: pods per second and namespace, ``0`` for no limit
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._lock = threading.Lock()
+        # namespace -> earliest time the next pod may be created there
+        self._next_slot: Dict[str, float] = {}
+
+    def wait(self, namespace: str) -> None:
+        """Block until a pod may be created in ``namespace``."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(namespace, now))
+            self._next_slot[namespace] = slot + 1.0 / self.rate
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class AirflowKubernetesScheduler(LoggingMixin):
     """Airflow Scheduler for Kubernetes"""
 
@@ -236,6 +427,7 @@ class AirflowKubernetesScheduler(LoggingMixin):
         result_queue: 'Queue[KubernetesResultsType]',
         kube_client: client.CoreV1Api,
         scheduler_job_id: str,
+        pod_cache: Optional[WorkerPodCache] = None,
     ):
         super().__init__()
         self.log.debug("Creating Kubernetes executor")
@@ -248,6 +440,8 @@ class AirflowKubernetesScheduler(LoggingMixin):
         self._manager = multiprocessing.Manager()
         self.watcher_queue = self._manager.Queue()
         self.scheduler_job_id = scheduler_job_id
+        self.pod_cache = pod_cache
+        self.rate_limiter = PodCreationRateLimiter(self.kube_config.worker_pods_creation_rate_limit)
         self.kube_watcher = self._make_kube_watcher()
 
     def run_pod_async(self, pod: k8s.V1Pod, **kwargs):
@@ -258,11 +452,15 @@ class AirflowKubernetesScheduler(LoggingMixin):
         json_pod = json.dumps(sanitized_pod, indent=2)
 
         self.log.debug('Pod Creation Request: \n%s', json_pod)
+        self.rate_limiter.wait(pod.metadata.namespace)
         try:
             resp = self.kube_client.create_namespaced_pod(
                 body=sanitized_pod, namespace=pod.metadata.namespace, **kwargs
             )
             self.log.debug('Pod Creation Response: %s', resp)
+            if self.pod_cache is not None and isinstance(resp, k8s.V1Pod):
+                # Do not wait for the watch to see the pod we just created
+                self.pod_cache.apply_event('ADDED', resp)
         except Exception as e:
             self.log.exception('Exception when attempting to create Namespaced Pod: %s', json_pod)
             raise e
@@ -438,8 +636,22 @@ class KubernetesExecutor(BaseExecutor):
         self.scheduler_job_id: Optional[str] = None
         self.event_scheduler: Optional[EventScheduler] = None
         self.last_handled: Dict[TaskInstanceKey, float] = {}
+        self.pod_cache: Optional[WorkerPodCache] = None
+        self._pod_creation_pool: Optional[ThreadPoolExecutor] = None
         super().__init__(parallelism=self.kube_config.parallelism)
 
+    def _get_cached_pods(
+        self, labels: Dict[str, str], phase: Optional[str] = None
+    ) -> Optional[List[k8s.V1Pod]]:
+        """
+        Pods of the executor namespace with the given labels, from the pod cache.
+
+        Returns None when there is no pod cache or it is not in sync, the pods must be listed then.
+        """
+        if self.pod_cache is None or not self.pod_cache.synced:
+            return None
+        return self.pod_cache.get_pods(labels, namespace=self.kube_config.kube_namespace, phase=phase)
+
     @provide_session
     def clear_not_launched_queued_tasks(self, session=None) -> None:
         """
@@ -474,6 +686,12 @@ class KubernetesExecutor(BaseExecutor):
             if ti.key in self.last_handled:
                 continue
 
+            # The cache saves listing the pods of the TIs it knows a pod of. A pod another scheduler
+            # just created may not have reached it yet, so a TI it has no pod of is looked up below
+            # before being rescheduled.
+            if self.pod_cache is not None and self.pod_cache.synced and self._has_cached_pod(ti):
+                continue
+
             # Build the pod selector
             base_label_selector = (
                 f"dag_id={pod_generator.make_safe_label_value(ti.dag_id)},"
@@ -501,11 +719,37 @@ class KubernetesExecutor(BaseExecutor):
             if pod_list.items:
                 continue
             self.log.info('TaskInstance: %s found in queued state but was not launched, rescheduling', ti)
-            session.query(TaskInstance).filter(
-                TaskInstance.dag_id == ti.dag_id,
-                TaskInstance.task_id == ti.task_id,
-                TaskInstance.run_id == ti.run_id,
-            ).update({TaskInstance.state: State.SCHEDULED})
+            self._reschedule_queued_ti(ti, session)
+
+    def _has_cached_pod(self, ti: TaskInstance) -> bool:
+        """Whether the pod cache holds a pod of ``ti``, looked up like the list calls above."""
+        if self.pod_cache is None:
+            raise AirflowException(NOT_STARTED_MESSAGE)
+        labels = {
+            'dag_id': pod_generator.make_safe_label_value(ti.dag_id),
+            'task_id': pod_generator.make_safe_label_value(ti.task_id),
+            'airflow-worker': pod_generator.make_safe_label_value(str(ti.queued_by_job_id)),
+        }
+        if ti.map_index >= 0:
+            labels['map_index'] = str(ti.map_index)
+        by_run_id = {**labels, 'run_id': pod_generator.make_safe_label_value(ti.run_id)}
+        by_execution_date = {
+            **labels,
+            'execution_date': pod_generator.datetime_to_label_safe_datestring(ti.execution_date),
+        }
+        namespace = self.kube_config.kube_namespace
+        return bool(
+            self.pod_cache.get_pods(by_run_id, namespace=namespace)
+            or self.pod_cache.get_pods(by_execution_date, namespace=namespace)
+        )
+
+    @staticmethod
+    def _reschedule_queued_ti(ti: TaskInstance, session) -> None:
+        session.query(TaskInstance).filter(
+            TaskInstance.dag_id == ti.dag_id,
+            TaskInstance.task_id == ti.task_id,
+            TaskInstance.run_id == ti.run_id,
+        ).update({TaskInstance.state: State.SCHEDULED})
 
     def start(self) -> None:
         """Starts the executor"""
@@ -515,8 +759,26 @@ class KubernetesExecutor(BaseExecutor):
         self.scheduler_job_id = str(self.job_id)
         self.log.debug('Start with scheduler_job_id: %s', self.scheduler_job_id)
         self.kube_client = get_kube_client()
+        if self.kube_config.worker_pods_informer_cache:
+            self.pod_cache = WorkerPodCache(
+                self.kube_client,
+                namespace=self.kube_config.kube_namespace,
+                multi_namespace_mode=self.kube_config.multi_namespace_mode,
+                kube_client_request_args=self.kube_config.kube_client_request_args,
+            )
+            self.pod_cache.start()
+        if self.kube_config.worker_pods_creation_concurrency > 1:
+            self._pod_creation_pool = ThreadPoolExecutor(
+                max_workers=self.kube_config.worker_pods_creation_concurrency,
+                thread_name_prefix="pod-creation",
+            )
         self.kube_scheduler = AirflowKubernetesScheduler(
-            self.kube_config, self.task_queue, self.result_queue, self.kube_client, self.scheduler_job_id
+            self.kube_config,
+            self.task_queue,
+            self.result_queue,
+            self.kube_client,
+            self.scheduler_job_id,
+            pod_cache=self.pod_cache,
         )
         self.event_scheduler = EventScheduler()
         self.event_scheduler.call_regular_interval(
@@ -605,35 +867,64 @@ class KubernetesExecutor(BaseExecutor):
         resource_instance = ResourceVersion()
         resource_instance.resource_version = last_resource_version or resource_instance.resource_version
 
+        tasks: List[KubernetesJobType] = []
         for _ in range(self.kube_config.worker_pods_creation_batch_size):
             try:
-                task = self.task_queue.get_nowait()
-                try:
-                    self.kube_scheduler.run_next(task)
-                except ApiException as e:
-
-                    # These codes indicate something is wrong with pod definition; otherwise we assume pod
-                    # definition is ok, and that retrying may work
-                    if e.status in (400, 422):
-                        self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
-                        key, _, _, _ = task
-                        self.change_state(key, State.FAILED, e)
-                    else:
-                        self.log.warning(
-                            'ApiException when attempting to run task, re-queueing. Reason: %r. Message: %s',
-                            e.reason,
-                            json.loads(e.body)['message'],
-                        )
-                        self.task_queue.put(task)
-                finally:
-                    self.task_queue.task_done()
+                tasks.append(self.task_queue.get_nowait())
             except Empty:
                 break
+        unexpected_error: Optional[Exception] = None
+        try:
+            for task, error in zip(tasks, self._run_tasks(tasks)):
+                if error is None:
+                    continue
+                if not isinstance(error, ApiException):
+                    unexpected_error = unexpected_error or error
+                    continue
+                # These codes indicate something is wrong with pod definition; otherwise we assume pod
+                # definition is ok, and that retrying may work
+                if error.status in (400, 422):
+                    self.log.error("Pod creation failed with reason %r. Failing task", error.reason)
+                    key, _, _, _ = task
+                    self.change_state(key, State.FAILED, error)
+                else:
+                    self.log.warning(
+                        'ApiException when attempting to run task, re-queueing. Reason: %r. Message: %s',
+                        error.reason,
+                        json.loads(error.body)['message'],
+                    )
+                    self.task_queue.put(task)
+        finally:
+            for _ in tasks:
+                self.task_queue.task_done()
+        if unexpected_error is not None:
+            raise unexpected_error
 
         # Run any pending timed events
         next_event = self.event_scheduler.run(blocking=False)
         self.log.debug("Next timed event is in %f", next_event)
 
+    def _run_tasks(self, tasks: List[KubernetesJobType]) -> List[Optional[Exception]]:
+        """
+        Create the pods of ``tasks``, several at a time when ``worker_pods_creation_concurrency`` allows.
+
+        :return: the exception raised creating the pod of each task, or None
+        """
+        if not self.kube_scheduler:
+            raise AirflowException(NOT_STARTED_MESSAGE)
+        kube_scheduler = self.kube_scheduler
+
+        def run_next(task: KubernetesJobType) -> Optional[Exception]:
+            try:
+                kube_scheduler.run_next(task)
+            except Exception as e:
+                return e
+            return None
+
+        if self._pod_creation_pool is None or len(tasks) < 2:
+            return [run_next(task) for task in tasks]
+        return list(self._pod_creation_pool.map(run_next, tasks))
+
     def _check_worker_pods_pending_timeout(self):
         """Check if any pending worker pods have timed out"""
         if not self.scheduler_job_id:
@@ -691,9 +982,13 @@ class KubernetesExecutor(BaseExecutor):
         kube_client: client.CoreV1Api = self.kube_client
         for scheduler_job_id in scheduler_job_ids:
             scheduler_job_id = pod_generator.make_safe_label_value(str(scheduler_job_id))
-            kwargs = {'label_selector': f'airflow-worker={scheduler_job_id}'}
-            pod_list = kube_client.list_namespaced_pod(namespace=self.kube_config.kube_namespace, **kwargs)
-            for pod in pod_list.items:
+            pods = self._get_cached_pods({'airflow-worker': scheduler_job_id})
+            if pods is None:
+                kwargs = {'label_selector': f'airflow-worker={scheduler_job_id}'}
+                pods = kube_client.list_namespaced_pod(
+                    namespace=self.kube_config.kube_namespace, **kwargs
+                ).items
+            for pod in pods:
                 self.adopt_launched_task(kube_client, pod, pod_ids)
         self._adopt_completed_pods(kube_client)
         tis_to_flush.extend(pod_ids.values())
@@ -738,12 +1033,14 @@ class KubernetesExecutor(BaseExecutor):
         """
         if not self.scheduler_job_id:
             raise AirflowException(NOT_STARTED_MESSAGE)
-        kwargs = {
-            'field_selector': "status.phase=Succeeded",
-            'label_selector': 'kubernetes_executor=True',
-        }
-        pod_list = kube_client.list_namespaced_pod(namespace=self.kube_config.kube_namespace, **kwargs)
-        for pod in pod_list.items:
+        pods = self._get_cached_pods({'kubernetes_executor': 'True'}, phase='Succeeded')
+        if pods is None:
+            kwargs = {
+                'field_selector': "status.phase=Succeeded",
+                'label_selector': 'kubernetes_executor=True',
+            }
+            pods = kube_client.list_namespaced_pod(namespace=self.kube_config.kube_namespace, **kwargs).items
+        for pod in pods:
             self.log.info("Attempting to adopt pod %s", pod.metadata.name)
             pod.metadata.labels['airflow-worker'] = pod_generator.make_safe_label_value(self.scheduler_job_id)
             try:
@@ -813,7 +1110,15 @@ class KubernetesExecutor(BaseExecutor):
         self.result_queue.join()
         if self.kube_scheduler:
             self.kube_scheduler.terminate()
+        self._stop_pod_creation_and_cache()
         self._manager.shutdown()
 
+    def _stop_pod_creation_and_cache(self) -> None:
+        if self._pod_creation_pool is not None:
+            self._pod_creation_pool.shutdown()
+            self._pod_creation_pool = None
+        if self.pod_cache is not None:
+            self.pod_cache.stop()
+
     def terminate(self):
         """Terminate the executor is not doing anything."""
@@ -34,9 +34,11 @@ from typing import Any, List, Optional, Tuple, Union
 from setproctitle import getproctitle, setproctitle
 
 from airflow import settings
+from airflow.configuration import conf
 from airflow.exceptions import AirflowException
 from airflow.executors.base_executor import NOT_STARTED_MESSAGE, PARALLELISM, BaseExecutor, CommandType
 from airflow.models.taskinstance import TaskInstanceKey, TaskInstanceStateType
+from airflow.utils.cli import preload_dag_for_task
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.state import State
 
@@ -96,6 +98,8 @@ class LocalWorkerBase(Process, LoggingMixin):
             return State.FAILED
 
     def _execute_work_in_fork(self, command: CommandType) -> str:
+        if conf.getboolean('core', 'fast_task_start'):
+            preload_dag_for_task(command)
         pid = os.fork()
         if pid:
             # In parent, wait for the child
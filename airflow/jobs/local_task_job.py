@@ -17,9 +17,11 @@
 # under the License.
 #
 import signal
-from typing import Optional
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
 
 import psutil
+from sqlalchemy import func, or_
 from sqlalchemy.exc import OperationalError
 
 from airflow.configuration import conf
@@ -32,10 +34,12 @@ from airflow.models.taskinstance import TaskInstance
 from airflow.sentry import Sentry
 from airflow.stats import Stats
 from airflow.task.task_runner import get_task_runner
+from airflow.ti_deps.dep_context import DepContext
+from airflow.ti_deps.dependencies_states import SCHEDULEABLE_STATES
 from airflow.utils import timezone
 from airflow.utils.net import get_hostname
 from airflow.utils.session import provide_session
-from airflow.utils.sqlalchemy import with_row_locks
+from airflow.utils.sqlalchemy import lock_timeout, with_row_locks
 from airflow.utils.state import State
 
 
@@ -240,44 +244,20 @@ class LocalTaskJob(BaseJob):
     @Sentry.enrich_errors
     def _run_mini_scheduler_on_child_tasks(self, session=None) -> None:
         try:
-            # Re-select the row with a lock
-            dag_run = with_row_locks(
-                session.query(DagRun).filter_by(
-                    dag_id=self.dag_id,
-                    run_id=self.task_instance.run_id,
-                ),
-                session=session,
-            ).one()
-
-            task = self.task_instance.task
-            assert task.dag  # For Mypy.
-
-            # Get a partial DAG with just the specific tasks we want to examine.
-            # In order for dep checks to work correctly, we include ourself (so
-            # TriggerRuleDep can check the state of the task we just executed).
-            partial_dag = task.dag.partial_subset(
-                task.downstream_task_ids,
-                include_downstream=True,
-                include_upstream=False,
-                include_direct_upstream=True,
-            )
-
-            dag_run.dag = partial_dag
-            info = dag_run.task_instance_scheduling_decisions(session)
-
-            skippable_task_ids = {
-                task_id for task_id in partial_dag.task_ids if task_id not in task.downstream_task_ids
-            }
-
-            schedulable_tis = [ti for ti in info.schedulable_tis if ti.task_id not in skippable_task_ids]
-            for schedulable_ti in schedulable_tis:
-                if not hasattr(schedulable_ti, "task"):
-                    schedulable_ti.task = task.dag.get_task(schedulable_ti.task_id)
-
-            num = dag_run.schedule_tis(schedulable_tis)
+            timeout = conf.getfloat('scheduler', 'mini_scheduler_lock_timeout', fallback=0.0)
+            with lock_timeout(session, timeout):
+                if (
+                    conf.getboolean('scheduler', 'mini_scheduler_fast_path', fallback=False)
+                    and self._can_schedule_direct_downstream()
+                ):
+                    num = self._schedule_direct_downstream(session)
+                else:
+                    num = self._schedule_downstream_with_partial_dag(session)
             self.log.info("%d downstream tasks scheduled from follow-on schedule check", num)
 
             session.commit()
+            Stats.incr('mini_scheduler.success')
+            Stats.incr('mini_scheduler.tis_scheduled', num)
         except OperationalError as e:
             # Any kind of DB error here is _non fatal_ as this block is just an optimisation.
             self.log.info(
@@ -286,6 +266,111 @@ class LocalTaskJob(BaseJob):
                 exc_info=True,
             )
             session.rollback()
+            Stats.incr('mini_scheduler.skipped')
+
+    def _schedule_downstream_with_partial_dag(self, session) -> int:
+        """
+        Lock the DagRun and make the scheduling decisions of the downstream of the task we just ran.
+
+        :return: The number of task instances scheduled
+        """
+        # Re-select the row with a lock
+        dag_run = with_row_locks(
+            session.query(DagRun).filter_by(
+                dag_id=self.dag_id,
+                run_id=self.task_instance.run_id,
+            ),
+            session=session,
+        ).one()
+
+        task = self.task_instance.task
+        assert task.dag  # For Mypy.
+
+        # Get a partial DAG with just the specific tasks we want to examine.
+        # In order for dep checks to work correctly, we include ourself (so
+        # TriggerRuleDep can check the state of the task we just executed).
+        partial_dag = task.dag.partial_subset(
+            task.downstream_task_ids,
+            include_downstream=True,
+            include_upstream=False,
+            include_direct_upstream=True,
+        )
+
+        dag_run.dag = partial_dag
+        info = dag_run.task_instance_scheduling_decisions(session)
+
+        skippable_task_ids = {
+            task_id for task_id in partial_dag.task_ids if task_id not in task.downstream_task_ids
+        }
+
+        schedulable_tis = [ti for ti in info.schedulable_tis if ti.task_id not in skippable_task_ids]
+        for schedulable_ti in schedulable_tis:
+            if not hasattr(schedulable_ti, "task"):
+                schedulable_ti.task = task.dag.get_task(schedulable_ti.task_id)
+
+        return dag_run.schedule_tis(schedulable_tis, session=session)
+
+    def _can_schedule_direct_downstream(self) -> bool:
+        """Whether :meth:`_schedule_direct_downstream` can handle the downstream of the task we just ran."""
+        task = self.task_instance.task
+        # Mapped tasks have to be expanded, which needs the whole scheduling decisions
+        return not any(task.dag.get_task(task_id).is_mapped for task_id in task.downstream_task_ids)
+
+    def _schedule_direct_downstream(self, session) -> int:
+        """
+        Schedule the direct downstream task instances of the task we just ran that are ready to run.
+
+        Unlike :meth:`_schedule_downstream_with_partial_dag` the DagRun is not locked and its scheduling
+        decisions are not made: only the direct downstream task instances that can be scheduled are
+        locked, and the states of their upstream task instances are counted with one query. The rest of
+        the DagRun is left to the scheduler.
+
+        :return: The number of task instances scheduled
+        """
+        task = self.task_instance.task
+        dag = task.dag
+        assert dag  # For Mypy.
+        if not task.downstream_task_ids:
+            return 0
+
+        schedulable_states = [state for state in SCHEDULEABLE_STATES if state is not None]
+        tis: List[TaskInstance] = with_row_locks(
+            session.query(TaskInstance).filter(
+                TaskInstance.dag_id == self.dag_id,
+                TaskInstance.run_id == self.task_instance.run_id,
+                TaskInstance.task_id.in_(task.downstream_task_ids),
+                or_(TaskInstance.state.is_(None), TaskInstance.state.in_(schedulable_states)),
+            ),
+            of=TaskInstance,
+            session=session,
+        ).all()
+        if not tis:
+            return 0
+
+        for ti in tis:
+            ti.task = dag.get_task(ti.task_id)
+        upstream_task_ids = set().union(*(ti.task.upstream_task_ids for ti in tis))
+        finished_ti_states: Dict[str, Counter] = defaultdict(Counter)
+        for task_id, state, count in (
+            session.query(TaskInstance.task_id, TaskInstance.state, func.count())
+            .filter(
+                TaskInstance.dag_id == self.dag_id,
+                TaskInstance.run_id == self.task_instance.run_id,
+                TaskInstance.task_id.in_(upstream_task_ids),
+                TaskInstance.state.in_(State.finished),
+            )
+            .group_by(TaskInstance.task_id, TaskInstance.state)
+        ):
+            finished_ti_states[task_id][state] = count
+
+        # The DagRun is loaded along with the task instances
+        dag_run = tis[0].dag_run
+        dag_run.dag = dag
+        dep_context = DepContext(flag_upstream_failed=True, finished_ti_states=dict(finished_ti_states))
+        schedulable_tis = [
+            ti for ti in tis if ti.are_dependencies_met(dep_context=dep_context, session=session)
+        ]
+        return dag_run.schedule_tis(schedulable_tis, session=session)
 
     @provide_session
     def _update_dagrun_state_for_paused_dag(self, session=None):
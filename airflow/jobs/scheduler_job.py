@@ -25,11 +25,12 @@ import sys
 import time
 import warnings
 from collections import defaultdict
+from contextlib import contextmanager
 from datetime import timedelta
-from typing import Collection, DefaultDict, Dict, Iterator, List, Optional, Tuple
+from typing import Collection, DefaultDict, Dict, List, Optional, Set, Tuple
 
 from sqlalchemy import and_, func, not_, or_, text, tuple_
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import DBAPIError, OperationalError
 from sqlalchemy.orm import load_only, selectinload
 from sqlalchemy.orm.session import Session, make_transient
 
@@ -45,11 +46,13 @@ from airflow.models import DAG
 from airflow.models.dag import DagModel
 from airflow.models.dagbag import DagBag
 from airflow.models.dagrun import DagRun
+from airflow.models.dagstats import DagStateStats
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.taskinstance import SimpleTaskInstance, TaskInstance, TaskInstanceKey
 from airflow.stats import Stats
 from airflow.ti_deps.dependencies_states import EXECUTION_STATES
 from airflow.utils import timezone
+from airflow.utils.concurrency_ledger import ConcurrencyLedger
 from airflow.utils.docs import get_docs_url
 from airflow.utils.event_scheduler import EventScheduler
 from airflow.utils.retries import MAX_DB_RETRIES, retry_db_transaction, run_with_db_retries
@@ -143,6 +146,21 @@ class SchedulerJob(BaseJob):
 
         self.dagbag = DagBag(dag_folder=self.subdir, read_dags_from_db=True, load_op_links=False)
 
+        # Optionally keep pool occupancy and dag/task concurrency in memory rather than aggregating
+        # over the task_instance table inside the critical section on every loop.
+        self._concurrency_ledger: Optional[ConcurrencyLedger] = None
+        if conf.getboolean('scheduler', 'use_concurrency_ledger', fallback=False):
+            self._concurrency_ledger = ConcurrencyLedger(
+                reconcile_interval=conf.getfloat(
+                    'scheduler', 'concurrency_ledger_reconcile_interval', fallback=30.0
+                )
+            )
+
+        # The DAGs with runs queued or running at the last refresh of the stats of the DAGs, and the
+        # time of the last refresh of the stats of all the DAGs
+        self._dag_ids_with_unfinished_runs: Set[str] = set()
+        self._last_dag_stats_reconcile: Optional[float] = None
+
         if conf.getboolean('smart_sensor', 'use_smart_sensor'):
             compatible_sensors = set(
                 map(lambda l: l.strip(), conf.get('smart_sensor', 'sensors_enabled').split(','))
@@ -262,7 +280,10 @@ class SchedulerJob(BaseJob):
 
         # Get the pool settings. We get a lock on the pool rows, treating this as a "critical section"
         # Throws an exception if lock cannot be obtained, rather than blocking
-        pools = models.Pool.slots_stats(lock_rows=True, session=session)
+        if self._concurrency_ledger:
+            pools = self._concurrency_ledger.pool_stats(lock_rows=True, session=session)
+        else:
+            pools = models.Pool.slots_stats(lock_rows=True, session=session)
 
         # If the pools are full, there is no point doing anything!
         # If _somehow_ the pool is overfull, don't let the limit go negative - it breaks SQL
@@ -317,9 +338,12 @@ class SchedulerJob(BaseJob):
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
         dag_max_active_tasks_map: DefaultDict[str, int]
         task_concurrency_map: DefaultDict[Tuple[str, str], int]
-        dag_max_active_tasks_map, task_concurrency_map = self.__get_concurrency_maps(
-            states=list(EXECUTION_STATES), session=session
-        )
+        if self._concurrency_ledger:
+            dag_max_active_tasks_map, task_concurrency_map = self._concurrency_ledger.concurrency_maps()
+        else:
+            dag_max_active_tasks_map, task_concurrency_map = self.__get_concurrency_maps(
+                states=list(EXECUTION_STATES), session=session
+            )
 
         num_tasks_in_executor = 0
         # Number of tasks that cannot be scheduled because of no open slot in pool
@@ -468,6 +492,8 @@ class SchedulerJob(BaseJob):
                 },
                 synchronize_session=False,
             )
+            if self._concurrency_ledger:
+                self._concurrency_ledger.record_queued(executable_tis)
 
         for ti in executable_tis:
             make_transient(ti)
@@ -488,6 +514,8 @@ class SchedulerJob(BaseJob):
         for ti in task_instances:
             if ti.dag_run.state in State.finished:
                 ti.set_state(State.NONE, session=session)
+                if self._concurrency_ledger:
+                    self._concurrency_ledger.record_finished([ti.key])
                 continue
             command = ti.command_as_list(
                 local=True,
@@ -533,112 +561,199 @@ class SchedulerJob(BaseJob):
         self._enqueue_task_instances_with_queued_state(queued_tis, session=session)
         return len(queued_tis)
 
+    @contextmanager
+    def _executor_events_phase(self, timings: Dict[str, float], phase: str):
+        """Time a phase of the processing of the executor events, and send it as a metric."""
+        with Stats.timer(f'scheduler.executor_events.{phase}') as timer:
+            yield
+        timings[phase] = timer.duration
+
     @provide_session
     def _process_executor_events(self, session: Session = None) -> int:
-        """Respond to executor events."""
+        """
+        Respond to executor events.
+
+        The events are processed as a set: the task instances they refer to are read with a single
+        (row locking) query of the columns needed, and only the task instances the executor reports
+        as finished while they are still queued -- the ones killed externally -- are loaded as ORM
+        objects to be failed, or to have their callbacks sent.
+        """
         if not self.processor_agent:
             raise ValueError("Processor agent is not started.")
         ti_primary_key_to_try_number_map: Dict[Tuple[str, str, str, int], int] = {}
         event_buffer = self.executor.get_event_buffer()
         tis_with_right_state: List[TaskInstanceKey] = []
+        timings: Dict[str, float] = {}
 
         # Report execution
-        for ti_key, value in event_buffer.items():
-            state: str
-            state, _ = value
-            # We create map (dag_id, task_id, execution_date) -> in-memory try_number
-            ti_primary_key_to_try_number_map[ti_key.primary] = ti_key.try_number
+        with self._executor_events_phase(timings, 'collect'):
+            for ti_key, value in event_buffer.items():
+                state: str
+                state, _ = value
+                # We create map (dag_id, task_id, execution_date) -> in-memory try_number
+                ti_primary_key_to_try_number_map[ti_key.primary] = ti_key.try_number
 
-            self.log.info(
-                "Executor reports execution of %s.%s run_id=%s exited with status %s for try_number %s",
-                ti_key.dag_id,
-                ti_key.task_id,
-                ti_key.run_id,
-                state,
-                ti_key.try_number,
-            )
-            if state in (TaskInstanceState.FAILED, TaskInstanceState.SUCCESS, TaskInstanceState.QUEUED):
-                tis_with_right_state.append(ti_key)
+                self.log.info(
+                    "Executor reports execution of %s.%s run_id=%s exited with status %s for try_number %s",
+                    ti_key.dag_id,
+                    ti_key.task_id,
+                    ti_key.run_id,
+                    state,
+                    ti_key.try_number,
+                )
+                if state in (TaskInstanceState.FAILED, TaskInstanceState.SUCCESS, TaskInstanceState.QUEUED):
+                    tis_with_right_state.append(ti_key)
 
         # Return if no finished tasks
         if not tis_with_right_state:
             return len(event_buffer)
 
         # Check state of finished tasks
-        filter_for_tis = TI.filter_for_tis(tis_with_right_state)
-        query = session.query(TI).filter(filter_for_tis).options(selectinload('dag_model'))
-        # row lock this entire set of taskinstances to make sure the scheduler doesn't fail when we have
-        # multi-schedulers
-        tis: Iterator[TI] = with_row_locks(
-            query,
-            of=TI,
-            session=session,
-            **skip_locked(session=session),
+        with self._executor_events_phase(timings, 'query'):
+            query = session.query(
+                TI.dag_id,
+                TI.task_id,
+                TI.run_id,
+                TI.map_index,
+                TI._try_number,
+                TI.state,
+                TI.start_date,
+                TI.end_date,
+                TI.duration,
+                TI.max_tries,
+                TI.job_id,
+                TI.pool,
+                TI.queue,
+                TI.priority_weight,
+                TI.operator,
+                TI.queued_by_job_id,
+            ).filter(TI.filter_for_tis(tis_with_right_state))
+            # row lock this entire set of taskinstances to make sure the scheduler doesn't fail when we have
+            # multi-schedulers
+            rows = with_row_locks(query, of=TI, session=session, **skip_locked(session=session)).all()
+
+        external_executor_ids = []
+        finished_keys: List[TaskInstanceKey] = []
+        killed_externally: Dict[TaskInstanceKey, Tuple[str, str]] = {}
+        with self._executor_events_phase(timings, 'reconcile'):
+            for row in rows:
+                primary = (row.dag_id, row.task_id, row.run_id, row.map_index)
+                buffer_key = TaskInstanceKey(
+                    *primary[:3], ti_primary_key_to_try_number_map[primary], row.map_index
+                )
+                state, info = event_buffer.pop(buffer_key)
+
+                # TODO: should we fail RUNNING as well, as we do in Backfills?
+                if state == TaskInstanceState.QUEUED:
+                    external_executor_ids.append(
+                        {
+                            'dag_id': row.dag_id,
+                            'task_id': row.task_id,
+                            'run_id': row.run_id,
+                            'map_index': row.map_index,
+                            'external_executor_id': info,
+                        }
+                    )
+                    self.log.info("Setting external_id for %s to %s", buffer_key, info)
+                    continue
+
+                finished_keys.append(buffer_key)
+                self.log.info(
+                    "TaskInstance Finished: dag_id=%s, task_id=%s, run_id=%s, "
+                    "run_start_date=%s, run_end_date=%s, "
+                    "run_duration=%s, state=%s, executor_state=%s, try_number=%s, max_tries=%s, job_id=%s, "
+                    "pool=%s, queue=%s, priority_weight=%d, operator=%s",
+                    row.dag_id,
+                    row.task_id,
+                    row.run_id,
+                    row.start_date,
+                    row.end_date,
+                    row.duration,
+                    row.state,
+                    state,
+                    buffer_key.try_number,
+                    row.max_tries,
+                    row.job_id,
+                    row.pool,
+                    row.queue,
+                    row.priority_weight,
+                    row.operator,
+                )
+
+                # The try number of a queued task instance is one more than the one stored
+                ti_queued = row._try_number + 1 == buffer_key.try_number and row.state == State.QUEUED
+                # A task instance queued again, by this or another scheduler, was not killed externally
+                ti_requeued = (
+                    row.queued_by_job_id is not None and row.queued_by_job_id != self.id
+                ) or self.executor.has_task(buffer_key)
+                if ti_queued and not ti_requeued:
+                    killed_externally[buffer_key] = state, info
+
+            if external_executor_ids:
+                session.bulk_update_mappings(TI, external_executor_ids)
+            if self._concurrency_ledger:
+                self._concurrency_ledger.record_finished(finished_keys)
+
+        if killed_externally:
+            with self._executor_events_phase(timings, 'killed_externally'):
+                self._handle_tis_killed_externally(killed_externally, session=session)
+
+        self.log.debug(
+            "Processed %d executor events in %.3fs (%s)",
+            len(tis_with_right_state),
+            sum(timings.values()),
+            ", ".join(f"{phase}: {seconds:.3f}s" for phase, seconds in timings.items()),
         )
-        for ti in tis:
-            try_number = ti_primary_key_to_try_number_map[ti.key.primary]
-            buffer_key = ti.key.with_try_number(try_number)
-            state, info = event_buffer.pop(buffer_key)
-
-            # TODO: should we fail RUNNING as well, as we do in Backfills?
-            if state == TaskInstanceState.QUEUED:
-                ti.external_executor_id = info
-                self.log.info("Setting external_id for %s to %s", ti, info)
-                continue
+        return len(event_buffer)
 
+    def _handle_tis_killed_externally(
+        self, killed_externally: Dict[TaskInstanceKey, Tuple[str, str]], session: Session
+    ) -> None:
+        """
+        Fail the task instances the executor reports as finished although they are still queued.
+
+        The callback requests of the tasks that have callbacks are all created before they are sent.
+
+        :param killed_externally: The executor state and info of the task instances, by key
+        """
+        tis = (
+            session.query(TI)
+            .filter(TI.filter_for_tis(killed_externally))
+            .options(selectinload('dag_model'))
+            .all()
+        )
+        requests: List[TaskCallbackRequest] = []
+        for ti in tis:
+            state, info = killed_externally[ti.key]
+            Stats.incr('scheduler.tasks.killed_externally')
             msg = (
-                "TaskInstance Finished: dag_id=%s, task_id=%s, run_id=%s, "
-                "run_start_date=%s, run_end_date=%s, "
-                "run_duration=%s, state=%s, executor_state=%s, try_number=%s, max_tries=%s, job_id=%s, "
-                "pool=%s, queue=%s, priority_weight=%d, operator=%s"
+                "Executor reports task instance %s finished (%s) although the "
+                "task says its %s. (Info: %s) Was the task killed externally?"
             )
-            self.log.info(
-                msg,
-                ti.dag_id,
-                ti.task_id,
-                ti.run_id,
-                ti.start_date,
-                ti.end_date,
-                ti.duration,
-                ti.state,
-                state,
-                try_number,
-                ti.max_tries,
-                ti.job_id,
-                ti.pool,
-                ti.queue,
-                ti.priority_weight,
-                ti.operator,
-            )
-
-            if ti.try_number == buffer_key.try_number and ti.state == State.QUEUED:
-                Stats.incr('scheduler.tasks.killed_externally')
-                msg = (
-                    "Executor reports task instance %s finished (%s) although the "
-                    "task says its %s. (Info: %s) Was the task killed externally?"
-                )
-                self.log.error(msg, ti, state, ti.state, info)
+            self.log.error(msg, ti, state, ti.state, info)
 
-                # Get task from the Serialized DAG
-                try:
-                    dag = self.dagbag.get_dag(ti.dag_id)
-                    task = dag.get_task(ti.task_id)
-                except Exception:
-                    self.log.exception("Marking task instance %s as %s", ti, state)
-                    ti.set_state(state)
-                    continue
-                ti.task = task
-                if task.on_retry_callback or task.on_failure_callback:
-                    request = TaskCallbackRequest(
+            # Get task from the Serialized DAG
+            try:
+                dag = self.dagbag.get_dag(ti.dag_id)
+                task = dag.get_task(ti.task_id)
+            except Exception:
+                self.log.exception("Marking task instance %s as %s", ti, state)
+                ti.set_state(state, session=session)
+                continue
+            ti.task = task
+            if task.on_retry_callback or task.on_failure_callback:
+                requests.append(
+                    TaskCallbackRequest(
                         full_filepath=ti.dag_model.fileloc,
                         simple_task_instance=SimpleTaskInstance(ti),
                         msg=msg % (ti, state, ti.state, info),
                     )
-                    self.executor.send_callback(request)
-                else:
-                    ti.handle_failure(error=msg % (ti, state, ti.state, info), session=session)
+                )
+            else:
+                ti.handle_failure(error=msg % (ti, state, ti.state, info), session=session)
 
-        return len(event_buffer)
+        for request in requests:
+            self.executor.send_callback(request)
 
     def _execute(self) -> None:
         self.log.info("Starting the scheduler")
@@ -752,6 +867,10 @@ class SchedulerJob(BaseJob):
             self._find_zombies,
         )
 
+        dag_stats_update_interval = conf.getfloat('scheduler', 'dag_stats_update_interval', fallback=10.0)
+        if dag_stats_update_interval > 0:
+            timers.call_regular_interval(dag_stats_update_interval, self._update_dag_stats)
+
         for loop_count in itertools.count(start=1):
             with Stats.timer() as timer:
 
@@ -1051,6 +1170,7 @@ class SchedulerJob(BaseJob):
         if not dag:
             self.log.error("Couldn't find dag %s in DagBag/DB!", dag_run.dag_id)
             return callback
+        dag_run.structure_index = self.dagbag.get_structure_index(dag_run.dag_id)
         dag_model = DM.get_dagmodel(dag.dag_id, session)
 
         if (
@@ -1120,6 +1240,7 @@ class SchedulerJob(BaseJob):
 
         # Refresh the DAG
         dag_run.dag = self.dagbag.get_dag(dag_id=dag_run.dag_id, session=session)
+        dag_run.structure_index = self.dagbag.get_structure_index(dag_run.dag_id)
 
         # Verify integrity also takes care of session.flush
         dag_run.verify_integrity(session=session)
@@ -1149,6 +1270,37 @@ class SchedulerJob(BaseJob):
             Stats.gauge(f'pool.queued_slots.{pool_name}', slot_stats["queued"])
             Stats.gauge(f'pool.running_slots.{pool_name}', slot_stats["running"])
 
+    def _update_dag_stats(self) -> None:
+        """
+        Refresh the stats of the DAGs shown on the home page.
+
+        The stats of the DAGs with runs queued or running change as their tasks run, so they are
+        refreshed, as are those of the DAGs that had some at the previous refresh, to count the runs
+        that finished since. The stats of all the DAGs are refreshed every
+        ``[scheduler] dag_stats_reconcile_interval`` seconds.
+        """
+        reconcile_interval = conf.getfloat('scheduler', 'dag_stats_reconcile_interval', fallback=300.0)
+        now = time.monotonic()
+        reconcile = self._last_dag_stats_reconcile is None or (
+            now - self._last_dag_stats_reconcile >= reconcile_interval
+        )
+        try:
+            with Stats.timer('scheduler.dag_stats_update'), create_session() as session:
+                dag_ids_with_unfinished_runs = DagStateStats.get_dag_ids_with_unfinished_runs(session=session)
+                if reconcile:
+                    dag_ids = {dag_id for dag_id, in session.query(DagModel.dag_id)}
+                else:
+                    dag_ids = dag_ids_with_unfinished_runs | self._dag_ids_with_unfinished_runs
+                DagStateStats.refresh(dag_ids, session=session)
+        except DBAPIError:
+            # Another scheduler may be refreshing the same stats, they are refreshed again next time
+            self.log.warning("Failed to refresh the stats of the DAGs", exc_info=True)
+            return
+        self._dag_ids_with_unfinished_runs = dag_ids_with_unfinished_runs
+        if reconcile:
+            self._last_dag_stats_reconcile = now
+        self.log.debug("Refreshed the stats of %d DAGs", len(dag_ids))
+
     @provide_session
     def heartbeat_callback(self, session: Session = None) -> None:
         Stats.incr('scheduler_heartbeat', 1, 1)
@@ -1217,6 +1369,8 @@ class SchedulerJob(BaseJob):
                         reset_tis_message.append(repr(ti))
                         ti.state = State.NONE
                         ti.queued_by_job_id = None
+                    if self._concurrency_ledger:
+                        self._concurrency_ledger.record_finished(ti.key for ti in to_reset)
 
                     for ti in set(tis_to_reset_or_adopt) - set(to_reset):
                         ti.queued_by_job_id = self.id
@@ -16,16 +16,19 @@
 # under the License.
 
 import asyncio
+import json
 import os
+import select
 import signal
 import sys
 import threading
 import time
 from collections import deque
-from typing import Deque, Dict, Set, Tuple, Type
+from typing import Callable, Deque, Dict, Optional, Set, Tuple, Type
 
 from sqlalchemy import func
 
+from airflow import settings
 from airflow.compat.asyncio import create_task
 from airflow.configuration import conf
 from airflow.jobs.base_job import BaseJob
@@ -33,9 +36,10 @@ from airflow.models.trigger import Trigger
 from airflow.stats import Stats
 from airflow.triggers.base import BaseTrigger, TriggerEvent
 from airflow.typing_compat import TypedDict
+from airflow.utils import timezone
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.module_loading import import_string
-from airflow.utils.session import provide_session
+from airflow.utils.session import create_session, provide_session
 
 
 class TriggererJob(BaseJob):
@@ -47,11 +51,20 @@ class TriggererJob(BaseJob):
     It runs as two threads:
      - The main thread does DB calls/checkins
      - A subthread runs all the async code
+
+    Several TriggererJobs can run on the same host as shards, each in its own
+    process; every shard claims its own share of the triggers.
+
+    :param capacity: how many triggers this triggerer runs at once
+    :param shard: index of this triggerer among the shards of its host, used to
+        tell their metrics apart
+    :param shards: number of shards on the host; each shard is only woken up by
+        the notifications of its share of the new triggers
     """
 
     __mapper_args__ = {'polymorphic_identity': 'TriggererJob'}
 
-    def __init__(self, capacity=None, *args, **kwargs):
+    def __init__(self, capacity=None, *args, shard: int = 0, shards: int = 1, **kwargs):
         # Call superclass
         super().__init__(*args, **kwargs)
 
@@ -61,9 +74,20 @@ class TriggererJob(BaseJob):
             self.capacity = capacity
         else:
             raise ValueError(f"Capacity number {capacity} is invalid")
+        self.shard = shard
+        self.shards = shards
+        self.poll_interval = conf.getfloat('triggerer', 'trigger_poll_interval', fallback=1.0)
+
+        # Set when there is something to do: new triggers were notified, or triggers fired
+        self.wakeup = threading.Event()
+        self.triggers_notified = False
+        self.notification_listener: Optional[TriggerNotificationListener] = None
 
         # Set up runner async thread
-        self.runner = TriggerRunner()
+        self.runner = TriggerRunner(
+            deduplicate=conf.getboolean('triggerer', 'deduplicate_triggers', fallback=True),
+            wakeup=self.wakeup,
+        )
 
     def register_signals(self) -> None:
         """Register signals that stop child processes"""
@@ -102,12 +126,15 @@ class TriggererJob(BaseJob):
         try:
             # Kick off runner thread
             self.runner.start()
+            self._start_notification_listener()
             # Start our own DB loop in the main thread
             self._run_trigger_loop()
         except Exception:
             self.log.exception("Exception when executing TriggererJob._run_trigger_loop")
             raise
         finally:
+            if self.notification_listener:
+                self.notification_listener.stop = True
             self.log.info("Waiting for triggers to clean up")
             # Tell the subthread to stop and then wait for it.
             # If the user interrupts/terms again, _graceful_exit will allow them
@@ -122,11 +149,20 @@ class TriggererJob(BaseJob):
 
         This runs synchronously and handles all database reads/writes.
         """
+        last_poll = None
         while not self.runner.stop:
-            # Clean out unused triggers
-            Trigger.clean_unused()
-            # Load/delete triggers
-            self.load_triggers()
+            # Poll the trigger table, or load the triggers we were just told about
+            if (
+                self.triggers_notified
+                or last_poll is None
+                or time.monotonic() - last_poll >= self.poll_interval
+            ):
+                self.triggers_notified = False
+                last_poll = time.monotonic()
+                # Clean out unused triggers
+                Trigger.clean_unused()
+                # Load/delete triggers
+                self.load_triggers()
             # Handle events
             self.handle_events()
             # Handle failed triggers
@@ -135,8 +171,34 @@ class TriggererJob(BaseJob):
             self.heartbeat(only_if_necessary=True)
             # Collect stats
             self.emit_metrics()
-            # Idle sleep
-            time.sleep(1)
+            # Idle sleep, unless triggers are notified or fire in the meantime
+            self.wakeup.wait(1)
+            self.wakeup.clear()
+
+    def _start_notification_listener(self) -> None:
+        with create_session() as session:
+            if not Trigger.notifications_supported(session):
+                self.log.info(
+                    "Polling the trigger table every %s seconds for new triggers", self.poll_interval
+                )
+                return
+        if settings.engine.dialect.driver != 'psycopg2':
+            self.log.info(
+                "Cannot listen to trigger notifications with the %s driver, polling the trigger table "
+                "every %s seconds for new triggers",
+                settings.engine.dialect.driver,
+                self.poll_interval,
+            )
+            return
+        self.notification_listener = TriggerNotificationListener(
+            self.on_triggers_notified, shard=self.shard, shards=self.shards
+        )
+        self.notification_listener.start()
+
+    def on_triggers_notified(self) -> None:
+        """Called from the notification listener when triggers were created."""
+        self.triggers_notified = True
+        self.wakeup.set()
 
     def load_triggers(self):
         """
@@ -144,8 +206,9 @@ class TriggererJob(BaseJob):
         adds them to our runner, and then removes ones from it we no longer
         need.
         """
-        Trigger.assign_unassigned(self.id, self.capacity)
-        ids = Trigger.ids_for_triggerer(self.id)
+        with create_session() as session:
+            Trigger.assign_unassigned(self.id, self.capacity, session=session)
+            ids = Trigger.ids_for_triggerer(self.id, session=session)
         self.runner.update_triggers(set(ids))
 
     def handle_events(self):
@@ -153,13 +216,16 @@ class TriggererJob(BaseJob):
         Handles outbound events from triggers - dispatching them into the Trigger
         model where they are then pushed into the relevant task instances.
         """
+        events = []
         while self.runner.events:
             # Get the event and its trigger ID
-            trigger_id, event = self.runner.events.popleft()
-            # Tell the model to wake up its tasks
-            Trigger.submit_event(trigger_id=trigger_id, event=event)
-            # Emit stat event
-            Stats.incr('triggers.succeeded')
+            events.append(self.runner.events.popleft())
+        if not events:
+            return
+        # Tell the model to wake up the tasks of all the triggers at once
+        Trigger.submit_events(events)
+        # Emit stat event
+        Stats.incr('triggers.succeeded', len(events))
 
     def handle_failed_triggers(self):
         """
@@ -175,6 +241,71 @@ class TriggererJob(BaseJob):
 
     def emit_metrics(self):
         Stats.gauge('triggers.running', len(self.runner.triggers))
+        Stats.gauge(f'triggers.running.{self.shard}', len(self.runner.triggers))
+        Stats.gauge(f'triggers.coroutines_running.{self.shard}', self.runner.coroutine_count)
+        Stats.gauge(f'triggerer.loop_lag.{self.shard}', self.runner.pop_max_loop_lag())
+
+
+class TriggerNotificationListener(threading.Thread, LoggingMixin):
+    """
+    Listens to the PostgreSQL notifications sent when triggers are created.
+
+    It holds a connection of its own, outside the connection pool, and reconnects
+    when that connection fails; the triggerer polls the trigger table meanwhile.
+    It relies on the notification API of psycopg2 connections.
+
+    Only the notifications of the triggers of this shard wake the triggerer up;
+    if the shard is at capacity, another shard claims the trigger on its next poll.
+
+    :param on_notified: called, from this thread, when triggers were created
+    :param shard: index of the shard of the triggerer on its host
+    :param shards: number of shards on the host
+    """
+
+    # How long to wait for notifications before checking the stop flag, in seconds
+    select_timeout = 1.0
+
+    def __init__(self, on_notified: Callable[[], None], shard: int = 0, shards: int = 1):
+        super().__init__(name="trigger-notification-listener", daemon=True)
+        self.on_notified = on_notified
+        self.shard = shard
+        self.shards = shards
+        self.stop = False
+
+    def run(self) -> None:
+        while not self.stop:
+            try:
+                self._listen()
+            except Exception:
+                self.log.warning("Lost the trigger notification connection, reconnecting", exc_info=True)
+                time.sleep(1)
+
+    def _connect(self):
+        connection = settings.engine.raw_connection()
+        # Keep the connection to ourselves, LISTEN needs it in autocommit mode
+        connection.detach()
+        dbapi_connection = connection.connection
+        dbapi_connection.autocommit = True
+        return connection, dbapi_connection
+
+    def _listen(self) -> None:
+        connection, dbapi_connection = self._connect()
+        try:
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {Trigger.NOTIFICATION_CHANNEL}")
+            self.log.info("Listening to new triggers on channel %s", Trigger.NOTIFICATION_CHANNEL)
+            # Triggers may have been created while we were not listening
+            self.on_notified()
+            while not self.stop:
+                if select.select([dbapi_connection], [], [], self.select_timeout) == ([], [], []):
+                    continue
+                dbapi_connection.poll()
+                notifies = list(dbapi_connection.notifies)
+                dbapi_connection.notifies.clear()
+                if any(Trigger.is_for_shard(n.payload, self.shard, self.shards) for n in notifies):
+                    self.on_notified()
+        finally:
+            connection.close()
 
 
 class TriggerDetails(TypedDict):
@@ -183,6 +314,10 @@ class TriggerDetails(TypedDict):
     task: asyncio.Task
     name: str
     events: int
+    # IDs of the identical triggers sharing ``task``, this one included
+    group: Set[int]
+    # Identifies identical triggers, None if the trigger cannot be shared
+    key: Optional[str]
 
 
 class TriggerRunner(threading.Thread, LoggingMixin):
@@ -193,6 +328,16 @@ class TriggerRunner(threading.Thread, LoggingMixin):
     event loop, but is also sometimes interacted with from the main thread
     (where all the DB queries are done). All communication between threads is
     done via Deques.
+
+    Identical triggers - same classpath and kwargs - are run by a single coroutine,
+    whose events are sent on behalf of all of them. A trigger only joins a coroutine
+    that has not fired yet, so it never misses an event.
+
+    Both threads are woken up as soon as the other has work for them, rather
+    than on their next loop.
+
+    :param deduplicate: whether to run identical triggers in a single coroutine
+    :param wakeup: set when there are events or failed triggers for the main thread
     """
 
     # Maps trigger IDs to their running tasks and other info
@@ -213,17 +358,50 @@ class TriggerRunner(threading.Thread, LoggingMixin):
     # Outbound queue of failed triggers
     failed_triggers: Deque[Tuple[int, BaseException]]
 
+    # Maps the keys of identical triggers to the group of the coroutine running them,
+    # while that coroutine has not fired
+    unfired_groups: Dict[str, Set[int]]
+
     # Should-we-stop flag
     stop: bool = False
 
-    def __init__(self):
+    def __init__(self, deduplicate: bool = True, wakeup: Optional[threading.Event] = None):
         super().__init__()
+        self.deduplicate = deduplicate
+        self.wakeup = wakeup
+        # Event loop of the runner thread, and what it waits on between loops
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.new_work: Optional[asyncio.Event] = None
         self.triggers = {}
         self.trigger_cache = {}
         self.to_create = deque()
         self.to_cancel = deque()
         self.events = deque()
         self.failed_triggers = deque()
+        self.unfired_groups = {}
+        # Longest delay of the event loop in waking up the watchdog, since last read
+        self.max_loop_lag = 0.0
+
+    @property
+    def coroutine_count(self) -> int:
+        """Number of trigger coroutines running, identical triggers sharing one."""
+        return len({id(details["task"]) for details in list(self.triggers.values())})
+
+    def pop_max_loop_lag(self) -> float:
+        """The longest delay of the event loop since the last call, in seconds."""
+        lag, self.max_loop_lag = self.max_loop_lag, 0.0
+        return lag
+
+    @staticmethod
+    def dedup_key(trigger: BaseTrigger) -> Optional[str]:
+        """Key that identical triggers share, or None if the trigger cannot be serialized."""
+        from airflow.serialization.serialized_objects import BaseSerialization
+
+        try:
+            classpath, kwargs = trigger.serialize()
+            return json.dumps([classpath, BaseSerialization._serialize(kwargs)], sort_keys=True)
+        except Exception:
+            return None
 
     def run(self):
         """Sync entrypoint - just runs arun in an async loop."""
@@ -236,6 +414,8 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         The loop in here runs trigger addition/deletion/cleanup. Actual
         triggers run in their own separate coroutines.
         """
+        self.new_work = asyncio.Event()
+        self.loop = asyncio.get_running_loop()
         watchdog = create_task(self.block_watchdog())
         last_status = time.time()
         while not self.stop:
@@ -243,8 +423,12 @@ class TriggerRunner(threading.Thread, LoggingMixin):
             await self.create_triggers()
             await self.cancel_triggers()
             await self.cleanup_finished_triggers()
-            # Sleep for a bit
-            await asyncio.sleep(1)
+            # Sleep for a bit, unless the main thread has new triggers for us
+            try:
+                await asyncio.wait_for(self.new_work.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                pass
+            self.new_work.clear()
             # Every minute, log status if at least one trigger is running.
             if time.time() - last_status >= 60:
                 count = len(self.triggers)
@@ -262,11 +446,31 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         while self.to_create:
             trigger_id, trigger_instance = self.to_create.popleft()
             if trigger_id not in self.triggers:
-                self.triggers[trigger_id] = {
-                    "task": create_task(self.run_trigger(trigger_id, trigger_instance)),
-                    "name": f"{trigger_instance!r} (ID {trigger_id})",
-                    "events": 0,
-                }
+                key = self.dedup_key(trigger_instance) if self.deduplicate else None
+                group = self.unfired_groups.get(key) if key is not None else None
+                if group:
+                    # An identical trigger is running and has not fired yet, share its coroutine
+                    shared = self.triggers[next(iter(group))]
+                    group.add(trigger_id)
+                    self.triggers[trigger_id] = {
+                        "task": shared["task"],
+                        "name": f"{trigger_instance!r} (ID {trigger_id})",
+                        "events": 0,
+                        "group": group,
+                        "key": key,
+                    }
+                    self.log.info("Trigger %s shares the coroutine of %s", trigger_id, shared["name"])
+                else:
+                    group = {trigger_id}
+                    if key is not None:
+                        self.unfired_groups[key] = group
+                    self.triggers[trigger_id] = {
+                        "task": create_task(self.run_trigger(trigger_id, trigger_instance)),
+                        "name": f"{trigger_instance!r} (ID {trigger_id})",
+                        "events": 0,
+                        "group": group,
+                        "key": key,
+                    }
             else:
                 self.log.warning("Trigger %s had insertion attempted twice", trigger_id)
             await asyncio.sleep(0)
@@ -279,10 +483,24 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         while self.to_cancel:
             trigger_id = self.to_cancel.popleft()
             if trigger_id in self.triggers:
-                # We only delete if it did not exit already
-                self.triggers[trigger_id]["task"].cancel()
+                details = self.triggers[trigger_id]
+                group = details["group"]
+                if group - {trigger_id}:
+                    # Identical triggers still need the coroutine, just stop sending events for this one
+                    group.discard(trigger_id)
+                    del self.triggers[trigger_id]
+                else:
+                    self._forget_group(details)
+                    # We only delete if it did not exit already
+                    details["task"].cancel()
             await asyncio.sleep(0)
 
+    def _forget_group(self, details: TriggerDetails) -> None:
+        """Stop identical triggers from joining the coroutine of ``details``."""
+        key = details["key"]
+        if key is not None and self.unfired_groups.get(key) is details["group"]:
+            del self.unfired_groups[key]
+
     async def cleanup_finished_triggers(self):
         """
         Go through all trigger tasks (coroutines) and clean up entries for
@@ -291,6 +509,7 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         """
         for trigger_id, details in list(self.triggers.items()):
             if details["task"].done():
+                self._forget_group(details)
                 # Check to see if it exited for good reasons
                 saved_exc = None
                 try:
@@ -319,6 +538,7 @@ class TriggerRunner(threading.Thread, LoggingMixin):
                         details["name"],
                     )
                     self.failed_triggers.append((trigger_id, saved_exc))
+                    self._wake_main_thread()
                 del self.triggers[trigger_id]
             await asyncio.sleep(0)
 
@@ -340,6 +560,7 @@ class TriggerRunner(threading.Thread, LoggingMixin):
             # We allow a generous amount of buffer room for now, since it might
             # be a busy event loop.
             time_elapsed = time.monotonic() - last_run
+            self.max_loop_lag = max(self.max_loop_lag, time_elapsed - 0.1)
             if time_elapsed > 0.2:
                 self.log.error(
                     "Triggerer's async thread was blocked for %.2f seconds, "
@@ -356,12 +577,17 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         Wrapper which runs an actual trigger (they are async generators)
         and pushes their events into our outbound event deque.
         """
-        self.log.info("Trigger %s starting", self.triggers[trigger_id]['name'])
+        details = self.triggers[trigger_id]
+        self.log.info("Trigger %s starting", details['name'])
         try:
             async for event in trigger.run():
-                self.log.info("Trigger %s fired: %s", self.triggers[trigger_id]['name'], event)
-                self.triggers[trigger_id]["events"] += 1
-                self.events.append((trigger_id, event))
+                self.log.info("Trigger %s fired: %s", details['name'], event)
+                # Identical triggers created from now on would miss this event, they get their own coroutine
+                self._forget_group(details)
+                for fired_id in sorted(details["group"]):
+                    self.triggers[fired_id]["events"] += 1
+                    self.events.append((fired_id, event))
+                self._wake_main_thread()
         finally:
             # CancelledError will get injected when we're stopped - which is
             # fine, the cleanup process will understand that, but we want to
@@ -369,8 +595,22 @@ class TriggerRunner(threading.Thread, LoggingMixin):
             # they exit cleanly.
             trigger.cleanup()
 
+    def _wake_main_thread(self) -> None:
+        if self.wakeup is not None:
+            self.wakeup.set()
+
     # Main-thread sync API
 
+    def wake(self) -> None:
+        """Called from the main thread to have the runner look at its queues right away."""
+        loop, new_work = self.loop, self.new_work
+        if loop is not None and new_work is not None:
+            try:
+                loop.call_soon_threadsafe(new_work.set)
+            except RuntimeError:
+                # The loop is closed, the runner is stopping
+                pass
+
     def update_triggers(self, requested_trigger_ids: Set[int]):
         """
         Called from the main thread to request that we update what
@@ -410,9 +650,12 @@ class TriggerRunner(threading.Thread, LoggingMixin):
                 self.failed_triggers.append((new_id, e))
                 continue
             self.to_create.append((new_id, trigger_class(**new_triggers[new_id].kwargs)))
+            Stats.timing('triggers.load_latency', timezone.utcnow() - new_triggers[new_id].created_date)
         # Enqueue orphaned triggers for cancellation
         for old_id in cancel_trigger_ids:
             self.to_cancel.append(old_id)
+        if self.to_create or self.to_cancel:
+            self.wake()
 
     def get_trigger_by_classpath(self, classpath: str) -> Type[BaseTrigger]:
         """
@@ -42,6 +42,15 @@ class KubeConfig:
         self.worker_pods_creation_batch_size = conf.getint(
             self.kubernetes_section, 'worker_pods_creation_batch_size'
         )
+        self.worker_pods_creation_concurrency = conf.getint(
+            self.kubernetes_section, 'worker_pods_creation_concurrency'
+        )
+        self.worker_pods_creation_rate_limit = conf.getfloat(
+            self.kubernetes_section, 'worker_pods_creation_rate_limit'
+        )
+        self.worker_pods_informer_cache = conf.getboolean(
+            self.kubernetes_section, 'worker_pods_informer_cache'
+        )
 
         self.worker_container_repository = conf.get(self.kubernetes_section, 'worker_container_repository')
         self.worker_container_tag = conf.get(self.kubernetes_section, 'worker_container_tag')
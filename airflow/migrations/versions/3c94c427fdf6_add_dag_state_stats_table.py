@@ -0,0 +1,55 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Add ``dag_state_stats`` table to store the counts of states shown on the home page.
+
+Revision ID: 3c94c427fdf6
+Revises: b7f3c5d1e9a2
+Create Date: 2022-03-08 14:21:09.816362
+"""
+
+from alembic import op
+from sqlalchemy import Column
+
+from airflow.migrations.db_types import TIMESTAMP, StringID
+from airflow.utils.sqlalchemy import ExtendedJSON
+
+# Revision identifiers, used by Alembic.
+revision = "3c94c427fdf6"
+down_revision = "b7f3c5d1e9a2"
+branch_labels = None
+depends_on = None
+airflow_version = '2.3.0'
+
+
+def upgrade():
+    """Add ``dag_state_stats`` table."""
+    op.create_table(
+        "dag_state_stats",
+        Column("dag_id", StringID(), nullable=False, primary_key=True),
+        Column("dag_run_states", ExtendedJSON(), nullable=False),
+        Column("running_task_states", ExtendedJSON(), nullable=False),
+        Column("last_run_task_states", ExtendedJSON(), nullable=False),
+        Column("last_dag_run", ExtendedJSON(), nullable=True),
+        Column("updated_at", TIMESTAMP, nullable=False),
+    )
+
+
+def downgrade():
+    """Remove ``dag_state_stats`` table."""
+    op.drop_table("dag_state_stats")
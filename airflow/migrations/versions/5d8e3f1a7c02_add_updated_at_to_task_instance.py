@@ -0,0 +1,50 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Add ``updated_at`` column to ``task_instance`` to find the task instances changed since a time.
+
+Revision ID: 5d8e3f1a7c02
+Revises: 3c94c427fdf6
+Create Date: 2022-03-15 09:42:27.513850
+"""
+
+from alembic import op
+from sqlalchemy import Column
+
+from airflow.migrations.db_types import TIMESTAMP
+
+# Revision identifiers, used by Alembic.
+revision = "5d8e3f1a7c02"
+down_revision = "3c94c427fdf6"
+branch_labels = None
+depends_on = None
+airflow_version = '2.3.0'
+
+
+def upgrade():
+    """Add ``updated_at`` column to ``task_instance``, with an index."""
+    with op.batch_alter_table("task_instance") as batch_op:
+        batch_op.add_column(Column("updated_at", TIMESTAMP, nullable=True))
+        batch_op.create_index("ti_updated_at", ["updated_at"])
+
+
+def downgrade():
+    """Remove ``updated_at`` column from ``task_instance``."""
+    with op.batch_alter_table("task_instance") as batch_op:
+        batch_op.drop_index("ti_updated_at")
+        batch_op.drop_column("updated_at")
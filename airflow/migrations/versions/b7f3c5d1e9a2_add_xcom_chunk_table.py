@@ -0,0 +1,64 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Add ``xcom_chunk`` table to store large XCom values over several rows.
+
+Revision ID: b7f3c5d1e9a2
+Revises: c306b5b5ae4a
+Create Date: 2022-03-01 10:12:44.517391
+"""
+
+from alembic import op
+from sqlalchemy import Column, ForeignKeyConstraint, Integer, LargeBinary
+
+from airflow.migrations.db_types import TIMESTAMP, StringID
+
+# Revision identifiers, used by Alembic.
+revision = "b7f3c5d1e9a2"
+down_revision = "c306b5b5ae4a"
+branch_labels = None
+depends_on = None
+airflow_version = '2.3.0'
+
+
+def upgrade():
+    """Add ``xcom_chunk`` table."""
+    op.create_table(
+        "xcom_chunk",
+        Column("dag_run_id", Integer(), nullable=False, primary_key=True),
+        Column("task_id", StringID(), nullable=False, primary_key=True),
+        Column("key", StringID(length=512), nullable=False, primary_key=True),
+        Column("chunk_index", Integer(), nullable=False, primary_key=True),
+        Column("dag_id", StringID(), nullable=False),
+        Column("run_id", StringID(), nullable=False),
+        Column("data", LargeBinary, nullable=False),
+        Column("timestamp", TIMESTAMP, nullable=False),
+        ForeignKeyConstraint(
+            ["dag_run_id", "task_id", "key"],
+            ["xcom.dag_run_id", "xcom.task_id", "xcom.key"],
+            name="xcom_chunk_xcom_fkey",
+            ondelete="CASCADE",
+        ),
+    )
+    op.create_index("idx_xcom_chunk_ti_id", "xcom_chunk", ["dag_id", "task_id", "run_id"])
+
+
+def downgrade():
+    """Remove ``xcom_chunk`` table."""
+    op.drop_index("idx_xcom_chunk_ti_id", table_name="xcom_chunk")
+    op.drop_table("xcom_chunk")
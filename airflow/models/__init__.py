@@ -25,6 +25,7 @@ from airflow.models.dag import DAG, DagModel, DagTag
 from airflow.models.dagbag import DagBag
 from airflow.models.dagpickle import DagPickle
 from airflow.models.dagrun import DagRun
+from airflow.models.dagstats import DagStateStats
 from airflow.models.errors import ImportError
 from airflow.models.log import Log
 from airflow.models.mappedoperator import MappedOperator
@@ -54,6 +55,7 @@ __all__ = [
     "DagModel",
     "DagPickle",
     "DagRun",
+    "DagStateStats",
     "DagTag",
     "ImportError",
     "Log",
@@ -193,6 +193,9 @@ class AbstractOperator(LoggingMixin, DAGNode):
         - WeightRule.ABSOLUTE - only own weight
         - WeightRule.DOWNSTREAM - adds priority weight of all downstream tasks
         - WeightRule.UPSTREAM - adds priority weight of all upstream tasks
+
+        The weight stored with a serialized DAG is used if there is one, so that the relatives of the
+        task are not walked.
         """
         if self.weight_rule == WeightRule.ABSOLUTE:
             return self.priority_weight
@@ -205,6 +208,8 @@ class AbstractOperator(LoggingMixin, DAGNode):
         dag = self.get_dag()
         if dag is None:
             return self.priority_weight
+        if dag.priority_weight_totals and self.task_id in dag.priority_weight_totals:
+            return dag.priority_weight_totals[self.task_id]
         return self.priority_weight + sum(
             dag.task_dict[task_id].priority_weight
             for task_id in self.get_flat_relative_ids(upstream=upstream)
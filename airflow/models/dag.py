@@ -303,6 +303,14 @@ class DAG(LoggingMixin):
 
     parent_dag: Optional["DAG"] = None  # Gets set when DAGs are loaded
 
+    priority_weight_totals: Optional[Dict[str, int]] = None
+    """
+    ``priority_weight_total`` of the tasks not using the absolute weight rule, by task_id.
+
+    This is only known in advance for a DAG loaded from its serialized form, which stores the
+    weights computed when the DAG was serialized.
+    """
+
     def __init__(
         self,
         dag_id: str,
@@ -1304,6 +1312,18 @@ class DAG(LoggingMixin):
         ``base_date``, or more if there are manual task runs between the
         requested period, which does not count toward ``num``.
         """
+        min_date = self.get_min_date_before(base_date, num, session=session)
+        return self.get_task_instances(start_date=min_date, end_date=base_date, session=session)
+
+    @provide_session
+    def get_min_date_before(
+        self,
+        base_date: datetime,
+        num: int,
+        *,
+        session: Session = NEW_SESSION,
+    ) -> datetime:
+        """Get the earliest logical date of the task instances of :meth:`get_task_instances_before`."""
         min_date: Optional[datetime] = (
             session.query(DagRun.execution_date)
             .filter(
@@ -1318,7 +1338,7 @@ class DAG(LoggingMixin):
         )
         if min_date is None:
             min_date = timezone.utc_epoch()
-        return self.get_task_instances(start_date=min_date, end_date=base_date, session=session)
+        return min_date
 
     @provide_session
     def get_task_instances(
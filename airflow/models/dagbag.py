@@ -27,7 +27,7 @@ import traceback
 import warnings
 import zipfile
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple, Union
 
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
@@ -42,6 +42,7 @@ from airflow.exceptions import (
     AirflowTimetableInvalid,
     ParamValidationError,
 )
+from airflow.models.dagstructure import DagStructureIndex
 from airflow.stats import Stats
 from airflow.utils import timezone
 from airflow.utils.dag_cycle_tester import check_cycle
@@ -124,6 +125,8 @@ class DagBag(LoggingMixin):
         self.dags_last_fetched: Dict[str, datetime] = {}
         # Only used by SchedulerJob to compare the dag_hash to identify change in DAGs
         self.dags_hash: Dict[str, str] = {}
+        # Structure indexes built by get_structure_index, together with the DAG they were built from
+        self._dags_structure: Dict[str, Tuple[DAG, DagStructureIndex]] = {}
 
         self.dagbag_import_error_tracebacks = conf.getboolean('core', 'dagbag_import_error_tracebacks')
         self.dagbag_import_error_traceback_depth = conf.getint('core', 'dagbag_import_error_traceback_depth')
@@ -198,6 +201,7 @@ class DagBag(LoggingMixin):
                     del self.dags[dag_id]
                     del self.dags_last_fetched[dag_id]
                     del self.dags_hash[dag_id]
+                    self._dags_structure.pop(dag_id, None)
                     return None
 
                 if sd_last_updated_datetime > self.dags_last_fetched[dag_id]:
@@ -241,6 +245,28 @@ class DagBag(LoggingMixin):
                 del self.dags[dag_id]
         return self.dags.get(dag_id)
 
+    def get_structure_index(self, dag_id: str) -> Optional[DagStructureIndex]:
+        """
+        Gets the structure index of the DAG currently in the bag, as last returned by :meth:`get_dag`.
+
+        The index is built once and kept for as long as that DAG stays in the bag, i.e. until a new
+        version of the serialized DAG (with a different ``dag_hash``) is loaded.
+
+        :param dag_id: DAG Id
+        """
+        dag = self.dags.get(dag_id)
+        if not dag:
+            self._dags_structure.pop(dag_id, None)
+            return None
+
+        cached = self._dags_structure.get(dag_id)
+        if cached and cached[0] is dag:
+            return cached[1]
+
+        index = DagStructureIndex(dag, dag_hash=self.dags_hash.get(dag_id))
+        self._dags_structure[dag_id] = (dag, index)
+        return index
+
     def _add_dag_from_db(self, dag_id: str, session: Session):
         """Add DAG to DagBag from DB"""
         from airflow.models.serialized_dag import SerializedDagModel
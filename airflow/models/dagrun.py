@@ -63,6 +63,7 @@ from airflow.utils.types import NOTSET, ArgNotSet, DagRunType
 
 if TYPE_CHECKING:
     from airflow.models.dag import DAG
+    from airflow.models.dagstructure import DagStructureIndex
     from airflow.models.operator import Operator
 
 
@@ -114,8 +115,11 @@ class DagRun(Base, LoggingMixin):
     # Remove this `if` after upgrading Sphinx-AutoAPI
     if not TYPE_CHECKING and "BUILDING_AIRFLOW_DOCS" in os.environ:
         dag: "Optional[DAG]"
+        structure_index: "Optional[DagStructureIndex]"
     else:
         dag: "Optional[DAG]" = None
+        # Structure index of ``dag``, set together with it by the scheduler
+        structure_index: "Optional[DagStructureIndex]" = None
 
     __table_args__ = (
         Index('dag_id_state', dag_id, _state),
@@ -526,7 +530,10 @@ class DagRun(Base, LoggingMixin):
                     or changed_tis
                 )
 
-        leaf_task_ids = {t.task_id for t in dag.leaves}
+        if self.structure_index:
+            leaf_task_ids = self.structure_index.leaves
+        else:
+            leaf_task_ids = {t.task_id for t in dag.leaves}
         leaf_tis = [ti for ti in tis if ti.task_id in leaf_task_ids]
 
         # if all roots finished and at least one failed, the run failed
@@ -669,6 +676,10 @@ class DagRun(Base, LoggingMixin):
         # `schedulable_tis` in place and have the `for` loop pick them up
         expanded_tis: List[TI] = []
 
+        # A single context is shared by all TIs of this run, so that the finished TIs are only indexed
+        # by task_id once rather than being re-scanned for every TI's trigger rule.
+        dep_context = DepContext(flag_upstream_failed=True, finished_tis=finished_tis)
+
         # Check dependencies
         for schedulable in itertools.chain(schedulable_tis, expanded_tis):
 
@@ -689,10 +700,7 @@ class DagRun(Base, LoggingMixin):
                         break
 
             old_state = schedulable.state
-            if schedulable.are_dependencies_met(
-                dep_context=DepContext(flag_upstream_failed=True, finished_tis=finished_tis),
-                session=session,
-            ):
+            if schedulable.are_dependencies_met(dep_context=dep_context, session=session):
                 ready_tis.append(schedulable)
             else:
                 old_states[schedulable.key] = old_state
@@ -713,16 +721,14 @@ class DagRun(Base, LoggingMixin):
     ) -> bool:
         # there might be runnable tasks that are up for retry and for some reason(retry delay, etc) are
         # not ready yet so we set the flags to count them in
+        dep_context = DepContext(
+            flag_upstream_failed=True,
+            ignore_in_retry_period=True,
+            ignore_in_reschedule_period=True,
+            finished_tis=finished_tis,
+        )
         for ut in unfinished_tis:
-            if ut.are_dependencies_met(
-                dep_context=DepContext(
-                    flag_upstream_failed=True,
-                    ignore_in_retry_period=True,
-                    ignore_in_reschedule_period=True,
-                    finished_tis=finished_tis,
-                ),
-                session=session,
-            ):
+            if ut.are_dependencies_met(dep_context=dep_context, session=session):
                 return True
         return False
 
@@ -834,9 +840,12 @@ class DagRun(Base, LoggingMixin):
 
         if hook_is_noop:
 
+            structure_index = self.structure_index
+
             def create_ti_mapping(task: "Operator") -> dict:
                 created_counts[task.task_type] += 1
-                return TI.insert_mapping(self.run_id, task, map_index=-1)
+                priority_weight = structure_index.priority_weight(task.task_id) if structure_index else None
+                return TI.insert_mapping(self.run_id, task, map_index=-1, priority_weight=priority_weight)
 
         else:
 
@@ -0,0 +1,219 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Table to store the counts of the states of the runs of the DAGs shown on the home page."""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional, Set
+
+from sqlalchemy import Column, and_, func
+from sqlalchemy.orm import Session, synonym
+
+from airflow.models.base import Base, StringID
+from airflow.models.dagrun import DagRun
+from airflow.models.taskinstance import TaskInstance
+from airflow.utils import timezone
+from airflow.utils.helpers import chunks
+from airflow.utils.session import NEW_SESSION, provide_session
+from airflow.utils.sqlalchemy import ExtendedJSON, UtcDateTime
+from airflow.utils.state import DagRunState
+
+# Number of DAGs whose stats are computed with each set of queries
+_REFRESH_CHUNK_SIZE = 500
+
+# The columns of the latest run of a DAG shown on the home page
+_LAST_DAG_RUN_COLUMNS = (
+    "start_date",
+    "end_date",
+    "state",
+    "execution_date",
+    "data_interval_start",
+    "data_interval_end",
+)
+
+
+def _state_counts(column_name: str):
+    """
+    Get the counts by state stored as ``[state, count]`` pairs in ``column_name`` as a dict, as
+    the keys of JSON objects cannot be null.
+    """
+
+    def get_counts(self) -> Dict[Optional[str], int]:
+        return {state: count for state, count in getattr(self, column_name)}
+
+    def set_counts(self, counts: Dict[Optional[str], int]) -> None:
+        setattr(self, column_name, [[state, count] for state, count in counts.items()])
+
+    return synonym(column_name, descriptor=property(get_counts, set_counts))
+
+
+class DagStateStats(Base):
+    """
+    Counts of the states of the runs of a DAG and of their task instances, and its latest run.
+
+    They are shown on the home page, which then looks up a row by DAG instead of counting the
+    states of all the runs and task instances of the DAGs shown. Every
+    ``[scheduler] dag_stats_update_interval`` seconds, the scheduler refreshes the stats of the DAGs
+    with runs queued or running, and of those that had some at its previous refresh. The stats of
+    all the DAGs are refreshed every ``[scheduler] dag_stats_reconcile_interval`` seconds, to take
+    into account the changes made to finished runs.
+    """
+
+    __tablename__ = "dag_state_stats"
+
+    dag_id = Column(StringID(), primary_key=True)
+    # Number of runs by state
+    _dag_run_states = Column("dag_run_states", ExtendedJSON, nullable=False)
+    dag_run_states = _state_counts("_dag_run_states")
+    # Number of task instances of the running runs by state
+    _running_task_states = Column("running_task_states", ExtendedJSON, nullable=False)
+    running_task_states = _state_counts("_running_task_states")
+    # Number of task instances of the latest run not running by state
+    _last_run_task_states = Column("last_run_task_states", ExtendedJSON, nullable=False)
+    last_run_task_states = _state_counts("_last_run_task_states")
+    # The latest run, or None if there is none
+    last_dag_run = Column(ExtendedJSON, nullable=True)
+    updated_at = Column(UtcDateTime, nullable=False)
+
+    def __init__(
+        self,
+        dag_id: str,
+        dag_run_states: Optional[Dict[Optional[str], int]] = None,
+        running_task_states: Optional[Dict[Optional[str], int]] = None,
+        last_run_task_states: Optional[Dict[Optional[str], int]] = None,
+        last_dag_run: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__()
+        self.dag_id = dag_id
+        self.dag_run_states = dag_run_states or {}
+        self.running_task_states = running_task_states or {}
+        self.last_run_task_states = last_run_task_states or {}
+        self.last_dag_run = last_dag_run
+        self.updated_at = timezone.utcnow()
+
+    def __repr__(self):
+        return f"<DagStateStats: {self.dag_id}>"
+
+    @classmethod
+    def compute(cls, dag_ids: Iterable[str], session: Session) -> Dict[str, "DagStateStats"]:
+        """Compute the stats of ``dag_ids`` without storing them."""
+        stats: Dict[str, DagStateStats] = {}
+        for dag_id_chunk in chunks(sorted(set(dag_ids)), _REFRESH_CHUNK_SIZE):
+            dag_run_states: Dict[str, Dict[Optional[str], int]] = defaultdict(dict)
+            running_task_states: Dict[str, Dict[Optional[str], int]] = defaultdict(dict)
+            last_run_task_states: Dict[str, Dict[Optional[str], int]] = defaultdict(dict)
+            last_dag_runs: Dict[str, Dict[str, Any]] = {}
+
+            dag_run_state_counts = (
+                session.query(DagRun.dag_id, DagRun.state, func.count(DagRun.state))
+                .filter(DagRun.dag_id.in_(dag_id_chunk))
+                .group_by(DagRun.dag_id, DagRun.state)
+            )
+            for dag_id, state, count in dag_run_state_counts:
+                dag_run_states[dag_id][state] = count
+
+            running_task_state_counts = (
+                session.query(TaskInstance.dag_id, TaskInstance.state, func.count())
+                .join(TaskInstance.dag_run)
+                .filter(DagRun.dag_id.in_(dag_id_chunk), DagRun.state == DagRunState.RUNNING)
+                .group_by(TaskInstance.dag_id, TaskInstance.state)
+            )
+            for dag_id, state, count in running_task_state_counts:
+                running_task_states[dag_id][state] = count
+
+            last_run = (
+                session.query(DagRun.dag_id, func.max(DagRun.execution_date).label('execution_date'))
+                .filter(DagRun.dag_id.in_(dag_id_chunk), DagRun.state != DagRunState.RUNNING)
+                .group_by(DagRun.dag_id)
+                .subquery('last_run')
+            )
+            last_run_task_state_counts = (
+                session.query(TaskInstance.dag_id, TaskInstance.state, func.count())
+                .join(TaskInstance.dag_run)
+                .join(
+                    last_run,
+                    and_(
+                        last_run.c.dag_id == DagRun.dag_id,
+                        last_run.c.execution_date == DagRun.execution_date,
+                    ),
+                )
+                .group_by(TaskInstance.dag_id, TaskInstance.state)
+            )
+            for dag_id, state, count in last_run_task_state_counts:
+                last_run_task_states[dag_id][state] = count
+
+            latest_run = (
+                session.query(DagRun.dag_id, func.max(DagRun.execution_date).label('execution_date'))
+                .filter(DagRun.dag_id.in_(dag_id_chunk))
+                .group_by(DagRun.dag_id)
+                .subquery('latest_run')
+            )
+            latest_runs = session.query(
+                DagRun.dag_id, *(getattr(DagRun, column) for column in _LAST_DAG_RUN_COLUMNS)
+            ).join(
+                latest_run,
+                and_(
+                    latest_run.c.dag_id == DagRun.dag_id,
+                    latest_run.c.execution_date == DagRun.execution_date,
+                ),
+            )
+            for dag_id, *values in latest_runs:
+                last_dag_runs[dag_id] = dict(zip(_LAST_DAG_RUN_COLUMNS, values))
+
+            for dag_id in dag_id_chunk:
+                stats[dag_id] = cls(
+                    dag_id,
+                    dag_run_states=dag_run_states[dag_id],
+                    running_task_states=running_task_states[dag_id],
+                    last_run_task_states=last_run_task_states[dag_id],
+                    last_dag_run=last_dag_runs.get(dag_id),
+                )
+        return stats
+
+    @classmethod
+    @provide_session
+    def refresh(cls, dag_ids: Iterable[str], session: Session = NEW_SESSION) -> None:
+        """Compute and store the stats of ``dag_ids``."""
+        for stats in cls.compute(dag_ids, session).values():
+            session.merge(stats)
+        session.flush()
+
+    @classmethod
+    @provide_session
+    def get(cls, dag_ids: Iterable[str], session: Session = NEW_SESSION) -> Dict[str, "DagStateStats"]:
+        """
+        Get the stats of ``dag_ids``, computing those of the DAGs that have not been stored yet,
+        which are not stored.
+        """
+        dag_ids = set(dag_ids)
+        stats: Dict[str, DagStateStats] = {}
+        for dag_id_chunk in chunks(sorted(dag_ids), _REFRESH_CHUNK_SIZE):
+            stats.update((row.dag_id, row) for row in session.query(cls).filter(cls.dag_id.in_(dag_id_chunk)))
+        missing_dag_ids = dag_ids.difference(stats)
+        if missing_dag_ids:
+            stats.update(cls.compute(missing_dag_ids, session))
+        return stats
+
+    @staticmethod
+    @provide_session
+    def get_dag_ids_with_unfinished_runs(session: Session = NEW_SESSION) -> Set[str]:
+        """Get the DAGs with runs queued or running, whose stats change as their tasks run."""
+        query = session.query(DagRun.dag_id).filter(
+            DagRun.state.in_([DagRunState.QUEUED, DagRunState.RUNNING])
+        )
+        return {dag_id for dag_id, in query.distinct()}
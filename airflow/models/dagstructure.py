@@ -0,0 +1,216 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Compact, immutable index of the structure of a DAG."""
+from array import array
+from collections import defaultdict, deque
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from airflow.exceptions import AirflowException
+from airflow.utils.weight_rule import WeightRule
+
+if TYPE_CHECKING:
+    from airflow.models.dag import DAG
+    from airflow.models.operator import Operator
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+class DagStructureIndex:
+    """
+    Structure of a DAG computed once and shared by everything that needs it.
+
+    Tasks are numbered ``0..n-1`` in the order of ``dag.task_dict``. The upstream and downstream
+    edges are stored as CSR-style arrays: the relatives of task ``i`` are
+    ``indices[indptr[i]:indptr[i + 1]]``. The topological order and the total priority weight of
+    every task (according to its own weight rule) are precomputed.
+
+    An index is only valid for the exact DAG it was built from; ``dag_hash`` records the version
+    of the serialized DAG it was built from, if known.
+
+    :param dag: The DAG to index
+    :param dag_hash: Hash of the serialized DAG ``dag`` was loaded from
+    """
+
+    __slots__ = (
+        "dag_id",
+        "dag_hash",
+        "task_ids",
+        "_task_index",
+        "_upstream_indptr",
+        "_upstream_indices",
+        "_downstream_indptr",
+        "_downstream_indices",
+        "_topological_order",
+        "_priority_weights",
+        "roots",
+        "leaves",
+    )
+
+    def __init__(self, dag: "DAG", dag_hash: Optional[str] = None):
+        self.dag_id: str = dag.dag_id
+        self.dag_hash = dag_hash
+        self.task_ids: Tuple[str, ...] = tuple(dag.task_dict)
+        self._task_index: Dict[str, int] = {task_id: i for i, task_id in enumerate(self.task_ids)}
+
+        task_index = self._task_index
+        tasks = [dag.task_dict[task_id] for task_id in self.task_ids]
+        self._upstream_indptr, self._upstream_indices = self._build_csr(
+            [[task_index[t] for t in task.upstream_task_ids if t in task_index] for task in tasks]
+        )
+        self._downstream_indptr, self._downstream_indices = self._build_csr(
+            [[task_index[t] for t in task.downstream_task_ids if t in task_index] for task in tasks]
+        )
+        self._topological_order = self._sort_topologically()
+
+        # Ids of the tasks without upstream tasks, and of the tasks without downstream tasks
+        self.roots: FrozenSet[str] = self._without_relatives(self._upstream_indptr)
+        self.leaves: FrozenSet[str] = self._without_relatives(self._downstream_indptr)
+        self._priority_weights = self._stored_priority_weights(dag, tasks) or self._compute_priority_weights(
+            [task.priority_weight for task in tasks], [task.weight_rule for task in tasks]
+        )
+
+    def __len__(self) -> int:
+        return len(self.task_ids)
+
+    def __repr__(self) -> str:
+        return f"<DagStructureIndex: {self.dag_id} ({len(self)} tasks, hash={self.dag_hash})>"
+
+    @staticmethod
+    def _build_csr(adjacency: List[List[int]]) -> Tuple[array, array]:
+        indptr = array("i", [0])
+        indices = array("i")
+        for relatives in adjacency:
+            indices.extend(sorted(relatives))
+            indptr.append(len(indices))
+        return indptr, indices
+
+    def _without_relatives(self, indptr: array) -> FrozenSet[str]:
+        return frozenset(task_id for i, task_id in enumerate(self.task_ids) if indptr[i] == indptr[i + 1])
+
+    def _relatives(self, indptr: array, indices: array, i: int) -> Sequence[int]:
+        return indices[indptr[i] : indptr[i + 1]]
+
+    def _sort_topologically(self) -> array:
+        """Kahn's algorithm, visiting ready tasks in ``task_dict`` order."""
+        num_tasks = len(self.task_ids)
+        in_degree = [self._upstream_indptr[i + 1] - self._upstream_indptr[i] for i in range(num_tasks)]
+        ready = deque(i for i in range(num_tasks) if not in_degree[i])
+        order = array("i")
+        while ready:
+            i = ready.popleft()
+            order.append(i)
+            for j in self._relatives(self._downstream_indptr, self._downstream_indices, i):
+                in_degree[j] -= 1
+                if not in_degree[j]:
+                    ready.append(j)
+        if len(order) != num_tasks:
+            raise AirflowException(f"A cyclic dependency occurred in dag: {self.dag_id}")
+        return order
+
+    @staticmethod
+    def _stored_priority_weights(dag: "DAG", tasks: List["Operator"]) -> Optional[Tuple[int, ...]]:
+        """Read ``priority_weight_total`` of every task from the weights stored in a serialized DAG."""
+        stored = dag.priority_weight_totals
+        if stored is None:
+            return None
+        weights = []
+        for task in tasks:
+            if task.weight_rule == WeightRule.ABSOLUTE:
+                weights.append(task.priority_weight)
+            elif task.task_id in stored:
+                weights.append(stored[task.task_id])
+            else:
+                # The DAG was changed since it was deserialized
+                return None
+        return tuple(weights)
+
+    def _compute_priority_weights(self, weights: List[int], weight_rules: List[str]) -> Tuple[int, ...]:
+        """
+        Compute ``priority_weight_total`` of every task in a single pass in each direction.
+
+        The set of all upstream (or downstream) tasks of a task is kept as an integer bitmask, built
+        from the bitmasks of its direct relatives. The total weight of a set is then the sum over the
+        distinct weights of ``weight * popcount(mask & tasks_with_that_weight)``, which avoids walking
+        the relatives of every task one by one.
+        """
+        num_tasks = len(weights)
+        masks_by_weight: Dict[int, int] = defaultdict(int)
+        for i, weight in enumerate(weights):
+            masks_by_weight[weight] |= 1 << i
+
+        def relative_masks(indptr: array, indices: array, order: Sequence[int]) -> List[int]:
+            masks = [0] * num_tasks
+            for i in order:
+                mask = 0
+                for j in self._relatives(indptr, indices, i):
+                    mask |= masks[j] | (1 << j)
+                masks[i] = mask
+            return masks
+
+        upstream_masks: List[int] = []
+        downstream_masks: List[int] = []
+        if any(rule == WeightRule.UPSTREAM for rule in weight_rules):
+            upstream_masks = relative_masks(
+                self._upstream_indptr, self._upstream_indices, self._topological_order
+            )
+        if any(rule not in (WeightRule.ABSOLUTE, WeightRule.UPSTREAM) for rule in weight_rules):
+            downstream_masks = relative_masks(
+                self._downstream_indptr, self._downstream_indices, self._topological_order[::-1]
+            )
+
+        totals = []
+        for i, (weight, rule) in enumerate(zip(weights, weight_rules)):
+            if rule == WeightRule.ABSOLUTE:
+                totals.append(weight)
+                continue
+            mask = upstream_masks[i] if rule == WeightRule.UPSTREAM else downstream_masks[i]
+            totals.append(weight + sum(w * _popcount(mask & m) for w, m in masks_by_weight.items()))
+        return tuple(totals)
+
+    def index_of(self, task_id: str) -> int:
+        """Integer id of ``task_id``."""
+        return self._task_index[task_id]
+
+    def has_task(self, task_id: str) -> bool:
+        """Whether ``task_id`` is a task of the indexed DAG."""
+        return task_id in self._task_index
+
+    def upstream_task_ids(self, task_id: str) -> Tuple[str, ...]:
+        """Task ids directly upstream of ``task_id``."""
+        i = self._task_index[task_id]
+        return tuple(
+            self.task_ids[j] for j in self._relatives(self._upstream_indptr, self._upstream_indices, i)
+        )
+
+    def downstream_task_ids(self, task_id: str) -> Tuple[str, ...]:
+        """Task ids directly downstream of ``task_id``."""
+        i = self._task_index[task_id]
+        return tuple(
+            self.task_ids[j] for j in self._relatives(self._downstream_indptr, self._downstream_indices, i)
+        )
+
+    @property
+    def topological_order(self) -> Tuple[str, ...]:
+        """Task ids sorted such that a task comes after all of its upstream tasks."""
+        return tuple(self.task_ids[i] for i in self._topological_order)
+
+    def priority_weight(self, task_id: str) -> int:
+        """Same as ``priority_weight_total`` of the task, without walking its relatives."""
+        return self._priority_weights[self._task_index[task_id]]
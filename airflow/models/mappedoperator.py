@@ -599,6 +599,7 @@ class MappedOperator(AbstractOperator):
         """
         if not jinja_env:
             jinja_env = self.get_template_env()
+        self._pull_xcom_args(context)
         unmapped_task = self.unmap()
         self._do_render_template_fields(
             parent=unmapped_task,
@@ -609,6 +610,22 @@ class MappedOperator(AbstractOperator):
         )
         return unmapped_task
 
+    def _pull_xcom_args(self, context: Context) -> None:
+        """Pull the XComs this task's arguments refer to with a single query.
+
+        The task instance keeps them for the rest of the run, so resolving each
+        XComArg while rendering does not go back to the database.
+        """
+        from airflow.models.xcom_arg import XComArg
+
+        xcom_refs = {
+            (xcom_arg.operator.task_id, str(xcom_arg.key))
+            for kwargs in (self.partial_kwargs, self._get_expansion_kwargs())
+            for xcom_arg in XComArg.iter_xcom_args(kwargs)
+        }
+        if xcom_refs:
+            context["ti"].xcom_pull_many(xcom_refs)
+
     def _render_template_field(
         self,
         key: str,
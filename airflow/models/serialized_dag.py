@@ -33,8 +33,14 @@ from airflow.models.base import ID_LEN, Base
 from airflow.models.dag import DAG, DagModel
 from airflow.models.dagcode import DagCode
 from airflow.models.dagrun import DagRun
+from airflow.serialization import compact
 from airflow.serialization.serialized_objects import DagDependency, SerializedDAG
-from airflow.settings import COMPRESS_SERIALIZED_DAGS, MIN_SERIALIZED_DAG_UPDATE_INTERVAL, json
+from airflow.settings import (
+    COMPRESS_SERIALIZED_DAGS,
+    MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
+    SERIALIZED_DAG_FORMAT,
+    json,
+)
 from airflow.utils import timezone
 from airflow.utils.session import provide_session
 from airflow.utils.sqlalchemy import UtcDateTime
@@ -56,6 +62,9 @@ class SerializedDagModel(Base):
       to use a smaller interval such as 60
     * ``[core] compress_serialized_dags``:
       whether compressing the dag data to the Database.
+    * ``[core] serialized_dag_format``:
+      ``compact`` stores the dag data in a binary format whose tasks are only
+      deserialized when accessed (see :mod:`airflow.serialization.compact`).
 
     It is used by webserver to load dags
     because reading from database is lightweight compared to importing from files,
@@ -103,7 +112,10 @@ class SerializedDagModel(Base):
 
         self.dag_hash = hashlib.md5(dag_data_json).hexdigest()
 
-        if COMPRESS_SERIALIZED_DAGS:
+        if SERIALIZED_DAG_FORMAT == "compact":
+            self._data = None
+            self._data_compressed = compact.encode(dag_data)
+        elif COMPRESS_SERIALIZED_DAGS:
             self._data = None
             self._data_compressed = zlib.compress(dag_data_json)
         else:
@@ -193,7 +205,9 @@ class SerializedDagModel(Base):
     def data(self):
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "__data_cache") or self.__data_cache is None:
-            if self._data_compressed:
+            if compact.is_compact(self._data_compressed):
+                self.__data_cache = compact.CompactDagReader(self._data_compressed).to_dict()
+            elif self._data_compressed:
                 self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
             else:
                 self.__data_cache = self._data
@@ -205,7 +219,9 @@ class SerializedDagModel(Base):
         """The DAG deserialized from the ``data`` column"""
         SerializedDAG._load_operator_extra_links = self.load_op_links
 
-        if isinstance(self.data, dict):
+        if compact.is_compact(self._data_compressed):
+            dag = SerializedDAG.from_compact(self._data_compressed)
+        elif isinstance(self.data, dict):
             dag = SerializedDAG.from_dict(self.data)  # type: Any
         else:
             dag = SerializedDAG.from_json(self.data)
@@ -96,7 +96,7 @@ from airflow.models.param import ParamsDict
 from airflow.models.taskfail import TaskFail
 from airflow.models.taskmap import TaskMap
 from airflow.models.taskreschedule import TaskReschedule
-from airflow.models.xcom import XCOM_RETURN_KEY, XCom
+from airflow.models.xcom import XCOM_RETURN_KEY, XCom, XComChunkReader
 from airflow.plugins_manager import integrate_macros_plugins
 from airflow.sentry import Sentry
 from airflow.stats import Stats
@@ -131,6 +131,33 @@ if TYPE_CHECKING:
 
 _EXECUTION_FRAME_MAPPING: "WeakKeyDictionary[Operator, FrameType]" = WeakKeyDictionary()
 
+# Placeholder for XCom values that have not been deserialized yet
+_NOT_DESERIALIZED = object()
+
+
+class _CachedXCom:
+    """XCom pulled by a task instance, deserialized when its value is first needed."""
+
+    __slots__ = ('_row', '_value')
+
+    def __init__(self, row):
+        self._row = row
+        self._value = _NOT_DESERIALIZED
+
+    @property
+    def value(self) -> Any:
+        if self._value is _NOT_DESERIALIZED:
+            # Since we're only fetching the values field, and not the
+            # whole class, the @recreate annotation does not kick in.
+            # Therefore we need to deserialize the fields by ourselves.
+            value = XCom.deserialize_value(self._row)
+            if isinstance(value, XComChunkReader):
+                # Every pull needs a reader of its own
+                return value
+            self._value = value
+            self._row = None
+        return self._value
+
 
 @contextlib.contextmanager
 def set_current_context(context: Context) -> Iterator[Context]:
@@ -381,6 +408,10 @@ class TaskInstance(Base, LoggingMixin):
     next_method = Column(String(1000))
     next_kwargs = Column(ExtendedJSON)
 
+    # When the row was last written, so that the UI can find the task instances changed since a time
+    # even when their dates did not move, e.g. when they are marked as success
+    updated_at = Column(UtcDateTime, default=timezone.utcnow, onupdate=timezone.utcnow)
+
     # If adding new fields here then remember to add them to
     # refresh_from_db() or they won't display in the UI correctly
 
@@ -392,6 +423,7 @@ class TaskInstance(Base, LoggingMixin):
         Index('ti_pool', pool, state, priority_weight),
         Index('ti_job_id', job_id),
         Index('ti_trigger_id', trigger_id),
+        Index('ti_updated_at', updated_at),
         ForeignKeyConstraint(
             [trigger_id],
             ['trigger.id'],
@@ -493,8 +525,12 @@ class TaskInstance(Base, LoggingMixin):
         self.test_mode = False
 
     @staticmethod
-    def insert_mapping(run_id: str, task: "Operator", map_index: int) -> dict:
+    def insert_mapping(
+        run_id: str, task: "Operator", map_index: int, priority_weight: Optional[int] = None
+    ) -> dict:
         """:meta private:"""
+        if priority_weight is None:
+            priority_weight = task.priority_weight_total
         return {
             'dag_id': task.dag_id,
             'task_id': task.task_id,
@@ -505,7 +541,7 @@ class TaskInstance(Base, LoggingMixin):
             'queue': task.queue,
             'pool': task.pool,
             'pool_slots': task.pool_slots,
-            'priority_weight': task.priority_weight_total,
+            'priority_weight': priority_weight,
             'run_as_user': task.run_as_user,
             'max_tries': task.retries,
             'executor_config': task.executor_config,
@@ -517,6 +553,8 @@ class TaskInstance(Base, LoggingMixin):
     def init_on_load(self):
         """Initialize the attributes that aren't stored in the DB"""
         self.test_mode = False  # can be changed when calling 'run'
+        # XComs of the current DAG run pulled so far, by (dag_id, task_id, key)
+        self._xcom_cache: Dict[Tuple[str, str, str], _CachedXCom] = {}
 
     @property
     def try_number(self):
@@ -796,6 +834,7 @@ class TaskInstance(Base, LoggingMixin):
             self.trigger_id = ti.trigger_id
             self.next_method = ti.next_method
             self.next_kwargs = ti.next_kwargs
+            self.updated_at = ti.updated_at
         else:
             self.state = None
 
@@ -825,6 +864,7 @@ class TaskInstance(Base, LoggingMixin):
         :param session: SQLAlchemy ORM Session
         """
         self.log.debug("Clearing XCom data")
+        self._xcom_cache.clear()
         XCom.clear(
             dag_id=self.dag_id,
             task_id=self.task_id,
@@ -1317,6 +1357,7 @@ class TaskInstance(Base, LoggingMixin):
         :param session: SQLAlchemy ORM Session
         """
         self.test_mode = test_mode
+        self._xcom_cache.clear()
         self.refresh_from_task(self.task, pool_override=pool)
         self.refresh_from_db(session=session)
         self.job_id = job_id
@@ -1558,6 +1599,8 @@ class TaskInstance(Base, LoggingMixin):
         trigger_row = Trigger.from_object(defer.trigger)
         session.add(trigger_row)
         session.flush()
+        # Have the triggerers pick it up as soon as this transaction commits
+        Trigger.notify_created(trigger_row.id, session)
 
         # Then, update ourselves so it matches the deferral request
         # Keep an eye on the logic in `check_and_change_state_before_execution()`
@@ -2212,6 +2255,7 @@ class TaskInstance(Base, LoggingMixin):
                 message = "Passing 'execution_date' to 'TaskInstance.xcom_push()' is deprecated."
                 warnings.warn(message, DeprecationWarning, stacklevel=3)
 
+        self._xcom_cache.pop((self.dag_id, self.task_id, key), None)
         XCom.set(
             key=key,
             value=value,
@@ -2274,16 +2318,65 @@ class TaskInstance(Base, LoggingMixin):
         if task_ids is None or isinstance(task_ids, str):
             xcom = query.with_entities(XCom.value).first()
             if xcom:
-                return XCom.deserialize_value(xcom)
+                return XCom.deserialize_value(xcom, session=session)
         else:
             vals_kv = {
-                result.task_id: XCom.deserialize_value(result)
+                result.task_id: XCom.deserialize_value(result, session=session)
                 for result in query.with_entities(XCom.task_id, XCom.value)
             }
 
             values_ordered_by_id = [vals_kv.get(task_id) for task_id in task_ids]
             return values_ordered_by_id
 
+    @provide_session
+    def xcom_pull_many(
+        self,
+        xcom_refs: Iterable[Tuple[str, str]],
+        dag_id: Optional[str] = None,
+        session: Session = NEW_SESSION,
+    ) -> Dict[Tuple[str, str], Any]:
+        """
+        Pull the XComs of this DAG run for many ``(task_id, key)`` pairs at once.
+
+        XComs that were not pulled before by this task instance are fetched in a
+        single query, and kept for the rest of the task run: pulling them again
+        with this method does not query the database, so it must only be used for
+        XComs that do not change while the task runs, such as the ones of the
+        upstream tasks of XComArgs. Values are only deserialized when they are
+        first returned. Unlike this method, :meth:`xcom_pull` always reads the
+        current values.
+
+        :param xcom_refs: ``(task_id, key)`` pairs of the XComs to pull.
+        :param dag_id: If provided, pulls XComs from this DAG. If None (default),
+            the DAG of the calling task is used.
+        :param session: Sqlalchemy ORM Session
+        :return: The value of every pair that has an XCom, by ``(task_id, key)``.
+            Pairs without an XCom are left out.
+        """
+        if dag_id is None:
+            dag_id = self.dag_id
+        xcom_refs = list(xcom_refs)
+
+        missing = [ref for ref in xcom_refs if (dag_id, *ref) not in self._xcom_cache]
+        if missing:
+            query = XCom.get_many(
+                run_id=self.run_id,
+                dag_ids=dag_id,
+                task_ids={task_id for task_id, _ in missing},
+                session=session,
+            ).filter(XCom.key.in_({key for _, key in missing}))
+            # Rows for pairs that were not asked for, but share their task_id and key with some
+            # that were, are cached too -- they belong to the same DAG run all the same.
+            for row in query.with_entities(XCom.task_id, XCom.key, XCom.value):
+                self._xcom_cache.setdefault((dag_id, row.task_id, row.key), _CachedXCom(row))
+
+        values = {}
+        for task_id, key in xcom_refs:
+            cached = self._xcom_cache.get((dag_id, task_id, key))
+            if cached is not None:
+                values[task_id, key] = cached.value
+        return values
+
     @provide_session
     def get_num_running_task_instances(self, session):
         """Return Number of running TIs from the DB"""
@@ -16,16 +16,17 @@
 # under the License.
 import datetime
 from traceback import format_exception
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from sqlalchemy import Column, Integer, String, func, or_
+from sqlalchemy import Column, Integer, String, func, or_, text
 
+from airflow.configuration import conf
 from airflow.models.base import Base
 from airflow.models.taskinstance import TaskInstance
-from airflow.triggers.base import BaseTrigger
+from airflow.triggers.base import BaseTrigger, TriggerEvent
 from airflow.utils import timezone
 from airflow.utils.session import provide_session
-from airflow.utils.sqlalchemy import ExtendedJSON, UtcDateTime
+from airflow.utils.sqlalchemy import ExtendedJSON, UtcDateTime, with_row_locks
 from airflow.utils.state import State
 
 
@@ -48,6 +49,9 @@ class Trigger(Base):
 
     __tablename__ = "trigger"
 
+    # PostgreSQL channel on which the creation of triggers is notified to the triggerers
+    NOTIFICATION_CHANNEL = "airflow_trigger_created"
+
     id = Column(Integer, primary_key=True)
     classpath = Column(String(1000), nullable=False)
     kwargs = Column(ExtendedJSON, nullable=False)
@@ -104,6 +108,42 @@ class Trigger(Base):
         # ...and delete them (we can't do this in one query due to MySQL)
         session.query(Trigger).filter(Trigger.id.in_(ids)).delete(synchronize_session=False)
 
+    @staticmethod
+    def notifications_supported(session) -> bool:
+        """Whether the creation of triggers is notified to the triggerers through this database."""
+        return session.get_bind().dialect.name == "postgresql" and conf.getboolean(
+            'triggerer', 'trigger_notifications', fallback=True
+        )
+
+    @classmethod
+    def notify_created(cls, trigger_id: int, session) -> None:
+        """
+        Tells the triggerers that a trigger was created, so they load it right away
+        instead of on their next poll of the trigger table.
+
+        The notification is sent when the transaction of ``session`` commits, and
+        only on PostgreSQL; the triggerers poll the table on other databases. Its
+        payload is the ID of the trigger, so that only one shard of each host wakes
+        up for it (see :meth:`is_for_shard`).
+        """
+        if cls.notifications_supported(session):
+            session.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": cls.NOTIFICATION_CHANNEL, "payload": str(trigger_id)},
+            )
+
+    @staticmethod
+    def is_for_shard(payload: str, shard: int, shards: int) -> bool:
+        """
+        Whether the shard ``shard`` of ``shards`` should load the trigger notified
+        with ``payload``; notifications without a trigger ID are for every shard.
+        """
+        try:
+            trigger_id = int(payload)
+        except ValueError:
+            return True
+        return trigger_id % shards == shard
+
     @classmethod
     @provide_session
     def submit_event(cls, trigger_id, event, session=None):
@@ -111,12 +151,29 @@ class Trigger(Base):
         Takes an event from an instance of itself, and triggers all dependent
         tasks to resume.
         """
+        cls.submit_events([(trigger_id, event)], session=session)
+
+    @classmethod
+    @provide_session
+    def submit_events(cls, events: Iterable[Tuple[int, TriggerEvent]], session=None):
+        """
+        Takes events from several triggers, and triggers all their dependent
+        tasks to resume, loading those in a single query.
+
+        Only the first event of each trigger is used, as the tasks no longer
+        wait on the trigger once they get it.
+        """
+        payloads: Dict[int, Any] = {}
+        for trigger_id, event in events:
+            payloads.setdefault(trigger_id, event.payload)
+        if not payloads:
+            return
         for task_instance in session.query(TaskInstance).filter(
-            TaskInstance.trigger_id == trigger_id, TaskInstance.state == State.DEFERRED
+            TaskInstance.trigger_id.in_(payloads), TaskInstance.state == State.DEFERRED
         ):
             # Add the event's payload into the kwargs for the task
             next_kwargs = task_instance.next_kwargs or {}
-            next_kwargs["event"] = event.payload
+            next_kwargs["event"] = payloads[task_instance.trigger_id]
             task_instance.next_kwargs = next_kwargs
             # Remove ourselves as its trigger
             task_instance.trigger_id = None
@@ -185,14 +242,16 @@ class Trigger(Base):
 
         # Find triggers who do NOT have an alive triggerer_id, and then assign
         # up to `capacity` of those to us.
-        trigger_ids_query = (
-            session.query(cls.id)
-            # notin_ doesn't find NULL rows
-            .filter(or_(cls.triggerer_id.is_(None), cls.triggerer_id.notin_(alive_triggerer_ids)))
-            .limit(capacity)
-            .all()
-        )
-        session.query(cls).filter(cls.id.in_([i.id for i in trigger_ids_query])).update(
+        # notin_ doesn't find NULL rows
+        unassigned = or_(cls.triggerer_id.is_(None), cls.triggerer_id.notin_(alive_triggerer_ids))
+        # Skip the rows another triggerer (e.g. another shard of this host) is claiming right now
+        trigger_ids_query = with_row_locks(
+            session.query(cls.id).filter(unassigned).limit(capacity),
+            session,
+            skip_locked=True,
+        ).all()
+        # Only claim triggers still unassigned, in case the rows could not be locked
+        session.query(cls).filter(cls.id.in_([i.id for i in trigger_ids_query]), unassigned).update(
             {cls.triggerer_id: triggerer_id},
             synchronize_session=False,
         )
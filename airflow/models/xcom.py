@@ -18,21 +18,24 @@
 
 import datetime
 import inspect
+import io
 import json
 import logging
 import pickle
 import warnings
-from functools import wraps
-from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Type, Union, cast, overload
+from functools import partial, wraps
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, Optional, Type, Union, cast, overload
 
 import pendulum
-from sqlalchemy import Column, Index, Integer, LargeBinary, String
+from sqlalchemy import Column, ForeignKeyConstraint, Index, Integer, LargeBinary, String
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import Query, Session, reconstructor, relationship
 from sqlalchemy.orm.exc import NoResultFound
 
+from airflow import settings
 from airflow.configuration import conf
 from airflow.models.base import COLLATION_ARGS, ID_LEN, Base
+from airflow.stats import Stats
 from airflow.utils import timezone
 from airflow.utils.helpers import exactly_one, is_container
 from airflow.utils.log.logging_mixin import LoggingMixin
@@ -50,10 +53,159 @@ XCOM_RETURN_KEY = 'return_value'
 # run without storing it in the database.
 IN_MEMORY_RUN_ID = "__airflow_in_memory_dagrun__"
 
+# Starts the value of XComs stored in the xcom_chunk table. Neither JSON nor
+# pickles start with a NUL byte, so it cannot be mistaken for a stored value.
+CHUNKED_XCOM_MARKER = b"\x00AIRFLOW-XCOM-CHUNKS"
+
 if TYPE_CHECKING:
     from airflow.models.taskinstance import TaskInstanceKey
 
 
+class XComChunk(Base):
+    """Part of an XCom value too large to be stored in a single row of the xcom table."""
+
+    __tablename__ = "xcom_chunk"
+
+    dag_run_id = Column(Integer(), nullable=False, primary_key=True)
+    task_id = Column(String(ID_LEN, **COLLATION_ARGS), nullable=False, primary_key=True)
+    key = Column(String(512, **COLLATION_ARGS), nullable=False, primary_key=True)
+    chunk_index = Column(Integer(), nullable=False, primary_key=True)
+
+    # Denormalized for easier lookup.
+    dag_id = Column(String(ID_LEN, **COLLATION_ARGS), nullable=False)
+    run_id = Column(String(ID_LEN, **COLLATION_ARGS), nullable=False)
+
+    data = Column(LargeBinary, nullable=False)
+    timestamp = Column(UtcDateTime, default=timezone.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("idx_xcom_chunk_ti_id", dag_id, task_id, run_id),
+        # Replacing, clearing or deleting an XCom deletes its chunks
+        ForeignKeyConstraint(
+            [dag_run_id, task_id, key],
+            ["xcom.dag_run_id", "xcom.task_id", "xcom.key"],
+            name="xcom_chunk_xcom_fkey",
+            ondelete="CASCADE",
+        ),
+    )
+
+    def __repr__(self):
+        return f'<XComChunk "{self.key}" #{self.chunk_index} ({self.task_id} @ {self.run_id})>'
+
+
+class ChunkedXCom:
+    """
+    Reference to an XCom value stored in the xcom_chunk table, as kept in the xcom table.
+
+    :param dag_run_id: ID of the DAG run row the XCom belongs to.
+    :param task_id: Task ID.
+    :param key: Key of the XCom.
+    :param num_chunks: Number of rows the value is split over.
+    :param size: Size of the value in bytes.
+    :param streamed: Whether the value was pushed as a file object, and so is
+        read back as one rather than deserialized.
+    """
+
+    def __init__(self, dag_run_id: int, task_id: str, key: str, num_chunks: int, size: int, streamed: bool):
+        self.dag_run_id = dag_run_id
+        self.task_id = task_id
+        self.key = key
+        self.num_chunks = num_chunks
+        self.size = size
+        self.streamed = streamed
+
+    def __repr__(self):
+        return f"<ChunkedXCom: {self.size} bytes in {self.num_chunks} chunks>"
+
+    def to_bytes(self) -> bytes:
+        return CHUNKED_XCOM_MARKER + json.dumps(self.__dict__).encode('UTF-8')
+
+    @classmethod
+    def from_bytes(cls, value: Optional[bytes]) -> Optional["ChunkedXCom"]:
+        """The reference stored in ``value``, or *None* if ``value`` is not chunked."""
+        if not value or not value.startswith(CHUNKED_XCOM_MARKER):
+            return None
+        return cls(**json.loads(value[len(CHUNKED_XCOM_MARKER) :].decode('UTF-8')))
+
+    def _query(self, session: Session) -> Query:
+        return session.query(XComChunk.data).filter(
+            XComChunk.dag_run_id == self.dag_run_id,
+            XComChunk.task_id == self.task_id,
+            XComChunk.key == self.key,
+        )
+
+    def read_chunk(self, chunk_index: int, session: Session) -> bytes:
+        data = self._query(session).filter(XComChunk.chunk_index == chunk_index).scalar()
+        if data is None:
+            raise ValueError(f"Chunk {chunk_index} of {self!r} for {self.task_id!r} is missing")
+        Stats.incr('xcom.chunked_bytes_read', count=len(data))
+        return data
+
+    def read_all(self, session: Session) -> bytes:
+        chunks = [data for data, in self._query(session).order_by(XComChunk.chunk_index)]
+        if len(chunks) != self.num_chunks:
+            raise ValueError(f"Expected {self.num_chunks} chunks of {self!r}, found {len(chunks)}")
+        value = b"".join(chunks)
+        Stats.incr('xcom.chunked_bytes_read', count=len(value))
+        return value
+
+
+class XComChunkReader(io.RawIOBase):
+    """
+    Read-only file object over an XCom value that was pushed as a file object.
+
+    Only one chunk is held in memory at a time; each is fetched from the
+    database when the previous one has been read.
+
+    :param chunked: The stored value.
+    :param session: Session to read the chunks with, which must be open while
+        the reader is read. If not provided, each chunk is read with a session
+        of its own, closed as soon as the chunk has been read.
+    """
+
+    def __init__(self, chunked: ChunkedXCom, session: Optional[Session] = None):
+        super().__init__()
+        self.chunked = chunked
+        self._session = session
+        self._next_chunk = 0
+        self._buffer = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer and self._next_chunk < self.chunked.num_chunks:
+            if self._session is not None:
+                data = self.chunked.read_chunk(self._next_chunk, self._session)
+            else:
+                with _new_chunk_session() as session:
+                    data = self.chunked.read_chunk(self._next_chunk, session)
+            self._buffer = memoryview(data)
+            self._next_chunk += 1
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+def _new_chunk_session() -> Session:
+    """
+    Session to read chunks with when the caller has none, apart from the thread's session, which
+    the XCom row referring to them may still be read with.
+    """
+    return settings.Session.session_factory()  # type: ignore[attr-defined]
+
+
+def _iter_chunks(value: Union[bytes, io.IOBase], chunk_size: int) -> Iterator[bytes]:
+    if isinstance(value, io.IOBase):
+        for chunk in iter(partial(value.read, chunk_size), b""):
+            yield chunk
+    else:
+        view = memoryview(value)
+        for start in range(0, len(view), chunk_size):
+            yield bytes(view[start : start + chunk_size])
+
+
 class BaseXCom(Base, LoggingMixin):
     """Base class for XCom objects."""
 
@@ -119,7 +271,8 @@ class BaseXCom(Base, LoggingMixin):
         ``run_id``. The two arguments are mutually exclusive.
 
         :param key: Key to store the XCom.
-        :param value: XCom value to store.
+        :param value: XCom value to store. A binary file object is read and
+            stored a chunk at a time, and is read back as a file object.
         :param dag_id: DAG ID.
         :param task_id: Task ID.
         :param run_id: DAG run ID for the task.
@@ -177,13 +330,15 @@ class BaseXCom(Base, LoggingMixin):
             if dag_run_id is None:
                 raise ValueError(f"DAG run not found on DAG {dag_id!r} with ID {run_id!r}")
 
-        value = cls.serialize_value(
-            value=value,
-            key=key,
-            task_id=task_id,
-            dag_id=dag_id,
-            run_id=run_id,
-        )
+        streamed = isinstance(value, (io.RawIOBase, io.BufferedIOBase))
+        if not streamed:
+            value = cls.serialize_value(
+                value=value,
+                key=key,
+                task_id=task_id,
+                dag_id=dag_id,
+                run_id=run_id,
+            )
 
         # Remove duplicate XComs and insert a new one.
         session.query(cls).filter(
@@ -192,10 +347,13 @@ class BaseXCom(Base, LoggingMixin):
             cls.task_id == task_id,
             cls.dag_id == dag_id,
         ).delete()
+
+        chunk_threshold = conf.getint('core', 'xcom_chunk_threshold', fallback=0)
+        chunked = streamed or bool(chunk_threshold and value is not None and len(value) > chunk_threshold)
         new = cast(Any, cls)(  # Work around Mypy complaining model not defining '__init__'.
             dag_run_id=dag_run_id,
             key=key,
-            value=value,
+            value=None if chunked else value,
             run_id=run_id,
             task_id=task_id,
             dag_id=dag_id,
@@ -203,6 +361,56 @@ class BaseXCom(Base, LoggingMixin):
         session.add(new)
         session.flush()
 
+        if chunked:
+            # The chunks refer to the XCom row, so they are written after it
+            new.value = cls._store_chunks(
+                value,
+                streamed=streamed,
+                key=key,
+                dag_run_id=dag_run_id,
+                run_id=run_id,
+                task_id=task_id,
+                dag_id=dag_id,
+                session=session,
+            ).to_bytes()
+            session.flush()
+
+    @staticmethod
+    def _store_chunks(
+        value: Union[bytes, io.IOBase],
+        *,
+        streamed: bool,
+        key: str,
+        dag_run_id: int,
+        run_id: str,
+        task_id: str,
+        dag_id: str,
+        session: Session,
+    ) -> ChunkedXCom:
+        """Write ``value`` to the xcom_chunk table, reading file objects a chunk at a time."""
+        chunk_size = conf.getint('core', 'xcom_chunk_size', fallback=MAX_XCOM_SIZE)
+        insert = XComChunk.__table__.insert()
+        num_chunks = size = 0
+        for chunk in _iter_chunks(value, chunk_size):
+            # Core inserts, so that chunks already written are not kept in the session.
+            session.execute(
+                insert.values(
+                    dag_run_id=dag_run_id,
+                    task_id=task_id,
+                    key=key,
+                    chunk_index=num_chunks,
+                    dag_id=dag_id,
+                    run_id=run_id,
+                    data=chunk,
+                    timestamp=timezone.utcnow(),
+                )
+            )
+            num_chunks += 1
+            size += len(chunk)
+        Stats.incr('xcom.chunked_values')
+        Stats.incr('xcom.chunked_bytes_written', count=size)
+        return ChunkedXCom(dag_run_id, task_id, key, num_chunks=num_chunks, size=size, streamed=streamed)
+
     @overload
     @classmethod
     def get_one(
@@ -316,7 +524,7 @@ class BaseXCom(Base, LoggingMixin):
 
         result = query.with_entities(cls.value).first()
         if result:
-            return cls.deserialize_value(result)
+            return cls.deserialize_value(result, session=session)
         return None
 
     @overload
@@ -522,20 +730,40 @@ class BaseXCom(Base, LoggingMixin):
             raise
 
     @staticmethod
-    def deserialize_value(result: "XCom") -> Any:
-        """Deserialize XCom value from str or pickle object"""
-        if result.value is None:
+    def deserialize_value(result: "XCom", session: Optional[Session] = None) -> Any:
+        """
+        Deserialize XCom value from str or pickle object
+
+        Values pushed as binary file objects are returned as an
+        :class:`XComChunkReader`, which reads them from the database as needed.
+
+        :param result: The XCom, or the row of its value.
+        :param session: Session the XCom was read with, which the chunks of the
+            value are read with too. If not given, they are read with a session
+            of their own.
+        """
+        value = result.value
+        if value is None:
             return None
+        chunked = ChunkedXCom.from_bytes(value)
+        if chunked is not None:
+            if chunked.streamed:
+                return XComChunkReader(chunked, session=session)
+            if session is not None:
+                value = chunked.read_all(session)
+            else:
+                with _new_chunk_session() as chunk_session:
+                    value = chunked.read_all(chunk_session)
         if conf.getboolean('core', 'enable_xcom_pickling'):
             try:
-                return pickle.loads(result.value)
+                return pickle.loads(value)
             except pickle.UnpicklingError:
-                return json.loads(result.value.decode('UTF-8'))
+                return json.loads(value.decode('UTF-8'))
         else:
             try:
-                return json.loads(result.value.decode('UTF-8'))
+                return json.loads(value.decode('UTF-8'))
             except (json.JSONDecodeError, UnicodeDecodeError):
-                return pickle.loads(result.value)
+                return pickle.loads(value)
 
     def orm_deserialize_value(self) -> Any:
         """
@@ -546,6 +774,10 @@ class BaseXCom(Base, LoggingMixin):
         creating XCom orm model. This is used when viewing XCom listing
         in the webserver, for example.
         """
+        # Chunked values can be very large, don't load them just to list them
+        chunked = ChunkedXCom.from_bytes(self.value)
+        if chunked is not None:
+            return repr(chunked)
         return BaseXCom.deserialize_value(self)
 
 
@@ -573,6 +805,21 @@ def _patch_outdated_serializer(clazz, params):
     clazz.serialize_value = _shim
 
 
+def _patch_outdated_deserializer(clazz):
+    """
+    ``XCom.deserialize_value`` used to only accept the XCom, before the session it was read with was
+    passed too. In order to maintain compatibility with XCom backends written with the old signature,
+    we patch them with a method that ignores the session.
+    """
+    old_deserializer = clazz.deserialize_value
+
+    @wraps(old_deserializer)
+    def _shim(result, session=None):
+        return old_deserializer(result)
+
+    clazz.deserialize_value = staticmethod(_shim)
+
+
 def _get_function_params(function) -> List[str]:
     """
     Returns the list of variables names of a function
@@ -600,6 +847,8 @@ def resolve_xcom_backend() -> Type[BaseXCom]:
     xcom_params = _get_function_params(clazz.serialize_value)
     if not set(base_xcom_params) == set(xcom_params):
         _patch_outdated_serializer(clazz=clazz, params=xcom_params)
+    if 'session' not in _get_function_params(clazz.deserialize_value):
+        _patch_outdated_deserializer(clazz=clazz)
     return clazz
 
 
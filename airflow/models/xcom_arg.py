@@ -14,9 +14,8 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Union
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Sequence, Union
 
-from airflow.exceptions import AirflowException
 from airflow.models.taskmixin import DAGNode, DependencyMixin
 from airflow.models.xcom import XCOM_RETURN_KEY
 from airflow.utils.context import Context
@@ -139,17 +138,22 @@ class XComArg(DependencyMixin):
         Pull XCom value for the existing arg. This method is run during ``op.execute()``
         in respectable context.
         """
-        resolved_value = context['ti'].xcom_pull(task_ids=[self.operator.task_id], key=str(self.key))
-        if not resolved_value:
-            if TYPE_CHECKING:
-                assert self.operator.dag
-            raise AirflowException(
-                f'XComArg result from {self.operator.task_id} at {self.operator.dag.dag_id} '
-                f'with key="{self.key}"" is not found!'
-            )
-        resolved_value = resolved_value[0]
-
-        return resolved_value
+        xcom_ref = (self.operator.task_id, str(self.key))
+        # The XComs of upstream tasks do not change while this task runs, so they are pulled through
+        # the ones the task instance keeps, which a mapped task fetches for all its arguments at once
+        return context['ti'].xcom_pull_many([xcom_ref]).get(xcom_ref)
+
+    @staticmethod
+    def iter_xcom_args(arg: Any) -> Iterator["XComArg"]:
+        """Return XComArg instances in an arbitrary value, looking inside lists, dicts and sets."""
+        if isinstance(arg, XComArg):
+            yield arg
+        elif isinstance(arg, (tuple, set, list)):
+            for elem in arg:
+                yield from XComArg.iter_xcom_args(elem)
+        elif isinstance(arg, dict):
+            for elem in arg.values():
+                yield from XComArg.iter_xcom_args(elem)
 
     @staticmethod
     def apply_upstream_relationship(op: "Operator", arg: Any):
@@ -18,6 +18,7 @@
 """Manages all providers."""
 import fnmatch
 import functools
+import hashlib
 import json
 import logging
 import os
@@ -44,6 +45,7 @@ from typing import (
 import jsonschema
 from packaging import version as packaging_version
 
+from airflow.configuration import conf
 from airflow.exceptions import AirflowOptionalProviderFeatureException
 from airflow.hooks.base import BaseHook
 from airflow.utils import yaml
@@ -186,6 +188,91 @@ def _sanity_check(provider_package: str, class_name: str) -> Optional[Type[BaseH
     return imported_class
 
 
+def _providers_fingerprint() -> str:
+    """
+    Fingerprint of what the discovered providers depend on: the installed distributions -- whose
+    versions are part of the names of their metadata folders -- and the provider.yaml files of the
+    local sources.
+    """
+    entries = []
+    for path in sys.path:
+        try:
+            with os.scandir(path or os.curdir) as it:
+                for entry in it:
+                    if entry.name.endswith((".dist-info", ".egg-info")):
+                        entries.append(f"{entry.path} {entry.stat().st_mtime}")
+        except OSError:
+            continue
+    try:
+        import airflow.providers
+
+        provider_paths = list(airflow.providers.__path__)  # type: ignore[attr-defined]
+    except ImportError:
+        provider_paths = []
+    for root_path in provider_paths:
+        for folder, subdirs, files in os.walk(root_path, topdown=True):
+            if "provider.yaml" in files:
+                provider_yaml = os.path.join(folder, "provider.yaml")
+                entries.append(f"{provider_yaml} {os.path.getmtime(provider_yaml)}")
+                subdirs[:] = []
+    return hashlib.sha256("\n".join(sorted(entries)).encode("utf-8")).hexdigest()
+
+
+class ProvidersCache:
+    """
+    Metadata discovered from the providers, kept in a file so that other processes do not have to
+    discover it again. The file is ignored, and then rewritten, once the installed distributions or
+    the provider.yaml files change.
+
+    The metadata is made of sections, each filled when first discovered. Sections discovered by other
+    processes in the meantime are kept when writing the file.
+
+    :param path: path of the file. Nothing is cached when it is empty.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._fingerprint: Optional[str] = None
+        self._sections: Optional[Dict[str, Any]] = None
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path) as cache_file:  # type: ignore[arg-type]
+                content = json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(content, dict) or content.get("fingerprint") != self._fingerprint:
+            return {}
+        return content.get("sections") or {}
+
+    def _load(self) -> Dict[str, Any]:
+        if self._sections is None:
+            if self.path:
+                self._fingerprint = _providers_fingerprint()
+                self._sections = self._read()
+            else:
+                self._sections = {}
+        return self._sections
+
+    def get(self, section: str) -> Any:
+        """Returns the cached section, None if it is not cached."""
+        return self._load().get(section)
+
+    def update(self, **sections: Any) -> None:
+        """Caches the sections, and writes them to the file."""
+        self._sections = {**self._load(), **sections}
+        if not self.path:
+            return
+        content = {"fingerprint": self._fingerprint, "sections": {**self._read(), **self._sections}}
+        temporary_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "w") as cache_file:
+                json.dump(content, cache_file)
+            os.replace(temporary_path, self.path)
+        except OSError as e:
+            log.debug("Could not write the providers cache to %s: %s", self.path, e)
+
+
 class ProviderInfo(NamedTuple):
     """Provider information"""
 
@@ -261,6 +348,7 @@ class ProvidersManager(LoggingMixin):
     """
 
     _instance = None
+    _initialized = False
     resource_version = "0"
 
     def __new__(cls):
@@ -270,6 +358,10 @@ class ProvidersManager(LoggingMixin):
 
     def __init__(self):
         """Initializes the manager."""
+        # __init__ is called whenever the singleton is requested, do not discard what was discovered
+        if self._initialized:
+            return
+        self._initialized = True
         super().__init__()
         self._initialized_cache: Dict[str, bool] = {}
         # Keeps dict of providers keyed by module name
@@ -294,6 +386,9 @@ class ProvidersManager(LoggingMixin):
         self._customized_form_fields_schema_validator = (
             _create_customized_form_field_behaviours_schema_validator()
         )
+        # Hook classes adding connection form widgets, with the package they come from
+        self._widget_hook_classes: Set[tuple] = set()
+        self._cache = ProvidersCache(conf.get('core', 'providers_cache_file', fallback=''))
 
     @provider_info_cache("list")
     def initialize_providers_list(self):
@@ -302,8 +397,14 @@ class ProvidersManager(LoggingMixin):
         # Development purpose. In production provider.yaml files are not present in the 'airflow" directory
         # So there is no risk we are going to override package provider accidentally. This can only happen
         # in case of local development
-        self._discover_all_airflow_builtin_providers_from_local_sources()
-        self._discover_all_providers_from_packages()
+        cached_providers = self._cache.get("providers")
+        if cached_providers is not None:
+            for package_name, (version, provider_info) in cached_providers.items():
+                self._provider_dict.setdefault(package_name, ProviderInfo(version, provider_info))
+        else:
+            self._discover_all_airflow_builtin_providers_from_local_sources()
+            self._discover_all_providers_from_packages()
+            self._cache.update(providers=self._provider_dict)
         self._verify_all_providers_all_compatible()
         self._provider_dict = OrderedDict(sorted(self._provider_dict.items()))
 
@@ -322,9 +423,26 @@ class ProvidersManager(LoggingMixin):
     def initialize_providers_hooks(self):
         """Lazy initialization of providers hooks."""
         self.initialize_providers_list()
-        self._discover_hooks()
+        cached_hook_providers = self._cache.get("hook_providers")
+        if cached_hook_providers is not None:
+            self._add_cached_hooks(cached_hook_providers, self._cache.get("hooks") or {})
+        else:
+            self._discover_hooks()
+            self._cache.update(hook_providers=self._hook_provider_dict)
         self._hook_provider_dict = OrderedDict(sorted(self._hook_provider_dict.items()))
 
+    def _add_cached_hooks(self, cached_hook_providers: Dict[str, list], cached_hooks: Dict[str, Any]) -> None:
+        """Registers the cached hooks, a hook is only imported if its information is not cached."""
+        for connection_type, (hook_class_name, package_name) in cached_hook_providers.items():
+            if connection_type in self._hook_provider_dict:
+                continue
+            self._hook_provider_dict[connection_type] = HookClassProvider(hook_class_name, package_name)
+            if connection_type in cached_hooks:
+                hook_info = cached_hooks[connection_type]
+                self._hooks_lazy_dict[connection_type] = HookInfo(**hook_info) if hook_info else None
+            else:
+                self._hooks_lazy_dict[connection_type] = functools.partial(self._import_hook, connection_type)
+
     @provider_info_cache("taskflow_decorators")
     def initialize_providers_taskflow_decorator(self):
         """Lazy initialization of providers hooks."""
@@ -335,25 +453,41 @@ class ProvidersManager(LoggingMixin):
     def initialize_providers_extra_links(self):
         """Lazy initialization of providers extra links."""
         self.initialize_providers_list()
-        self._discover_extra_links()
+        self._discover_class_names("extra_links", self._discover_extra_links, self._extra_link_class_name_set)
 
     @provider_info_cache("logging")
     def initialize_providers_logging(self):
         """Lazy initialization of providers logging information."""
         self.initialize_providers_list()
-        self._discover_logging()
+        self._discover_class_names("logging", self._discover_logging, self._logging_class_name_set)
 
     @provider_info_cache("secrets_backends")
     def initialize_providers_secrets_backends(self):
         """Lazy initialization of providers secrets_backends information."""
         self.initialize_providers_list()
-        self._discover_secrets_backends()
+        self._discover_class_names(
+            "secrets_backends", self._discover_secrets_backends, self._secrets_backend_class_name_set
+        )
 
     @provider_info_cache("auth_backends")
     def initialize_providers_auth_backends(self):
         """Lazy initialization of providers API auth_backends information."""
         self.initialize_providers_list()
-        self._discover_auth_backends()
+        self._discover_class_names(
+            "auth_backends", self._discover_auth_backends, self._api_auth_backend_module_names
+        )
+
+    def _discover_class_names(self, section: str, discover: Callable[[], None], class_names: Set[str]):
+        """
+        Fills ``class_names`` from the section of the providers cache, or with ``discover`` -- which
+        imports the classes to check them -- when they are not cached.
+        """
+        cached_class_names = self._cache.get(section)
+        if cached_class_names is not None:
+            class_names.update(cached_class_names)
+        else:
+            discover()
+            self._cache.update(**{section: sorted(class_names)})
 
     def _discover_all_providers_from_packages(self) -> None:
         """
@@ -577,8 +711,30 @@ class ProvidersManager(LoggingMixin):
     @provider_info_cache("import_all_hooks")
     def _import_info_from_all_hooks(self):
         """Force-import all hooks and initialize the connections/fields"""
-        # Retrieve all hooks to make sure that all of them are imported
-        _ = list(self._hooks_lazy_dict.values())
+        cached_widget_hooks = self._cache.get("widget_hooks")
+        cached_field_behaviours = self._cache.get("field_behaviours")
+        if cached_widget_hooks is not None and cached_field_behaviours is not None:
+            # Only the hooks adding widgets need to be imported, to create the widgets
+            for hook_class_name, package_name in cached_widget_hooks:
+                self._import_hook(
+                    connection_type=None, hook_class_name=hook_class_name, package_name=package_name
+                )
+            for connection_type, field_behaviours in cached_field_behaviours.items():
+                self._field_behaviours.setdefault(connection_type, field_behaviours)
+        else:
+            # Retrieve all hooks to make sure that all of them are imported
+            hooks = {
+                connection_type: self._hooks_lazy_dict[connection_type]
+                for connection_type in self._hooks_lazy_dict
+            }
+            self._cache.update(
+                hooks={
+                    connection_type: hook_info._asdict() if isinstance(hook_info, HookInfo) else None
+                    for connection_type, hook_info in hooks.items()
+                },
+                widget_hooks=sorted(self._widget_hook_classes),
+                field_behaviours=self._field_behaviours,
+            )
         self._connection_form_widgets = OrderedDict(sorted(self._connection_form_widgets.items()))
         self._field_behaviours = OrderedDict(sorted(self._field_behaviours.items()))
 
@@ -677,6 +833,7 @@ class ProvidersManager(LoggingMixin):
                                 allowed_field_classes,
                             )
                             return None
+                    self._widget_hook_classes.add((hook_class_name, package_name))
                     self._add_widgets(package_name, hook_class, widgets)
             if 'get_ui_field_behaviour' in hook_class.__dict__:
                 field_behaviours = hook_class.get_ui_field_behaviour()
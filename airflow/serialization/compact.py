@@ -0,0 +1,273 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compact binary format for serialized DAGs, where every task can be decoded on its own.
+
+Layout::
+
+    MAGIC | format version (uint16) | header length (uint32) | header | dictionary | task 0 | task 1 | ...
+
+The header is the zlib-compressed JSON of the serialized DAG without its tasks, plus a table giving,
+for every task, its id, the offset and length of its own zlib-compressed JSON, and its downstream
+task ids -- so the structure of the DAG is known without decoding any task.
+
+Tasks of a DAG tend to look alike, so they are compressed with a preset dictionary made of the first
+tasks, stored right after the header. This keeps the size close to compressing all tasks at once.
+"""
+import struct
+import zlib
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, MutableMapping, Optional, Set
+
+from airflow.settings import json
+
+if TYPE_CHECKING:
+    from airflow.models.operator import Operator
+    from airflow.utils.task_group import TaskGroup
+
+MAGIC = b"\x00AIRFLOW-DAG"
+FORMAT_VERSION = 1
+
+_PREAMBLE = struct.Struct(">HI")
+# zlib only looks back 32KiB, a longer preset dictionary would not help
+_MAX_ZDICT_SIZE = 32 * 1024
+
+
+def is_compact(data: Optional[bytes]) -> bool:
+    """Whether ``data`` is a DAG serialized in the compact format."""
+    return bool(data) and data[: len(MAGIC)] == MAGIC  # type: ignore[index]
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, sort_keys=True).encode("utf-8")
+
+
+def _compress(value: bytes, zdict: Optional[bytes] = None) -> bytes:
+    compressor = zlib.compressobj(zdict=zdict) if zdict else zlib.compressobj()
+    return compressor.compress(value) + compressor.flush()
+
+
+def _decompress(value: bytes, zdict: Optional[bytes] = None) -> bytes:
+    decompressor = zlib.decompressobj(zdict=zdict) if zdict else zlib.decompressobj()
+    return decompressor.decompress(value) + decompressor.flush()
+
+
+def _build_zdict(tasks: List[bytes]) -> bytes:
+    zdict = bytearray()
+    for task in tasks:
+        if len(zdict) >= _MAX_ZDICT_SIZE:
+            break
+        zdict += task
+    # zlib finds matches at the end of the dictionary more cheaply, so keep that part
+    return bytes(zdict[-_MAX_ZDICT_SIZE:])
+
+
+def encode(serialized_dag: Dict[str, Any]) -> bytes:
+    """
+    Encode the output of :meth:`~airflow.serialization.serialized_objects.SerializedDAG.to_dict`.
+
+    :param serialized_dag: the ``{"__version": ..., "dag": ...}`` dict of a serialized DAG
+    """
+    dag_data = dict(serialized_dag["dag"])
+    tasks = dag_data.pop("tasks", [])
+    dumped_tasks = [_dumps(task) for task in tasks]
+    zdict = _build_zdict(dumped_tasks)
+
+    segments = [_compress(zdict)]
+    offset = len(segments[0])
+    task_table = []
+    for task, dumped_task in zip(tasks, dumped_tasks):
+        blob = _compress(dumped_task, zdict)
+        task_table.append(
+            [task["task_id"], offset, len(blob), sorted(task.get("downstream_task_ids") or [])]
+        )
+        segments.append(blob)
+        offset += len(blob)
+
+    header = _compress(
+        _dumps(
+            {
+                "__version": serialized_dag["__version"],
+                "dag": dag_data,
+                "zdict_length": len(segments[0]),
+                "tasks": task_table,
+            }
+        )
+    )
+    return b"".join([MAGIC, _PREAMBLE.pack(FORMAT_VERSION, len(header)), header, *segments])
+
+
+class CompactDagReader:
+    """
+    Decodes a DAG serialized in the compact format, one task at a time.
+
+    :param data: the encoded DAG
+    """
+
+    def __init__(self, data: bytes):
+        if not is_compact(data):
+            raise ValueError("Not a DAG serialized in the compact format")
+        format_version, header_length = _PREAMBLE.unpack_from(data, len(MAGIC))
+        if format_version != FORMAT_VERSION:
+            raise ValueError(f"Unsure how to deserialize compact format version {format_version!r}")
+
+        header_start = len(MAGIC) + _PREAMBLE.size
+        body_start = header_start + header_length
+        header = json.loads(_decompress(data[header_start:body_start]))
+
+        self._data = memoryview(data)[body_start:]
+        self._zdict = _decompress(self._data[: header["zdict_length"]])
+        self.serializer_version = header["__version"]
+        # The serialized DAG, without its tasks
+        self.dag_data: Dict[str, Any] = header["dag"]
+        self._offsets: Dict[str, tuple] = {}
+        self._upstream_task_ids: Dict[str, Set[str]] = defaultdict(set)
+        for task_id, offset, length, downstream_task_ids in header["tasks"]:
+            self._offsets[task_id] = (offset, length)
+            for downstream_task_id in downstream_task_ids:
+                self._upstream_task_ids[downstream_task_id].add(task_id)
+
+    @property
+    def task_ids(self) -> List[str]:
+        """Ids of the tasks of the DAG, in the order they were serialized."""
+        return list(self._offsets)
+
+    def load_task(self, task_id: str) -> Dict[str, Any]:
+        """The serialized form of ``task_id``."""
+        offset, length = self._offsets[task_id]
+        return json.loads(_decompress(self._data[offset : offset + length], self._zdict))
+
+    def upstream_task_ids(self, task_id: str) -> Set[str]:
+        """Ids of the tasks directly upstream of ``task_id``."""
+        return set(self._upstream_task_ids.get(task_id, ()))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Decode everything, giving back what was passed to :func:`encode`."""
+        dag_data = dict(self.dag_data)
+        dag_data["tasks"] = [self.load_task(task_id) for task_id in self._offsets]
+        return {"__version": self.serializer_version, "dag": dag_data}
+
+
+# Placeholder for values that have not been loaded yet
+_NOT_LOADED = object()
+
+
+class LazyTaskDict(MutableMapping):
+    """
+    ``task_dict`` of a DAG whose tasks are only deserialized when first accessed.
+
+    Iterating over the keys or testing membership does not load any task. Copying or pickling it
+    loads all the tasks and gives a plain dict.
+
+    :param task_ids: ids of all the tasks, in order
+    :param load: deserializes a task from its id
+    :param finalize: attaches a freshly deserialized task to its DAG. It is called once the task
+        is stored in this mapping, so it can look the task up.
+    """
+
+    def __init__(
+        self,
+        task_ids: List[str],
+        load: Callable[[str], "Operator"],
+        finalize: Callable[["Operator"], None],
+    ):
+        self._tasks: Dict[str, Any] = dict.fromkeys(task_ids, _NOT_LOADED)
+        self._load = load
+        self._finalize = finalize
+        # Map from task id to the TaskGroup the task belongs to
+        self.task_groups: Dict[str, "TaskGroup"] = {}
+
+    def __getitem__(self, task_id: str) -> "Operator":
+        task = self._tasks[task_id]
+        if task is _NOT_LOADED:
+            task = self._load(task_id)
+            self._tasks[task_id] = task
+            self._finalize(task)
+        return task
+
+    def __setitem__(self, task_id: str, task: "Operator") -> None:
+        self._tasks[task_id] = task
+
+    def __delitem__(self, task_id: str) -> None:
+        del self._tasks[task_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tasks)
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._tasks
+
+    def __repr__(self) -> str:
+        return f"<LazyTaskDict: {self.num_loaded}/{len(self)} tasks loaded>"
+
+    @property
+    def num_loaded(self) -> int:
+        """Number of tasks deserialized so far."""
+        return sum(1 for task in self._tasks.values() if task is not _NOT_LOADED)
+
+    def copy(self) -> Dict[str, "Operator"]:
+        return dict(self.items())
+
+    def __reduce__(self):
+        return dict, (self.copy(),)
+
+
+class LazyTaskGroupChildren(MutableMapping):
+    """
+    ``children`` of a TaskGroup whose tasks are looked up in a :class:`LazyTaskDict` when accessed.
+
+    :param task_dict: the lazy ``task_dict`` of the DAG
+    """
+
+    def __init__(self, task_dict: LazyTaskDict):
+        self._task_dict = task_dict
+        self._children: Dict[str, Any] = {}
+
+    def set_task(self, task_id: str) -> None:
+        """Add the task ``task_id``, without loading it."""
+        self._children[task_id] = _NOT_LOADED
+
+    def __getitem__(self, label: str) -> Any:
+        child = self._children[label]
+        if child is _NOT_LOADED:
+            child = self._children[label] = self._task_dict[label]
+        return child
+
+    def __setitem__(self, label: str, child: Any) -> None:
+        self._children[label] = child
+
+    def __delitem__(self, label: str) -> None:
+        del self._children[label]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._children)
+
+    def __len__(self) -> int:
+        return len(self._children)
+
+    def __contains__(self, label: object) -> bool:
+        return label in self._children
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __reduce__(self):
+        return dict, (self.copy(),)
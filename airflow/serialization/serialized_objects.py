@@ -23,7 +23,7 @@ import logging
 import weakref
 from dataclasses import dataclass
 from inspect import Parameter, signature
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, NamedTuple, Optional, Set, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Type, Union
 
 import cattr
 import pendulum
@@ -36,12 +36,14 @@ from airflow.exceptions import AirflowException, SerializationError
 from airflow.models.baseoperator import BaseOperator, BaseOperatorLink
 from airflow.models.connection import Connection
 from airflow.models.dag import DAG, create_timetable
+from airflow.models.dagstructure import DagStructureIndex
 from airflow.models.mappedoperator import MappedOperator
 from airflow.models.operator import Operator
 from airflow.models.param import Param, ParamsDict
 from airflow.models.taskmixin import DAGNode
 from airflow.models.xcom_arg import XComArg
 from airflow.providers_manager import ProvidersManager
+from airflow.serialization.compact import CompactDagReader, LazyTaskDict, LazyTaskGroupChildren
 from airflow.serialization.enums import DagAttributeTypes as DAT, Encoding
 from airflow.serialization.helpers import serialize_template_field
 from airflow.serialization.json_schema import Validator, load_dag_schema
@@ -52,6 +54,7 @@ from airflow.utils.docs import get_docs_url
 from airflow.utils.module_loading import as_importable_string, import_string
 from airflow.utils.operator_resources import Resources
 from airflow.utils.task_group import MappedTaskGroup, TaskGroup
+from airflow.utils.weight_rule import WeightRule
 
 if TYPE_CHECKING:
     from airflow.ti_deps.deps.base_ti_dep import BaseTIDep
@@ -970,6 +973,7 @@ class SerializedDAG(DAG, BaseSerialization):
 
             # Edge info in the JSON exactly matches our internal structure
             serialized_dag["edge_info"] = dag.edge_info
+            serialized_dag["priority_weight_totals"] = cls._serialize_priority_weight_totals(dag)
             serialized_dag["params"] = cls._serialize_params_dict(dag.params)
 
             # has_on_*_callback are only stored if the value is True, as the default is False
@@ -983,10 +987,33 @@ class SerializedDAG(DAG, BaseSerialization):
         except Exception as e:
             raise SerializationError(f'Failed to serialize DAG {dag.dag_id!r}: {e}')
 
+    @staticmethod
+    def _serialize_priority_weight_totals(dag: DAG) -> Dict[str, int]:
+        """
+        Compute ``priority_weight_total`` of the tasks not using the absolute weight rule in one pass
+        over the DAG, so the scheduler and the webserver do not have to walk the relatives of every task.
+        """
+        index = DagStructureIndex(dag)
+        return {
+            task_id: index.priority_weight(task_id)
+            for task_id, task in dag.task_dict.items()
+            if task.weight_rule != WeightRule.ABSOLUTE
+        }
+
     @classmethod
-    def deserialize_dag(cls, encoded_dag: Dict[str, Any]) -> 'SerializedDAG':
-        """Deserializes a DAG from a JSON object."""
+    def deserialize_dag(
+        cls, encoded_dag: Dict[str, Any], lazy_tasks: Optional[CompactDagReader] = None
+    ) -> 'SerializedDAG':
+        """
+        Deserializes a DAG from a JSON object.
+
+        :param encoded_dag: the serialized DAG
+        :param lazy_tasks: if given, ``encoded_dag`` has no tasks, and they are deserialized from
+            this reader when they are first accessed
+        """
         dag = SerializedDAG(dag_id=encoded_dag['_dag_id'])
+        if lazy_tasks is not None:
+            dag.task_dict = cls._lazy_task_dict(dag, lazy_tasks)
 
         for k, v in encoded_dag.items():
             if k == "_downstream_task_ids":
@@ -1047,23 +1074,11 @@ class SerializedDAG(DAG, BaseSerialization):
         for k in keys_to_set_none:
             setattr(dag, k, None)
 
-        for task in dag.task_dict.values():
-            task.dag = dag
-
-            for date_attr in ["start_date", "end_date"]:
-                if getattr(task, date_attr) is None:
-                    setattr(task, date_attr, getattr(dag, date_attr))
-
-            if task.subdag is not None:
-                setattr(task.subdag, 'parent_dag', dag)
-
-            if isinstance(task, MappedOperator):
-                for d in (task.mapped_kwargs, task.partial_kwargs):
-                    for k, v in d.items():
-                        if not isinstance(v, _XComRef):
-                            continue
+        if lazy_tasks is not None:
+            return dag
 
-                        d[k] = XComArg(operator=dag.get_task(v.task_id), key=v.key)
+        for task in dag.task_dict.values():
+            cls._attach_task(dag, task)
 
             for task_id in task.downstream_task_ids:
                 # Bypass set_upstream etc here - it does more than we want
@@ -1071,6 +1086,45 @@ class SerializedDAG(DAG, BaseSerialization):
 
         return dag
 
+    @staticmethod
+    def _attach_task(dag: 'SerializedDAG', task: Operator) -> None:
+        """Set the references between a deserialized task and its DAG."""
+        task.dag = dag
+
+        for date_attr in ["start_date", "end_date"]:
+            if getattr(task, date_attr) is None:
+                setattr(task, date_attr, getattr(dag, date_attr))
+
+        if task.subdag is not None:
+            setattr(task.subdag, 'parent_dag', dag)
+
+        if isinstance(task, MappedOperator):
+            for d in (task.mapped_kwargs, task.partial_kwargs):
+                for k, v in d.items():
+                    if not isinstance(v, _XComRef):
+                        continue
+
+                    d[k] = XComArg(operator=dag.get_task(v.task_id), key=v.key)
+
+    @classmethod
+    def _lazy_task_dict(cls, dag: 'SerializedDAG', reader: CompactDagReader) -> LazyTaskDict:
+        load_operator_extra_links = cls._load_operator_extra_links
+
+        def load(task_id: str) -> Operator:
+            SerializedBaseOperator._load_operator_extra_links = load_operator_extra_links
+            return SerializedBaseOperator.deserialize_operator(reader.load_task(task_id))
+
+        def finalize(task: Operator) -> None:
+            cls._attach_task(dag, task)
+            # Bypass set_upstream etc here - it does more than we want
+            task.upstream_task_ids.update(reader.upstream_task_ids(task.task_id))
+            group = task_dict.task_groups.get(task.task_id)
+            if group is not None:
+                task.task_group = weakref.proxy(group)
+
+        task_dict = LazyTaskDict(reader.task_ids, load, finalize)
+        return task_dict
+
     @classmethod
     def to_dict(cls, var: Any) -> dict:
         """Stringifies DAGs and operators contained by var and returns a dict of var."""
@@ -1088,6 +1142,18 @@ class SerializedDAG(DAG, BaseSerialization):
             raise ValueError(f"Unsure how to deserialize version {ver!r}")
         return cls.deserialize_dag(serialized_obj['dag'])
 
+    @classmethod
+    def from_compact(cls, data: bytes) -> 'SerializedDAG':
+        """
+        Deserializes a DAG encoded by :func:`airflow.serialization.compact.encode`.
+
+        The operators are only deserialized when they are first accessed through ``task_dict``.
+        """
+        reader = CompactDagReader(data)
+        if reader.serializer_version != cls.SERIALIZER_VERSION:
+            raise ValueError(f"Unsure how to deserialize version {reader.serializer_version!r}")
+        return cls.deserialize_dag(reader.dag_data, lazy_tasks=reader)
+
 
 class SerializedTaskGroup(TaskGroup, BaseSerialization):
     """A JSON serializable representation of TaskGroup."""
@@ -1131,7 +1197,7 @@ class SerializedTaskGroup(TaskGroup, BaseSerialization):
         cls,
         encoded_group: Dict[str, Any],
         parent_group: Optional[TaskGroup],
-        task_dict: Dict[str, Operator],
+        task_dict: Mapping[str, Operator],
     ) -> Optional[TaskGroup]:
         """Deserializes a TaskGroup from a JSON object."""
         if not encoded_group:
@@ -1148,12 +1214,23 @@ class SerializedTaskGroup(TaskGroup, BaseSerialization):
             task.task_group = weakref.proxy(group)
             return task
 
-        group.children = {
-            label: set_ref(task_dict[val])  # type: ignore
-            if _type == DAT.OP  # type: ignore
-            else SerializedTaskGroup.deserialize_task_group(val, group, task_dict)
-            for label, (_type, val) in encoded_group["children"].items()
-        }
+        if isinstance(task_dict, LazyTaskDict):
+            # Don't load the tasks, just remember which group they belong to for when they are
+            children = LazyTaskGroupChildren(task_dict)
+            for label, (_type, val) in encoded_group["children"].items():
+                if _type == DAT.OP:
+                    task_dict.task_groups[val] = group
+                    children.set_task(val)
+                else:
+                    children[label] = SerializedTaskGroup.deserialize_task_group(val, group, task_dict)
+            group.children = children  # type: ignore
+        else:
+            group.children = {
+                label: set_ref(task_dict[val])  # type: ignore
+                if _type == DAT.OP  # type: ignore
+                else SerializedTaskGroup.deserialize_task_group(val, group, task_dict)
+                for label, (_type, val) in encoded_group["children"].items()
+            }
         group.upstream_group_ids.update(cls._deserialize(encoded_group["upstream_group_ids"]))
         group.downstream_group_ids.update(cls._deserialize(encoded_group["downstream_group_ids"]))
         group.upstream_task_ids.update(cls._deserialize(encoded_group["upstream_task_ids"]))
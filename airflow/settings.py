@@ -17,27 +17,30 @@
 # under the License.
 import atexit
 import functools
+import importlib
 import json
 import logging
 import os
 import sys
+import threading
 import warnings
 from typing import TYPE_CHECKING, Callable, List, Optional, Union
 
 import pendulum
-import sqlalchemy
-from sqlalchemy import create_engine, exc
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import scoped_session, sessionmaker
-from sqlalchemy.orm.session import Session as SASession
-from sqlalchemy.pool import NullPool
 
 from airflow.configuration import AIRFLOW_HOME, WEBSERVER_CONFIG, conf  # NOQA F401
 from airflow.executors import executor_constants
 from airflow.logging_config import configure_logging
-from airflow.utils.orm_event_handlers import setup_event_handlers
 
 if TYPE_CHECKING:
+    import sqlalchemy
+    from sqlalchemy import create_engine, exc
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.orm import scoped_session, sessionmaker
+    from sqlalchemy.orm.session import Session as SASession
+    from sqlalchemy.pool import NullPool
+
+    from airflow.utils.orm_event_handlers import setup_event_handlers
     from airflow.www.utils import UIAlert
 
 log = logging.getLogger(__name__)
@@ -79,8 +82,27 @@ LOGGING_CLASS_PATH: Optional[str] = None
 DONOT_MODIFY_HANDLERS: Optional[bool] = None
 DAGS_FOLDER: str = os.path.expanduser(conf.get('core', 'DAGS_FOLDER'))
 
-engine: Engine
-Session: Callable[..., SASession]
+engine: "Engine"
+Session: Callable[..., "SASession"]
+
+# Names of this module imported only when first used, as importing SQLAlchemy takes a large part of the
+# time needed to import airflow: name -> (module, attribute of the module or None for the module itself)
+_LAZY_IMPORTS = {
+    "sqlalchemy": ("sqlalchemy", None),
+    "create_engine": ("sqlalchemy", "create_engine"),
+    "exc": ("sqlalchemy", "exc"),
+    "Engine": ("sqlalchemy.engine", "Engine"),
+    "scoped_session": ("sqlalchemy.orm", "scoped_session"),
+    "sessionmaker": ("sqlalchemy.orm", "sessionmaker"),
+    "SASession": ("sqlalchemy.orm.session", "Session"),
+    "NullPool": ("sqlalchemy.pool", "NullPool"),
+    "setup_event_handlers": ("airflow.utils.orm_event_handlers", "setup_event_handlers"),
+}
+
+# Whether initialize() left the configuration of the ORM to the first access to engine or Session
+_ORM_CONFIGURATION_DEFERRED = False
+# Held during the deferred configuration of the ORM, so that threads first using it together configure it once
+_ORM_CONFIGURATION_LOCK = threading.RLock()
 
 # The JSON library to use for DAG Serialization and De-Serialization
 json = json
@@ -240,6 +262,29 @@ def configure_vars():
     DONOT_MODIFY_HANDLERS = conf.getboolean('logging', 'donot_modify_handlers', fallback=False)
 
 
+def _import_lazy_names():
+    """Import the names of this module listed in ``_LAZY_IMPORTS``, keeping those already set"""
+    for name, (module_name, attribute) in _LAZY_IMPORTS.items():
+        if name not in globals():
+            module = importlib.import_module(module_name)
+            globals()[name] = module if attribute is None else getattr(module, attribute)
+
+
+def __getattr__(name):
+    # PEP-562: SQLAlchemy is imported, and the ORM configured, when first needed
+    if name in _LAZY_IMPORTS:
+        _import_lazy_names()
+        return globals()[name]
+    if name in ("engine", "Session") and _ORM_CONFIGURATION_DEFERRED:
+        with _ORM_CONFIGURATION_LOCK:
+            # Another thread may have configured it while we waited
+            if _ORM_CONFIGURATION_DEFERRED:
+                configure_adapters()
+                configure_orm()
+        return globals()[name]
+    raise AttributeError(f"module {__name__} has no attribute {name}")
+
+
 def configure_orm(disable_connection_pool=False):
     """Configure ORM using SQLAlchemy"""
     from airflow.utils.log.secrets_masker import mask_secret
@@ -247,6 +292,8 @@ def configure_orm(disable_connection_pool=False):
     log.debug("Setting up DB connection pool (PID %s)", os.getpid())
     global engine
     global Session
+    global _ORM_CONFIGURATION_DEFERRED
+    _import_lazy_names()
     engine_args = prepare_engine_args(disable_connection_pool)
 
     if conf.has_option('core', 'sql_alchemy_connect_args'):
@@ -268,6 +315,7 @@ def configure_orm(disable_connection_pool=False):
             expire_on_commit=False,
         )
     )
+    _ORM_CONFIGURATION_DEFERRED = False
     if engine.dialect.name == 'mssql':
         session = Session()
         try:
@@ -302,6 +350,7 @@ DEFAULT_ENGINE_ARGS = {
 
 def prepare_engine_args(disable_connection_pool=False):
     """Prepare SQLAlchemy engine args"""
+    _import_lazy_names()
     default_args = {}
     for dialect, default in DEFAULT_ENGINE_ARGS.items():
         if SQL_ALCHEMY_CONN.startswith(dialect):
@@ -378,18 +427,26 @@ def prepare_engine_args(disable_connection_pool=False):
     return engine_args
 
 
+def is_orm_configured() -> bool:
+    """Whether the ORM was configured, without configuring it when its configuration is deferred"""
+    return globals().get("engine") is not None
+
+
 def dispose_orm():
     """Properly close pooled database connections"""
     log.debug("Disposing DB connection pool (PID %s)", os.getpid())
     global engine
     global Session
+    global _ORM_CONFIGURATION_DEFERRED
 
-    if Session:
+    # The ORM may never have been configured
+    _ORM_CONFIGURATION_DEFERRED = False
+    if globals().get("Session"):
         Session.remove()
-        Session = None
-    if engine:
+    if globals().get("engine"):
         engine.dispose()
-        engine = None
+    Session = None
+    engine = None
 
 
 def reconfigure_orm(disable_connection_pool=False):
@@ -430,6 +487,7 @@ def validate_session():
     if not worker_precheck:
         return True
     else:
+        _import_lazy_names()
         check_session = sessionmaker(bind=engine)
         session = check_session()
         try:
@@ -544,9 +602,13 @@ def initialize():
     import_local_settings()
     global LOGGING_CLASS_PATH
     LOGGING_CLASS_PATH = configure_logging()
-    configure_adapters()
-    # The webservers import this file from models.py with the default settings.
-    configure_orm()
+    if LAZY_CONFIGURE_ORM:
+        global _ORM_CONFIGURATION_DEFERRED
+        _ORM_CONFIGURATION_DEFERRED = True
+    else:
+        configure_adapters()
+        # The webservers import this file from models.py with the default settings.
+        configure_orm()
     configure_action_logging()
 
     # Ensure we close DB connections at scheduler and gunicorn worker terminations
@@ -567,6 +629,9 @@ MIN_SERIALIZED_DAG_UPDATE_INTERVAL = conf.getint('core', 'min_serialized_dag_upd
 # If set to True, serialized DAGs is compressed before writing to DB,
 COMPRESS_SERIALIZED_DAGS = conf.getboolean('core', 'compress_serialized_dags', fallback=False)
 
+# Format serialized DAGs are written to the DB in, ``json`` or ``compact``
+SERIALIZED_DAG_FORMAT = conf.get('core', 'serialized_dag_format', fallback='json')
+
 # Fetching serialized DAG can not be faster than a minimum interval to reduce database
 # read rate. This config controls when your DAGs are updated in the Webserver
 MIN_SERIALIZED_DAG_FETCH_INTERVAL = conf.getint('core', 'min_serialized_dag_fetch_interval', fallback=10)
@@ -595,6 +660,11 @@ LAZY_LOAD_PLUGINS = conf.getboolean('core', 'lazy_load_plugins', fallback=True)
 # loaded from module.
 LAZY_LOAD_PROVIDERS = conf.getboolean('core', 'lazy_discover_providers', fallback=True)
 
+# By default the ORM is configured, and so SQLAlchemy imported, whenever 'airflow' is imported. Set it
+# to True to only do it when the database is first used, which makes commands and processes that do not
+# use the database start faster.
+LAZY_CONFIGURE_ORM = conf.getboolean('core', 'lazy_configure_orm', fallback=False)
+
 # Determines if the executor utilizes Kubernetes
 IS_K8S_OR_K8SCELERY_EXECUTOR = conf.get('core', 'EXECUTOR') in {
     executor_constants.KUBERNETES_EXECUTOR,
@@ -16,7 +16,8 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import TYPE_CHECKING, List, Optional
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from sqlalchemy.orm.session import Session
 
@@ -57,6 +58,9 @@ class DepContext:
         trigger rule
     :param ignore_ti_state: Ignore the task instance's previous failure/success
     :param finished_tis: A list of all the finished task instances of this run
+    :param finished_ti_states: The states of ``finished_tis`` counted per task_id. This is
+        derived from ``finished_tis`` when first needed, so a single context can be reused to
+        evaluate many task instances of the same run without re-scanning ``finished_tis``
     """
 
     def __init__(
@@ -70,6 +74,7 @@ class DepContext:
         ignore_task_deps: bool = False,
         ignore_ti_state: bool = False,
         finished_tis: Optional[List["TaskInstance"]] = None,
+        finished_ti_states: Optional[Dict[str, Counter]] = None,
     ):
         self.deps = deps or set()
         self.flag_upstream_failed = flag_upstream_failed
@@ -80,6 +85,7 @@ class DepContext:
         self.ignore_task_deps = ignore_task_deps
         self.ignore_ti_state = ignore_ti_state
         self.finished_tis = finished_tis
+        self.finished_ti_states = finished_ti_states
 
     def ensure_finished_tis(self, dag_run: "DagRun", session: Session) -> List["TaskInstance"]:
         """
@@ -96,3 +102,22 @@ class DepContext:
         else:
             finished_tis = self.finished_tis
         return finished_tis
+
+    def ensure_finished_ti_states(self, dag_run: "DagRun", session: Session) -> Dict[str, Counter]:
+        """
+        This method makes sure finished_ti_states is populated if it's currently None.
+
+        The finished task instances are indexed by task_id once, so that checking the
+        upstream of a task instance only has to look at its direct upstream task ids
+        rather than at every finished task instance of the run.
+
+        :param dag_run: The DagRun for which to find finished tasks
+        :return: A map from task_id to a Counter of the states of its finished task instances
+        :rtype: dict[str, collections.Counter]
+        """
+        if self.finished_ti_states is None:
+            finished_ti_states: Dict[str, Counter] = defaultdict(Counter)
+            for ti in self.ensure_finished_tis(dag_run, session):
+                finished_ti_states[ti.task_id][ti.state] += 1
+            self.finished_ti_states = dict(finished_ti_states)
+        return self.finished_ti_states
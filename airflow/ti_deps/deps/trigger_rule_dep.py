@@ -17,7 +17,7 @@
 # under the License.
 
 from collections import Counter
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict
 
 from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.deps.base_ti_dep import BaseTIDep
@@ -57,6 +57,28 @@ class TriggerRuleDep(BaseTIDep):
             sum(counter.values()),
         )
 
+    @staticmethod
+    def _count_upstream_ti_states(ti, finished_ti_states: Dict[str, Counter]):
+        """
+        Same as ``_get_states_count_upstream_ti``, but using the finished task instance states
+        already counted per task_id, so only the direct upstream of ``ti`` is visited.
+
+        :param ti: the ti that we want to calculate deps for
+        :param finished_ti_states: the states of the finished tasks of the dag_run, by task_id
+        """
+        counter: Counter = Counter()
+        for task_id in ti.task.upstream_task_ids:
+            states = finished_ti_states.get(task_id)
+            if states:
+                counter.update(states)
+        return (
+            counter.get(State.SUCCESS, 0),
+            counter.get(State.SKIPPED, 0),
+            counter.get(State.FAILED, 0),
+            counter.get(State.UPSTREAM_FAILED, 0),
+            sum(counter.values()),
+        )
+
     @provide_session
     def _get_dep_statuses(self, ti, session, dep_context: DepContext):
         # Checking that all upstream dependencies have succeeded
@@ -68,8 +90,8 @@ class TriggerRuleDep(BaseTIDep):
             yield self._passing_status(reason="The task had a always trigger rule set.")
             return
         # see if the task name is in the task upstream for our task
-        successes, skipped, failed, upstream_failed, done = self._get_states_count_upstream_ti(
-            ti=ti, finished_tis=dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
+        successes, skipped, failed, upstream_failed, done = self._count_upstream_ti_states(
+            ti=ti, finished_ti_states=dep_context.ensure_finished_ti_states(ti.get_dagrun(session), session)
         )
 
         yield from self._evaluate_trigger_rule(
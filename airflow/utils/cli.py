@@ -28,20 +28,24 @@ import threading
 import traceback
 import warnings
 from argparse import Namespace
+from collections import OrderedDict
 from datetime import datetime
-from typing import TYPE_CHECKING, Callable, Optional, TypeVar, cast
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, TypeVar, cast
 
 from airflow import settings
 from airflow.exceptions import AirflowException
 from airflow.utils import cli_action_loggers
 from airflow.utils.log.non_caching_file_handler import NonCachingFileHandler
+from airflow.utils.module_loading import modules_from, unload_modules_from
 from airflow.utils.platform import getuser, is_terminal_support_colors
 from airflow.utils.session import provide_session
 
 T = TypeVar("T", bound=Callable)
 
 if TYPE_CHECKING:
-    from airflow.models import DAG
+    from airflow.models import DAG, DagBag
+
+log = logging.getLogger(__name__)
 
 
 def _check_cli_args(args):
@@ -206,6 +210,94 @@ def get_dag(subdir: Optional[str], dag_id: str) -> "DAG":
     return dagbag.dags[dag_id]
 
 
+# DAG files parsed by this process to run tasks, by path, least recently used first: the modification
+# times of the file and of the modules it imported from the DAG folder when it was parsed, and the
+# resulting DagBag. Processes forked to run tasks inherit them.
+_task_dagbags: "OrderedDict[str, Tuple[float, Dict[str, Optional[float]], DagBag]]" = OrderedDict()
+
+# The most DAG files kept parsed by a process
+_TASK_DAGBAGS_MAX_SIZE = 32
+
+
+def _getmtime(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def get_dag_for_task(subdir: Optional[str], dag_id: str) -> "DAG":
+    """
+    Returns DAG of a given dag_id to run one of its tasks, parsing only the file of the DAG.
+
+    The file is ``subdir`` when it is a file, otherwise the file recorded with the serialized DAG.
+    Unlike :func:`get_dag`, the example DAGs are not parsed, and the parsed file is kept, so that the
+    next tasks run by this process -- or by processes forked from it -- do not parse it again as long as
+    neither it nor the modules it imported from the DAG folder are modified. Falls back to
+    :func:`get_dag` when the file of the DAG is not known.
+    """
+    from airflow.models import DagBag
+    from airflow.models.serialized_dag import SerializedDagModel
+    from airflow.utils.session import create_session
+
+    fileloc = process_subdir(subdir)
+    if not fileloc or not os.path.isfile(fileloc):
+        with create_session() as session:
+            fileloc = (
+                session.query(SerializedDagModel.fileloc).filter(SerializedDagModel.dag_id == dag_id).scalar()
+            )
+        # DAGs from zip files are left to the DagBag of the whole folder
+        if not fileloc or not os.path.isfile(fileloc):
+            return get_dag(subdir, dag_id)
+
+    mtime = os.path.getmtime(fileloc)
+    cached = _task_dagbags.get(fileloc)
+    if (
+        cached
+        and cached[0] == mtime
+        and all(_getmtime(path) == module_mtime for path, module_mtime in cached[1].items())
+    ):
+        _task_dagbags.move_to_end(fileloc)
+        dagbag = cached[2]
+    else:
+        # Have the modules of the DAG folder imported again, from their current content
+        unload_modules_from(settings.DAGS_FOLDER)
+        dagbag = DagBag(fileloc, include_examples=False, include_smart_sensor=False, safe_mode=False)
+        module_mtimes = {path: _getmtime(path) for path in modules_from(settings.DAGS_FOLDER).values()}
+        _task_dagbags[fileloc] = (mtime, module_mtimes, dagbag)
+        _task_dagbags.move_to_end(fileloc)
+        while len(_task_dagbags) > _TASK_DAGBAGS_MAX_SIZE:
+            _task_dagbags.popitem(last=False)
+    if dag_id not in dagbag.dags:
+        return get_dag(subdir, dag_id)
+    return dagbag.dags[dag_id]
+
+
+def preload_dag_for_task(command: List[str]) -> None:
+    """
+    Parses the DAG file of an ``airflow tasks run`` command before forking a process to run it.
+
+    The forked process then finds the DAG already parsed by :func:`get_dag_for_task`, and so do the
+    processes forked for the next tasks of the same file. Only commands giving the DAG file with
+    ``--subdir`` are preloaded, so the database is not needed.
+    """
+    from airflow.cli.cli_parser import get_parser
+
+    try:
+        # [1:] - remove "airflow" from the start of the command
+        args = get_parser().parse_args(command[1:])
+        fileloc = process_subdir(getattr(args, "subdir", None))
+        if getattr(args, "pickle", None) or not fileloc or not os.path.isfile(fileloc):
+            return
+        get_dag_for_task(fileloc, args.dag_id)
+    except Exception:
+        log.warning("Could not preload the DAG of %s", command, exc_info=True)
+    finally:
+        # The DAG file may have used the database, do not share connections with the forked process
+        if settings.is_orm_configured():
+            settings.engine.dispose()
+
+
 def get_dags(subdir: Optional[str], dag_id: str, use_regex: bool = False):
     """Returns DAG(s) matching a given regex or dag_id"""
     from airflow.models import DagBag
@@ -0,0 +1,225 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""In-memory ledger of pool occupancy and DAG/task concurrency used by the scheduler."""
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, DefaultDict, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from airflow.models.pool import Pool, PoolStats
+from airflow.ti_deps.dependencies_states import EXECUTION_STATES
+from airflow.utils import timezone
+from airflow.utils.log.logging_mixin import LoggingMixin
+from airflow.utils.sqlalchemy import nowait, with_row_locks
+from airflow.utils.state import TaskInstanceState
+
+if TYPE_CHECKING:
+    from airflow.models.taskinstance import TaskInstance, TaskInstanceKey
+
+TIPrimaryKey = Tuple[str, str, str, int]
+
+# The TIs updated since the last sync are read again from a bit earlier, as the transactions that
+# changed them may have been committed after it, by hosts whose clocks may be a bit late
+SYNC_OVERLAP = timedelta(seconds=60)
+
+
+class _LedgerEntry(NamedTuple):
+    pool: str
+    pool_slots: int
+    state: str
+    try_number: int
+
+
+class ConcurrencyLedger(LoggingMixin):
+    """
+    Incrementally maintained view of the task instances occupying executor capacity.
+
+    The scheduler's critical section needs to know how many pool slots are used and how many
+    task instances of each DAG (and each task) are queued or running. Computing that from the
+    ``task_instance`` table means aggregating over every running TI on every loop, so instead the
+    ledger is seeded from the database, updated from the state transitions the scheduler makes
+    itself (queuing TIs) and from executor events (TIs finishing), and periodically reconciled
+    against the database. In between, the TIs queued by other schedulers and the TIs the tasks
+    themselves moved to running are read on each sync, as the TIs updated since the previous sync:
+    only these few rows are read, through the index on ``updated_at``.
+
+    A TI is only tracked for one try at a time: the finish event of an earlier try does not
+    remove the entry of a later one.
+
+    :param reconcile_interval: How often (in seconds) the ledger is rebuilt from the database.
+    """
+
+    def __init__(self, reconcile_interval: float):
+        super().__init__()
+        self.reconcile_interval = reconcile_interval
+        self._entries: Dict[TIPrimaryKey, _LedgerEntry] = {}
+        self._pool_slots: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+        self._dag_counts: DefaultDict[str, int] = defaultdict(int)
+        self._task_counts: DefaultDict[Tuple[str, str], int] = defaultdict(int)
+        self._last_reconcile: float = 0.0
+        self._last_sync: Optional[datetime] = None
+        self._seeded = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def needs_reconcile(self) -> bool:
+        """Whether the ledger has never been seeded or the reconcile interval has elapsed."""
+        return not self._seeded or time.monotonic() - self._last_reconcile >= self.reconcile_interval
+
+    def reconcile(self, session: Session) -> None:
+        """Rebuild the ledger from the TIs currently in an execution state in the database."""
+        from airflow.models.taskinstance import TaskInstance as TI  # Avoid circular import
+
+        sync_start = timezone.utcnow()
+        self._clear()
+        self._add_rows(session.query(*self._columns()).filter(TI.state.in_(list(EXECUTION_STATES))))
+        self._last_reconcile = time.monotonic()
+        self._last_sync = sync_start
+        self._seeded = True
+        self.log.debug("Reconciled concurrency ledger with %d task instances", len(self._entries))
+
+    def sync(self, session: Session) -> None:
+        """
+        Record the TIs updated since the last sync that are in an execution state, e.g. queued by
+        another scheduler or moved from queued to running by the task itself.
+
+        The TIs are found through the index on ``TaskInstance.updated_at``, so the cost depends on
+        the number of TIs updated since the last sync, not on the number of running TIs.
+        """
+        from airflow.models.taskinstance import TaskInstance as TI  # Avoid circular import
+
+        sync_start = timezone.utcnow()
+        since = self._last_sync - SYNC_OVERLAP
+        self._add_rows(
+            session.query(*self._columns()).filter(
+                TI.updated_at >= since,
+                TI.state.in_(list(EXECUTION_STATES)),
+            )
+        )
+        self._last_sync = sync_start
+
+    def reconcile_if_due(self, session: Session) -> None:
+        """Rebuild the ledger from the database if the reconcile interval has elapsed, or sync it."""
+        if self.needs_reconcile:
+            self.reconcile(session)
+        else:
+            self.sync(session)
+
+    def record_queued(self, tis: Iterable["TaskInstance"]) -> None:
+        """Record that the scheduler moved ``tis`` to the queued state."""
+        for ti in tis:
+            # The key of a queued TI holds the try number it will run as
+            self._add(
+                ti.key.primary,
+                _LedgerEntry(ti.pool, ti.pool_slots, TaskInstanceState.QUEUED, ti.key.try_number),
+            )
+
+    def record_finished(self, keys: Iterable["TaskInstanceKey"]) -> None:
+        """Record that the tries of the TIs identified by ``keys`` no longer occupy executor capacity."""
+        for key in keys:
+            entry = self._entries.get(key.primary)
+            if entry is not None and entry.try_number <= key.try_number:
+                self._remove(key.primary)
+
+    @staticmethod
+    def _columns():
+        from airflow.models.taskinstance import TaskInstance as TI  # Avoid circular import
+
+        return (
+            TI.dag_id,
+            TI.task_id,
+            TI.run_id,
+            TI.map_index,
+            TI.pool,
+            TI.pool_slots,
+            TI.state,
+            TI._try_number,
+        )
+
+    def _add_rows(self, rows) -> None:
+        for dag_id, task_id, run_id, map_index, pool, pool_slots, state, stored_try_number in rows:
+            # Like TaskInstance.try_number, the try of a TI not running yet is the next one
+            try_number = stored_try_number if state == TaskInstanceState.RUNNING else stored_try_number + 1
+            self._add((dag_id, task_id, run_id, map_index), _LedgerEntry(pool, pool_slots, state, try_number))
+
+    def pool_stats(self, *, lock_rows: bool = False, session: Session) -> Dict[str, PoolStats]:
+        """
+        Get Pool stats in the same shape as :meth:`airflow.models.pool.Pool.slots_stats`.
+
+        Only the (small) ``slot_pool`` table is read from the database -- and locked if ``lock_rows``
+        is True -- the occupancy comes from the ledger. The reconcile or sync happens while the
+        pool rows are locked, so it sees the same state the critical section acts upon.
+        """
+        query = session.query(Pool.pool, Pool.slots)
+        if lock_rows:
+            query = with_row_locks(query, session=session, **nowait(session))
+        pool_rows: Iterable[Tuple[str, int]] = query.all()
+
+        self.reconcile_if_due(session)
+
+        pools: Dict[str, PoolStats] = {}
+        for pool_name, total_slots in pool_rows:
+            if total_slots == -1:
+                total_slots = float('inf')  # type: ignore
+            running = self._pool_slots[(pool_name, TaskInstanceState.RUNNING)]
+            queued = self._pool_slots[(pool_name, TaskInstanceState.QUEUED)]
+            pools[pool_name] = PoolStats(
+                total=total_slots, running=running, queued=queued, open=total_slots - running - queued
+            )
+        return pools
+
+    def concurrency_maps(self) -> Tuple[DefaultDict[str, int], DefaultDict[Tuple[str, str], int]]:
+        """
+        Get copies of the concurrency maps.
+
+        :return: A map from dag_id to # of task instances and a map from (dag_id, task_id) to
+            # of task instances in an execution state
+        """
+        return defaultdict(int, self._dag_counts), defaultdict(int, self._task_counts)
+
+    def _clear(self) -> None:
+        self._entries.clear()
+        self._pool_slots.clear()
+        self._dag_counts.clear()
+        self._task_counts.clear()
+
+    def _add(self, key: TIPrimaryKey, entry: _LedgerEntry) -> None:
+        # Re-queuing a TI we already track (e.g. a retry) or seeing it again when it starts running
+        # must not count it twice
+        current = self._entries.get(key)
+        if current is not None and current.try_number > entry.try_number:
+            return
+        self._remove(key)
+        dag_id, task_id, _, _ = key
+        self._entries[key] = entry
+        self._pool_slots[(entry.pool, entry.state)] += entry.pool_slots
+        self._dag_counts[dag_id] += 1
+        self._task_counts[(dag_id, task_id)] += 1
+
+    def _remove(self, key: TIPrimaryKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        dag_id, task_id, _, _ = key
+        self._pool_slots[(entry.pool, entry.state)] -= entry.pool_slots
+        self._dag_counts[dag_id] -= 1
+        self._task_counts[(dag_id, task_id)] -= 1
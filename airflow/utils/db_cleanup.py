@@ -20,13 +20,17 @@ This module took inspiration from the community maintenance dag
 (https://github.com/teamclairvoyant/airflow-maintenance-dags/blob/4e5c7682a808082561d60cbc9cafaa477b0d8c65/db-cleanup/airflow-db-cleanup.py).
 """
 
+import csv
 import logging
+import operator
+import os
+import time
 from contextlib import AbstractContextManager
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
 
 from pendulum import DateTime
-from sqlalchemy import and_, false, func
+from sqlalchemy import and_, exists, false, func, or_
 from sqlalchemy.exc import OperationalError
 
 from airflow.cli.simple_table import AirflowConsole
@@ -45,13 +49,14 @@ from airflow.models import (
     TaskReschedule,
     XCom,
 )
+from airflow.models.xcom import XComChunk
 from airflow.utils import timezone
 from airflow.utils.session import NEW_SESSION, provide_session
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Query, Session
     from sqlalchemy.orm.attributes import InstrumentedAttribute
-    from sqlalchemy.sql.schema import Column
+    from sqlalchemy.sql.schema import Column, Table
 
 
 @dataclass
@@ -115,6 +120,7 @@ config_list: List[_TableConfig] = [
     _TableConfig(orm_model=TaskInstance, recency_column=TaskInstance.start_date),
     _TableConfig(orm_model=TaskReschedule, recency_column=TaskReschedule.start_date),
     _TableConfig(orm_model=XCom, recency_column=XCom.timestamp),
+    _TableConfig(orm_model=XComChunk, recency_column=XComChunk.timestamp),
 ]
 try:
     from celery.backends.database.models import Task, TaskSet
@@ -131,27 +137,168 @@ except ImportError:
 config_dict: Dict[str, _TableConfig] = {x.orm_model.__tablename__: x for x in sorted(config_list)}
 
 
-def _print_entities(*, query: "Query", print_rows=False):
+def _print_entities(*, query: "Query", print_rows=False) -> int:
     num_entities = query.count()
     print(f"Found {num_entities} rows meeting deletion criteria.")
     if not print_rows:
-        return
+        return num_entities
     max_rows_to_print = 100
     if num_entities > 0:
         print(f"Printing first {max_rows_to_print} rows.")
     logger.debug("print entities query: %s", query)
     for entry in query.limit(max_rows_to_print):
         print(entry.__dict__)
+    return num_entities
+
+
+def _archive_rows(
+    *, rows: Iterable[Any], columns: Sequence["Column"], table_name: str, archive_dir: str
+) -> int:
+    """
+    Append the rows to the CSV file of the table in ``archive_dir``, with a header if it is new.
+
+    :return: The number of rows archived
+    """
+    os.makedirs(archive_dir, exist_ok=True)
+    path = os.path.join(archive_dir, f"{table_name}.csv")
+    num_rows = 0
+    with open(path, "a", newline="") as archive_file:
+        writer = csv.writer(archive_file)
+        if archive_file.tell() == 0:
+            writer.writerow(column.name for column in columns)
+        for row in rows:
+            writer.writerow(row)
+            num_rows += 1
+        # The rows must be archived before they are deleted
+        archive_file.flush()
+        os.fsync(archive_file.fileno())
+    return num_rows
+
+
+def _cascaded_conditions(table: "Table", condition) -> Dict["Table", List[Any]]:
+    """
+    Find the rows deleted by the foreign keys of other tables along with the rows of ``table`` matching
+    ``condition``: for each of these tables, the conditions on their rows, one per chain of foreign keys.
+    """
+    conditions: Dict["Table", List[Any]] = {}
+    for child in Base.metadata.sorted_tables:
+        for constraint in child.foreign_key_constraints:
+            if constraint.referred_table is not table or (constraint.ondelete or "").upper() != "CASCADE":
+                continue
+            joined = and_(*(fk.parent == fk.column for fk in constraint.elements))
+            child_condition = exists().where(and_(joined, condition)).correlate(child)
+            conditions.setdefault(child, []).append(child_condition)
+            for descendant, descendant_conditions in _cascaded_conditions(child, child_condition).items():
+                conditions.setdefault(descendant, []).extend(descendant_conditions)
+    return conditions
+
+
+def _archive_cascaded_rows(*, table: "Table", condition, session, archive_dir: str):
+    """Archive the rows deleted by foreign keys along with the rows of ``table`` matching ``condition``."""
+    for child, conditions in _cascaded_conditions(table, condition).items():
+        num_rows = _archive_rows(
+            rows=session.execute(child.select().where(or_(*conditions))),
+            columns=child.columns,
+            table_name=child.name,
+            archive_dir=archive_dir,
+        )
+        if num_rows:
+            print(f"Archived {num_rows} rows of {child.name!r} deleted along with rows of {table.name!r}")
 
 
-def _do_delete(*, query, session):
+def _do_delete(*, query, session, archive_dir=None):
     print("Performing Delete...")
+    if archive_dir:
+        table = query.column_descriptions[0]["entity"].__table__
+        _archive_cascaded_rows(
+            table=table, condition=query.whereclause, session=session, archive_dir=archive_dir
+        )
+        _archive_rows(
+            rows=query.with_entities(*table.columns).yield_per(1000),
+            columns=table.columns,
+            table_name=table.name,
+            archive_dir=archive_dir,
+        )
     # using bulk delete
     query.delete(synchronize_session=False)
     session.commit()
     print("Finished Performing Delete")
 
 
+def _key_bound(
+    columns: Sequence["Column"], key: Sequence[Any], compare: Callable[[Any, Any], Any], inclusive: bool
+):
+    """
+    Condition on the rows whose key ``columns`` compare to ``key`` in lexicographic order, written
+    as (a > x) OR (a = x AND b > y) for (a, b) > (x, y), as not all the databases can compare row
+    values.
+    """
+    conditions = [
+        and_(*(c == v for c, v in zip(columns[:i], key[:i])), compare(column, value))
+        for i, (column, value) in enumerate(zip(columns, key))
+    ]
+    if inclusive:
+        conditions.append(and_(*(c == v for c, v in zip(columns, key))))
+    return or_(*conditions)
+
+
+def _do_delete_in_batches(*, query, session, num_rows, batch_size, sleep_between_batches=0, archive_dir=None):
+    """
+    Delete the rows of the query by batches of ``batch_size`` rows, each committed in its own
+    transaction.
+
+    A batch holds the next rows in the order of the primary key, and it is deleted by the range of
+    the primary keys of its first and last row, which lets the database lock only that range. As
+    every batch is committed, interrupting the cleanup only loses the current batch, and running
+    it again deletes the remaining rows.
+    """
+    table = query.column_descriptions[0]["entity"].__table__
+    primary_key = list(table.primary_key.columns)
+    # The archived rows are read whole, and only the primary key is needed otherwise
+    columns = list(table.columns) if archive_dir else primary_key
+    key_indexes = [columns.index(column) for column in primary_key]
+
+    print(f"Performing Delete by batches of {batch_size} rows...")
+    num_deleted, last_key = 0, None
+    start = time.monotonic()
+    while True:
+        batch_query = query.with_entities(*columns)
+        if last_key is not None:
+            # Skip the rows of the previous batches that were kept
+            batch_query = batch_query.filter(_key_bound(primary_key, last_key, operator.gt, inclusive=False))
+        rows = batch_query.order_by(*primary_key).limit(batch_size).all()
+        if not rows:
+            break
+        first_key = [rows[0][index] for index in key_indexes]
+        last_key = [rows[-1][index] for index in key_indexes]
+        batch_delete_query = query.filter(
+            _key_bound(primary_key, first_key, operator.gt, inclusive=True),
+            _key_bound(primary_key, last_key, operator.lt, inclusive=True),
+        )
+
+        if archive_dir:
+            _archive_cascaded_rows(
+                table=table,
+                condition=batch_delete_query.whereclause,
+                session=session,
+                archive_dir=archive_dir,
+            )
+            _archive_rows(rows=rows, columns=columns, table_name=table.name, archive_dir=archive_dir)
+        num_deleted += batch_delete_query.delete(synchronize_session=False)
+        session.commit()
+
+        elapsed = time.monotonic() - start
+        print(
+            f"Deleted {num_deleted} of {num_rows} rows from {table.name!r} "
+            f"({num_deleted / elapsed if elapsed else 0:.0f} rows/s)"
+        )
+        if len(rows) < batch_size:
+            break
+        if sleep_between_batches:
+            time.sleep(sleep_between_batches)
+    print("Finished Performing Delete")
+
+
 def _subquery_keep_last(*, recency_column, keep_last_filters, keep_last_group_by, session):
     subquery = session.query(func.max(recency_column))
 
@@ -189,7 +336,9 @@ def _build_query(
             keep_last_group_by=keep_last_group_by,
             session=session,
         )
-        conditions.append(recency_column.notin_(subquery))
+        # The kept values are read once, not again by each query deleting a batch of rows
+        kept_values = [value for value, in subquery if value is not None]
+        conditions.append(recency_column.notin_(kept_values))
     query = query.filter(and_(*conditions))
     return query
 
@@ -207,6 +356,9 @@ def _cleanup_table(
     clean_before_timestamp,
     dry_run=True,
     verbose=False,
+    batch_size=None,
+    sleep_between_batches=0,
+    archive_dir=None,
     session=None,
     **kwargs,
 ):
@@ -223,11 +375,22 @@ def _cleanup_table(
         session=session,
     )
 
-    _print_entities(query=query, print_rows=False)
+    num_rows = _print_entities(query=query, print_rows=False)
 
-    if not dry_run:
-        _do_delete(query=query, session=session)
-        session.commit()
+    if dry_run:
+        return
+    if batch_size:
+        _do_delete_in_batches(
+            query=query,
+            session=session,
+            num_rows=num_rows,
+            batch_size=batch_size,
+            sleep_between_batches=sleep_between_batches,
+            archive_dir=archive_dir,
+        )
+    else:
+        _do_delete(query=query, session=session, archive_dir=archive_dir)
+    session.commit()
 
 
 def _confirm_delete(*, date: DateTime, tables: List[str]):
@@ -264,6 +427,12 @@ class _warn_if_missing(AbstractContextManager):
         return caught_error
 
 
+def _referencing_tables_first(configs: Dict[str, _TableConfig]) -> Dict[str, _TableConfig]:
+    """Order the tables so that each table comes before the tables its foreign keys reference."""
+    order = {table.name: i for i, table in enumerate(reversed(Base.metadata.sorted_tables))}
+    return dict(sorted(configs.items(), key=lambda item: (order.get(item[0], -1), item[0])))
+
+
 @provide_session
 def run_cleanup(
     *,
@@ -272,6 +441,9 @@ def run_cleanup(
     dry_run: bool = False,
     verbose: bool = False,
     confirm: bool = True,
+    batch_size: Optional[int] = None,
+    sleep_between_batches: float = 0,
+    archive_dir: Optional[str] = None,
     session: 'Session' = NEW_SESSION,
 ):
     """
@@ -282,7 +454,9 @@ def run_cleanup(
 
     Where there are foreign key relationships, deletes will cascade, so that for
     example if you clean up old dag runs, the associated task instances will
-    be deleted.
+    be deleted. The tables are cleaned before the tables they reference, so the
+    rows of a table meeting its own deletion criteria are deleted with it, and
+    the rows deleted along with another table are archived with that table.
 
     :param clean_before_timestamp: The timestamp before which data should be purged
     :param table_names: Optional. List of table names to perform maintenance on.  If list not provided,
@@ -290,6 +464,12 @@ def run_cleanup(
     :param dry_run: If true, print rows meeting deletion criteria
     :param verbose: If true, may provide more detailed output.
     :param confirm: Require user input to confirm before processing deletions.
+    :param batch_size: Optional. Number of rows to delete in each transaction. If not provided, all the
+        rows of a table are deleted in one transaction.
+    :param sleep_between_batches: Number of seconds to sleep between the batches, to throttle the
+        cleanup.
+    :param archive_dir: Optional. Directory in which the rows are appended to a CSV file per table
+        before they are deleted.
     :param session: Session representing connection to the metadata database.
     """
     clean_before_timestamp = timezone.coerce_datetime(clean_before_timestamp)
@@ -304,12 +484,15 @@ def run_cleanup(
         _print_config(configs=effective_config_dict)
     if not dry_run and confirm:
         _confirm_delete(date=clean_before_timestamp, tables=list(effective_config_dict.keys()))
-    for table_name, table_config in effective_config_dict.items():
+    for table_name, table_config in _referencing_tables_first(effective_config_dict).items():
         with _warn_if_missing(table_name, table_config.warn_if_missing):
             _cleanup_table(
                 clean_before_timestamp=clean_before_timestamp,
                 dry_run=dry_run,
                 verbose=verbose,
+                batch_size=batch_size,
+                sleep_between_batches=sleep_between_batches,
+                archive_dir=archive_dir,
                 **table_config.__dict__,
                 session=session,
             )
@@ -55,6 +55,9 @@ class FileProcessorHandler(logging.Handler):
         :param filename: filename in which the dag is located
         """
         local_loc = self._init_file(filename)
+        # A long-lived processor sets the context once per file, don't leak the previous file handle
+        if self.handler is not None:
+            self.handler.close()
         self.handler = NonCachingFileHandler(local_loc)
         self.handler.setFormatter(self.formatter)
         self.handler.setLevel(self.level)
@@ -28,11 +28,44 @@ from airflow.configuration import AirflowConfigException, conf
 from airflow.utils.context import Context
 from airflow.utils.helpers import parse_template_string, render_template_to_string
 from airflow.utils.log.non_caching_file_handler import NonCachingFileHandler
+from airflow.utils.state import State
 
 if TYPE_CHECKING:
     from airflow.models import TaskInstance
 
 
+def _content_range_length(content_range: str) -> int:
+    """Complete length of a file from a ``Content-Range`` header, e.g. ``bytes 0-99/1234``."""
+    return int(content_range.rsplit("/", 1)[1])
+
+
+class _LogChunk:
+    """
+    Bytes read from a log file, cut at the end of the last complete line unless the log is finished.
+
+    :param data: the bytes read
+    :param log_pos: offset in the file of the first byte read
+    :param size: size of the file
+    :param max_bytes: the most bytes that could be read, ``None`` if there was no limit
+    :param finished: whether nothing more will be written to the file
+    """
+
+    def __init__(self, data: bytes, log_pos: int, size: int, max_bytes: Optional[int], finished: bool):
+        # Whether all that was written so far was read. The last line, if still being written, is read
+        # again with what follows it next time.
+        self.end_of_file = log_pos + len(data) >= size
+        if not (self.end_of_file and finished):
+            last_line_end = data.rfind(b"\n")
+            # A line longer than a whole chunk is cut anyway, not to get stuck on it
+            if last_line_end != -1 or max_bytes is None or len(data) < max_bytes:
+                data = data[: last_line_end + 1]
+        self.data = data
+        self.next_log_pos = log_pos + len(data)
+
+    def text(self, errors: str) -> str:
+        return self.data.decode("utf-8", errors=errors)
+
+
 class FileTaskHandler(logging.Handler):
     """
     FileTaskHandler is a python log handler that handles and reads
@@ -118,6 +151,13 @@ class FileTaskHandler(logging.Handler):
         Template method that contains custom logic of reading
         logs given the try_number.
 
+        When ``metadata`` holds a ``log_pos`` byte offset, at most
+        ``[webserver] log_fetch_chunk_size`` bytes of the log are read from it,
+        and the returned metadata has ``log_pos`` moved past what was read.
+        While the try is running only complete lines are read, and the end of
+        the log is not reached until the try is over, unless the log is being
+        downloaded. Without ``log_pos`` the whole log is read.
+
         :param ti: task instance record
         :param try_number: current try_number to read log from
         :param metadata: log metadata,
@@ -131,12 +171,27 @@ class FileTaskHandler(logging.Handler):
         location = os.path.join(self.local_base, log_relative_path)
 
         log = ""
+        chunk: Optional[_LogChunk] = None
+        if metadata is None or 'log_pos' not in metadata:
+            log_pos, max_bytes, finished = 0, None, True
+        else:
+            log_pos = metadata['log_pos']
+            max_bytes = conf.getint('webserver', 'log_fetch_chunk_size', fallback=1024 * 1024)
+            # The log of the running try can still grow
+            finished = bool(
+                ti.state != State.RUNNING or try_number != ti.try_number or metadata.get('download_logs')
+            )
 
         if os.path.exists(location):
             try:
-                with open(location, encoding="utf-8", errors="surrogateescape") as file:
+                with open(location, "rb") as file:
+                    size = os.fstat(file.fileno()).st_size
+                    file.seek(log_pos)
+                    data = file.read(-1 if max_bytes is None else min(max_bytes, max(size - log_pos, 0)))
+                if log_pos == 0:
                     log += f"*** Reading local file: {location}\n"
-                    log += "".join(file.readlines())
+                chunk = _LogChunk(data, log_pos, size, max_bytes, finished)
+                log += chunk.text(errors="surrogateescape")
             except Exception as e:
                 log = f"*** Failed to load local log file: {location}\n"
                 log += f"*** {str(e)}\n"
@@ -182,8 +237,9 @@ class FileTaskHandler(logging.Handler):
             url = os.path.join("http://{ti.hostname}:{worker_log_server_port}/log", log_relative_path).format(
                 ti=ti, worker_log_server_port=conf.get('logging', 'WORKER_LOG_SERVER_PORT')
             )
-            log += f"*** Log file does not exist: {location}\n"
-            log += f"*** Fetching from: {url}\n"
+            if log_pos == 0:
+                log += f"*** Log file does not exist: {location}\n"
+                log += f"*** Fetching from: {url}\n"
             try:
                 timeout = None  # No timeout
                 try:
@@ -199,10 +255,10 @@ class FileTaskHandler(logging.Handler):
                     salt='task-instance-logs',
                 )
 
-                response = httpx.get(
-                    url, timeout=timeout, headers={'Authorization': signer.dumps(log_relative_path)}
-                )
-                response.encoding = "utf-8"
+                headers = {'Authorization': signer.dumps(log_relative_path)}
+                if max_bytes is not None:
+                    headers['Range'] = f"bytes={log_pos}-{log_pos + max_bytes - 1}"
+                response = httpx.get(url, timeout=timeout, headers=headers)
 
                 if response.status_code == 403:
                     log += (
@@ -215,14 +271,37 @@ class FileTaskHandler(logging.Handler):
                         "*** See more at https://airflow.apache.org/docs/apache-airflow/"
                         "stable/configurations-ref.html#secret-key\n***"
                     )
-                # Check if the resource was properly fetched
-                response.raise_for_status()
-
-                log += '\n' + response.text
+                if response.status_code == 416:
+                    # Nothing was written past log_pos yet
+                    data, size = b"", _content_range_length(response.headers['Content-Range'])
+                else:
+                    # Check if the resource was properly fetched
+                    response.raise_for_status()
+                    if response.status_code == 206:
+                        data, size = response.content, _content_range_length(
+                            response.headers['Content-Range']
+                        )
+                    else:
+                        # The whole file was sent (by a worker not supporting ranges)
+                        size = len(response.content)
+                        end = size if max_bytes is None else log_pos + max_bytes
+                        data = response.content[log_pos:end]
+
+                if log_pos == 0:
+                    log += '\n'
+                chunk = _LogChunk(data, log_pos, size, max_bytes, finished)
+                log += chunk.text(errors="replace")
             except Exception as e:
                 log += f"*** Failed to fetch log file from worker. {str(e)}\n"
 
-        return log, {'end_of_log': True}
+        if max_bytes is None or chunk is None:
+            return log, {'end_of_log': True}
+        return log, {
+            **metadata,
+            'end_of_log': finished and chunk.end_of_file,
+            'end_of_file': chunk.end_of_file,
+            'log_pos': chunk.next_log_pos,
+        }
 
     def read(self, task_instance, try_number=None, metadata=None):
         """
@@ -253,8 +332,10 @@ class FileTaskHandler(logging.Handler):
 
         logs = [''] * len(try_numbers)
         metadata_array = [{}] * len(try_numbers)
+        # A single position cannot be kept for several tries, so each of them is read whole
+        try_metadata = metadata if len(try_numbers) == 1 else None
         for i, try_number_element in enumerate(try_numbers):
-            log, metadata = self._read(task_instance, try_number_element, metadata)
+            log, metadata = self._read(task_instance, try_number_element, try_metadata)
             # es_task_handler return logs grouped by host. wrap other handler returning log string
             # with default/ empty host so that UI can render the response in the same way
             logs[i] = log if self._read_grouped_logs() else [(task_instance.hostname, log)]
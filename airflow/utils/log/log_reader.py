@@ -62,6 +62,9 @@ class TaskLogReader:
         """
         Used to continuously read log to the end
 
+        The log is read as a download: the log of a running try is read up to what was written so far,
+        instead of waiting for the try to finish.
+
         :param ti: The Task Instance
         :param try_number: the task try number
         :param metadata: A dictionary containing information about how to read the task log
@@ -72,14 +75,26 @@ class TaskLogReader:
             try_numbers = list(range(1, next_try))
         else:
             try_numbers = [try_number]
+        metadata['download_logs'] = True
         for current_try_number in try_numbers:
             metadata.pop('end_of_log', None)
             metadata.pop('max_offset', None)
             metadata.pop('offset', None)
+            # Read the log in chunks, from its start
+            metadata['log_pos'] = 0
+            previous_host = None
             while 'end_of_log' not in metadata or not metadata['end_of_log']:
                 logs, metadata = self.read_log_chunks(ti, current_try_number, metadata)
                 for host, log in logs[0]:
-                    yield "\n".join([host or '', log]) + "\n"
+                    # The chunks of a log read from the same host follow each other
+                    if host != previous_host:
+                        log = "\n".join([host or '', log])
+                        previous_host = host
+                    # A chunk cut within a line longer than a chunk is followed by the rest of the line
+                    if log and not log.endswith("\n") and metadata.get('end_of_file') is not False:
+                        log += "\n"
+                    if log:
+                        yield log
 
     @cached_property
     def log_handler(self):
@@ -18,7 +18,7 @@
 import collections
 import logging
 import re
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 from airflow.compat.functools import cache, cached_property
 
@@ -112,17 +112,194 @@ def _secrets_masker() -> "SecretsMasker":
     )
 
 
+class MaskingEngine:
+    """
+    Finds secrets in strings and replaces them.
+
+    When secrets overlap, the leftmost one is replaced, and the longest one when several start at the
+    same place, so all the engines give the same output.
+    """
+
+    def add(self, secret: str) -> None:
+        """Add a secret to look for."""
+        raise NotImplementedError()
+
+    def mask(self, text: str, replacement: str) -> str:
+        """Replace every secret found in ``text`` with ``replacement``."""
+        raise NotImplementedError()
+
+
+class RegexMaskingEngine(MaskingEngine):
+    """Masks secrets with a regular expression alternating all of them."""
+
+    def __init__(self):
+        self._secrets: List[str] = []
+        self._replacer: Optional["RePatternType"] = None
+
+    def add(self, secret: str) -> None:
+        self._secrets.append(secret)
+        # Compiled when next needed, not after each of the secrets added in a row
+        self._replacer = None
+
+    def mask(self, text: str, replacement: str) -> str:
+        if not self._secrets:
+            return text
+        if self._replacer is None:
+            # The first alternative matching wins, so put the longest secrets first
+            self._replacer = re.compile(
+                '|'.join(re.escape(secret) for secret in sorted(self._secrets, key=len, reverse=True))
+            )
+        return self._replacer.sub(lambda _: replacement, text)
+
+
+# Characters often found in log messages, from the least to the most frequent. Any other character
+# (upper case letters, most punctuation, non-ASCII) is deemed rarer than all of them.
+_FREQUENT_CHARS = "zqxjkvbpygfwmucldrhsnioate0123456789,-_=/:. "
+
+
+def _char_rarity(char: str) -> int:
+    return _FREQUENT_CHARS.find(char)
+
+
+class AhoCorasickMaskingEngine(MaskingEngine):
+    """
+    Masks secrets with an Aho-Corasick automaton, looking for all of them in a single pass.
+
+    The failure links of the automaton depend on all the secrets, so they are rebuilt when secrets are
+    added. To keep adding secrets cheap, new secrets are first searched one by one, and only put in the
+    automaton once there are enough of them compared to the secrets already in it.
+
+    Strings which cannot contain any secret are returned without being scanned: for every secret the
+    character deemed the rarest in logs is kept as its anchor, and a string containing no anchor is
+    left alone.
+    """
+
+    # Secrets searched one by one, at most, before rebuilding the automaton
+    MIN_PENDING_SECRETS = 16
+
+    def __init__(self):
+        self._secrets: Set[str] = set()
+        self._pending: List[str] = []
+        # Node 0 is the root. For each node: the transitions, the failure link, and the lengths of
+        # the secrets ending at that node, including through failure links.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._ends: List[Tuple[int, ...]] = [()]
+        self._anchors: Set[str] = set()
+        self._min_length = 0
+
+    def add(self, secret: str) -> None:
+        if secret in self._secrets:
+            return
+        self._secrets.add(secret)
+        self._pending.append(secret)
+        self._anchors.add(min(secret, key=_char_rarity))
+        self._min_length = min(self._min_length or len(secret), len(secret))
+
+    def _build(self) -> None:
+        goto = self._goto
+        terminal: Dict[int, int] = {}
+        for secret in self._secrets:
+            node = 0
+            for char in secret:
+                next_node = goto[node].get(char)
+                if next_node is None:
+                    next_node = goto[node][char] = len(goto)
+                    goto.append({})
+                node = next_node
+            terminal[node] = len(secret)
+
+        fail = [0] * len(goto)
+        ends: List[Tuple[int, ...]] = [()] * len(goto)
+        # Breadth first, so the failure link of a node is built before the node. Iterating over a
+        # list while appending to it reaches the appended items.
+        queue = list(goto[0].values())
+        for node in queue:
+            ending_here = terminal.get(node)
+            ends[node] = (ending_here,) + ends[fail[node]] if ending_here else ends[fail[node]]
+            for char, child in goto[node].items():
+                link = fail[node]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                fail[child] = goto[link].get(char, 0)
+                queue.append(child)
+        self._fail = fail
+        self._ends = ends
+        self._pending = []
+
+    def mask(self, text: str, replacement: str) -> str:
+        if not self._min_length or len(text) < self._min_length or self._anchors.isdisjoint(text):
+            return text
+        if len(self._pending) > max(self.MIN_PENDING_SECRETS, (len(self._secrets) - len(self._pending)) // 4):
+            self._build()
+
+        # Length of the longest secret found starting at each position
+        found: Dict[int, int] = {}
+        if len(self._pending) < len(self._secrets):
+            goto, fail, ends = self._goto, self._fail, self._ends
+            node = 0
+            for end, char in enumerate(text, 1):
+                while node and char not in goto[node]:
+                    node = fail[node]
+                node = goto[node].get(char, 0)
+                for length in ends[node]:
+                    start = end - length
+                    if found.get(start, 0) < length:
+                        found[start] = length
+        for secret in self._pending:
+            length = len(secret)
+            start = text.find(secret)
+            while start != -1:
+                if found.get(start, 0) < length:
+                    found[start] = length
+                start = text.find(secret, start + 1)
+        if not found:
+            return text
+
+        pieces = []
+        position = 0
+        for start in sorted(found):
+            if start < position:
+                continue
+            pieces.append(text[position:start])
+            pieces.append(replacement)
+            position = start + found[start]
+        pieces.append(text[position:])
+        return ''.join(pieces)
+
+
+MASKING_ENGINES: Dict[str, Type[MaskingEngine]] = {
+    'aho_corasick': AhoCorasickMaskingEngine,
+    'regex': RegexMaskingEngine,
+}
+
+
 class SecretsMasker(logging.Filter):
-    """Redact secrets from logs"""
+    """
+    Redact secrets from logs
 
-    replacer: Optional["RePatternType"] = None
+    :param engine: name of the :class:`MaskingEngine` finding the secrets, see ``MASKING_ENGINES``.
+        Defaults to ``[core] secrets_masker_engine``.
+    """
+
+    engine: MaskingEngine
     patterns: Set[str]
 
     ALREADY_FILTERED_FLAG = "__SecretsMasker_filtered"
     MAX_RECURSION_DEPTH = 5
 
-    def __init__(self):
+    def __init__(self, engine: Optional[str] = None):
+        from airflow.configuration import conf
+        from airflow.exceptions import AirflowConfigException
+
         super().__init__()
+        engine = engine or conf.get('core', 'secrets_masker_engine', fallback='aho_corasick')
+        try:
+            self.engine = MASKING_ENGINES[engine]()
+        except KeyError:
+            raise AirflowConfigException(
+                f"Unknown secrets masker engine {engine!r}, expected one of {sorted(MASKING_ENGINES)}"
+            )
         self.patterns = set()
 
     @cached_property
@@ -164,7 +341,7 @@ class SecretsMasker(logging.Filter):
             # "private" flag that stops us needing to process it more than once
             return True
 
-        if self.replacer:
+        if self.patterns:
             for k, v in record.__dict__.items():
                 if k in self._record_attrs_to_ignore:
                     continue
@@ -204,12 +381,10 @@ class SecretsMasker(logging.Filter):
                     for dict_key, subval in item.items()
                 }
             elif isinstance(item, str):
-                if self.replacer:
-                    # We can't replace specific values, but the key-based redacting
-                    # can still happen, so we can't short-circuit, we need to walk
-                    # the structure.
-                    return self.replacer.sub('***', item)
-                return item
+                # The engine returns the item as is when there is nothing to mask, but the
+                # key-based redacting can still happen, so we can't short-circuit, we need to
+                # walk the structure.
+                return self.engine.mask(item, '***')
             elif isinstance(item, (tuple, set)):
                 # Turn set in to tuple!
                 return tuple(self._redact(subval, name=None, depth=(depth + 1)) for subval in item)
@@ -253,7 +428,7 @@ class SecretsMasker(logging.Filter):
             pattern = re.escape(secret)
             if pattern not in self.patterns and (not name or should_hide_value_for_key(name)):
                 self.patterns.add(pattern)
-                self.replacer = re.compile('|'.join(self.patterns))
+                self.engine.add(secret)
         elif isinstance(secret, collections.abc.Iterable):
             for v in secret:
                 self.add_mask(v, name)
@@ -16,7 +16,10 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from importlib import import_module
+import os
+import sys
+from importlib import import_module, invalidate_caches
+from typing import Dict
 
 
 def import_string(dotted_path):
@@ -40,3 +43,35 @@ def import_string(dotted_path):
 def as_importable_string(thing) -> str:
     """Convert an attribute/class to a string importable by ``import_string``."""
     return f"{thing.__module__}.{thing.__name__}"
+
+
+def modules_from(directory: str) -> Dict[str, str]:
+    """
+    Find the modules imported from files under ``directory``.
+
+    :return: The paths of the files of the modules, by module name
+    """
+    prefixes = tuple(
+        {os.path.join(os.path.abspath(directory), ""), os.path.join(os.path.realpath(directory), "")}
+    )
+    return {
+        name: module.__file__
+        for name, module in list(sys.modules.items())
+        if (getattr(module, "__file__", None) or "").startswith(prefixes)
+    }
+
+
+def unload_modules_from(directory: str) -> int:
+    """
+    Remove the modules imported from files under ``directory`` from ``sys.modules``, so that they
+    are imported again, from their current content, the next time they are imported.
+
+    :return: The number of modules removed
+    """
+    module_names = list(modules_from(directory))
+    for name in module_names:
+        del sys.modules[name]
+    if module_names:
+        # New files may have been added since the directory was last read
+        invalidate_caches()
+    return len(module_names)
@@ -69,7 +69,11 @@ def create_app():
 
     @flask_app.route('/log/<path:filename>')
     def serve_logs_view(filename):
-        return send_from_directory(log_directory, filename, mimetype="application/json", as_attachment=False)
+        # Conditional responses honour the Range header, so the webserver can fetch only the part of
+        # the log it has not read yet
+        return send_from_directory(
+            log_directory, filename, mimetype="application/json", as_attachment=False, conditional=True
+        )
 
     return flask_app
 
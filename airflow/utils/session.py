@@ -17,13 +17,16 @@
 import contextlib
 from functools import wraps
 from inspect import signature
-from typing import Callable, Iterator, TypeVar, cast
+from typing import TYPE_CHECKING, Callable, Iterator, TypeVar, cast
 
 from airflow import settings
 
+if TYPE_CHECKING:
+    from sqlalchemy.orm.session import Session as SASession
+
 
 @contextlib.contextmanager
-def create_session() -> Iterator[settings.SASession]:
+def create_session() -> Iterator["SASession"]:
     """Contextmanager that will create and teardown a session."""
     if not settings.Session:
         raise RuntimeError("Session must be set before!")
@@ -77,4 +80,4 @@ def provide_session(func: Callable[..., RT]) -> Callable[..., RT]:
 # the 'session' argument to be of type Session instead of Optional[Session],
 # making it easier to type hint the function body without dealing with the None
 # case that can never happen at runtime.
-NEW_SESSION: settings.SASession = cast(settings.SASession, None)
+NEW_SESSION: "SASession" = cast("SASession", None)
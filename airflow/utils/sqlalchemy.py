@@ -16,14 +16,16 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import contextlib
 import datetime
 import json
 import logging
-from typing import Any, Dict
+import math
+from typing import Any, Dict, Iterator
 
 import pendulum
 from dateutil import relativedelta
-from sqlalchemy import event, nullsfirst
+from sqlalchemy import event, nullsfirst, text
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm.session import Session
 from sqlalchemy.types import JSON, DateTime, Text, TypeDecorator, TypeEngine, UnicodeText
@@ -217,6 +219,47 @@ def nowait(session: Session) -> Dict[str, Any]:
         return {}
 
 
+@contextlib.contextmanager
+def lock_timeout(session: Session, timeout: float) -> Iterator[None]:
+    """
+    Limit how long the statements run in the context wait for row locks.
+
+    A statement that cannot acquire its locks in time fails with an ``OperationalError`` that
+    :func:`is_lock_not_available_error` recognises. On Postgres the limit only applies to the current
+    transaction, on MySQL and MSSQL the previous limit of the connection is restored when leaving the
+    context. SQLite has no row locks, so nothing is done for it, nor when ``timeout`` is not positive.
+
+    :param session: ORM Session
+    :param timeout: The longest time to wait for a lock, in seconds
+    """
+    dialect = session.bind.dialect.name
+    if timeout <= 0 or dialect not in ("postgresql", "mysql", "mssql"):
+        yield
+        return
+
+    previous = None
+    if dialect == "postgresql":
+        session.execute(
+            text("SELECT set_config('lock_timeout', :timeout, true)"), {"timeout": f"{int(timeout * 1000)}ms"}
+        )
+    elif dialect == "mysql":
+        # The limit has a granularity of a second on MySQL
+        previous = session.execute(text("SELECT @@innodb_lock_wait_timeout")).scalar()
+        session.execute(
+            text("SET SESSION innodb_lock_wait_timeout = :timeout"), {"timeout": math.ceil(timeout)}
+        )
+    else:
+        previous = session.execute(text("SELECT @@LOCK_TIMEOUT")).scalar()
+        session.execute(text(f"SET LOCK_TIMEOUT {int(timeout * 1000)}"))
+    try:
+        yield
+    finally:
+        if dialect == "mysql":
+            session.execute(text("SET SESSION innodb_lock_wait_timeout = :timeout"), {"timeout": previous})
+        elif dialect == "mssql":
+            session.execute(text(f"SET LOCK_TIMEOUT {int(previous)}"))
+
+
 def nulls_first(col, session: Session) -> Dict[str, Any]:
     """
     Adds a nullsfirst construct to the column ordering. Currently only Postgres supports it.
@@ -48,6 +48,7 @@ from airflow.www.extensions.init_views import (
     init_plugins,
 )
 from airflow.www.extensions.init_wsgi_middlewares import init_wsgi_middleware
+from airflow.www.view_data_cache import get_view_data_cache
 
 app: Optional[Flask] = None
 
@@ -116,6 +117,7 @@ def create_app(config=None, testing=False):
 
     cache_config = {'CACHE_TYPE': 'flask_caching.backends.filesystem', 'CACHE_DIR': gettempdir()}
     Cache(app=flask_app, config=cache_config)
+    flask_app.view_data_cache = get_view_data_cache()
 
     init_flash_views(flask_app)
 
@@ -119,7 +119,9 @@ function autoTailingLog(tryNumber, metadata = null, autoTailing = false) {
         const linkifiedMessage = escapedMessage
           .replace(urlRegex, (url) => `<a href="${url}" target="_blank">${url}</a>`)
           .replaceAll(dateRegex, (date) => `<time datetime="${date}${tzOffset}">${formatDateTime(`${date}${tzOffset}`)}</time>`);
-        logBlock.innerHTML += `${linkifiedMessage}\n`;
+        // Chunks of a log may already end with a new line, or be cut within a line longer than a chunk
+        const noNewLine = linkifiedMessage.endsWith('\n') || res.metadata.end_of_file === false;
+        logBlock.innerHTML += noNewLine ? linkifiedMessage : `${linkifiedMessage}\n`;
       });
 
       // Auto scroll window to the end if current window location is near the end.
@@ -132,7 +134,8 @@ function autoTailingLog(tryNumber, metadata = null, autoTailing = false) {
       document.getElementById(`loading-${tryNumber}`).style.display = 'none';
       return;
     }
-    recurse().then(() => autoTailingLog(
+    // Fetch the rest of the log right away when it was not read to the end of the file
+    recurse(res.metadata.end_of_file === false ? 0 : DELAY).then(() => autoTailingLog(
       tryNumber, res.metadata, autoTailing,
     ));
   });
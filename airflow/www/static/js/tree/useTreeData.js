@@ -50,6 +50,43 @@ const formatData = (data) => {
   return formattedData;
 };
 
+const mergeGroups = (group, newGroup, keptRunIds) => {
+  const children = group.children || [];
+  const mergedGroup = {
+    ...newGroup,
+    instances: [
+      ...(group.instances || []).filter((instance) => keptRunIds.has(instance.runId)),
+      ...(newGroup.instances || []),
+    ],
+  };
+  if (newGroup.children) {
+    mergedGroup.children = newGroup.children.map((newChild) => {
+      const child = children.find((c) => c.id === newChild.id);
+      return child ? mergeGroups(child, newChild, keptRunIds) : newChild;
+    });
+  }
+  return mergedGroup;
+};
+
+// Merge the task instances of the runs that changed into the data already shown.
+// Returns null when the data of a run is neither shown nor returned, so all of it must be fetched.
+export const mergeTreeData = (data, newData) => {
+  if (!newData.changedRunIds) return newData;
+  const changedRunIds = new Set(newData.changedRunIds);
+  const shownRunIds = new Set(data.dagRuns.map((run) => run.runId));
+  const keptRunIds = new Set();
+  const isMissingRun = newData.dagRuns.some(({ runId }) => {
+    if (changedRunIds.has(runId)) return false;
+    keptRunIds.add(runId);
+    return !shownRunIds.has(runId);
+  });
+  if (isMissingRun) return null;
+  return {
+    ...newData,
+    groups: mergeGroups(data.groups, newData.groups, keptRunIds),
+  };
+};
+
 const useTreeData = () => {
   const [data, setData] = useState(formatData(treeData));
   const defaultIsOpen = isPaused !== 'True' && !JSON.parse(localStorage.getItem('disableAutoRefresh')) && areActiveRuns(data.dagRuns);
@@ -59,10 +96,20 @@ const useTreeData = () => {
     try {
       const root = urlRoot ? `&root=${urlRoot}` : '';
       const base = baseDate ? `&base_date=${baseDate}` : '';
-      const resp = await fetch(`${treeDataUrl}?dag_id=${dagId}&num_runs=${numRuns}${root}${base}`);
+      const url = `${treeDataUrl}?dag_id=${dagId}&num_runs=${numRuns}${root}${base}`;
+      // Only fetch the task instances of the runs that changed since the last refresh
+      const since = data.timestamp ? `&since=${encodeURIComponent(data.timestamp)}` : '';
+      let resp = await fetch(`${url}${since}`);
       let newData = await resp.json();
       if (newData) {
         newData = formatData(newData);
+        if (since) {
+          newData = mergeTreeData(data, newData);
+          if (!newData) {
+            resp = await fetch(url);
+            newData = formatData(await resp.json());
+          }
+        }
         if (JSON.stringify(newData) !== JSON.stringify(data)) {
           setData(newData);
         }
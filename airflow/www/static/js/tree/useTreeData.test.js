@@ -18,7 +18,7 @@
  */
 
 import { renderHook } from '@testing-library/react-hooks';
-import useTreeData from './useTreeData';
+import useTreeData, { mergeTreeData } from './useTreeData';
 
 /* global describe, test, expect, jest, beforeAll */
 
@@ -113,3 +113,61 @@ describe('Test useTreeData hook', () => {
     expect(isRefreshOn).toBe(false);
   });
 });
+
+describe('Test mergeTreeData', () => {
+  const instance = (runId, state) => ({ taskId: 'task', runId, state });
+  const data = {
+    dagRuns: [{ runId: 'run_1' }, { runId: 'run_2' }],
+    groups: {
+      id: null,
+      instances: [],
+      children: [{ id: 'task', instances: [instance('run_1', 'success'), instance('run_2', 'running')] }],
+    },
+  };
+
+  test('Replaces the instances of the changed runs only', () => {
+    const newData = {
+      dagRuns: [{ runId: 'run_1' }, { runId: 'run_2' }],
+      changedRunIds: ['run_2'],
+      groups: { id: null, instances: [], children: [{ id: 'task', instances: [instance('run_2', 'success')] }] },
+    };
+
+    const merged = mergeTreeData(data, newData);
+
+    expect(merged.groups.children[0].instances).toStrictEqual([
+      instance('run_1', 'success'),
+      instance('run_2', 'success'),
+    ]);
+  });
+
+  test('Drops the instances of the runs no longer shown', () => {
+    const newData = {
+      dagRuns: [{ runId: 'run_2' }, { runId: 'run_3' }],
+      changedRunIds: ['run_3'],
+      groups: { id: null, instances: [], children: [{ id: 'task', instances: [instance('run_3', 'queued')] }] },
+    };
+
+    const merged = mergeTreeData(data, newData);
+
+    expect(merged.groups.children[0].instances).toStrictEqual([
+      instance('run_2', 'running'),
+      instance('run_3', 'queued'),
+    ]);
+  });
+
+  test('Returns null when an unchanged run is not shown', () => {
+    const newData = {
+      dagRuns: [{ runId: 'run_0' }, { runId: 'run_1' }],
+      changedRunIds: [],
+      groups: { id: null, instances: [], children: [{ id: 'task', instances: [] }] },
+    };
+
+    expect(mergeTreeData(data, newData)).toBeNull();
+  });
+
+  test('Returns the data as is without changedRunIds', () => {
+    const newData = { dagRuns: [], groups: {} };
+
+    expect(mergeTreeData(data, newData)).toBe(newData);
+  });
+});
@@ -18,7 +18,7 @@
 import json
 import textwrap
 import time
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlencode
 
 import markdown
@@ -76,45 +76,52 @@ def get_instance_with_map(task_instance, session):
     return get_mapped_summary(task_instance, mapped_instances)
 
 
+# Order in which the states of task instances take precedence in the summary of a group of them
+TI_STATE_PRIORITY = [
+    TaskInstanceState.FAILED,
+    TaskInstanceState.UPSTREAM_FAILED,
+    TaskInstanceState.UP_FOR_RETRY,
+    TaskInstanceState.UP_FOR_RESCHEDULE,
+    TaskInstanceState.QUEUED,
+    TaskInstanceState.SCHEDULED,
+    TaskInstanceState.DEFERRED,
+    TaskInstanceState.SENSING,
+    TaskInstanceState.RUNNING,
+    TaskInstanceState.SHUTDOWN,
+    TaskInstanceState.RESTARTING,
+    TaskInstanceState.REMOVED,
+    TaskInstanceState.SUCCESS,
+    TaskInstanceState.SKIPPED,
+]
+
+
 def get_mapped_summary(parent_instance, task_instances):
-    priority = [
-        TaskInstanceState.FAILED,
-        TaskInstanceState.UPSTREAM_FAILED,
-        TaskInstanceState.UP_FOR_RETRY,
-        TaskInstanceState.UP_FOR_RESCHEDULE,
-        TaskInstanceState.QUEUED,
-        TaskInstanceState.SCHEDULED,
-        TaskInstanceState.DEFERRED,
-        TaskInstanceState.SENSING,
-        TaskInstanceState.RUNNING,
-        TaskInstanceState.SHUTDOWN,
-        TaskInstanceState.RESTARTING,
-        TaskInstanceState.REMOVED,
-        TaskInstanceState.SUCCESS,
-        TaskInstanceState.SKIPPED,
-    ]
-
-    mapped_states = [ti.state for ti in task_instances]
+    return encode_mapped_summary(
+        parent_instance,
+        mapped_states=[ti.state for ti in task_instances],
+        start_date=min((ti.start_date for ti in task_instances if ti.start_date), default=None),
+        end_date=max((ti.end_date for ti in task_instances if ti.end_date), default=None),
+    )
 
+
+def encode_mapped_summary(
+    parent_instance,
+    mapped_states: List[Optional[str]],
+    start_date: Optional[DateTime],
+    end_date: Optional[DateTime],
+) -> Dict[str, Any]:
     group_state = None
-    for state in priority:
+    for state in TI_STATE_PRIORITY:
         if state in mapped_states:
             group_state = state
             break
 
-    group_start_date = datetime_to_string(
-        min((ti.start_date for ti in task_instances if ti.start_date), default=None)
-    )
-    group_end_date = datetime_to_string(
-        max((ti.end_date for ti in task_instances if ti.end_date), default=None)
-    )
-
     return {
         'task_id': parent_instance.task_id,
         'run_id': parent_instance.run_id,
         'state': group_state,
-        'start_date': group_start_date,
-        'end_date': group_end_date,
+        'start_date': datetime_to_string(start_date),
+        'end_date': datetime_to_string(end_date),
         'mapped_states': mapped_states,
         'operator': parent_instance.operator,
         'execution_date': datetime_to_string(parent_instance.execution_date),
@@ -122,6 +129,46 @@ def get_mapped_summary(parent_instance, task_instances):
     }
 
 
+def get_mapped_summaries(
+    dag_id: str, run_ids: List[str], task_ids: List[str], session: Session
+) -> Dict[Tuple[str, str], Tuple[List[Optional[str]], Optional[DateTime], Optional[DateTime]]]:
+    """
+    Summarize the mapped task instances of several tasks and runs with a single query.
+
+    :return: the states of the mapped task instances, their earliest start date and their latest
+        end date, by task_id and run_id
+    """
+    if not run_ids or not task_ids:
+        return {}
+    query = (
+        session.query(
+            TaskInstance.task_id,
+            TaskInstance.run_id,
+            TaskInstance.state,
+            sqla.func.count(),
+            sqla.func.min(TaskInstance.start_date),
+            sqla.func.max(TaskInstance.end_date),
+        )
+        .filter(
+            TaskInstance.dag_id == dag_id,
+            TaskInstance.run_id.in_(run_ids),
+            TaskInstance.task_id.in_(task_ids),
+            TaskInstance.map_index >= 0,
+        )
+        .group_by(TaskInstance.task_id, TaskInstance.run_id, TaskInstance.state)
+    )
+    summaries: Dict[Tuple[str, str], Tuple[List[Optional[str]], Optional[DateTime], Optional[DateTime]]] = {}
+    for task_id, run_id, state, count, start_date, end_date in query:
+        states, min_start_date, max_end_date = summaries.get((task_id, run_id), ([], None, None))
+        states.extend([state] * count)
+        summaries[task_id, run_id] = (
+            states,
+            min(filter(None, (min_start_date, start_date)), default=None),
+            max(filter(None, (max_end_date, end_date)), default=None),
+        )
+    return summaries
+
+
 def encode_ti(
     task_instance: Optional[TaskInstance], is_mapped: Optional[bool], session: Optional[Session]
 ) -> Optional[Dict[str, Any]]:
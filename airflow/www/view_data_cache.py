@@ -0,0 +1,215 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Caches of the data computed by the views of the webserver from the DAG and its runs.
+
+An entry is keyed by the view, the arguments of the request, the hash of the serialized DAG and a
+marker of the last updates of the DAG runs and task instances shown, so a change to any of them
+leads to a new key rather than to an invalidation. Entries also expire after ``[webserver]
+view_data_cache_ttl`` seconds, which bounds how long data the marker does not cover may be stale.
+"""
+import hashlib
+import json
+import os
+import stat
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Type
+
+from cachelib import FileSystemCache
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from airflow.configuration import conf
+from airflow.exceptions import AirflowConfigException
+from airflow.models.dagrun import DagRun
+from airflow.models.taskinstance import TaskInstance
+from airflow.stats import Stats
+from airflow.utils.module_loading import import_string
+
+
+class ViewDataCache:
+    """
+    Base class of the caches of the data of the views.
+
+    :param max_entries: the number of entries kept, the least recently used ones being evicted
+    :param ttl: the number of seconds after which an entry expires
+    """
+
+    def __init__(self, max_entries: int, ttl: int):
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get the value cached for ``key``, or None."""
+        raise NotImplementedError()
+
+    def set(self, key: str, value: Any) -> None:
+        """Cache ``value`` for ``key``."""
+        raise NotImplementedError()
+
+    def get_or_compute(self, view: str, key: str, compute: Callable[[], Any]) -> Any:
+        """Get the value cached for ``key``, computing and caching it on a miss."""
+        value = self.get(key)
+        if value is not None:
+            Stats.incr(f'view_data_cache.{view}.hit')
+            return value
+        Stats.incr(f'view_data_cache.{view}.miss')
+        value = compute()
+        self.set(key, value)
+        return value
+
+
+class MemoryViewDataCache(ViewDataCache):
+    """Cache of the data of the views in the memory of the process of the webserver."""
+
+    def __init__(self, max_entries: int, ttl: int):
+        super().__init__(max_entries, ttl)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class FileSystemViewDataCache(ViewDataCache):
+    """
+    Cache of the data of the views in files, shared by the workers of the webserver on this host.
+
+    The files are kept in ``[webserver] view_data_cache_dir``. As the cached data is unpickled, the
+    directory is created private to the user running the webserver and is not used if anyone else
+    owns it or can write to it.
+    """
+
+    def __init__(self, max_entries: int, ttl: int):
+        super().__init__(max_entries, ttl)
+        cache_dir = os.path.expanduser(conf.get('webserver', 'view_data_cache_dir'))
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        cache_dir_stat = os.stat(cache_dir)
+        if cache_dir_stat.st_uid != os.getuid() or cache_dir_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise AirflowConfigException(
+                f'The view data cache directory "{cache_dir}" must be owned by the user running the '
+                f'webserver and writable by it only. Please check "view_data_cache_dir" key in '
+                f'"webserver" section.'
+            )
+        self._cache = FileSystemCache(cache_dir, threshold=max_entries, default_timeout=ttl)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: Any) -> None:
+        self._cache.set(key, value)
+
+
+VIEW_DATA_CACHE_BACKENDS: Dict[str, Type[ViewDataCache]] = {
+    'memory': MemoryViewDataCache,
+    'filesystem': FileSystemViewDataCache,
+}
+
+
+def get_view_data_cache() -> Optional[ViewDataCache]:
+    """
+    Create the cache of the data of the views configured by ``[webserver] view_data_cache``.
+
+    :return: the cache, or None if the data of the views is not cached
+    """
+    backend = conf.get('webserver', 'view_data_cache')
+    if not backend or backend.lower() == 'none':
+        return None
+    try:
+        cache_class = VIEW_DATA_CACHE_BACKENDS.get(backend) or import_string(backend)
+    except ImportError:
+        raise AirflowConfigException(
+            f'The view data cache could not be loaded. Please check "view_data_cache" key in "webserver" '
+            f'section. Current value: "{backend}".'
+        )
+    return cache_class(
+        max_entries=conf.getint('webserver', 'view_data_cache_size'),
+        ttl=conf.getint('webserver', 'view_data_cache_ttl'),
+    )
+
+
+def get_update_marker(
+    dag_id: str,
+    session: Session,
+    *,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    include_task_instances: bool = True,
+) -> Tuple[Hashable, ...]:
+    """
+    Summarize the DAG runs of ``dag_id`` executed between ``start_date`` and ``end_date`` and their
+    task instances, so that the summary changes when any of them is created, updated or deleted.
+
+    The summary is computed with at most two aggregate queries.
+    """
+    run_filters = [DagRun.dag_id == dag_id]
+    if start_date is not None:
+        run_filters.append(DagRun.execution_date >= start_date)
+    if end_date is not None:
+        run_filters.append(DagRun.execution_date <= end_date)
+
+    marker: Tuple[Hashable, ...] = tuple(
+        session.query(
+            DagRun.state,
+            func.count(),
+            func.max(DagRun.id),
+            func.max(DagRun.last_scheduling_decision),
+        )
+        .filter(*run_filters)
+        .group_by(DagRun.state)
+        .order_by(DagRun.state)
+    )
+    if include_task_instances:
+        marker += tuple(
+            session.query(
+                TaskInstance.state,
+                func.count(),
+                func.sum(TaskInstance._try_number),
+                func.max(TaskInstance.updated_at),
+            )
+            .join(TaskInstance.dag_run)
+            .filter(TaskInstance.dag_id == dag_id, *run_filters)
+            .group_by(TaskInstance.state)
+            .order_by(TaskInstance.state)
+        )
+    return marker
+
+
+def get_view_data_key(view: str, dag_id: str, dag_hash: str, args: Any, marker: Tuple[Hashable, ...]) -> str:
+    """Get the key of the data of ``view`` for ``args``, the arguments of the request."""
+    key = json.dumps([view, dag_id, dag_hash, args, marker], default=str, sort_keys=True)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
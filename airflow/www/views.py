@@ -27,7 +27,7 @@ import sys
 import traceback
 import warnings
 from collections import defaultdict
-from datetime import timedelta
+from datetime import datetime, timedelta
 from functools import wraps
 from json import JSONDecodeError
 from operator import itemgetter
@@ -83,7 +83,7 @@ from pendulum.datetime import DateTime
 from pendulum.parsing.exceptions import ParserError
 from pygments import highlight, lexers
 from pygments.formatters import HtmlFormatter
-from sqlalchemy import Date, and_, desc, func, inspect, union_all
+from sqlalchemy import Date, and_, desc, func, inspect
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 from wtforms import SelectField, validators
@@ -103,6 +103,7 @@ from airflow.models import DAG, Connection, DagModel, DagTag, Log, SlaMiss, Task
 from airflow.models.abstractoperator import AbstractOperator
 from airflow.models.dagcode import DagCode
 from airflow.models.dagrun import DagRun, DagRunType
+from airflow.models.dagstats import DagStateStats
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.taskinstance import TaskInstance
 from airflow.providers_manager import ProvidersManager
@@ -130,6 +131,7 @@ from airflow.www.forms import (
     DateTimeWithNumRunsWithDagRunsForm,
     TaskInstanceEditForm,
 )
+from airflow.www.view_data_cache import get_update_marker, get_view_data_key
 from airflow.www.widgets import AirflowModelListWidget, AirflowVariableShowWidget
 
 PAGE_SIZE = conf.getint('webserver', 'page_size')
@@ -227,86 +229,176 @@ def get_date_time_num_runs_dag_runs_form_data(www_request, session, dag):
 def task_group_to_tree(task_item_or_group, dag, dag_runs, tis, session):
     """
     Create a nested dict representation of this TaskGroup and its children used to construct
-    the Graph.
+    the Grid.
+
+    The task instances are indexed by task_id once and the mapped task instances of all the tasks
+    and runs are summarized with a single query. The summary of every group is rolled up from the
+    summaries of its children, so building the tree is linear in the number of task instances.
     """
-    if isinstance(task_item_or_group, AbstractOperator):
-        return {
-            'id': task_item_or_group.task_id,
-            'instances': [
-                wwwutils.encode_ti(ti, task_item_or_group.is_mapped, session)
-                for ti in tis
-                if ti.task_id == task_item_or_group.task_id
-            ],
-            'label': task_item_or_group.label,
-            'extra_links': [],
-            'is_mapped': task_item_or_group.is_mapped,
-        }
+    tis_by_task_id: Dict[str, List[TaskInstance]] = defaultdict(list)
+    for ti in tis:
+        tis_by_task_id[ti.task_id].append(ti)
+    mapped_task_ids = [task_id for task_id in tis_by_task_id if dag.get_task(task_id).is_mapped]
+    mapped_summaries = wwwutils.get_mapped_summaries(
+        dag.dag_id, [dr.run_id for dr in dag_runs], mapped_task_ids, session
+    )
+    tree, _ = _task_group_to_tree(task_item_or_group, dag_runs, tis_by_task_id, mapped_summaries)
+    return tree
 
-    # Task Group
-    task_group = task_item_or_group
 
-    children = [
-        task_group_to_tree(child, dag, dag_runs, tis, session) for child in task_group.children.values()
-    ]
+# Rank of the states of task instances in the summary of a group, the lowest taking precedence
+_GROUP_STATE_RANK = {state: rank for rank, state in enumerate(wwwutils.TI_STATE_PRIORITY)}
 
-    def get_summary(dag_run, children):
-        priority = [
-            TaskInstanceState.FAILED,
-            TaskInstanceState.UPSTREAM_FAILED,
-            TaskInstanceState.UP_FOR_RETRY,
-            TaskInstanceState.UP_FOR_RESCHEDULE,
-            TaskInstanceState.QUEUED,
-            TaskInstanceState.SCHEDULED,
-            TaskInstanceState.DEFERRED,
-            TaskInstanceState.SENSING,
-            TaskInstanceState.RUNNING,
-            TaskInstanceState.SHUTDOWN,
-            TaskInstanceState.RESTARTING,
-            TaskInstanceState.REMOVED,
-            TaskInstanceState.SUCCESS,
-            TaskInstanceState.SKIPPED,
-        ]
 
-        child_instances = [child['instances'] for child in children if 'instances' in child]
-        child_instances = [item for sublist in child_instances for item in sublist]
+def _task_group_to_tree(task_item_or_group, dag_runs, tis_by_task_id, mapped_summaries):
+    """
+    Build the tree of ``task_item_or_group`` for :func:`task_group_to_tree`.
 
-        children_start_dates = [
-            item['start_date'] for item in child_instances if item['run_id'] == dag_run.run_id
-        ]
-        children_end_dates = [
-            item['end_date'] for item in child_instances if item['run_id'] == dag_run.run_id
-        ]
-        children_states = [item['state'] for item in child_instances if item['run_id'] == dag_run.run_id]
-
-        group_state = None
-        for state in priority:
-            if state in children_states:
-                group_state = state
-                break
-        group_start_date = wwwutils.datetime_to_string(
-            min((timezone.parse(date) for date in children_start_dates if date), default=None)
-        )
-        group_end_date = wwwutils.datetime_to_string(
-            max((timezone.parse(date) for date in children_end_dates if date), default=None)
-        )
+    :return: the tree, and the state rank, earliest start date and latest end date of the task
+        instances it contains, by run_id
+    """
+    rollup: Dict[str, List[Any]] = {}
 
-        return {
-            'task_id': task_group.group_id,
-            'run_id': dag_run.run_id,
-            'state': group_state,
-            'start_date': group_start_date,
-            'end_date': group_end_date,
+    def add_to_rollup(run_id, state, start_date, end_date):
+        rank = _GROUP_STATE_RANK.get(state, len(_GROUP_STATE_RANK))
+        current = rollup.get(run_id)
+        if current is None:
+            rollup[run_id] = [rank, start_date, end_date]
+            return
+        current[0] = min(current[0], rank)
+        current[1] = min(filter(None, (current[1], start_date)), default=None)
+        current[2] = max(filter(None, (current[2], end_date)), default=None)
+
+    if isinstance(task_item_or_group, AbstractOperator):
+        task = task_item_or_group
+        instances = []
+        if task.is_mapped:
+            # The first mapped task instance of each run stands for all of them
+            parents = {}
+            for ti in tis_by_task_id.get(task.task_id, ()):
+                parents.setdefault(ti.run_id, ti)
+            for run_id, parent in parents.items():
+                mapped_states, start_date, end_date = mapped_summaries.get(
+                    (task.task_id, run_id), ([], None, None)
+                )
+                instance = wwwutils.encode_mapped_summary(parent, mapped_states, start_date, end_date)
+                instances.append(instance)
+                add_to_rollup(run_id, instance['state'], start_date, end_date)
+        else:
+            for ti in tis_by_task_id.get(task.task_id, ()):
+                instances.append(wwwutils.encode_ti(ti, False, None))
+                add_to_rollup(ti.run_id, ti.state, ti.start_date, ti.end_date)
+        tree = {
+            'id': task.task_id,
+            'instances': instances,
+            'label': task.label,
+            'extra_links': [],
+            'is_mapped': task.is_mapped,
         }
+        return tree, rollup
 
-    group_summaries = [get_summary(dr, children) for dr in dag_runs]
+    # Task Group
+    task_group = task_item_or_group
 
-    return {
+    children = []
+    for child in task_group.children.values():
+        child_tree, child_rollup = _task_group_to_tree(child, dag_runs, tis_by_task_id, mapped_summaries)
+        children.append(child_tree)
+        for run_id, (rank, start_date, end_date) in child_rollup.items():
+            state = wwwutils.TI_STATE_PRIORITY[rank] if rank < len(_GROUP_STATE_RANK) else None
+            add_to_rollup(run_id, state, start_date, end_date)
+
+    group_summaries = []
+    for dag_run in dag_runs:
+        rank, start_date, end_date = rollup.get(dag_run.run_id, (len(_GROUP_STATE_RANK), None, None))
+        group_summaries.append(
+            {
+                'task_id': task_group.group_id,
+                'run_id': dag_run.run_id,
+                'state': wwwutils.TI_STATE_PRIORITY[rank] if rank < len(_GROUP_STATE_RANK) else None,
+                'start_date': wwwutils.datetime_to_string(start_date),
+                'end_date': wwwutils.datetime_to_string(end_date),
+            }
+        )
+
+    tree = {
         'id': task_group.group_id,
         'label': task_group.label,
         'children': children,
         'tooltip': task_group.tooltip,
         'instances': group_summaries,
     }
+    return tree, rollup
+
+
+def get_grid_task_instances(dag, dag_runs, session):
+    """
+    Get the task instances of ``dag_runs`` shown in the Grid.
+
+    Of the instances of a mapped task, only the first one is loaded: the others are summarized by
+    :func:`task_group_to_tree`.
+    """
+    run_ids = [dr.run_id for dr in dag_runs]
+    if not run_ids:
+        return []
+    return (
+        session.query(TaskInstance)
+        .filter(
+            TaskInstance.dag_id == dag.dag_id,
+            TaskInstance.run_id.in_(run_ids),
+            TaskInstance.task_id.in_(dag.task_ids),
+            TaskInstance.map_index <= 0,
+        )
+        .all()
+    )
+
+
+def get_changed_run_ids(dag, dag_runs, since, session) -> Set[str]:
+    """
+    Get the run_id of the runs among ``dag_runs`` that may have changed since ``since``.
+
+    A run changed if it is not finished, if it started or ended since then, or if one of its task
+    instances was updated since then.
+    """
+    changed = {
+        dr.run_id
+        for dr in dag_runs
+        if dr.state not in (State.SUCCESS, State.FAILED)
+        or (dr.start_date and dr.start_date >= since)
+        or (dr.end_date and dr.end_date >= since)
+    }
+    other_run_ids = [dr.run_id for dr in dag_runs if dr.run_id not in changed]
+    if other_run_ids:
+        changed.update(
+            run_id
+            for run_id, in session.query(TaskInstance.run_id)
+            .filter(
+                TaskInstance.dag_id == dag.dag_id,
+                TaskInstance.run_id.in_(other_run_ids),
+                TaskInstance.updated_at >= since,
+            )
+            .distinct()
+        )
+    return changed
+
+
+def get_cached_view_data(view: str, dag: DAG, compute: Callable[[], Any], session: Session, **window) -> Any:
+    """
+    Get the data of ``view`` from the view data cache, computing it with ``compute`` on a miss.
+
+    The data is cached for the arguments of the request, the version of the serialized DAG and the
+    last updates of the DAG runs in ``window``, passed to
+    :func:`~airflow.www.view_data_cache.get_update_marker`, and their task instances. It is always
+    computed when the version of the DAG is not known, i.e. when it is not read from the database.
+    """
+    cache = getattr(current_app, 'view_data_cache', None)
+    dag_hash = current_app.dag_bag.dags_hash.get(dag.dag_id)
+    if cache is None or dag_hash is None:
+        return compute()
+    marker = get_update_marker(dag.dag_id, session, **window)
+    args = [sorted(request.args.items(multi=True)), window]
+    key = get_view_data_key(view, dag.dag_id, dag_hash, args, marker)
+    return cache.get_or_compute(view, key, compute)
 
 
 def task_group_to_dict(task_item_or_group):
@@ -498,6 +590,18 @@ def dag_edges(dag):
     return result
 
 
+def get_dag_state_stats(dag_ids: Set[str], session: Session) -> Dict[str, DagStateStats]:
+    """
+    Get the stats of ``dag_ids`` shown on the home page.
+
+    They are read from the stats the scheduler refreshes, unless it does not refresh them, in which
+    case they are computed.
+    """
+    if conf.getfloat('scheduler', 'dag_stats_update_interval', fallback=10.0) > 0:
+        return DagStateStats.get(dag_ids, session=session)
+    return DagStateStats.compute(dag_ids, session)
+
+
 def get_task_stats_from_query(qry):
     """
     Return a dict of the task quantity, grouped by dag id and task status.
@@ -882,14 +986,8 @@ class Airflow(AirflowBaseView):
     @provide_session
     def dag_stats(self, session=None):
         """Dag statistics."""
-        dr = models.DagRun
-
         allowed_dag_ids = current_app.appbuilder.sm.get_accessible_dag_ids(g.user)
 
-        dag_state_stats = session.query(dr.dag_id, dr.state, sqla.func.count(dr.state)).group_by(
-            dr.dag_id, dr.state
-        )
-
         # Filter by post parameters
         selected_dag_ids = {unquote(dag_id) for dag_id in request.form.getlist('dag_ids') if dag_id}
 
@@ -902,18 +1000,12 @@ class Airflow(AirflowBaseView):
             return wwwutils.json_response({})
 
         payload = {}
-        dag_state_stats = dag_state_stats.filter(dr.dag_id.in_(filter_dag_ids))
-        data = {}
-
-        for dag_id, state, count in dag_state_stats:
-            if dag_id not in data:
-                data[dag_id] = {}
-            data[dag_id][state] = count
+        dag_state_stats = get_dag_state_stats(filter_dag_ids, session)
 
         for dag_id in filter_dag_ids:
             payload[dag_id] = []
             for state in State.dag_states:
-                count = data.get(dag_id, {}).get(state, 0)
+                count = dag_state_stats[dag_id].dag_run_states.get(state, 0)
                 payload[dag_id].append({'state': state, 'count': count})
 
         return wwwutils.json_response(payload)
@@ -942,84 +1034,26 @@ class Airflow(AirflowBaseView):
         else:
             filter_dag_ids = allowed_dag_ids
 
-        running_dag_run_query_result = (
-            session.query(DagRun.dag_id, DagRun.run_id)
-            .join(DagModel, DagModel.dag_id == DagRun.dag_id)
-            .filter(DagRun.state == State.RUNNING, DagModel.is_active)
-        )
-
-        running_dag_run_query_result = running_dag_run_query_result.filter(DagRun.dag_id.in_(filter_dag_ids))
-
-        running_dag_run_query_result = running_dag_run_query_result.subquery('running_dag_run')
-
-        # Select all task_instances from active dag_runs.
-        running_task_instance_query_result = session.query(
-            TaskInstance.dag_id.label('dag_id'),
-            TaskInstance.state.label('state'),
-            sqla.literal(True).label('is_dag_running'),
-        ).join(
-            running_dag_run_query_result,
-            and_(
-                running_dag_run_query_result.c.dag_id == TaskInstance.dag_id,
-                running_dag_run_query_result.c.run_id == TaskInstance.run_id,
-            ),
-        )
-
-        if conf.getboolean('webserver', 'SHOW_RECENT_STATS_FOR_COMPLETED_RUNS', fallback=True):
-
-            last_dag_run = (
-                session.query(DagRun.dag_id, sqla.func.max(DagRun.execution_date).label('execution_date'))
-                .join(DagModel, DagModel.dag_id == DagRun.dag_id)
-                .filter(DagRun.state != State.RUNNING, DagModel.is_active)
-                .group_by(DagRun.dag_id)
-            )
-
-            last_dag_run = last_dag_run.filter(DagRun.dag_id.in_(filter_dag_ids))
-            last_dag_run = last_dag_run.subquery('last_dag_run')
-
-            # Select all task_instances from active dag_runs.
-            # If no dag_run is active, return task instances from most recent dag_run.
-            last_task_instance_query_result = (
-                session.query(
-                    TaskInstance.dag_id.label('dag_id'),
-                    TaskInstance.state.label('state'),
-                    sqla.literal(False).label('is_dag_running'),
-                )
-                .join(TaskInstance.dag_run)
-                .join(
-                    last_dag_run,
-                    and_(
-                        last_dag_run.c.dag_id == TaskInstance.dag_id,
-                        last_dag_run.c.execution_date == DagRun.execution_date,
-                    ),
-                )
-            )
-
-            final_task_instance_query_result = union_all(
-                last_task_instance_query_result, running_task_instance_query_result
-            ).alias('final_ti')
-        else:
-            final_task_instance_query_result = running_task_instance_query_result.subquery('final_ti')
-
-        qry = (
-            session.query(
-                final_task_instance_query_result.c.dag_id,
-                final_task_instance_query_result.c.state,
-                final_task_instance_query_result.c.is_dag_running,
-                sqla.func.count(),
-            )
-            .group_by(
-                final_task_instance_query_result.c.dag_id,
-                final_task_instance_query_result.c.state,
-                final_task_instance_query_result.c.is_dag_running,
-            )
-            .order_by(
-                final_task_instance_query_result.c.dag_id,
-                final_task_instance_query_result.c.is_dag_running.desc(),
+        dag_state_stats = get_dag_state_stats(filter_dag_ids, session)
+        active_dag_ids = {
+            dag_id
+            for dag_id, in session.query(DagModel.dag_id).filter(
+                DagModel.dag_id.in_(filter_dag_ids), DagModel.is_active
             )
+        }
+        show_completed_runs = conf.getboolean(
+            'webserver', 'SHOW_RECENT_STATS_FOR_COMPLETED_RUNS', fallback=True
         )
 
-        data = get_task_stats_from_query(qry)
+        # The task instances of the running runs, or of the latest run if none is running
+        data = {}
+        for dag_id in active_dag_ids:
+            stats = dag_state_stats[dag_id]
+            if stats.running_task_states:
+                data[dag_id] = stats.running_task_states
+            elif show_completed_runs:
+                data[dag_id] = stats.last_run_task_states
+
         payload = {}
         for dag_id in filter_dag_ids:
             payload[dag_id] = []
@@ -1051,44 +1085,20 @@ class Airflow(AirflowBaseView):
         if not filter_dag_ids:
             return wwwutils.json_response({})
 
-        last_runs_subquery = (
-            session.query(
-                DagRun.dag_id,
-                sqla.func.max(DagRun.execution_date).label("max_execution_date"),
-            )
-            .group_by(DagRun.dag_id)
-            .filter(DagRun.dag_id.in_(filter_dag_ids))  # Only include accessible/selected DAGs.
-            .subquery("last_runs")
-        )
-
-        query = session.query(
-            DagRun.dag_id,
-            DagRun.start_date,
-            DagRun.end_date,
-            DagRun.state,
-            DagRun.execution_date,
-            DagRun.data_interval_start,
-            DagRun.data_interval_end,
-        ).join(
-            last_runs_subquery,
-            and_(
-                last_runs_subquery.c.dag_id == DagRun.dag_id,
-                last_runs_subquery.c.max_execution_date == DagRun.execution_date,
-            ),
-        )
-
-        resp = {
-            r.dag_id.replace('.', '__dot__'): {
-                "dag_id": r.dag_id,
-                "state": r.state,
-                "execution_date": wwwutils.datetime_to_string(r.execution_date),
-                "start_date": wwwutils.datetime_to_string(r.start_date),
-                "end_date": wwwutils.datetime_to_string(r.end_date),
-                "data_interval_start": wwwutils.datetime_to_string(r.data_interval_start),
-                "data_interval_end": wwwutils.datetime_to_string(r.data_interval_end),
+        resp = {}
+        for dag_id, stats in get_dag_state_stats(filter_dag_ids, session).items():
+            last_dag_run = stats.last_dag_run
+            if last_dag_run is None:
+                continue
+            resp[dag_id.replace('.', '__dot__')] = {
+                "dag_id": dag_id,
+                "state": last_dag_run["state"],
+                "execution_date": wwwutils.datetime_to_string(last_dag_run["execution_date"]),
+                "start_date": wwwutils.datetime_to_string(last_dag_run["start_date"]),
+                "end_date": wwwutils.datetime_to_string(last_dag_run["end_date"]),
+                "data_interval_start": wwwutils.datetime_to_string(last_dag_run["data_interval_start"]),
+                "data_interval_end": wwwutils.datetime_to_string(last_dag_run["data_interval_end"]),
             }
-            for r in query
-        }
         return wwwutils.json_response(resp)
 
     @expose('/code')
@@ -1410,6 +1420,8 @@ class Airflow(AirflowBaseView):
                 ti.task = dag.get_task(ti.task_id)
 
             if response_format == 'json':
+                # The log page reads the log in chunks, from its start
+                metadata.setdefault('log_pos', 0)
                 logs, metadata = task_log_reader.read_log_chunks(ti, try_number, metadata)
                 message = logs[0] if try_number is not None else logs
                 return jsonify(message=message, metadata=metadata)
@@ -2424,6 +2436,7 @@ class Airflow(AirflowBaseView):
     @provide_session
     def grid(self, dag_id, session=None):
         """Get Dag's grid view."""
+        timestamp = timezone.utcnow()
         dag = current_app.dag_bag.get_dag(dag_id)
         dag_model = DagModel.get_dagmodel(dag_id)
         if not dag:
@@ -2472,13 +2485,17 @@ class Airflow(AirflowBaseView):
         else:
             external_log_name = None
 
-        min_date = min(dag_run_dates, default=None)
-
-        tis = dag.get_task_instances(start_date=min_date, end_date=base_date, session=session)
+        def get_groups():
+            tis = get_grid_task_instances(dag, dag_runs, session)
+            return task_group_to_tree(dag.task_group, dag, dag_runs, tis, session)
 
+        min_date = min(dag_run_dates, default=None)
         data = {
-            'groups': task_group_to_tree(dag.task_group, dag, dag_runs, tis, session),
+            'groups': get_cached_view_data(
+                'grid', dag, get_groups, session, start_date=min_date, end_date=base_date
+            ),
             'dag_runs': encoded_runs,
+            'timestamp': timestamp.isoformat(),
         }
 
         # avoid spaces to reduce payload size
@@ -2544,31 +2561,34 @@ class Airflow(AirflowBaseView):
         if root:
             dag = dag.partial_subset(task_ids_or_regex=root, include_downstream=False, include_upstream=True)
 
-        dag_states = (
-            session.query(
-                (_convert_to_date(session, DagRun.execution_date)).label('date'),
-                DagRun.state,
-                func.count('*').label('count'),
+        def get_dag_states():
+            dag_states = (
+                session.query(
+                    (_convert_to_date(session, DagRun.execution_date)).label('date'),
+                    DagRun.state,
+                    func.count('*').label('count'),
+                )
+                .filter(DagRun.dag_id == dag.dag_id)
+                .group_by(_convert_to_date(session, DagRun.execution_date), DagRun.state)
+                .order_by(_convert_to_date(session, DagRun.execution_date).asc())
+                .all()
             )
-            .filter(DagRun.dag_id == dag.dag_id)
-            .group_by(_convert_to_date(session, DagRun.execution_date), DagRun.state)
-            .order_by(_convert_to_date(session, DagRun.execution_date).asc())
-            .all()
-        )
 
-        dag_states = [
-            {
-                # DATE() in SQLite and MySQL behave differently:
-                # SQLite returns a string, MySQL returns a date.
-                'date': dr.date if isinstance(dr.date, str) else dr.date.isoformat(),
-                'state': dr.state,
-                'count': dr.count,
-            }
-            for dr in dag_states
-        ]
+            return [
+                {
+                    # DATE() in SQLite and MySQL behave differently:
+                    # SQLite returns a string, MySQL returns a date.
+                    'date': dr.date if isinstance(dr.date, str) else dr.date.isoformat(),
+                    'state': dr.state,
+                    'count': dr.count,
+                }
+                for dr in dag_states
+            ]
 
         data = {
-            'dag_states': dag_states,
+            'dag_states': get_cached_view_data(
+                'calendar', dag, get_dag_states, session, include_task_instances=False
+            ),
             'start_date': (dag.start_date or DateTime.utcnow()).date().isoformat(),
             'end_date': (dag.end_date or DateTime.utcnow()).date().isoformat(),
         }
@@ -2651,10 +2671,15 @@ class Airflow(AirflowBaseView):
         form = GraphForm(data=dt_nr_dr_data)
         form.execution_date.choices = dt_nr_dr_data['dr_choices']
 
-        task_instances = {
-            ti.task_id: wwwutils.get_instance_with_map(ti, session)
-            for ti in dag.get_task_instances(dttm, dttm)
-        }
+        def get_task_instances():
+            return {
+                ti.task_id: wwwutils.get_instance_with_map(ti, session)
+                for ti in dag.get_task_instances(dttm, dttm)
+            }
+
+        task_instances = get_cached_view_data(
+            'graph', dag, get_task_instances, session, start_date=dttm, end_date=dttm
+        )
         tasks = {
             t.task_id: {
                 'dag_id': t.dag_id,
@@ -2743,87 +2768,111 @@ class Airflow(AirflowBaseView):
         root = request.args.get('root')
         if root:
             dag = dag.partial_subset(task_ids_or_regex=root, include_upstream=True, include_downstream=False)
-        chart_height = wwwutils.get_chart_height(dag)
-        chart = nvd3.lineChart(
-            name="lineChart",
-            x_custom_format=True,
-            x_axis_date=True,
-            x_axis_format=LINECHART_X_AXIS_TICKFORMAT,
-            height=chart_height,
-            chart_attr=self.line_chart_attr,
-        )
-        cum_chart = nvd3.lineChart(
-            name="cumLineChart",
-            x_custom_format=True,
-            x_axis_date=True,
-            x_axis_format=LINECHART_X_AXIS_TICKFORMAT,
-            height=chart_height,
-            chart_attr=self.line_chart_attr,
-        )
-
-        y_points = defaultdict(list)
-        x_points = defaultdict(list)
-        cumulative_y = defaultdict(list)
 
-        task_instances = dag.get_task_instances_before(base_date, num_runs, session=session)
-        if task_instances:
-            min_date = task_instances[0].execution_date
-        else:
-            min_date = timezone.utc_epoch()
-        ti_fails = (
-            session.query(TaskFail)
-            .filter(
-                TaskFail.dag_id == dag.dag_id,
-                TaskFail.execution_date >= min_date,
-                TaskFail.execution_date <= base_date,
-                TaskFail.task_id.in_([t.task_id for t in dag.tasks]),
+        def get_charts():
+            chart_height = wwwutils.get_chart_height(dag)
+            chart = nvd3.lineChart(
+                name="lineChart",
+                x_custom_format=True,
+                x_axis_date=True,
+                x_axis_format=LINECHART_X_AXIS_TICKFORMAT,
+                height=chart_height,
+                chart_attr=self.line_chart_attr,
             )
-            .all()
-        )
+            cum_chart = nvd3.lineChart(
+                name="cumLineChart",
+                x_custom_format=True,
+                x_axis_date=True,
+                x_axis_format=LINECHART_X_AXIS_TICKFORMAT,
+                height=chart_height,
+                chart_attr=self.line_chart_attr,
+            )
+
+            y_points = defaultdict(list)
+            x_points = defaultdict(list)
+            cumulative_y = defaultdict(list)
 
-        fails_totals = defaultdict(int)
-        for failed_task_instance in ti_fails:
-            dict_key = (
-                failed_task_instance.dag_id,
-                failed_task_instance.task_id,
-                failed_task_instance.execution_date,
+            task_instances = dag.get_task_instances_before(base_date, num_runs, session=session)
+            if task_instances:
+                min_date = task_instances[0].execution_date
+            else:
+                min_date = timezone.utc_epoch()
+            ti_fails = (
+                session.query(TaskFail)
+                .filter(
+                    TaskFail.dag_id == dag.dag_id,
+                    TaskFail.execution_date >= min_date,
+                    TaskFail.execution_date <= base_date,
+                    TaskFail.task_id.in_([t.task_id for t in dag.tasks]),
+                )
+                .all()
             )
-            if failed_task_instance.duration:
-                fails_totals[dict_key] += failed_task_instance.duration
-
-        for task_instance in task_instances:
-            if task_instance.duration:
-                date_time = wwwutils.epoch(task_instance.execution_date)
-                x_points[task_instance.task_id].append(date_time)
-                y_points[task_instance.task_id].append(float(task_instance.duration))
-                fails_dict_key = (task_instance.dag_id, task_instance.task_id, task_instance.execution_date)
-                fails_total = fails_totals[fails_dict_key]
-                cumulative_y[task_instance.task_id].append(float(task_instance.duration + fails_total))
-
-        # determine the most relevant time unit for the set of task instance
-        # durations for the DAG
-        y_unit = infer_time_unit([d for t in y_points.values() for d in t])
-        cum_y_unit = infer_time_unit([d for t in cumulative_y.values() for d in t])
-        # update the y Axis on both charts to have the correct time units
-        chart.create_y_axis('yAxis', format='.02f', custom_format=False, label=f'Duration ({y_unit})')
-        chart.axislist['yAxis']['axisLabelDistance'] = '-15'
-        cum_chart.create_y_axis('yAxis', format='.02f', custom_format=False, label=f'Duration ({cum_y_unit})')
-        cum_chart.axislist['yAxis']['axisLabelDistance'] = '-15'
-
-        for task_id in x_points:
-            chart.add_serie(
-                name=task_id,
-                x=x_points[task_id],
-                y=scale_time_units(y_points[task_id], y_unit),
+
+            fails_totals = defaultdict(int)
+            for failed_task_instance in ti_fails:
+                dict_key = (
+                    failed_task_instance.dag_id,
+                    failed_task_instance.task_id,
+                    failed_task_instance.execution_date,
+                )
+                if failed_task_instance.duration:
+                    fails_totals[dict_key] += failed_task_instance.duration
+
+            for task_instance in task_instances:
+                if task_instance.duration:
+                    date_time = wwwutils.epoch(task_instance.execution_date)
+                    x_points[task_instance.task_id].append(date_time)
+                    y_points[task_instance.task_id].append(float(task_instance.duration))
+                    fails_dict_key = (
+                        task_instance.dag_id,
+                        task_instance.task_id,
+                        task_instance.execution_date,
+                    )
+                    fails_total = fails_totals[fails_dict_key]
+                    cumulative_y[task_instance.task_id].append(float(task_instance.duration + fails_total))
+
+            # determine the most relevant time unit for the set of task instance
+            # durations for the DAG
+            y_unit = infer_time_unit([d for t in y_points.values() for d in t])
+            cum_y_unit = infer_time_unit([d for t in cumulative_y.values() for d in t])
+            # update the y Axis on both charts to have the correct time units
+            chart.create_y_axis('yAxis', format='.02f', custom_format=False, label=f'Duration ({y_unit})')
+            chart.axislist['yAxis']['axisLabelDistance'] = '-15'
+            cum_chart.create_y_axis(
+                'yAxis', format='.02f', custom_format=False, label=f'Duration ({cum_y_unit})'
             )
-            cum_chart.add_serie(
-                name=task_id,
-                x=x_points[task_id],
-                y=scale_time_units(cumulative_y[task_id], cum_y_unit),
+            cum_chart.axislist['yAxis']['axisLabelDistance'] = '-15'
+
+            for task_id in x_points:
+                chart.add_serie(
+                    name=task_id,
+                    x=x_points[task_id],
+                    y=scale_time_units(y_points[task_id], y_unit),
+                )
+                cum_chart.add_serie(
+                    name=task_id,
+                    x=x_points[task_id],
+                    y=scale_time_units(cumulative_y[task_id], cum_y_unit),
+                )
+
+            dates = sorted({ti.execution_date for ti in task_instances})
+            max_date = max(ti.execution_date for ti in task_instances) if dates else None
+
+            chart.buildcontent()
+            cum_chart.buildcontent()
+            s_index = cum_chart.htmlcontent.rfind('});')
+            cum_chart.htmlcontent = (
+                cum_chart.htmlcontent[:s_index]
+                + "$( document ).trigger('chartload')"
+                + cum_chart.htmlcontent[s_index:]
             )
 
-        dates = sorted({ti.execution_date for ti in task_instances})
-        max_date = max(ti.execution_date for ti in task_instances) if dates else None
+            return chart.htmlcontent, cum_chart.htmlcontent, max_date
+
+        window_start = dag.get_min_date_before(base_date, num_runs, session=session)
+        chart_content, cum_chart_content, max_date = get_cached_view_data(
+            'duration', dag, get_charts, session, start_date=window_start, end_date=base_date
+        )
 
         session.commit()
 
@@ -2833,22 +2882,13 @@ class Airflow(AirflowBaseView):
                 'num_runs': num_runs,
             }
         )
-        chart.buildcontent()
-        cum_chart.buildcontent()
-        s_index = cum_chart.htmlcontent.rfind('});')
-        cum_chart.htmlcontent = (
-            cum_chart.htmlcontent[:s_index]
-            + "$( document ).trigger('chartload')"
-            + cum_chart.htmlcontent[s_index:]
-        )
-
         return self.render_template(
             'airflow/duration_chart.html',
             dag=dag,
             root=root,
             form=form,
-            chart=Markup(chart.htmlcontent),
-            cum_chart=Markup(cum_chart.htmlcontent),
+            chart=Markup(chart_content),
+            cum_chart=Markup(cum_chart_content),
             dag_model=dag_model,
         )
 
@@ -2892,34 +2932,43 @@ class Airflow(AirflowBaseView):
         if root:
             dag = dag.partial_subset(task_ids_or_regex=root, include_upstream=True, include_downstream=False)
 
-        chart_height = wwwutils.get_chart_height(dag)
-        chart = nvd3.lineChart(
-            name="lineChart",
-            x_custom_format=True,
-            x_axis_date=True,
-            x_axis_format=LINECHART_X_AXIS_TICKFORMAT,
-            height=chart_height,
-            chart_attr=self.line_chart_attr,
-        )
+        def get_chart():
+            chart_height = wwwutils.get_chart_height(dag)
+            chart = nvd3.lineChart(
+                name="lineChart",
+                x_custom_format=True,
+                x_axis_date=True,
+                x_axis_format=LINECHART_X_AXIS_TICKFORMAT,
+                height=chart_height,
+                chart_attr=self.line_chart_attr,
+            )
 
-        tis = dag.get_task_instances_before(base_date, num_runs, session=session)
-        for task in dag.tasks:
-            y_points = []
-            x_points = []
-            for ti in tis:
-                if ti.task_id != task.task_id:
-                    continue
-                dttm = wwwutils.epoch(ti.execution_date)
-                x_points.append(dttm)
-                # y value should reflect completed tries to have a 0 baseline.
-                y_points.append(ti.prev_attempted_tries)
-            if x_points:
-                chart.add_serie(name=task.task_id, x=x_points, y=y_points)
-
-        tries = sorted({ti.try_number for ti in tis})
-        max_date = max(ti.execution_date for ti in tis) if tries else None
-        chart.create_y_axis('yAxis', format='.02f', custom_format=False, label='Tries')
-        chart.axislist['yAxis']['axisLabelDistance'] = '-15'
+            tis = dag.get_task_instances_before(base_date, num_runs, session=session)
+            for task in dag.tasks:
+                y_points = []
+                x_points = []
+                for ti in tis:
+                    if ti.task_id != task.task_id:
+                        continue
+                    dttm = wwwutils.epoch(ti.execution_date)
+                    x_points.append(dttm)
+                    # y value should reflect completed tries to have a 0 baseline.
+                    y_points.append(ti.prev_attempted_tries)
+                if x_points:
+                    chart.add_serie(name=task.task_id, x=x_points, y=y_points)
+
+            tries = sorted({ti.try_number for ti in tis})
+            max_date = max(ti.execution_date for ti in tis) if tries else None
+            chart.create_y_axis('yAxis', format='.02f', custom_format=False, label='Tries')
+            chart.axislist['yAxis']['axisLabelDistance'] = '-15'
+
+            chart.buildcontent()
+            return chart.htmlcontent, max_date
+
+        window_start = dag.get_min_date_before(base_date, num_runs, session=session)
+        chart_content, max_date = get_cached_view_data(
+            'tries', dag, get_chart, session, start_date=window_start, end_date=base_date
+        )
 
         session.commit()
 
@@ -2930,14 +2979,12 @@ class Airflow(AirflowBaseView):
             }
         )
 
-        chart.buildcontent()
-
         return self.render_template(
             'airflow/chart.html',
             dag=dag,
             root=root,
             form=form,
-            chart=Markup(chart.htmlcontent),
+            chart=Markup(chart_content),
             tab_title='Tries',
             dag_model=dag_model,
         )
@@ -2982,49 +3029,59 @@ class Airflow(AirflowBaseView):
         if root:
             dag = dag.partial_subset(task_ids_or_regex=root, include_upstream=True, include_downstream=False)
 
-        tis = dag.get_task_instances_before(base_date, num_runs, session=session)
-
         chart_height = wwwutils.get_chart_height(dag)
-        chart = nvd3.lineChart(
-            name="lineChart",
-            x_custom_format=True,
-            x_axis_date=True,
-            x_axis_format=LINECHART_X_AXIS_TICKFORMAT,
-            height=chart_height,
-            chart_attr=self.line_chart_attr,
-        )
-        y_points = {}
-        x_points = {}
-        for task in dag.tasks:
-            task_id = task.task_id
-            y_points[task_id] = []
-            x_points[task_id] = []
-            for ti in tis:
-                if ti.task_id != task.task_id:
-                    continue
-                ts = dag.get_run_data_interval(ti.dag_run).end
-                if ti.end_date:
-                    dttm = wwwutils.epoch(ti.execution_date)
-                    secs = (ti.end_date - ts).total_seconds()
-                    x_points[task_id].append(dttm)
-                    y_points[task_id].append(secs)
-
-        # determine the most relevant time unit for the set of landing times
-        # for the DAG
-        y_unit = infer_time_unit([d for t in y_points.values() for d in t])
-        # update the y Axis to have the correct time units
-        chart.create_y_axis('yAxis', format='.02f', custom_format=False, label=f'Landing Time ({y_unit})')
-        chart.axislist['yAxis']['axisLabelDistance'] = '-15'
-
-        for task_id in x_points:
-            chart.add_serie(
-                name=task_id,
-                x=x_points[task_id],
-                y=scale_time_units(y_points[task_id], y_unit),
+
+        def get_chart():
+            tis = dag.get_task_instances_before(base_date, num_runs, session=session)
+
+            chart = nvd3.lineChart(
+                name="lineChart",
+                x_custom_format=True,
+                x_axis_date=True,
+                x_axis_format=LINECHART_X_AXIS_TICKFORMAT,
+                height=chart_height,
+                chart_attr=self.line_chart_attr,
             )
+            y_points = {}
+            x_points = {}
+            for task in dag.tasks:
+                task_id = task.task_id
+                y_points[task_id] = []
+                x_points[task_id] = []
+                for ti in tis:
+                    if ti.task_id != task.task_id:
+                        continue
+                    ts = dag.get_run_data_interval(ti.dag_run).end
+                    if ti.end_date:
+                        dttm = wwwutils.epoch(ti.execution_date)
+                        secs = (ti.end_date - ts).total_seconds()
+                        x_points[task_id].append(dttm)
+                        y_points[task_id].append(secs)
+
+            # determine the most relevant time unit for the set of landing times
+            # for the DAG
+            y_unit = infer_time_unit([d for t in y_points.values() for d in t])
+            # update the y Axis to have the correct time units
+            chart.create_y_axis('yAxis', format='.02f', custom_format=False, label=f'Landing Time ({y_unit})')
+            chart.axislist['yAxis']['axisLabelDistance'] = '-15'
+
+            for task_id in x_points:
+                chart.add_serie(
+                    name=task_id,
+                    x=x_points[task_id],
+                    y=scale_time_units(y_points[task_id], y_unit),
+                )
 
-        dates = sorted({ti.execution_date for ti in tis})
-        max_date = max(ti.execution_date for ti in tis) if dates else None
+            dates = sorted({ti.execution_date for ti in tis})
+            max_date = max(ti.execution_date for ti in tis) if dates else None
+
+            chart.buildcontent()
+            return chart.htmlcontent, max_date
+
+        window_start = dag.get_min_date_before(base_date, num_runs, session=session)
+        chart_content, max_date = get_cached_view_data(
+            'landing_times', dag, get_chart, session, start_date=window_start, end_date=base_date
+        )
 
         session.commit()
 
@@ -3034,11 +3091,10 @@ class Airflow(AirflowBaseView):
                 'num_runs': num_runs,
             }
         )
-        chart.buildcontent()
         return self.render_template(
             'airflow/chart.html',
             dag=dag,
-            chart=Markup(chart.htmlcontent),
+            chart=Markup(chart_content),
             height=str(chart_height + 100) + "px",
             root=root,
             form=form,
@@ -3100,67 +3156,72 @@ class Airflow(AirflowBaseView):
         form = DateTimeWithNumRunsWithDagRunsForm(data=dt_nr_dr_data)
         form.execution_date.choices = dt_nr_dr_data['dr_choices']
 
-        tis = (
-            session.query(TaskInstance)
-            .join(TaskInstance.dag_run)
-            .filter(
-                DagRun.execution_date == dttm,
-                TaskInstance.dag_id == dag_id,
-                TaskInstance.start_date.isnot(None),
-                TaskInstance.state.isnot(None),
+        def get_data():
+            tis = (
+                session.query(TaskInstance)
+                .join(TaskInstance.dag_run)
+                .filter(
+                    DagRun.execution_date == dttm,
+                    TaskInstance.dag_id == dag_id,
+                    TaskInstance.start_date.isnot(None),
+                    TaskInstance.state.isnot(None),
+                )
+                .order_by(TaskInstance.start_date)
             )
-            .order_by(TaskInstance.start_date)
-        )
 
-        ti_fails = (
-            session.query(TaskFail)
-            .join(DagRun, DagRun.execution_date == TaskFail.execution_date)
-            .filter(DagRun.execution_date == dttm, TaskFail.dag_id == dag_id)
-        )
+            ti_fails = (
+                session.query(TaskFail)
+                .join(DagRun, DagRun.execution_date == TaskFail.execution_date)
+                .filter(DagRun.execution_date == dttm, TaskFail.dag_id == dag_id)
+            )
 
-        tasks = []
-        for ti in tis:
-            # prev_attempted_tries will reflect the currently running try_number
-            # or the try_number of the last complete run
-            # https://issues.apache.org/jira/browse/AIRFLOW-2143
-            try_count = ti.prev_attempted_tries if ti.prev_attempted_tries != 0 else ti.try_number
-            task_dict = alchemy_to_dict(ti)
-            task_dict['end_date'] = task_dict['end_date'] or timezone.utcnow()
-            task_dict['extraLinks'] = dag.get_task(ti.task_id).extra_links
-            task_dict['try_number'] = try_count
-            task_dict['execution_date'] = dttm.isoformat()
-            task_dict['run_id'] = dag_run_id
-            tasks.append(task_dict)
-
-        tf_count = 0
-        try_count = 1
-        prev_task_id = ""
-        for failed_task_instance in ti_fails:
-            if tf_count != 0 and failed_task_instance.task_id == prev_task_id:
-                try_count += 1
-            else:
-                try_count = 1
-            prev_task_id = failed_task_instance.task_id
-            tf_count += 1
-            task = dag.get_task(failed_task_instance.task_id)
-            task_dict = alchemy_to_dict(failed_task_instance)
-            end_date = task_dict['end_date'] or timezone.utcnow()
-            task_dict['end_date'] = end_date
-            task_dict['start_date'] = task_dict['start_date'] or end_date
-            task_dict['state'] = State.FAILED
-            task_dict['operator'] = task.task_type
-            task_dict['try_number'] = try_count
-            task_dict['extraLinks'] = task.extra_links
-            task_dict['execution_date'] = dttm.isoformat()
-            task_dict['run_id'] = dag_run_id
-            tasks.append(task_dict)
-
-        task_names = [ti.task_id for ti in tis]
-        data = {
-            'taskNames': task_names,
-            'tasks': tasks,
-            'height': len(task_names) * 25 + 25,
-        }
+            tasks = []
+            for ti in tis:
+                # prev_attempted_tries will reflect the currently running try_number
+                # or the try_number of the last complete run
+                # https://issues.apache.org/jira/browse/AIRFLOW-2143
+                try_count = ti.prev_attempted_tries if ti.prev_attempted_tries != 0 else ti.try_number
+                task_dict = alchemy_to_dict(ti)
+                task_dict['extraLinks'] = dag.get_task(ti.task_id).extra_links
+                task_dict['try_number'] = try_count
+                task_dict['execution_date'] = dttm.isoformat()
+                task_dict['run_id'] = dag_run_id
+                tasks.append(task_dict)
+
+            tf_count = 0
+            try_count = 1
+            prev_task_id = ""
+            for failed_task_instance in ti_fails:
+                if tf_count != 0 and failed_task_instance.task_id == prev_task_id:
+                    try_count += 1
+                else:
+                    try_count = 1
+                prev_task_id = failed_task_instance.task_id
+                tf_count += 1
+                task = dag.get_task(failed_task_instance.task_id)
+                task_dict = alchemy_to_dict(failed_task_instance)
+                end_date = task_dict['end_date'] or timezone.utcnow()
+                task_dict['end_date'] = end_date
+                task_dict['start_date'] = task_dict['start_date'] or end_date
+                task_dict['state'] = State.FAILED
+                task_dict['operator'] = task.task_type
+                task_dict['try_number'] = try_count
+                task_dict['extraLinks'] = task.extra_links
+                task_dict['execution_date'] = dttm.isoformat()
+                task_dict['run_id'] = dag_run_id
+                tasks.append(task_dict)
+
+            task_names = [ti.task_id for ti in tis]
+            return {
+                'taskNames': task_names,
+                'tasks': tasks,
+                'height': len(task_names) * 25 + 25,
+            }
+
+        data = get_cached_view_data('gantt', dag, get_data, session, start_date=dttm, end_date=dttm)
+        # The task instances still running end now
+        now = timezone.utcnow()
+        data = {**data, 'tasks': [{**task, 'end_date': task['end_date'] or now} for task in data['tasks']]}
 
         session.commit()
 
@@ -3287,7 +3348,13 @@ class Airflow(AirflowBaseView):
         ]
     )
     def tree_data(self):
-        """Returns tree data"""
+        """
+        Returns tree data
+
+        When ``since`` is given, only the task instances of the runs that changed since then are
+        returned, with the run_id of these runs in ``changed_run_ids``.
+        """
+        timestamp = timezone.utcnow()
         dag_id = request.args.get('dag_id')
         dag = current_app.dag_bag.get_dag(dag_id)
 
@@ -3309,6 +3376,11 @@ class Airflow(AirflowBaseView):
         except (KeyError, ValueError):
             base_date = dag.get_latest_execution_date() or timezone.utcnow()
 
+        try:
+            since = timezone.parse(request.args["since"])
+        except (KeyError, ValueError):
+            since = None
+
         with create_session() as session:
             dag_runs = (
                 session.query(DagRun)
@@ -3319,13 +3391,34 @@ class Airflow(AirflowBaseView):
             )
             dag_runs.reverse()
             encoded_runs = [wwwutils.encode_dag_run(dr) for dr in dag_runs]
-            dag_run_dates = {dr.execution_date: alchemy_to_dict(dr) for dr in dag_runs}
-            min_date = min(dag_run_dates, default=None)
-            tis = dag.get_task_instances(start_date=min_date, end_date=base_date, session=session)
+            if since is not None:
+                changed_run_ids = get_changed_run_ids(dag, dag_runs, since, session)
+                changed_runs = [dr for dr in dag_runs if dr.run_id in changed_run_ids]
+            else:
+                changed_runs = dag_runs
+
+            def get_groups():
+                tis = get_grid_task_instances(dag, changed_runs, session)
+                return task_group_to_tree(dag.task_group, dag, changed_runs, tis, session)
+
+            if since is None:
+                groups = get_cached_view_data(
+                    'grid',
+                    dag,
+                    get_groups,
+                    session,
+                    start_date=min((dr.execution_date for dr in dag_runs), default=None),
+                    end_date=base_date,
+                )
+            else:
+                groups = get_groups()
             data = {
-                'groups': task_group_to_tree(dag.task_group, dag, dag_runs, tis, session),
+                'groups': groups,
                 'dag_runs': encoded_runs,
+                'timestamp': timestamp.isoformat(),
             }
+            if since is not None:
+                data['changed_run_ids'] = [dr.run_id for dr in changed_runs]
 
         # avoid spaces to reduce payload size
         return htmlsafe_json_dumps(data, separators=(',', ':'))
@@ -545,6 +545,9 @@ vertica = [
 virtualenv = [
     'virtualenv',
 ]
+watchdog = [
+    'watchdog>=2.1.0',
+]
 webhdfs = [
     'hdfs[avro,dataframe,kerberos]>=2.0.4',
 ]
@@ -764,6 +767,7 @@ CORE_EXTRAS_REQUIREMENTS: Dict[str, List[str]] = {
     'sentry': sentry,
     'statsd': statsd,
     'virtualenv': virtualenv,
+    'watchdog': watchdog,
 }
 
 EXTRAS_REQUIREMENTS: Dict[str, List[str]] = deepcopy(CORE_EXTRAS_REQUIREMENTS)
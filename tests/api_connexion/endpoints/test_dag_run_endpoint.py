@@ -300,6 +300,7 @@ class TestGetDagRuns(TestDagRunEndpoint):
                 },
             ],
             "total_entries": 2,
+            "next_cursor": None,
         }
 
     def test_filter_by_state(self, session):
@@ -362,6 +363,7 @@ class TestGetDagRuns(TestDagRunEndpoint):
                 },
             ],
             "total_entries": 2,
+            "next_cursor": None,
         }
 
     def test_should_return_all_with_tilde_as_dag_id_and_all_dag_permissions(self):
@@ -459,6 +461,24 @@ class TestGetDagRunsPagination(TestDagRunEndpoint):
         assert response.status_code == 200
         assert len(response.json["dag_runs"]) == 150
 
+    def test_should_follow_next_cursor(self):
+        self._create_dag_runs(3)
+        response = self.client.get(
+            "api/v1/dags/TEST_DAG_ID/dagRuns?limit=2", environ_overrides={'REMOTE_USER': "test"}
+        )
+        assert [dag_run["dag_run_id"] for dag_run in response.json["dag_runs"]] == [
+            "TEST_DAG_RUN_ID1",
+            "TEST_DAG_RUN_ID2",
+        ]
+
+        response = self.client.get(
+            f"api/v1/dags/TEST_DAG_ID/dagRuns?limit=2&cursor={response.json['next_cursor']}",
+            environ_overrides={'REMOTE_USER': "test"},
+        )
+        assert response.status_code == 200
+        assert [dag_run["dag_run_id"] for dag_run in response.json["dag_runs"]] == ["TEST_DAG_RUN_ID3"]
+        assert response.json["next_cursor"] is None
+
     def _create_dag_runs(self, count):
         dag_runs = [
             DagRun(
@@ -617,6 +637,7 @@ class TestGetDagRunBatch(TestDagRunEndpoint):
                 },
             ],
             "total_entries": 2,
+            "next_cursor": None,
         }
 
     def test_filter_by_state(self):
@@ -666,6 +687,7 @@ class TestGetDagRunBatch(TestDagRunEndpoint):
                 },
             ],
             "total_entries": 2,
+            "next_cursor": None,
         }
 
     def test_order_by_raises_for_invalid_attr(self):
@@ -713,6 +735,7 @@ class TestGetDagRunBatch(TestDagRunEndpoint):
                 },
             ],
             "total_entries": 2,
+            "next_cursor": None,
         }
 
     @parameterized.expand(
@@ -801,6 +824,73 @@ class TestGetDagRunBatchPagination(TestDagRunEndpoint):
         assert response.json["total_entries"] == 200
         assert len(response.json["dag_runs"]) == 100  # default is 100
 
+    @parameterized.expand(
+        [
+            ("id", [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]),
+            ("-id", [[10, 9, 8, 7], [6, 5, 4, 3], [2, 1]]),
+        ]
+    )
+    def test_should_follow_next_cursor(self, order_by, expected_dag_run_numbers):
+        self._create_dag_runs(10)
+        payload = {"page_limit": 4, "order_by": order_by}
+        pages = []
+        while True:
+            response = self.client.post(
+                "api/v1/dags/~/dagRuns/list", json=payload, environ_overrides={'REMOTE_USER': "test"}
+            )
+            assert response.status_code == 200
+            assert response.json["total_entries"] == 10
+            pages.append([dag_run["dag_run_id"] for dag_run in response.json["dag_runs"]])
+            if not response.json["next_cursor"]:
+                break
+            payload["page_cursor"] = response.json["next_cursor"]
+
+        assert pages == [[f"TEST_DAG_RUN_ID{number}" for number in page] for page in expected_dag_run_numbers]
+
+    def test_should_skip_total_entries(self):
+        self._create_dag_runs(2)
+        response = self.client.post(
+            "api/v1/dags/~/dagRuns/list",
+            json={"include_total_entries": False},
+            environ_overrides={'REMOTE_USER': "test"},
+        )
+        assert response.status_code == 200
+        assert response.json["total_entries"] is None
+        assert len(response.json["dag_runs"]) == 2
+
+    def test_should_raise_400_for_cursor_not_ordered_by_id(self):
+        response = self.client.post(
+            "api/v1/dags/~/dagRuns/list",
+            json={"order_by": "execution_date", "page_cursor": "WzFd"},
+            environ_overrides={'REMOTE_USER': "test"},
+        )
+        assert response.status_code == 400
+        assert response.json["detail"] == "Only pages of DAG runs ordered by 'id' can start after a cursor"
+
+    @conf_vars({("api", "page_streaming_threshold"): "5"})
+    def test_should_stream_large_pages(self):
+        self._create_dag_runs(10)
+        response = self.client.post(
+            "api/v1/dags/~/dagRuns/list", json={"page_limit": 8}, environ_overrides={'REMOTE_USER': "test"}
+        )
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.json["total_entries"] == 10
+        assert [dag_run["dag_run_id"] for dag_run in response.json["dag_runs"]] == [
+            f"TEST_DAG_RUN_ID{i}" for i in range(1, 9)
+        ]
+
+        response = self.client.post(
+            "api/v1/dags/~/dagRuns/list",
+            json={"page_limit": 8, "page_cursor": response.json["next_cursor"]},
+            environ_overrides={'REMOTE_USER': "test"},
+        )
+        assert [dag_run["dag_run_id"] for dag_run in response.json["dag_runs"]] == [
+            "TEST_DAG_RUN_ID9",
+            "TEST_DAG_RUN_ID10",
+        ]
+        assert response.json["next_cursor"] is None
+
     def _create_dag_runs(self, count):
         dag_runs = [
             DagRun(
@@ -178,6 +178,7 @@ class TestGetEventLogs(TestEventLogEndpoint):
                 },
             ],
             "total_entries": 3,
+            "next_cursor": None,
         }
 
     def test_order_eventlogs_by_owner(self, create_log_model, session):
@@ -225,6 +226,7 @@ class TestGetEventLogs(TestEventLogEndpoint):
                 },
             ],
             "total_entries": 3,
+            "next_cursor": None,
         }
 
     def test_should_raises_401_unauthenticated(self, log_model):
@@ -317,5 +319,87 @@ class TestGetEventLogPagination(TestEventLogEndpoint):
         assert response.status_code == 200
         assert len(response.json['event_logs']) == 150
 
+    @pytest.mark.parametrize(
+        ("order_by", "expected_events"),
+        [
+            (
+                "event_log_id",
+                [["TEST_EVENT_1", "TEST_EVENT_2"], ["TEST_EVENT_3", "TEST_EVENT_4"], ["TEST_EVENT_5"]],
+            ),
+            (
+                "-event_log_id",
+                [["TEST_EVENT_5", "TEST_EVENT_4"], ["TEST_EVENT_3", "TEST_EVENT_2"], ["TEST_EVENT_1"]],
+            ),
+        ],
+    )
+    def test_should_follow_next_cursor(self, order_by, expected_events, task_instance, session):
+        log_models = self._create_event_logs(task_instance, 5)
+        session.add_all(log_models)
+        session.commit()
+
+        url = f"/api/v1/eventLogs?limit=2&order_by={order_by}"
+        pages = []
+        while url:
+            response = self.client.get(url, environ_overrides={'REMOTE_USER': "test"})
+            assert response.status_code == 200
+            assert response.json["total_entries"] == 5
+            pages.append([event_log["event"] for event_log in response.json["event_logs"]])
+            next_cursor = response.json["next_cursor"]
+            url = (
+                f"/api/v1/eventLogs?limit=2&order_by={order_by}&cursor={next_cursor}" if next_cursor else None
+            )
+        assert pages == expected_events
+
+    def test_should_skip_total_entries(self, task_instance, session):
+        log_models = self._create_event_logs(task_instance, 2)
+        session.add_all(log_models)
+        session.commit()
+
+        response = self.client.get(
+            "/api/v1/eventLogs?include_total_entries=false", environ_overrides={'REMOTE_USER': "test"}
+        )
+        assert response.status_code == 200
+        assert response.json["total_entries"] is None
+        assert len(response.json["event_logs"]) == 2
+
+    @pytest.mark.parametrize(
+        ("url", "detail"),
+        [
+            (
+                "/api/v1/eventLogs?order_by=owner&cursor=WzFd",
+                "Only pages of event logs ordered by 'event_log_id' can start after a cursor",
+            ),
+            ("/api/v1/eventLogs?cursor=invalid", "Cursor 'invalid' could not be decoded"),
+            ('/api/v1/eventLogs?cursor=WyJhIl0=', "Cursor 'WyJhIl0=' does not match the sort order"),
+        ],
+    )
+    def test_should_raise_400_for_invalid_cursor(self, url, detail):
+        response = self.client.get(url, environ_overrides={'REMOTE_USER': "test"})
+        assert response.status_code == 400
+        assert response.json['detail'] == detail
+
+    @conf_vars({("api", "maximum_page_limit"): "150", ("api", "page_streaming_threshold"): "10"})
+    def test_should_stream_large_pages(self, task_instance, session):
+        log_models = self._create_event_logs(task_instance, 20)
+        session.add_all(log_models)
+        session.commit()
+
+        response = self.client.get("/api/v1/eventLogs?limit=15", environ_overrides={'REMOTE_USER': "test"})
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.json["total_entries"] == 20
+        assert [event_log["event"] for event_log in response.json["event_logs"]] == [
+            f"TEST_EVENT_{i}" for i in range(1, 16)
+        ]
+
+        response = self.client.get(
+            f"/api/v1/eventLogs?limit=15&cursor={response.json['next_cursor']}",
+            environ_overrides={'REMOTE_USER': "test"},
+        )
+        assert [event_log["event"] for event_log in response.json["event_logs"]] == [
+            f"TEST_EVENT_{i}" for i in range(16, 21)
+        ]
+        assert response.json["next_cursor"] is None
+
     def _create_event_logs(self, task_instance, count):
         return [Log(event="TEST_EVENT_" + str(i), task_instance=task_instance) for i in range(1, count + 1)]
@@ -31,6 +31,7 @@ from airflow.security import permissions
 from airflow.utils import timezone
 from airflow.utils.types import DagRunType
 from tests.test_utils.api_connexion_utils import assert_401, create_user, delete_user
+from tests.test_utils.config import conf_vars
 from tests.test_utils.db import clear_db_runs
 
 
@@ -146,6 +147,26 @@ class TestGetLog:
         assert info == {'end_of_log': True}
         assert 200 == response.status_code
 
+    def test_should_respond_200_json_with_whole_log_larger_than_chunk(self):
+        key = self.app.config["SECRET_KEY"]
+        serializer = URLSafeSerializer(key)
+        log_path = self.log_dir / self.DAG_ID / self.TASK_ID / self.default_time.replace(':', '.') / "1.log"
+        lines = "".join(f"Log line {i}\n" for i in range(10))
+        log_path.write_text(lines)
+
+        with conf_vars({("webserver", "log_fetch_chunk_size"): "16"}):
+            response = self.client.get(
+                f"api/v1/dags/{self.DAG_ID}/dagRuns/TEST_DAG_RUN_ID/taskInstances/{self.TASK_ID}/logs/1",
+                headers={'Accept': 'application/json'},
+                environ_overrides={'REMOTE_USER': "test"},
+            )
+
+        assert 200 == response.status_code
+        expected_logs = [('localhost', f"*** Reading local file: {log_path}\n{lines}")]
+        assert response.json['content'] == str(expected_logs)
+        info = serializer.loads(response.json['continuation_token'])
+        assert info == {'end_of_log': True}
+
     def test_should_respond_200_text_plain(self):
         key = self.app.config["SECRET_KEY"]
         serializer = URLSafeSerializer(key)
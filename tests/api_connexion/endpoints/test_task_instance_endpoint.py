@@ -479,6 +479,23 @@ class TestGetTaskInstances(TestTaskInstanceEndpoint):
         assert count == response.json["total_entries"]
         assert count == len(response.json["task_instances"])
 
+    def test_should_follow_next_cursor(self, session):
+        tis = self.create_task_instances(session)
+        task_ids = sorted(ti.task_id for ti in tis)
+        response = self.client.get(
+            "/api/v1/dags/example_python_operator/dagRuns/~/taskInstances?limit=2",
+            environ_overrides={"REMOTE_USER": "test"},
+        )
+        assert [ti["task_id"] for ti in response.json["task_instances"]] == task_ids[:2]
+
+        response = self.client.get(
+            "/api/v1/dags/example_python_operator/dagRuns/~/taskInstances"
+            f"?limit=2&cursor={response.json['next_cursor']}",
+            environ_overrides={"REMOTE_USER": "test"},
+        )
+        assert response.status_code == 200
+        assert [ti["task_id"] for ti in response.json["task_instances"]] == task_ids[2:4]
+
     def test_should_raises_401_unauthenticated(self):
         response = self.client.get(
             "/api/v1/dags/example_python_operator/dagRuns/~/taskInstances",
@@ -687,6 +704,47 @@ class TestGetTaskInstancesBatch(TestTaskInstanceEndpoint):
         assert len(response.json["task_instances"]) == expected_ti
         assert response.json["total_entries"] == total_ti
 
+    @provide_session
+    def test_should_follow_next_cursor(self, session):
+        self.create_task_instances(session)
+        self.create_task_instances(session, dag_id="example_skip_dag")
+        expected_keys = [
+            [ti.dag_id, ti.task_id]
+            for ti in session.query(TaskInstance).order_by(TaskInstance.dag_id, TaskInstance.task_id)
+        ]
+
+        payload = {"page_limit": 4}
+        keys = []
+        while True:
+            response = self.client.post(
+                "/api/v1/dags/~/dagRuns/~/taskInstances/list",
+                environ_overrides={"REMOTE_USER": "test"},
+                json=payload,
+            )
+            assert response.status_code == 200
+            assert response.json["total_entries"] == len(expected_keys)
+            assert len(response.json["task_instances"]) <= 4
+            keys.extend([ti["dag_id"], ti["task_id"]] for ti in response.json["task_instances"])
+            if not response.json["next_cursor"]:
+                break
+            payload["page_cursor"] = response.json["next_cursor"]
+
+        assert keys == expected_keys
+
+    @provide_session
+    def test_should_stream_all_task_instances_without_page_limit(self, session):
+        self.create_task_instances(session)
+        response = self.client.post(
+            "/api/v1/dags/~/dagRuns/~/taskInstances/list",
+            environ_overrides={"REMOTE_USER": "test"},
+            json={"include_total_entries": False},
+        )
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.json["total_entries"] is None
+        assert response.json["next_cursor"] is None
+        assert len(response.json["task_instances"]) == session.query(TaskInstance).count()
+
     def test_should_raises_401_unauthenticated(self):
         response = self.client.post(
             "/api/v1/dags/~/dagRuns/~/taskInstances/list",
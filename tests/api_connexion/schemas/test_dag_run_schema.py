@@ -176,4 +176,5 @@ class TestDagRunCollection(TestDAGRunBase):
                 },
             ],
             "total_entries": 2,
+            "next_cursor": None,
         }
@@ -93,4 +93,5 @@ class TestEventLogCollection(TestEventLogSchemaBase):
                 },
             ],
             "total_entries": 2,
+            "next_cursor": None,
         }
@@ -0,0 +1,96 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pytest
+
+from airflow.api_connexion.exceptions import BadRequest
+from airflow.api_connexion.pagination import (
+    apply_keyset_pagination,
+    decode_cursor,
+    encode_cursor,
+    fetch_page,
+    should_stream,
+)
+from airflow.models import Log, TaskInstance as TI
+from tests.test_utils.config import conf_vars
+from tests.test_utils.db import clear_db_logs
+
+TI_KEY = [TI.dag_id, TI.task_id, TI.run_id, TI.map_index]
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = encode_cursor(("dag", "task", "run", -1))
+        assert decode_cursor(cursor, TI_KEY) == ["dag", "task", "run", -1]
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not base64!",
+            encode_cursor(["dag", "task", "run"]),
+            encode_cursor(["dag", "task", "run", "-1"]),
+        ],
+    )
+    def test_invalid_cursor(self, cursor):
+        with pytest.raises(BadRequest):
+            decode_cursor(cursor, TI_KEY)
+
+
+class TestKeysetPagination:
+    @pytest.fixture(autouse=True)
+    def logs(self, session):
+        clear_db_logs()
+        session.add_all(Log(event=f"event_{i}") for i in range(5))
+        session.commit()
+        yield
+        clear_db_logs()
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_pages(self, descending, session):
+        expected_ids = sorted((log_id for log_id, in session.query(Log.id)), reverse=descending)
+        pages, cursor = [], None
+        while True:
+            query = apply_keyset_pagination(session.query(Log), [Log.id], cursor, descending=descending)
+            logs, cursor = fetch_page(query, limit=2, cursor_key=lambda log: [log.id])
+            pages.append([log.id for log in logs])
+            if cursor is None:
+                break
+
+        assert pages == [expected_ids[:2], expected_ids[2:4], expected_ids[4:]]
+
+    def test_composite_key(self):
+        query = apply_keyset_pagination(
+            TI.__table__.select(), TI_KEY, encode_cursor(["dag", "task", "run", -1])
+        )
+        where_clause = str(query.whereclause.compile(compile_kwargs={"literal_binds": True}))
+        assert where_clause == (
+            "task_instance.dag_id > 'dag' "
+            "OR task_instance.dag_id = 'dag' AND task_instance.task_id > 'task' "
+            "OR task_instance.dag_id = 'dag' AND task_instance.task_id = 'task' "
+            "AND task_instance.run_id > 'run' "
+            "OR task_instance.dag_id = 'dag' AND task_instance.task_id = 'task' "
+            "AND task_instance.run_id = 'run' AND task_instance.map_index > -1"
+        )
+
+
+@pytest.mark.parametrize(
+    ("threshold", "limit", "expected"),
+    [("1000", 100, False), ("1000", 1001, True), ("1000", None, True), ("0", None, False)],
+)
+def test_should_stream(threshold, limit, expected):
+    with conf_vars({("api", "page_streaming_threshold"): threshold}):
+        assert should_stream(limit) is expected
@@ -233,6 +233,19 @@ class TestWorkerStart(unittest.TestCase):
             ]
         )
 
+    @mock.patch("airflow.cli.commands.celery_command.setup_locations")
+    @mock.patch('airflow.cli.commands.celery_command.Process')
+    @mock.patch('airflow.cli.commands.celery_command.celery_app')
+    @conf_vars({("core", "executor"): "CeleryExecutor", ("celery", "sync_with_task_events"): "True"})
+    def test_worker_started_with_task_events(self, mock_celery_app, mock_popen, mock_locations):
+        mock_locations.return_value = ("pid_file", None, None, None)
+        args = self.parser.parse_args(['celery', 'worker'])
+
+        celery_command.worker(args)
+
+        options = mock_celery_app.worker_main.call_args[0][0]
+        assert '--task-events' in options
+
 
 @pytest.mark.backend("mysql", "postgres")
 class TestWorkerFailure(unittest.TestCase):
@@ -226,6 +226,9 @@ class TestCLIDBClean:
             clean_before_timestamp=pendulum.parse(timestamp, tz=timezone),
             verbose=False,
             confirm=False,
+            batch_size=None,
+            sleep_between_batches=0,
+            archive_dir=None,
         )
 
     @pytest.mark.parametrize('timezone', ['UTC', 'Europe/Berlin', 'America/Los_Angeles'])
@@ -245,6 +248,9 @@ class TestCLIDBClean:
             clean_before_timestamp=pendulum.parse(timestamp),
             verbose=False,
             confirm=False,
+            batch_size=None,
+            sleep_between_batches=0,
+            archive_dir=None,
         )
 
     @pytest.mark.parametrize('confirm_arg, expected', [(['-y'], False), ([], True)])
@@ -270,6 +276,9 @@ class TestCLIDBClean:
             clean_before_timestamp=pendulum.parse('2021-01-01 00:00:00Z'),
             verbose=False,
             confirm=expected,
+            batch_size=None,
+            sleep_between_batches=0,
+            archive_dir=None,
         )
 
     @pytest.mark.parametrize('dry_run_arg, expected', [(['--dry-run'], True), ([], False)])
@@ -295,6 +304,9 @@ class TestCLIDBClean:
             clean_before_timestamp=pendulum.parse('2021-01-01 00:00:00Z'),
             verbose=False,
             confirm=True,
+            batch_size=None,
+            sleep_between_batches=0,
+            archive_dir=None,
         )
 
     @pytest.mark.parametrize(
@@ -322,6 +334,9 @@ class TestCLIDBClean:
             clean_before_timestamp=pendulum.parse('2021-01-01 00:00:00Z'),
             verbose=False,
             confirm=True,
+            batch_size=None,
+            sleep_between_batches=0,
+            archive_dir=None,
         )
 
     @pytest.mark.parametrize('extra_args, expected', [(['--verbose'], True), ([], False)])
@@ -347,4 +362,49 @@ class TestCLIDBClean:
             clean_before_timestamp=pendulum.parse('2021-01-01 00:00:00Z'),
             verbose=expected,
             confirm=True,
+            batch_size=None,
+            sleep_between_batches=0,
+            archive_dir=None,
         )
+
+    @pytest.mark.parametrize(
+        'extra_args, expected',
+        [
+            (
+                ['--batch-size', '1000', '--sleep-between-batches', '0.5', '--archive-dir', '/tmp/archive'],
+                dict(batch_size=1000, sleep_between_batches=0.5, archive_dir='/tmp/archive'),
+            ),
+            (['--batch-size', '10'], dict(batch_size=10, sleep_between_batches=0, archive_dir=None)),
+        ],
+    )
+    @patch('airflow.cli.commands.db_command.run_cleanup')
+    def test_batches(self, run_cleanup_mock, extra_args, expected):
+        """
+        The batch size, the sleep between the batches and the archive directory are passed through.
+        """
+        args = self.parser.parse_args(
+            [
+                'db',
+                'clean',
+                '--clean-before-timestamp',
+                '2021-01-01',
+                *extra_args,
+            ]
+        )
+        db_command.cleanup_tables(args)
+
+        run_cleanup_mock.assert_called_once_with(
+            table_names=None,
+            dry_run=False,
+            clean_before_timestamp=pendulum.parse('2021-01-01 00:00:00Z'),
+            verbose=False,
+            confirm=True,
+            **expected,
+        )
+
+    @pytest.mark.parametrize('batch_size', ['0', '-1'])
+    def test_batch_size_must_be_positive(self, batch_size):
+        with pytest.raises(SystemExit):
+            self.parser.parse_args(
+                ['db', 'clean', '--clean-before-timestamp', '2021-01-01', '--batch-size', batch_size]
+            )
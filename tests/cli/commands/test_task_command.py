@@ -148,6 +148,28 @@ class TestCliTasks(unittest.TestCase):
             external_executor_id=None,
         )
 
+    @conf_vars({('core', 'fast_task_start'): 'True'})
+    @mock.patch("airflow.cli.commands.task_command.Stats")
+    @mock.patch("airflow.cli.commands.task_command.get_dag_for_task")
+    @mock.patch("airflow.cli.commands.task_command.LocalTaskJob")
+    def test_run_with_fast_task_start(self, mock_local_job, mock_get_dag_for_task, mock_stats):
+        mock_get_dag_for_task.return_value = self.dag
+        args = self.parser.parse_args(
+            ['tasks', 'run', '--local', self.dag_id, self.dag.task_ids[0], self.run_id]
+        )
+
+        task_command.task_run(args)
+
+        mock_get_dag_for_task.assert_called_once_with(args.subdir, self.dag_id)
+        mock_local_job.assert_called_once()
+        timed_phases = {call.args[0] for call in mock_stats.timing.call_args_list}
+        assert timed_phases == {
+            'task_startup.process',
+            'task_startup.configure',
+            'task_startup.load_dag',
+            'task_startup.load_task_instance',
+        }
+
     @mock.patch("airflow.cli.commands.task_command.LocalTaskJob")
     def test_run_raises_when_theres_no_dagrun(self, mock_local_job):
         """
@@ -44,3 +44,13 @@ class TestTriggererCommand(unittest.TestCase):
         args = self.parser.parse_args(['triggerer', '--capacity=42'])
         triggerer_command.triggerer(args)
         mock_scheduler_job.assert_called_once_with(capacity=42)
+
+    @pytest.mark.skipif(not PY37, reason="triggerer subcommand only works with Python 3.7+")
+    @mock.patch("airflow.cli.commands.triggerer_command._run_shards")
+    @mock.patch("airflow.cli.commands.triggerer_command.TriggererJob")
+    def test_shards_argument(self, mock_triggerer_job, mock_run_shards):
+        """Ensure that several shards are run in child processes"""
+        args = self.parser.parse_args(['triggerer', '--capacity=42', '--shards=4'])
+        triggerer_command.triggerer(args)
+        mock_triggerer_job.assert_not_called()
+        mock_run_shards.assert_called_once_with(42, 4)
@@ -791,3 +791,12 @@ notacommand = OK
             "CRITICAL, FATAL, ERROR, WARN, WARNING, INFO, DEBUG."
         )
         assert message == exception
+
+    def test_enum_serialized_dag_format(self):
+        test_conf = AirflowConfigParser(default_config='')
+        test_conf.read_dict({'core': {'serialized_dag_format': 'msgpack'}})
+        with pytest.raises(AirflowConfigException) as ctx:
+            test_conf._validate_enums()
+        assert str(ctx.value) == (
+            "`[core] serialized_dag_format` should not be 'msgpack'. Possible values: json, compact."
+        )
@@ -24,6 +24,15 @@ import pytest
 
 from airflow.exceptions import AirflowOptionalProviderFeatureException
 from airflow.providers_manager import HookClassProvider, ProviderInfo, ProvidersManager
+from tests.test_utils.config import conf_vars
+
+
+@pytest.fixture(autouse=True)
+def fresh_providers_manager():
+    # ProvidersManager is a singleton, every test starts with one that has not discovered anything yet
+    ProvidersManager._instance = None
+    yield
+    ProvidersManager._instance = None
 
 
 class TestProviderManager(unittest.TestCase):
@@ -191,3 +200,77 @@ class TestProviderManager(unittest.TestCase):
                 "Optional feature disabled on exception when importing 'HookClass' from "
                 "'test_package' package"
             ] == self._caplog.messages
+
+
+class TestProvidersCache:
+    @pytest.fixture(autouse=True)
+    def providers_cache_file(self, tmp_path):
+        cache_file = tmp_path / "providers_cache.json"
+        with conf_vars({('core', 'providers_cache_file'): str(cache_file)}):
+            yield cache_file
+
+    def test_providers_are_read_from_cache(self, providers_cache_file):
+        providers = dict(ProvidersManager().providers)
+        assert providers_cache_file.exists()
+
+        ProvidersManager._instance = None
+        with patch.object(
+            ProvidersManager, "_discover_all_providers_from_packages"
+        ) as discover_packages, patch.object(
+            ProvidersManager, "_discover_all_airflow_builtin_providers_from_local_sources"
+        ) as discover_sources:
+            assert ProvidersManager().providers == providers
+        discover_packages.assert_not_called()
+        discover_sources.assert_not_called()
+
+    def test_cache_is_invalidated_when_distributions_change(self):
+        with patch("airflow.providers_manager._providers_fingerprint", return_value="before"):
+            ProvidersManager().initialize_providers_list()
+
+        ProvidersManager._instance = None
+        with patch("airflow.providers_manager._providers_fingerprint", return_value="after"), patch.object(
+            ProvidersManager, "_discover_all_providers_from_packages"
+        ) as discover_packages:
+            ProvidersManager().initialize_providers_list()
+        discover_packages.assert_called_once_with()
+
+    def test_hooks_are_not_imported_when_cached(self):
+        provider_manager = ProvidersManager()
+        hooks = {connection_type: hook for connection_type, hook in provider_manager.hooks.items()}
+        widgets = set(provider_manager.connection_form_widgets)
+        field_behaviours = dict(provider_manager.field_behaviours)
+
+        ProvidersManager._instance = None
+        provider_manager = ProvidersManager()
+        with patch.object(ProvidersManager, "_import_hook") as import_hook:
+            assert dict(provider_manager.hooks.items()) == hooks
+        import_hook.assert_not_called()
+
+        # Only the hooks adding widgets are imported
+        with patch.object(
+            ProvidersManager, "_import_hook", autospec=True, side_effect=ProvidersManager._import_hook
+        ) as import_hook:
+            assert set(provider_manager.connection_form_widgets) == widgets
+            assert provider_manager.field_behaviours == field_behaviours
+        assert 0 < import_hook.call_count < len(hooks)
+
+    def test_class_names_are_not_checked_when_cached(self):
+        extra_links = ProvidersManager().extra_links_class_names
+
+        ProvidersManager._instance = None
+        with patch("airflow.providers_manager._sanity_check") as sanity_check:
+            assert ProvidersManager().extra_links_class_names == extra_links
+        sanity_check.assert_not_called()
+
+    def test_cache_disabled(self, providers_cache_file):
+        with conf_vars({('core', 'providers_cache_file'): ''}):
+            assert ProvidersManager().providers
+        assert not providers_cache_file.exists()
+
+    def test_singleton_is_initialized_once(self):
+        provider_manager = ProvidersManager()
+        provider_manager.initialize_providers_list()
+        with patch.object(ProvidersManager, "_discover_all_providers_from_packages") as discover_packages:
+            assert ProvidersManager() is provider_manager
+            assert ProvidersManager().providers
+        discover_packages.assert_not_called()
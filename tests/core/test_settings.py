@@ -17,9 +17,13 @@
 # under the License.
 #
 import os
+import subprocess
 import sys
 import tempfile
+import threading
+import time
 import unittest
+from unittest import mock
 from unittest.mock import MagicMock, call
 
 import pytest
@@ -213,3 +217,74 @@ class TestUpdatedConfigNames(unittest.TestCase):
         session_lifetime_config = settings.get_session_lifetime_config()
         default_timeout_minutes = 30 * 24 * 60
         assert session_lifetime_config == default_timeout_minutes
+
+
+class TestLazyConfigureOrm(unittest.TestCase):
+    def setUp(self):
+        from airflow import settings
+
+        self.old_engine = settings.engine
+        self.old_session = settings.Session
+
+    def tearDown(self):
+        from airflow import settings
+
+        settings.engine = self.old_engine
+        settings.Session = self.old_session
+
+    def test_import_airflow_does_not_import_sqlalchemy(self):
+        env = {**os.environ, "AIRFLOW__CORE__LAZY_CONFIGURE_ORM": "True"}
+        code = "import sys, airflow; print('sqlalchemy' in sys.modules)"
+        output = subprocess.check_output([sys.executable, "-c", code], env=env, text=True)
+        assert output.strip().splitlines()[-1] == "False"
+
+    def test_orm_configured_on_first_use(self):
+        from airflow import settings
+
+        del settings.engine
+        del settings.Session
+        with mock.patch.object(settings, "_ORM_CONFIGURATION_DEFERRED", True), mock.patch.object(
+            settings, "configure_adapters"
+        ) as configure_adapters:
+            engine = settings.engine
+            assert engine is not None
+            assert settings.Session is not None
+            assert not settings._ORM_CONFIGURATION_DEFERRED
+            configure_adapters.assert_called_once_with()
+            engine.dispose()
+
+    def test_orm_configured_once_by_concurrent_first_uses(self):
+        from airflow import settings
+
+        del settings.engine
+        del settings.Session
+        configure_orm = settings.configure_orm
+
+        def slow_configure_orm():
+            time.sleep(0.1)
+            configure_orm()
+
+        with mock.patch.object(settings, "_ORM_CONFIGURATION_DEFERRED", True), mock.patch.object(
+            settings, "configure_adapters"
+        ), mock.patch.object(settings, "configure_orm", side_effect=slow_configure_orm) as mock_configure_orm:
+            engines = []
+            threads = [threading.Thread(target=lambda: engines.append(settings.engine)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            mock_configure_orm.assert_called_once_with()
+            assert len(engines) == 4
+            assert len(set(map(id, engines))) == 1
+            engines[0].dispose()
+
+    def test_dispose_orm_never_configured(self):
+        from airflow import settings
+
+        del settings.engine
+        del settings.Session
+        with mock.patch.object(settings, "_ORM_CONFIGURATION_DEFERRED", True):
+            settings.dispose_orm()
+            assert settings.engine is None
+            assert settings.Session is None
@@ -0,0 +1,132 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import os
+
+import pytest
+
+from airflow.dag_processing.file_changes import DagDirectoryWatcher, DagFileChangeTracker
+
+
+@pytest.fixture
+def dag_folder(tmp_path):
+    (tmp_path / "common").mkdir()
+    (tmp_path / "common" / "__init__.py").write_text("")
+    (tmp_path / "common" / "helpers.py").write_text("SCHEDULE = '@daily'\n")
+    (tmp_path / "dag_a.py").write_text("from common.helpers import SCHEDULE\nimport os\n")
+    (tmp_path / "dag_b.py").write_text("import datetime\n")
+    return tmp_path
+
+
+def _touch(path, content):
+    stat = os.stat(path)
+    path.write_text(content)
+    # Make sure the change is visible even on filesystems with a coarse mtime resolution
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+
+class TestDagFileChangeTracker:
+    def test_unparsed_file_has_changed(self, dag_folder):
+        tracker = DagFileChangeTracker(dag_folder)
+        assert tracker.has_changed(str(dag_folder / "dag_a.py"))
+
+    def test_parsed_file_has_not_changed(self, dag_folder):
+        tracker = DagFileChangeTracker(dag_folder)
+        file_path = str(dag_folder / "dag_b.py")
+        tracker.start_parsing(file_path)
+        tracker.finish_parsing(file_path, success=True)
+        assert not tracker.has_changed(file_path)
+
+        _touch(dag_folder / "dag_b.py", "import datetime\nimport json\n")
+        assert tracker.has_changed(file_path)
+
+    def test_same_content_has_not_changed(self, dag_folder):
+        tracker = DagFileChangeTracker(dag_folder)
+        file_path = str(dag_folder / "dag_b.py")
+        tracker.start_parsing(file_path)
+        tracker.finish_parsing(file_path, success=True)
+
+        _touch(dag_folder / "dag_b.py", "import datetime\n")
+        assert not tracker.has_changed(file_path)
+
+    def test_failed_parse_has_changed(self, dag_folder):
+        tracker = DagFileChangeTracker(dag_folder)
+        file_path = str(dag_folder / "dag_b.py")
+        tracker.start_parsing(file_path)
+        tracker.finish_parsing(file_path, success=False)
+        assert tracker.has_changed(file_path)
+
+    def test_change_in_imported_module(self, dag_folder):
+        tracker = DagFileChangeTracker(dag_folder)
+        dag_a, dag_b = str(dag_folder / "dag_a.py"), str(dag_folder / "dag_b.py")
+        for file_path in (dag_a, dag_b):
+            tracker.start_parsing(file_path)
+            tracker.finish_parsing(file_path, success=True)
+
+        _touch(dag_folder / "common" / "helpers.py", "SCHEDULE = '@hourly'\n")
+        assert tracker.has_changed(dag_a)
+        assert not tracker.has_changed(dag_b)
+
+    def test_dependents(self, dag_folder):
+        tracker = DagFileChangeTracker(dag_folder)
+        dag_a, dag_b = str(dag_folder / "dag_a.py"), str(dag_folder / "dag_b.py")
+        for file_path in (dag_a, dag_b):
+            tracker.start_parsing(file_path)
+            tracker.finish_parsing(file_path, success=True)
+
+        assert tracker.dependents([str(dag_folder / "common" / "helpers.py")]) == {dag_a}
+        assert tracker.dependents([dag_b]) == {dag_b}
+        assert tracker.dependents([str(dag_folder / "other.py")]) == set()
+
+    def test_change_during_parse(self, dag_folder):
+        tracker = DagFileChangeTracker(dag_folder)
+        file_path = str(dag_folder / "dag_b.py")
+        tracker.start_parsing(file_path)
+        _touch(dag_folder / "dag_b.py", "import json\n")
+        tracker.finish_parsing(file_path, success=True)
+        assert tracker.has_changed(file_path)
+
+    def test_retain(self, dag_folder):
+        tracker = DagFileChangeTracker(dag_folder)
+        dag_a, dag_b = str(dag_folder / "dag_a.py"), str(dag_folder / "dag_b.py")
+        for file_path in (dag_a, dag_b):
+            tracker.start_parsing(file_path)
+            tracker.finish_parsing(file_path, success=True)
+
+        tracker.retain([dag_b])
+        assert tracker.has_changed(dag_a)
+        assert not tracker.has_changed(dag_b)
+
+
+class TestDagDirectoryWatcher:
+    def test_pop_changes(self, tmp_path):
+        watcher = DagDirectoryWatcher(tmp_path)
+        watcher._record("modified", "/dags/a.py", None)
+        watcher._record("modified", "/dags/a.py", None)
+        assert watcher.pop_changes() == ({"/dags/a.py"}, False)
+        assert watcher.pop_changes() == (set(), False)
+
+    @pytest.mark.parametrize("event_type", ["created", "deleted"])
+    def test_pop_changes_files_added_or_removed(self, tmp_path, event_type):
+        watcher = DagDirectoryWatcher(tmp_path)
+        watcher._record(event_type, "/dags/a.py", None)
+        assert watcher.pop_changes() == ({"/dags/a.py"}, True)
+
+    def test_pop_changes_moved(self, tmp_path):
+        watcher = DagDirectoryWatcher(tmp_path)
+        watcher._record("moved", "/dags/a.py", "/dags/b.py")
+        assert watcher.pop_changes() == ({"/dags/a.py", "/dags/b.py"}, True)
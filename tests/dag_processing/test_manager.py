@@ -232,6 +232,25 @@ class TestDagFileProcessorManager:
         assert file_2 in manager._processors.keys()
         assert [file_3] == manager._file_path_queue
 
+    @conf_vars({("scheduler", "parsing_worker_pool"): "True"})
+    @mock.patch("airflow.dag_processing.manager.PooledDagFileProcessorProcess")
+    def test_start_new_processes_with_worker_pool(self, mock_pooled_processor):
+        manager = DagFileProcessorManager(
+            dag_directory='directory',
+            max_runs=1,
+            processor_timeout=timedelta.max,
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        manager._file_path_queue = ['file_1.py']
+        manager.start_new_processes()
+
+        mock_pooled_processor.assert_called_once_with(manager._worker_pool, 'file_1.py', False, [], [])
+        mock_pooled_processor.return_value.start.assert_called_once_with()
+        assert manager._processors == {'file_1.py': mock_pooled_processor.return_value}
+
     def test_set_file_paths_when_processor_file_path_not_in_new_file_paths(self):
         manager = DagFileProcessorManager(
             dag_directory='directory',
@@ -451,6 +470,100 @@ class TestDagFileProcessorManager:
                 > (freezed_base_time - manager.get_last_finish_time("file_1.py")).total_seconds()
             )
 
+    @conf_vars(
+        {
+            ("scheduler", "skip_unchanged_dag_files"): "True",
+            ("scheduler", "file_parsing_sort_mode"): "alphabetical",
+        }
+    )
+    def test_unchanged_files_are_skipped(self, tmp_path):
+        """Test files parsed successfully are not parsed again until they change"""
+        unchanged_file = tmp_path / "file_1.py"
+        changed_file = tmp_path / "file_2.py"
+        for file_path in (unchanged_file, changed_file):
+            file_path.write_text("import datetime\n")
+        dag_files = [str(unchanged_file), str(changed_file)]
+
+        manager = DagFileProcessorManager(
+            dag_directory=tmp_path,
+            max_runs=3,
+            processor_timeout=timedelta.max,
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        last_finish_time = timezone.utcnow() - timedelta(hours=1)
+        for file_path in dag_files:
+            manager._file_stats[file_path] = DagFileStat(1, 0, last_finish_time, 1.0, 1)
+            manager._file_change_tracker.start_parsing(file_path)
+            manager._file_change_tracker.finish_parsing(file_path, success=True)
+
+        changed_file.write_text("import datetime\nimport json\n")
+        manager.set_file_paths(dag_files)
+        manager.prepare_file_path_queue()
+
+        assert manager._file_path_queue == [str(changed_file)]
+        unchanged_stat = manager._file_stats[str(unchanged_file)]
+        assert unchanged_stat.run_count == 2
+        assert unchanged_stat.last_finish_time > last_finish_time
+
+    @conf_vars({("scheduler", "watch_dag_dir"): "True"})
+    def test_watched_changes_only_check_reported_files(self, tmp_path):
+        """Only the reported files, and the files importing them, are queued and checked for changes"""
+        (tmp_path / "common.py").write_text("SCHEDULE = '@daily'\n")
+        dag_files = [str(tmp_path / f"file_{i}.py") for i in range(3)]
+        for file_path in dag_files:
+            pathlib.Path(file_path).write_text("import common\n")
+        (tmp_path / "file_0.py").write_text("import datetime\n")
+
+        manager = DagFileProcessorManager(
+            dag_directory=tmp_path,
+            max_runs=1,
+            processor_timeout=timedelta.max,
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        manager.set_file_paths(dag_files)
+        for file_path in dag_files:
+            manager._file_change_tracker.start_parsing(file_path)
+            manager._file_change_tracker.finish_parsing(file_path, success=True)
+        (tmp_path / "common.py").write_text("SCHEDULE = '@hourly'\n")
+        os.utime(tmp_path / "common.py", (0, 10))
+
+        manager._dag_dir_watcher = MagicMock()
+        manager._dag_dir_watcher.pop_changes.return_value = ({str(tmp_path / "common.py")}, False)
+        with mock.patch.object(
+            manager._file_change_tracker, "has_changed", wraps=manager._file_change_tracker.has_changed
+        ) as has_changed:
+            manager._queue_watched_changes()
+
+        assert sorted(manager._file_path_queue) == dag_files[1:]
+        assert sorted(call.args[0] for call in has_changed.call_args_list) == dag_files[1:]
+
+    @pytest.mark.parametrize("result, expected_changed", [((1, 0), False), ((1, 1), True), (None, True)])
+    def test_files_with_import_errors_are_parsed_again(self, tmp_path, result, expected_changed):
+        """Files whose parse failed or had import errors are not skipped as unchanged"""
+        file_path = str(tmp_path / "file_1.py")
+        pathlib.Path(file_path).write_text("import missing_package\n")
+        manager = DagFileProcessorManager(
+            dag_directory=tmp_path,
+            max_runs=1,
+            processor_timeout=timedelta.max,
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        manager._file_change_tracker.start_parsing(file_path)
+        processor = MagicMock(file_path=file_path, result=result, start_time=timezone.utcnow())
+
+        manager._collect_results_from_processor(processor)
+
+        assert manager._file_change_tracker.has_changed(file_path) is expected_changed
+
     @mock.patch("airflow.dag_processing.processor.DagFileProcessorProcess.pid", new_callable=PropertyMock)
     @mock.patch("airflow.dag_processing.processor.DagFileProcessorProcess.kill")
     def test_kill_timed_out_processors_kill(self, mock_kill, mock_pid):
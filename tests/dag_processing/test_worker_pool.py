@@ -0,0 +1,128 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import time
+from textwrap import dedent
+
+import pytest
+
+from airflow import settings
+from airflow.dag_processing.worker_pool import DagFileProcessorWorkerPool, PooledDagFileProcessorProcess
+from airflow.models import DagModel
+from airflow.utils.session import create_session
+from tests.test_utils.db import clear_db_dags, clear_db_serialized_dags
+
+DAG_CODE = dedent(
+    """
+    from airflow import DAG
+    dag = DAG(dag_id='{dag_id}', schedule_interval='0 0 * * *')
+    """
+)
+
+
+def wait_until_done(processor, timeout=60):
+    deadline = time.monotonic() + timeout
+    while not processor.done:
+        assert time.monotonic() < deadline, f"Processing {processor.file_path} timed out"
+        time.sleep(0.1)
+
+
+@pytest.fixture
+def dag_files(tmp_path):
+    file_paths = []
+    for dag_id in ("pooled_dag_1", "pooled_dag_2"):
+        file_path = tmp_path / f"{dag_id}.py"
+        file_path.write_text(DAG_CODE.format(dag_id=dag_id))
+        file_paths.append(str(file_path))
+    return file_paths
+
+
+@pytest.mark.execution_timeout(120)
+class TestDagFileProcessorWorkerPool:
+    def setup_method(self):
+        clear_db_dags()
+        clear_db_serialized_dags()
+
+    def teardown_method(self):
+        clear_db_dags()
+        clear_db_serialized_dags()
+
+    def process(self, pool, file_path):
+        processor = PooledDagFileProcessorProcess(pool, file_path, False, [], [])
+        processor.start()
+        wait_until_done(processor)
+        return processor
+
+    def test_worker_is_reused(self, dag_files):
+        pool = DagFileProcessorWorkerPool(["json"], max_files_per_worker=10, max_worker_memory_mb=0)
+        try:
+            first, second = (self.process(pool, file_path) for file_path in dag_files)
+            assert first.result == (1, 0)
+            assert second.result == (1, 0)
+            assert first.pid == second.pid
+            assert len(pool) == 1
+        finally:
+            pool.stop()
+
+    def test_worker_is_recycled_after_max_files(self, dag_files):
+        pool = DagFileProcessorWorkerPool([], max_files_per_worker=1, max_worker_memory_mb=0)
+        try:
+            first, second = (self.process(pool, file_path) for file_path in dag_files)
+            assert first.result == (1, 0)
+            assert second.result == (1, 0)
+            assert first.pid != second.pid
+            assert len(pool) == 0
+        finally:
+            pool.stop()
+
+    def test_killed_worker_is_replaced(self, dag_files):
+        pool = DagFileProcessorWorkerPool([], max_files_per_worker=10, max_worker_memory_mb=0)
+        try:
+            processor = PooledDagFileProcessorProcess(pool, dag_files[0], False, [], [])
+            processor.start()
+            processor.kill()
+            wait_until_done(processor)
+            assert processor.result is None
+            assert len(pool) == 0
+
+            assert self.process(pool, dag_files[1]).result == (1, 0)
+        finally:
+            pool.stop()
+
+    def test_changed_helper_module_is_imported_again(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "DAGS_FOLDER", str(tmp_path))
+        monkeypatch.syspath_prepend(str(tmp_path))
+        (tmp_path / "pooled_helper.py").write_text("DAG_ID = 'pooled_helper_dag_1'\n")
+        dag_file = tmp_path / "pooled_helper_dag.py"
+        dag_file.write_text(
+            "from airflow import DAG\n"
+            "from pooled_helper import DAG_ID\n"
+            "dag = DAG(dag_id=DAG_ID, schedule_interval='0 0 * * *')\n"
+        )
+
+        pool = DagFileProcessorWorkerPool([], max_files_per_worker=10, max_worker_memory_mb=0)
+        try:
+            first = self.process(pool, str(dag_file))
+            (tmp_path / "pooled_helper.py").write_text("DAG_ID = 'pooled_helper_dag_two'\n")
+            second = self.process(pool, str(dag_file))
+        finally:
+            pool.stop()
+
+        assert first.pid == second.pid
+        with create_session() as session:
+            dag_ids = {dag_id for dag_id, in session.query(DagModel.dag_id)}
+        assert {"pooled_helper_dag_1", "pooled_helper_dag_two"} <= dag_ids
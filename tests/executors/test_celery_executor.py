@@ -50,6 +50,7 @@ from airflow.operators.bash import BashOperator
 from airflow.utils import timezone
 from airflow.utils.state import State
 from tests.test_utils import db
+from tests.test_utils.config import conf_vars
 
 
 def _prepare_test_bodies():
@@ -579,6 +580,63 @@ class TestCeleryExecutor:
                 assert ti.state == state
 
 
+class TestCeleryExecutorTaskEvents:
+    @pytest.fixture
+    def executor(self):
+        with conf_vars({('celery', 'sync_with_task_events'): 'True'}):
+            executor = celery_executor.CeleryExecutor()
+        executor.task_event_listener.connected = True
+        self.key_1 = TaskInstanceKey("dag", "task_1", "run_id", 1)
+        self.key_2 = TaskInstanceKey("dag", "task_2", "run_id", 1)
+        self.result_1 = mock.Mock(task_id="231")
+        self.result_2 = mock.Mock(task_id="232")
+        executor.tasks = {self.key_1: self.result_1, self.key_2: self.result_2}
+        executor.running = {self.key_1, self.key_2}
+        executor.bulk_state_fetcher = mock.MagicMock()
+        return executor
+
+    def test_sync_updates_states_from_events(self, executor):
+        listener = executor.task_event_listener
+        listener.on_event({'type': 'task-started', 'uuid': '231', 'timestamp': time.time()})
+        listener.on_event({'type': 'task-succeeded', 'uuid': '231', 'timestamp': time.time()})
+        listener.on_event({'type': 'task-failed', 'uuid': '232', 'timestamp': time.time()})
+        listener.on_event({'type': 'task-succeeded', 'uuid': 'unknown', 'timestamp': time.time()})
+
+        executor.sync()
+
+        executor.bulk_state_fetcher.get_many.assert_not_called()
+        assert executor.event_buffer == {self.key_1: (State.SUCCESS, None), self.key_2: (State.FAILED, None)}
+        assert executor.tasks == {}
+        assert listener.get_events() == []
+
+    def test_sync_reconciles_a_batch_of_tasks(self, executor):
+        executor.task_events_reconcile_interval = 0
+        executor.task_events_reconcile_batch_size = 1
+        executor.bulk_state_fetcher.get_many.side_effect = lambda results: {
+            result.task_id: (celery_executor.celery_states.SUCCESS, None) for result in results
+        }
+
+        executor.sync()
+        executor.bulk_state_fetcher.get_many.assert_called_once_with([self.result_1])
+        assert list(executor.tasks) == [self.key_2]
+
+        executor.sync()
+        executor.bulk_state_fetcher.get_many.assert_called_with([self.result_2])
+        assert executor.tasks == {}
+
+    def test_sync_polls_all_tasks_while_disconnected(self, executor):
+        executor.task_event_listener.connected = False
+        executor.bulk_state_fetcher.get_many.return_value = {
+            "231": (celery_executor.celery_states.STARTED, None),
+            "232": (celery_executor.celery_states.SUCCESS, None),
+        }
+
+        executor.sync()
+
+        executor.bulk_state_fetcher.get_many.assert_called_once()
+        assert executor.event_buffer == {self.key_2: (State.SUCCESS, None)}
+
+
 def test_operation_timeout_config():
     assert celery_executor.OPERATION_TIMEOUT == 1
 
@@ -17,6 +17,7 @@
 #
 import pathlib
 import random
+import threading
 import re
 import string
 import unittest
@@ -38,6 +39,8 @@ try:
         AirflowKubernetesScheduler,
         KubernetesExecutor,
         KubernetesJobWatcher,
+        PodCreationRateLimiter,
+        WorkerPodCache,
         create_pod_id,
         get_base_pod_from_template,
     )
@@ -744,6 +747,277 @@ class TestKubernetesExecutor:
         )
 
 
+def make_worker_pod(name, labels=None, phase='Running', namespace='default'):
+    return k8s.V1Pod(
+        metadata=k8s.V1ObjectMeta(
+            name=name,
+            namespace=namespace,
+            labels={'kubernetes_executor': 'True', **(labels or {})},
+            annotations={},
+        ),
+        status=k8s.V1PodStatus(phase=phase),
+    )
+
+
+class FakeKubeClient:
+    """Kubernetes API keeping pods in memory, answering label and phase selectors"""
+
+    def __init__(self, pods=()):
+        self.pods = {}
+        self.resource_version = 0
+        self.list_calls = 0
+        self.created = []
+        self.create_errors = {}
+        self.lock = threading.Lock()
+        self.api_client = mock.MagicMock()
+        self.api_client.sanitize_for_serialization.side_effect = PodGenerator.serialize_pod
+        for pod in pods:
+            self._store(pod)
+
+    def _store(self, pod):
+        self.resource_version += 1
+        pod.metadata.resource_version = str(self.resource_version)
+        self.pods[(pod.metadata.namespace, pod.metadata.name)] = pod
+
+    def _select(self, namespace, label_selector=None, field_selector=None):
+        labels = dict(term.split('=', 1) for term in label_selector.split(',')) if label_selector else {}
+        phase = field_selector.split('=', 1)[1] if field_selector else None
+        return k8s.V1PodList(
+            items=[
+                pod
+                for pod in self.pods.values()
+                if (namespace is None or pod.metadata.namespace == namespace)
+                and (phase is None or pod.status.phase == phase)
+                and all(pod.metadata.labels.get(name) == value for name, value in labels.items())
+            ],
+            metadata=k8s.V1ListMeta(resource_version=str(self.resource_version)),
+        )
+
+    def list_namespaced_pod(self, namespace, label_selector=None, field_selector=None, **kwargs):
+        self.list_calls += 1
+        return self._select(namespace, label_selector, field_selector)
+
+    def list_pod_for_all_namespaces(self, label_selector=None, field_selector=None, **kwargs):
+        self.list_calls += 1
+        return self._select(None, label_selector, field_selector)
+
+    def create_namespaced_pod(self, body, namespace, **kwargs):
+        pod = PodGenerator.deserialize_model_dict(body)
+        error = self.create_errors.get(pod.metadata.labels['task_id'])
+        if error:
+            raise error
+        pod.metadata.namespace = namespace
+        pod.status = k8s.V1PodStatus(phase='Pending')
+        with self.lock:
+            self.created.append(pod.metadata.name)
+            self._store(pod)
+        return pod
+
+    def patch_namespaced_pod(self, name, namespace, body):
+        pod = PodGenerator.deserialize_model_dict(body)
+        self.pods[(namespace, name)].metadata.labels = pod.metadata.labels
+
+
+class TestWorkerPodCache:
+    def test_resync_and_get_pods(self):
+        fake_client = FakeKubeClient(
+            [
+                make_worker_pod('a', {'dag_id': 'dag', 'task_id': 'task1', 'airflow-worker': '1'}),
+                make_worker_pod(
+                    'b', {'dag_id': 'dag', 'task_id': 'task2', 'airflow-worker': '1'}, 'Succeeded'
+                ),
+                make_worker_pod(
+                    'c', {'dag_id': 'dag', 'task_id': 'task1', 'airflow-worker': '2'}, namespace='other'
+                ),
+            ]
+        )
+        cache = WorkerPodCache(fake_client, namespace=None, multi_namespace_mode=True)
+        assert not cache.synced
+
+        cache.resync()
+        assert cache.synced
+        assert cache.resource_version == '3'
+        assert {pod.metadata.name for pod in cache.get_pods({'dag_id': 'dag', 'task_id': 'task1'})} == {
+            'a',
+            'c',
+        }
+        assert [pod.metadata.name for pod in cache.get_pods({'airflow-worker': '1'}, phase='Succeeded')] == [
+            'b'
+        ]
+        assert [pod.metadata.name for pod in cache.get_pods({}, namespace='other')] == ['c']
+        assert cache.get_pods({'dag_id': 'dag', 'task_id': 'task3'}) == []
+
+        # Callers get copies they can modify
+        pod = cache.get_pods({'dag_id': 'dag', 'task_id': 'task2'})[0]
+        pod.metadata.labels['airflow-worker'] = '10'
+        assert cache.get_pods({'airflow-worker': '10'}) == []
+
+    def test_apply_event(self):
+        cache = WorkerPodCache(FakeKubeClient(), namespace='default', multi_namespace_mode=False)
+        cache.resync()
+        pod = make_worker_pod('a', {'dag_id': 'dag', 'task_id': 'task', 'airflow-worker': '1'})
+
+        cache.apply_event('ADDED', pod)
+        assert len(cache.get_pods({'dag_id': 'dag', 'task_id': 'task'})) == 1
+
+        moved = make_worker_pod('a', {'dag_id': 'dag', 'task_id': 'task', 'airflow-worker': '2'})
+        moved.metadata.resource_version = '42'
+        cache.apply_event('MODIFIED', moved)
+        assert cache.get_pods({'airflow-worker': '1'}) == []
+        assert len(cache.get_pods({'airflow-worker': '2'})) == 1
+        assert cache.resource_version == '42'
+
+        cache.apply_event('DELETED', moved)
+        assert cache.get_pods({'dag_id': 'dag', 'task_id': 'task'}) == []
+
+    @mock.patch('airflow.executors.kubernetes_executor.watch')
+    def test_follow_applies_watch_events(self, mock_watch):
+        fake_client = FakeKubeClient([make_worker_pod('a'), make_worker_pod('b')])
+        cache = WorkerPodCache(fake_client, namespace='default', multi_namespace_mode=False)
+        cache.resync()
+        mock_watch.Watch.return_value.stream.return_value = [
+            {'type': 'DELETED', 'object': make_worker_pod('a')},
+            {'type': 'ADDED', 'object': make_worker_pod('c')},
+            {'type': 'ERROR', 'object': None, 'raw_object': {'code': 410}},
+        ]
+
+        cache._follow()
+
+        mock_watch.Watch.return_value.stream.assert_called_once_with(
+            fake_client.list_namespaced_pod,
+            'default',
+            label_selector='kubernetes_executor=True',
+            resource_version='2',
+        )
+        assert sorted(pod.metadata.name for pod in cache.get_pods({})) == ['b', 'c']
+        # The watch failed, the pods have to be listed again
+        assert not cache.synced
+
+
+class TestPodCreationRateLimiter:
+    @mock.patch('airflow.executors.kubernetes_executor.time')
+    def test_wait(self, mock_time):
+        mock_time.monotonic.return_value = 100.0
+        limiter = PodCreationRateLimiter(rate=4)
+
+        for _ in range(3):
+            limiter.wait('default')
+        limiter.wait('other')
+
+        assert mock_time.sleep.call_args_list == [mock.call(0.25), mock.call(0.5)]
+
+    @mock.patch('airflow.executors.kubernetes_executor.time')
+    def test_no_limit(self, mock_time):
+        limiter = PodCreationRateLimiter(rate=0)
+        for _ in range(10):
+            limiter.wait('default')
+        mock_time.sleep.assert_not_called()
+
+
+@pytest.mark.skipif(AirflowKubernetesScheduler is None, reason='kubernetes python package is not installed')
+class TestKubernetesExecutorWithFakeApi:
+    """The KubernetesExecutor creating and looking up pods through a fake Kubernetes API"""
+
+    @pytest.fixture(autouse=True)
+    def fake_api(self):
+        self.fake_client = FakeKubeClient()
+        path = str(pathlib.Path(__file__).parents[1] / 'kubernetes' / 'pod_generator_base_with_secrets.yaml')
+        with mock.patch(
+            'airflow.executors.kubernetes_executor.get_kube_client', return_value=self.fake_client
+        ), mock.patch('airflow.executors.kubernetes_executor.KubernetesJobWatcher'), mock.patch.object(
+            WorkerPodCache, 'start', WorkerPodCache.resync
+        ), conf_vars(
+            {
+                ('kubernetes', 'pod_template_file'): path,
+                ('kubernetes', 'worker_pods_creation_batch_size'): '8',
+                ('kubernetes', 'worker_pods_creation_concurrency'): '4',
+                ('kubernetes', 'worker_pods_informer_cache'): 'True',
+            }
+        ):
+            self.executor = KubernetesExecutor()
+            self.executor.job_id = 5
+            yield
+        self.executor.end()
+
+    def queue_tasks(self, *task_ids):
+        for task_id in task_ids:
+            self.executor.execute_async(
+                key=TaskInstanceKey('dag', task_id, 'run_id', 1),
+                command=['airflow', 'tasks', 'run', 'dag', task_id, 'run_id'],
+            )
+
+    def test_sync_creates_pods_concurrently(self):
+        self.executor.start()
+        assert self.executor._pod_creation_pool is not None
+        self.fake_client.create_errors = {
+            'task2': ApiException(http_resp=HTTPResponse(body='{"message": "quota"}', status=403)),
+            'task3': ApiException(http_resp=HTTPResponse(body='{"message": "invalid"}', status=422)),
+        }
+        self.queue_tasks(*(f'task{i}' for i in range(10)))
+
+        self.executor.sync()
+        assert len(self.fake_client.created) == 6
+        assert self.executor.event_buffer[TaskInstanceKey('dag', 'task3', 'run_id', 1)][0] == State.FAILED
+        # The created pods are in the cache right away
+        assert len(self.executor.pod_cache.get_pods({'airflow-worker': '5'})) == 6
+
+        self.fake_client.create_errors = {}
+        self.executor.sync()
+        # The two remaining tasks and task2, which was re-queued
+        assert len(self.fake_client.created) == 9
+        assert self.executor.task_queue.empty()
+
+    @pytest.mark.parametrize(
+        'launched, expected_state, expected_list_calls',
+        [
+            # Only the initial listing of the cache goes to the API
+            pytest.param('before_start', State.QUEUED, 1, id='in_cache'),
+            # A pod another scheduler just created is found by listing the pods of the TI
+            pytest.param('after_start', State.QUEUED, 2, id='not_in_cache_yet'),
+            # The pods of the TI are listed by run_id, then by execution_date
+            pytest.param(None, State.SCHEDULED, 3, id='not_launched'),
+        ],
+    )
+    def test_clear_not_launched_queued_tasks_from_cache(
+        self, dag_maker, create_dummy_dag, session, launched, expected_state, expected_list_calls
+    ):
+        labels = {'dag_id': 'test_clear', 'task_id': 'task1', 'airflow-worker': '1', 'run_id': 'test'}
+        if launched == 'before_start':
+            self.fake_client._store(make_worker_pod('test-clear-task1', labels))
+        self.executor.start()
+        if launched == 'after_start':
+            self.fake_client._store(make_worker_pod('test-clear-task1', labels))
+
+        create_dummy_dag(dag_id="test_clear", task_id="task1", with_dagrun_type=None)
+        dag_run = dag_maker.create_dagrun()
+        ti = dag_run.task_instances[0]
+        ti.state = State.QUEUED
+        ti.queued_by_job_id = 1
+        session.flush()
+        self.executor.clear_not_launched_queued_tasks(session=session)
+
+        ti.refresh_from_db()
+        assert ti.state == expected_state
+        assert self.fake_client.list_calls == expected_list_calls
+
+    def test_try_adopt_task_instances_from_cache(self):
+        annotations = {'dag_id': 'dag', 'task_id': 'task', 'run_id': 'run_id', 'try_number': '1'}
+        running_pod = make_worker_pod('running', {'airflow-worker': '1', 'dag_id': 'dag', 'task_id': 'task'})
+        running_pod.metadata.annotations = annotations
+        done_pod = make_worker_pod('done', {'airflow-worker': '2'}, phase='Succeeded')
+        self.fake_client._store(running_pod)
+        self.fake_client._store(done_pod)
+        self.executor.start()
+        ti = mock.MagicMock(queued_by_job_id='1', key=annotations_to_key(annotations))
+
+        assert self.executor.try_adopt_task_instances([ti]) == []
+
+        assert self.executor.running == {ti.key}
+        assert self.fake_client.pods[('default', 'running')].metadata.labels['airflow-worker'] == '5'
+        assert self.fake_client.pods[('default', 'done')].metadata.labels['airflow-worker'] == '5'
+        assert self.fake_client.list_calls == 1
+
+
 class TestKubernetesJobWatcher(unittest.TestCase):
     def setUp(self):
         self.watcher = KubernetesJobWatcher(
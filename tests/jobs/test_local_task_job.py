@@ -28,6 +28,7 @@ from unittest.mock import patch
 
 import psutil
 import pytest
+from sqlalchemy.exc import OperationalError
 
 from airflow import settings
 from airflow.exceptions import AirflowException, AirflowFailException
@@ -696,11 +697,20 @@ class TestLocalTaskJob:
             ),
         ],
     )
+    @pytest.mark.parametrize("fast_path", [False, True])
     def test_fast_follow(
-        self, conf, dependencies, init_state, first_run_state, second_run_state, error_message, dag_maker
+        self,
+        conf,
+        dependencies,
+        init_state,
+        first_run_state,
+        second_run_state,
+        error_message,
+        fast_path,
+        dag_maker,
     ):
 
-        with conf_vars(conf):
+        with conf_vars({**conf, ('scheduler', 'mini_scheduler_fast_path'): str(fast_path)}):
             session = settings.Session()
 
             python_callable = lambda: True
@@ -752,8 +762,8 @@ class TestLocalTaskJob:
             if scheduler_job.processor_agent:
                 scheduler_job.processor_agent.end()
 
-    @conf_vars({('scheduler', 'schedule_after_task_execution'): 'True'})
-    def test_mini_scheduler_works_with_wait_for_upstream(self, caplog, dag_maker):
+    @pytest.mark.parametrize("fast_path", ['False', 'True'])
+    def test_mini_scheduler_works_with_wait_for_upstream(self, fast_path, caplog, dag_maker):
         session = settings.Session()
         with dag_maker(default_args={'wait_for_downstream': True}, catchup=False) as dag:
             task_a = PythonOperator(task_id='A', python_callable=lambda: True)
@@ -784,7 +794,13 @@ class TestLocalTaskJob:
 
         job1 = LocalTaskJob(task_instance=ti2_a, ignore_ti_state=True, executor=SequentialExecutor())
         job1.task_runner = StandardTaskRunner(job1)
-        job1.run()
+        with conf_vars(
+            {
+                ('scheduler', 'schedule_after_task_execution'): 'True',
+                ('scheduler', 'mini_scheduler_fast_path'): fast_path,
+            }
+        ):
+            job1.run()
 
         ti2_a.refresh_from_db(session)
         ti2_b.refresh_from_db(session)
@@ -797,6 +813,47 @@ class TestLocalTaskJob:
         assert failed_deps[0].dep_name == "Previous Dagrun State"
         assert not failed_deps[0].passed
 
+    @conf_vars({('scheduler', 'mini_scheduler_fast_path'): 'True'})
+    @mock.patch('airflow.jobs.local_task_job.Stats.incr')
+    def test_mini_scheduler_fast_path(self, mock_stats_incr, dag_maker, session):
+        with dag_maker('test_mini_scheduler_fast_path', session=session):
+            task_a = DummyOperator(task_id='A')
+            task_b = PythonOperator(task_id='B', python_callable=lambda: True)
+            task_c = PythonOperator(task_id='C', python_callable=lambda: True)
+            task_d = PythonOperator(task_id='D', python_callable=lambda: True)
+            task_a >> [task_b, task_c]
+            task_d >> task_c
+        dag_run = dag_maker.create_dagrun()
+        ti_a = dag_run.get_task_instance(task_a.task_id, session=session)
+        ti_a.state = State.SUCCESS
+        session.commit()
+
+        job = LocalTaskJob(task_instance=ti_a, executor=SequentialExecutor())
+        with mock.patch.object(LocalTaskJob, '_schedule_downstream_with_partial_dag') as partial_dag:
+            job._run_mini_scheduler_on_child_tasks(session=session)
+        partial_dag.assert_not_called()
+
+        session.expire_all()
+        states = {ti.task_id: ti.state for ti in dag_run.get_task_instances(session=session)}
+        # C still waits for D
+        assert states == {'A': State.SUCCESS, 'B': State.SCHEDULED, 'C': State.NONE, 'D': State.NONE}
+        mock_stats_incr.assert_any_call('mini_scheduler.success')
+        mock_stats_incr.assert_any_call('mini_scheduler.tis_scheduled', 1)
+
+    @mock.patch('airflow.jobs.local_task_job.Stats.incr')
+    def test_mini_scheduler_skipped_on_lock_timeout(self, mock_stats_incr, dag_maker, session):
+        with dag_maker('test_mini_scheduler_skipped_on_lock_timeout', session=session):
+            task_a = DummyOperator(task_id='A')
+            task_a >> PythonOperator(task_id='B', python_callable=lambda: True)
+        ti_a = dag_maker.create_dagrun().get_task_instance(task_a.task_id, session=session)
+        mock_stats_incr.reset_mock()
+
+        job = LocalTaskJob(task_instance=ti_a, executor=SequentialExecutor())
+        error = OperationalError("SELECT ... FOR UPDATE", {}, Exception("lock timeout"))
+        with mock.patch.object(LocalTaskJob, '_schedule_downstream_with_partial_dag', side_effect=error):
+            job._run_mini_scheduler_on_child_tasks(session=session)
+        mock_stats_incr.assert_called_once_with('mini_scheduler.skipped')
+
     @patch('airflow.utils.process_utils.subprocess.check_call')
     def test_task_sigkill_works_with_retries(self, _check_call, caplog, dag_maker):
         """
@@ -46,11 +46,13 @@ from airflow.jobs.local_task_job import LocalTaskJob
 from airflow.jobs.scheduler_job import SchedulerJob
 from airflow.models import DAG, DagBag, DagModel, Pool, TaskInstance
 from airflow.models.dagrun import DagRun
+from airflow.models.dagstats import DagStateStats
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.models.taskinstance import SimpleTaskInstance, TaskInstanceKey
 from airflow.operators.bash import BashOperator
 from airflow.operators.dummy import DummyOperator
 from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.stats import Timer
 from airflow.utils import timezone
 from airflow.utils.file import list_py_file_paths
 from airflow.utils.session import create_session, provide_session
@@ -371,6 +373,95 @@ class TestSchedulerJob:
         ti1.refresh_from_db()
         assert ti1.state == State.FAILED
 
+    @mock.patch('airflow.jobs.scheduler_job.Stats.incr')
+    def test_process_executor_events_requeued_by_another_scheduler(self, mock_stats_incr, dag_maker):
+        with dag_maker(dag_id='test_process_executor_events_requeued', fileloc='/test_path1/'):
+            task1 = DummyOperator(task_id='dummy_task')
+        ti1 = dag_maker.create_dagrun().get_task_instance(task1.task_id)
+
+        executor = MockExecutor(do_update=False)
+        self.scheduler_job = SchedulerJob(executor=executor)
+        self.scheduler_job.id = 1
+        self.scheduler_job.processor_agent = mock.MagicMock()
+        session = settings.Session()
+
+        ti1.state = State.QUEUED
+        ti1.queued_by_job_id = 2
+        session.merge(ti1)
+        session.commit()
+
+        executor.event_buffer[ti1.key] = State.FAILED, None
+        self.scheduler_job._process_executor_events(session=session)
+        ti1.refresh_from_db(session=session)
+        assert ti1.state == State.QUEUED
+        assert mock.call('scheduler.tasks.killed_externally') not in mock_stats_incr.mock_calls
+
+    @mock.patch('airflow.jobs.scheduler_job.Stats.incr')
+    def test_process_executor_events_queued_by_unknown_scheduler(self, mock_stats_incr, dag_maker):
+        with dag_maker(dag_id='test_process_executor_events_queued_by_unknown', fileloc='/test_path1/'):
+            task1 = DummyOperator(task_id='dummy_task')
+        ti1 = dag_maker.create_dagrun().get_task_instance(task1.task_id)
+
+        executor = MockExecutor(do_update=False)
+        self.scheduler_job = SchedulerJob(executor=executor)
+        self.scheduler_job.id = 1
+        self.scheduler_job.processor_agent = mock.MagicMock()
+        session = settings.Session()
+
+        ti1.state = State.QUEUED
+        ti1.queued_by_job_id = None
+        session.merge(ti1)
+        session.commit()
+
+        executor.event_buffer[ti1.key] = State.FAILED, None
+        self.scheduler_job._process_executor_events(session=session)
+        ti1.refresh_from_db(session=session)
+        assert ti1.state == State.FAILED
+        mock_stats_incr.assert_any_call('scheduler.tasks.killed_externally')
+
+    @mock.patch('airflow.jobs.scheduler_job.Stats.timer', side_effect=lambda *args, **kwargs: Timer())
+    def test_process_executor_events_in_bulk(self, mock_stats_timer, dag_maker):
+        with dag_maker(dag_id='test_process_executor_events_in_bulk', fileloc='/test_path1/'):
+            tasks = [DummyOperator(task_id=f'dummy_task_{i}') for i in range(5)]
+            running_task = DummyOperator(task_id='running_task')
+        dag_run = dag_maker.create_dagrun()
+        tis = [dag_run.get_task_instance(task.task_id) for task in tasks]
+
+        executor = MockExecutor(do_update=False)
+        self.scheduler_job = SchedulerJob(executor=executor)
+        self.scheduler_job.processor_agent = mock.MagicMock()
+        session = settings.Session()
+
+        for i, ti in enumerate(tis):
+            ti.state = State.SUCCESS if i % 2 else State.QUEUED
+            session.merge(ti)
+        session.commit()
+        for i, ti in enumerate(tis):
+            executor.event_buffer[ti.key] = (State.SUCCESS, None) if i % 2 else (State.QUEUED, f'ext-{i}')
+        # Not a state reported when a task is queued or finished: left in the buffer
+        executor.event_buffer[dag_run.get_task_instance(running_task.task_id).key] = State.RUNNING, None
+
+        assert self.scheduler_job._process_executor_events(session=session) == 1
+        session.commit()
+        external_ids = {
+            ti.task_id: ti.external_executor_id
+            for ti in session.query(TaskInstance).filter(TaskInstance.dag_id == dag_run.dag_id)
+        }
+        assert external_ids == {
+            'dummy_task_0': 'ext-0',
+            'dummy_task_1': None,
+            'dummy_task_2': 'ext-2',
+            'dummy_task_3': None,
+            'dummy_task_4': 'ext-4',
+            'running_task': None,
+        }
+        phases = [call.args[0] for call in mock_stats_timer.call_args_list]
+        assert phases == [
+            'scheduler.executor_events.collect',
+            'scheduler.executor_events.query',
+            'scheduler.executor_events.reconcile',
+        ]
+
     def test_execute_task_instances_is_paused_wont_execute(self, session, dag_maker):
         dag_id = 'SchedulerJobTest.test_execute_task_instances_is_paused_wont_execute'
         task_id_1 = 'dummy_task'
@@ -488,6 +579,41 @@ class TestSchedulerJob:
         assert tis[3].key in res_keys
         session.rollback()
 
+    @conf_vars({('scheduler', 'use_concurrency_ledger'): 'True'})
+    def test_find_executable_task_instances_pool_with_concurrency_ledger(self, dag_maker, session):
+        dag_id = 'SchedulerJobTest.test_find_executable_task_instances_pool_with_concurrency_ledger'
+        with dag_maker(dag_id=dag_id, max_active_tasks=16, session=session):
+            DummyOperator(task_id='dummy', pool='a')
+
+        self.scheduler_job = SchedulerJob(subdir=os.devnull)
+        assert self.scheduler_job._concurrency_ledger is not None
+
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
+        ti1 = dr1.get_task_instance('dummy', session=session)
+        ti2 = dr2.get_task_instance('dummy', session=session)
+        ti1.state = State.SCHEDULED
+        ti2.state = State.SCHEDULED
+        session.add(Pool(pool='a', slots=1, description='haha'))
+        session.flush()
+
+        res = self.scheduler_job._executable_task_instances_to_queued(max_tis=32, session=session)
+        session.flush()
+        assert [ti1.key] == [ti.key for ti in res]
+
+        # The slot taken above is accounted for in memory, without needing a reconcile
+        res = self.scheduler_job._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert [] == res
+
+        # Once the executor reports the first TI as finished its slot is free again
+        self.scheduler_job._concurrency_ledger.record_finished([ti1.key])
+        ti1.state = State.SUCCESS
+        session.merge(ti1)
+        session.flush()
+        res = self.scheduler_job._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert [ti2.key] == [ti.key for ti in res]
+        session.rollback()
+
     @pytest.mark.parametrize(
         "state, total_executed_ti",
         [
@@ -3503,6 +3629,48 @@ class TestSchedulerJob:
         assert ti1.next_method == "__fail__"
         assert ti2.state == State.DEFERRED
 
+    def test_update_dag_stats(self, dag_maker, session):
+        with dag_maker(dag_id='test_update_dag_stats_running', session=session):
+            DummyOperator(task_id='dummy')
+        running = dag_maker.create_dagrun(state=DagRunState.RUNNING)
+        with dag_maker(dag_id='test_update_dag_stats_finished', session=session):
+            DummyOperator(task_id='dummy')
+        finished = dag_maker.create_dagrun(state=DagRunState.SUCCESS)
+        session.commit()
+
+        def get_dag_run_states():
+            session.expire_all()
+            return {stats.dag_id: stats.dag_run_states for stats in session.query(DagStateStats)}
+
+        self.scheduler_job = SchedulerJob(subdir=os.devnull)
+        # The stats of all the DAGs are refreshed first
+        self.scheduler_job._update_dag_stats()
+        assert get_dag_run_states() == {
+            'test_update_dag_stats_running': {'running': 1},
+            'test_update_dag_stats_finished': {'success': 1},
+        }
+
+        running.state = DagRunState.SUCCESS
+        finished.state = DagRunState.FAILED
+        session.merge(running)
+        session.merge(finished)
+        session.commit()
+
+        # Then only those of the DAGs with runs unfinished now or at the previous refresh
+        self.scheduler_job._update_dag_stats()
+        assert get_dag_run_states() == {
+            'test_update_dag_stats_running': {'success': 1},
+            'test_update_dag_stats_finished': {'success': 1},
+        }
+
+        # Until the stats of all the DAGs are refreshed again
+        self.scheduler_job._last_dag_stats_reconcile -= 300
+        self.scheduler_job._update_dag_stats()
+        assert get_dag_run_states() == {
+            'test_update_dag_stats_running': {'success': 1},
+            'test_update_dag_stats_finished': {'failed': 1},
+        }
+
     def test_find_zombies_nothing(self):
         with create_session() as session:
             executor = MockExecutor(do_update=False)
@@ -21,15 +21,16 @@ import datetime
 import sys
 import time
 from threading import Thread
+from unittest import mock
 
 import pytest
 
-from airflow.jobs.triggerer_job import TriggererJob, TriggerRunner
+from airflow.jobs.triggerer_job import TriggererJob, TriggerNotificationListener, TriggerRunner
 from airflow.models import DagModel, DagRun, TaskInstance, Trigger
 from airflow.operators.dummy import DummyOperator
 from airflow.operators.python import PythonOperator
 from airflow.triggers.base import TriggerEvent
-from airflow.triggers.temporal import TimeDeltaTrigger
+from airflow.triggers.temporal import DateTimeTrigger, TimeDeltaTrigger
 from airflow.triggers.testing import FailureTrigger, SuccessTrigger
 from airflow.utils import timezone
 from airflow.utils.session import create_session
@@ -464,3 +465,237 @@ def test_invalid_trigger(session, dag_maker):
     assert task_instance.next_method == "__fail__"
     assert task_instance.next_kwargs['error'] == 'Trigger failure'
     assert task_instance.next_kwargs['traceback'][-1] == "ModuleNotFoundError: No module named 'fake'\n"
+
+
+@pytest.mark.skipif(sys.version_info.minor <= 6 and sys.version_info.major <= 3, reason="No triggerer on 3.6")
+def test_identical_triggers_share_a_coroutine():
+    """
+    Checks that identical triggers are run by one coroutine sending its events for all of them,
+    and that a trigger created after that coroutine fired gets its own.
+    """
+    runner = TriggerRunner()
+
+    async def run():
+        moment = timezone.utcnow() + datetime.timedelta(seconds=1)
+        runner.to_create.extend(
+            [
+                (1, DateTimeTrigger(moment)),
+                (2, DateTimeTrigger(moment)),
+                (3, DateTimeTrigger(moment + datetime.timedelta(days=7))),
+            ]
+        )
+        await runner.create_triggers()
+        assert runner.coroutine_count == 2
+        assert runner.triggers[1]["task"] is runner.triggers[2]["task"]
+        # Let the shared trigger fire (it checks the time every second), then add an identical trigger
+        await asyncio.sleep(2.1)
+        runner.to_create.append((4, DateTimeTrigger(moment)))
+        await runner.create_triggers()
+        assert runner.triggers[4]["task"] is not runner.triggers[1]["task"]
+        await asyncio.sleep(0.1)
+        await runner.cleanup_finished_triggers()
+        runner.to_cancel.append(3)
+        await runner.cancel_triggers()
+        await asyncio.sleep(0)
+        await runner.cleanup_finished_triggers()
+
+    asyncio.run(run())
+    assert sorted(trigger_id for trigger_id, _ in runner.events) == [1, 2, 4]
+    assert not runner.failed_triggers
+    assert runner.triggers == {}
+    assert runner.unfired_groups == {}
+
+
+@pytest.mark.skipif(sys.version_info.minor <= 6 and sys.version_info.major <= 3, reason="No triggerer on 3.6")
+def test_shared_coroutine_cancelled_with_last_trigger():
+    """Checks that a shared coroutine keeps running until all its triggers are cancelled"""
+    runner = TriggerRunner()
+    moment = timezone.utcnow() + datetime.timedelta(days=7)
+
+    async def run():
+        runner.to_create.extend(
+            [
+                (1, DateTimeTrigger(moment)),
+                (2, DateTimeTrigger(moment)),
+            ]
+        )
+        await runner.create_triggers()
+        task = runner.triggers[1]["task"]
+
+        runner.to_cancel.append(1)
+        await runner.cancel_triggers()
+        await asyncio.sleep(0)
+        assert not task.cancelled()
+        assert list(runner.triggers) == [2]
+
+        runner.to_cancel.append(2)
+        await runner.cancel_triggers()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        await runner.cleanup_finished_triggers()
+
+    asyncio.run(run())
+    assert runner.triggers == {}
+    assert not runner.failed_triggers
+
+
+@pytest.mark.skipif(sys.version_info.minor <= 6 and sys.version_info.major <= 3, reason="No triggerer on 3.6")
+def test_deduplication_disabled():
+    runner = TriggerRunner(deduplicate=False)
+
+    async def run():
+        runner.to_create.extend([(1, SuccessTrigger()), (2, SuccessTrigger())])
+        await runner.create_triggers()
+        assert runner.coroutine_count == 2
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+    assert sorted(runner.events) == [(1, TriggerEvent(True)), (2, TriggerEvent(True))]
+
+
+@mock.patch('airflow.jobs.triggerer_job.Stats.gauge')
+def test_emit_metrics_per_shard(mock_gauge):
+    job = TriggererJob(shard=3)
+    job.runner.max_loop_lag = 0.5
+    job.emit_metrics()
+
+    mock_gauge.assert_has_calls(
+        [
+            mock.call('triggers.running', 0),
+            mock.call('triggers.running.3', 0),
+            mock.call('triggers.coroutines_running.3', 0),
+            mock.call('triggerer.loop_lag.3', 0.5),
+        ]
+    )
+    assert job.runner.max_loop_lag == 0.0
+
+
+@pytest.mark.skipif(sys.version_info.minor <= 6 and sys.version_info.major <= 3, reason="No triggerer on 3.6")
+def test_new_triggers_start_without_waiting_for_the_runner_loop(session):
+    """Checks that the runner is woken up to start new triggers, rather than on its next loop"""
+    job = TriggererJob()
+    job.runner.daemon = True
+    job.runner.start()
+    try:
+        for _ in range(30):
+            if job.runner.loop:
+                break
+            time.sleep(0.1)
+        # Let the runner go to sleep
+        time.sleep(0.2)
+        trigger_orm = Trigger.from_object(TimeDeltaTrigger(datetime.timedelta(days=7)))
+        trigger_orm.id = 1
+        session.add(trigger_orm)
+        session.commit()
+
+        job.load_triggers()
+        started = time.monotonic()
+        while not job.runner.triggers and time.monotonic() - started < 1:
+            time.sleep(0.01)
+        assert list(job.runner.triggers) == [1]
+        assert time.monotonic() - started < 0.5
+    finally:
+        job.runner.stop = True
+
+
+def test_notified_triggers_are_loaded_right_away():
+    job = TriggererJob()
+    job.runner.stop = False
+    with mock.patch.object(job, 'load_triggers') as mock_load_triggers, mock.patch.object(
+        Trigger, 'clean_unused'
+    ), mock.patch.object(job, 'heartbeat'):
+
+        def notify_then_stop(*args, **kwargs):
+            if mock_load_triggers.call_count == 1:
+                job.on_triggers_notified()
+            else:
+                loaded.append(time.monotonic())
+                job.runner.stop = True
+
+        loaded = []
+        mock_load_triggers.side_effect = notify_then_stop
+        job.poll_interval = 60
+        started = time.monotonic()
+        job._run_trigger_loop()
+
+    # Loaded on start, then on the notification without waiting for the poll interval
+    assert mock_load_triggers.call_count == 2
+    assert loaded[0] - started < 0.5
+
+
+@pytest.mark.parametrize(
+    "payloads, shard, notified_times",
+    [
+        pytest.param(['4'], 0, 2, id="for_this_shard"),
+        pytest.param(['5'], 0, 1, id="for_another_shard"),
+        pytest.param(['5', '6'], 0, 2, id="one_for_this_shard"),
+        pytest.param([''], 1, 2, id="for_every_shard"),
+    ],
+)
+def test_notification_listener(payloads, shard, notified_times):
+    notified = []
+    listener = TriggerNotificationListener(lambda: notified.append(True), shard=shard, shards=2)
+    dbapi_connection = mock.MagicMock(notifies=[])
+    cursor = dbapi_connection.cursor.return_value.__enter__.return_value
+    polls = iter([[], [mock.Mock(payload=payload) for payload in payloads]])
+
+    def poll():
+        dbapi_connection.notifies[:] = next(polls)
+        if dbapi_connection.notifies:
+            listener.stop = True
+
+    dbapi_connection.poll.side_effect = poll
+    connection = mock.MagicMock(connection=dbapi_connection)
+
+    with mock.patch('airflow.jobs.triggerer_job.settings.engine') as mock_engine, mock.patch(
+        'airflow.jobs.triggerer_job.select.select', return_value=([dbapi_connection], [], [])
+    ):
+        mock_engine.raw_connection.return_value = connection
+        listener.run()
+
+    connection.detach.assert_called_once()
+    assert dbapi_connection.autocommit is True
+    cursor.execute.assert_called_once_with(f"LISTEN {Trigger.NOTIFICATION_CHANNEL}")
+    # Once when it starts listening, once more if a notification is for this shard
+    assert len(notified) == notified_times
+    assert dbapi_connection.notifies == []
+    connection.close.assert_called_once()
+
+
+@pytest.mark.parametrize("driver, listens", [("psycopg2", True), ("pg8000", False)])
+def test_notification_listener_needs_psycopg2(driver, listens):
+    job = TriggererJob(shard=1, shards=3)
+    with mock.patch.object(Trigger, 'notifications_supported', return_value=True), mock.patch(
+        'airflow.jobs.triggerer_job.settings.engine'
+    ) as mock_engine, mock.patch('airflow.jobs.triggerer_job.TriggerNotificationListener') as mock_listener:
+        mock_engine.dialect.driver = driver
+        job._start_notification_listener()
+
+    if listens:
+        mock_listener.assert_called_once_with(job.on_triggers_notified, shard=1, shards=3)
+        mock_listener.return_value.start.assert_called_once()
+    else:
+        mock_listener.assert_not_called()
+        assert job.notification_listener is None
+
+
+@pytest.mark.backend("postgres")
+def test_notification_roundtrip(session):
+    """Checks that a trigger notification sent on commit reaches the listener"""
+    notified = []
+    listener = TriggerNotificationListener(lambda: notified.append(True))
+    listener.start()
+    try:
+        for _ in range(30):
+            if notified:
+                break
+            time.sleep(0.1)
+        Trigger.notify_created(1, session)
+        session.commit()
+        for _ in range(30):
+            if len(notified) == 2:
+                break
+            time.sleep(0.1)
+        assert len(notified) == 2
+    finally:
+        listener.stop = True
@@ -2396,3 +2396,24 @@ def test_get_next_data_interval(
     )
 
     assert dag.get_next_data_interval(dag_model) == expected_data_interval
+
+
+def test_get_min_date_before(dag_maker, session):
+    with dag_maker("test_get_min_date_before", start_date=DEFAULT_DATE, session=session) as dag:
+        DummyOperator(task_id="task")
+    for i in range(3):
+        dag_maker.create_dagrun(
+            run_id=f"run_{i}",
+            run_type=DagRunType.SCHEDULED,
+            execution_date=DEFAULT_DATE + timedelta(days=i),
+        )
+    dag_maker.create_dagrun(
+        run_id="manual", run_type=DagRunType.MANUAL, execution_date=DEFAULT_DATE + timedelta(hours=36)
+    )
+    base_date = DEFAULT_DATE + timedelta(days=2)
+
+    # Manual runs do not count
+    assert dag.get_min_date_before(base_date, 1, session=session) == DEFAULT_DATE + timedelta(days=1)
+    assert dag.get_min_date_before(base_date, 3, session=session) == timezone.utc_epoch()
+    task_instances = dag.get_task_instances_before(base_date, 1, session=session)
+    assert sorted(ti.run_id for ti in task_instances) == ["manual", "run_1", "run_2"]
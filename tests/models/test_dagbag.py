@@ -939,6 +939,32 @@ class TestDagBag:
         assert set(updated_ser_dag_1.tags) == {"example", "example2", "new_tag"}
         assert updated_ser_dag_1_update_time > ser_dag_1_update_time
 
+    @patch("airflow.models.dagbag.settings.MIN_SERIALIZED_DAG_UPDATE_INTERVAL", 5)
+    @patch("airflow.models.dagbag.settings.MIN_SERIALIZED_DAG_FETCH_INTERVAL", 5)
+    def test_get_structure_index_rebuilt_when_dag_hash_changes(self):
+        with freeze_time(tz.datetime(2020, 1, 5, 0, 0, 0)):
+            example_bash_op_dag = DagBag(include_examples=True).dags.get("example_bash_operator")
+            SerializedDagModel.write_dag(dag=example_bash_op_dag)
+
+            dag_bag = DagBag(read_dags_from_db=True)
+            assert dag_bag.get_structure_index("example_bash_operator") is None
+            dag_bag.get_dag("example_bash_operator")
+            index = dag_bag.get_structure_index("example_bash_operator")
+            assert index.dag_hash == dag_bag.dags_hash["example_bash_operator"]
+            assert dag_bag.get_structure_index("example_bash_operator") is index
+
+        with freeze_time(tz.datetime(2020, 1, 5, 0, 0, 6)):
+            example_bash_op_dag.tags += ["new_tag"]
+            SerializedDagModel.write_dag(dag=example_bash_op_dag)
+
+        with freeze_time(tz.datetime(2020, 1, 5, 0, 0, 8)):
+            dag_bag.get_dag("example_bash_operator")
+            updated_index = dag_bag.get_structure_index("example_bash_operator")
+
+        assert updated_index is not index
+        assert updated_index.dag_hash == dag_bag.dags_hash["example_bash_operator"]
+        assert updated_index.dag_hash != index.dag_hash
+
     def test_collect_dags_from_db(self):
         """DAGs are collected from Database"""
         db.clear_db_dags()
@@ -0,0 +1,118 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from datetime import timedelta
+
+import pytest
+
+from airflow.models.dagstats import DagStateStats
+from airflow.operators.dummy import DummyOperator
+from airflow.utils import timezone
+from airflow.utils.state import DagRunState, TaskInstanceState
+from tests.test_utils.db import clear_db_dags, clear_db_runs
+
+DEFAULT_DATE = timezone.datetime(2022, 1, 1)
+
+
+class TestDagStateStats:
+    @pytest.fixture(autouse=True)
+    def clean_db(self):
+        clear_db_runs()
+        clear_db_dags()
+        yield
+        clear_db_runs()
+        clear_db_dags()
+
+    @pytest.fixture
+    def dag_runs(self, dag_maker, session):
+        with dag_maker("test_dag_stats", start_date=DEFAULT_DATE, session=session):
+            DummyOperator(task_id="first")
+            DummyOperator(task_id="second")
+
+        failed = dag_maker.create_dagrun(
+            run_id="failed", state=DagRunState.FAILED, execution_date=DEFAULT_DATE
+        )
+        for ti in failed.task_instances:
+            ti.state = TaskInstanceState.FAILED
+        success = dag_maker.create_dagrun(
+            run_id="success", state=DagRunState.SUCCESS, execution_date=DEFAULT_DATE + timedelta(days=1)
+        )
+        success.get_task_instance("first", session=session).state = TaskInstanceState.SUCCESS
+        running = dag_maker.create_dagrun(
+            run_id="running", state=DagRunState.RUNNING, execution_date=DEFAULT_DATE + timedelta(days=2)
+        )
+        running.get_task_instance("first", session=session).state = TaskInstanceState.RUNNING
+        session.flush()
+        return failed, success, running
+
+    def test_compute(self, dag_runs, session):
+        _, _, running = dag_runs
+        stats = DagStateStats.compute(["test_dag_stats", "no_runs"], session)
+
+        assert stats["test_dag_stats"].dag_run_states == {"failed": 1, "success": 1, "running": 1}
+        assert stats["test_dag_stats"].running_task_states == {"running": 1, None: 1}
+        # The latest run not running
+        assert stats["test_dag_stats"].last_run_task_states == {"success": 1, None: 1}
+        assert stats["test_dag_stats"].last_dag_run["state"] == DagRunState.RUNNING
+        assert stats["test_dag_stats"].last_dag_run["execution_date"] == running.execution_date
+
+        assert stats["no_runs"].dag_run_states == {}
+        assert stats["no_runs"].running_task_states == {}
+        assert stats["no_runs"].last_run_task_states == {}
+        assert stats["no_runs"].last_dag_run is None
+
+    def test_refresh_stores_the_stats(self, dag_runs, session):
+        _, _, running = dag_runs
+        DagStateStats.refresh(["test_dag_stats"], session=session)
+        session.expunge_all()
+
+        stored = session.query(DagStateStats).one()
+        assert stored.dag_id == "test_dag_stats"
+        # The counts of the task instances without state survive the round-trip through JSON
+        assert stored.running_task_states == {"running": 1, None: 1}
+        assert stored.last_dag_run["execution_date"] == running.execution_date
+
+        # Until refreshed, the stored stats are returned
+        running.state = DagRunState.SUCCESS
+        session.merge(running)
+        session.flush()
+        assert DagStateStats.get(["test_dag_stats"], session=session)["test_dag_stats"].dag_run_states == {
+            "failed": 1,
+            "success": 1,
+            "running": 1,
+        }
+
+        DagStateStats.refresh(["test_dag_stats"], session=session)
+        assert DagStateStats.get(["test_dag_stats"], session=session)["test_dag_stats"].dag_run_states == {
+            "failed": 1,
+            "success": 2,
+        }
+        assert session.query(DagStateStats).count() == 1
+
+    def test_get_computes_missing_stats_without_storing_them(self, dag_runs, session):
+        stats = DagStateStats.get(["test_dag_stats"], session=session)
+
+        assert stats["test_dag_stats"].dag_run_states == {"failed": 1, "success": 1, "running": 1}
+        assert session.query(DagStateStats).count() == 0
+
+    def test_get_dag_ids_with_unfinished_runs(self, dag_runs, session):
+        assert DagStateStats.get_dag_ids_with_unfinished_runs(session=session) == {"test_dag_stats"}
+
+        _, _, running = dag_runs
+        running.state = DagRunState.SUCCESS
+        session.flush()
+        assert DagStateStats.get_dag_ids_with_unfinished_runs(session=session) == set()
@@ -0,0 +1,111 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowException
+from airflow.models import DAG
+from airflow.models.dagstructure import DagStructureIndex
+from airflow.operators.dummy import DummyOperator
+from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.utils.weight_rule import WeightRule
+from tests.models import DEFAULT_DATE
+
+
+def _make_dag(weight_rule=WeightRule.DOWNSTREAM):
+    with DAG('test_dag_structure', start_date=DEFAULT_DATE) as dag:
+        a = DummyOperator(task_id='a', priority_weight=3, weight_rule=weight_rule)
+        b = DummyOperator(task_id='b', weight_rule=weight_rule)
+        c = DummyOperator(task_id='c', priority_weight=5, weight_rule=weight_rule)
+        d = DummyOperator(task_id='d', weight_rule=weight_rule)
+        e = DummyOperator(task_id='e', priority_weight=2, weight_rule=weight_rule)
+        DummyOperator(task_id='f', weight_rule=WeightRule.ABSOLUTE)
+        a >> [b, c] >> d
+        d >> e
+        a >> e
+    return dag
+
+
+class TestDagStructureIndex:
+    @pytest.mark.parametrize("serialize", [False, True])
+    def test_relatives_match_dag(self, serialize):
+        dag = _make_dag()
+        if serialize:
+            dag = SerializedDAG.from_dict(SerializedDAG.to_dict(dag))
+        index = DagStructureIndex(dag, dag_hash="abc")
+
+        assert index.dag_hash == "abc"
+        assert len(index) == len(dag.tasks)
+        for task in dag.tasks:
+            assert set(index.upstream_task_ids(task.task_id)) == task.upstream_task_ids
+            assert set(index.downstream_task_ids(task.task_id)) == task.downstream_task_ids
+        assert index.roots == {t.task_id for t in dag.roots}
+        assert index.leaves == {t.task_id for t in dag.leaves}
+
+    def test_topological_order(self):
+        index = DagStructureIndex(_make_dag())
+        order = index.topological_order
+        assert sorted(order) == sorted(index.task_ids)
+        position = {task_id: i for i, task_id in enumerate(order)}
+        for task_id in order:
+            for upstream_task_id in index.upstream_task_ids(task_id):
+                assert position[upstream_task_id] < position[task_id]
+
+    @pytest.mark.parametrize("weight_rule", [WeightRule.DOWNSTREAM, WeightRule.UPSTREAM, WeightRule.ABSOLUTE])
+    def test_priority_weights_match_priority_weight_total(self, weight_rule):
+        dag = _make_dag(weight_rule)
+        index = DagStructureIndex(dag)
+        for task in dag.tasks:
+            assert index.priority_weight(task.task_id) == task.priority_weight_total
+
+    @pytest.mark.parametrize("weight_rule", [WeightRule.DOWNSTREAM, WeightRule.UPSTREAM, WeightRule.ABSOLUTE])
+    def test_priority_weights_stored_in_serialized_dag(self, weight_rule):
+        dag = _make_dag(weight_rule)
+        serialized = SerializedDAG.to_dict(dag)
+        assert serialized["dag"]["priority_weight_totals"] == {
+            task.task_id: task.priority_weight_total
+            for task in dag.tasks
+            if task.weight_rule != WeightRule.ABSOLUTE
+        }
+
+        deserialized = SerializedDAG.from_dict(serialized)
+        with mock.patch.object(DagStructureIndex, "_compute_priority_weights") as compute:
+            index = DagStructureIndex(deserialized)
+        compute.assert_not_called()
+        for task in dag.tasks:
+            assert index.priority_weight(task.task_id) == task.priority_weight_total
+            assert deserialized.get_task(task.task_id).priority_weight_total == task.priority_weight_total
+
+    def test_priority_weights_computed_when_not_stored(self):
+        dag = _make_dag()
+        deserialized = SerializedDAG.from_dict(SerializedDAG.to_dict(dag))
+        # A serialized DAG stored before the weights were, or changed since it was deserialized
+        deserialized.priority_weight_totals = {'a': 1}
+        index = DagStructureIndex(deserialized)
+        for task in dag.tasks:
+            assert index.priority_weight(task.task_id) == task.priority_weight_total
+
+    def test_cycle_raises(self):
+        with DAG('test_dag_structure_cycle', start_date=DEFAULT_DATE) as dag:
+            a = DummyOperator(task_id='a')
+            b = DummyOperator(task_id='b')
+            a >> b >> a
+        with pytest.raises(AirflowException, match="cyclic dependency"):
+            DagStructureIndex(dag)
@@ -48,23 +48,30 @@ def clear_db_serialized_dags():
     [
         {"compress_serialized_dags": "False"},
         {"compress_serialized_dags": "True"},
+        {"serialized_dag_format": "compact"},
     ]
 )
 class SerializedDagModelTest(unittest.TestCase):
     """Unit tests for SerializedDagModel."""
 
     compress_serialized_dags = "False"
+    serialized_dag_format = "json"
 
     def setUp(self):
         self.patcher = mock.patch(
             'airflow.models.serialized_dag.COMPRESS_SERIALIZED_DAGS', self.compress_serialized_dags
         )
         self.patcher.start()
+        self.format_patcher = mock.patch(
+            'airflow.models.serialized_dag.SERIALIZED_DAG_FORMAT', self.serialized_dag_format
+        )
+        self.format_patcher.start()
 
         clear_db_serialized_dags()
 
     def tearDown(self):
         self.patcher.stop()
+        self.format_patcher.stop()
         clear_db_serialized_dags()
 
     def test_dag_fileloc_hash(self):
@@ -1055,6 +1055,45 @@ class TestTaskInstance:
         result = ti1.xcom_pull(task_ids=['test_xcom_1', 'test_xcom_2'], key='foo')
         assert result == ['bar', 'baz']
 
+    def test_xcom_pull_many(self, create_task_instance):
+        """
+        Test xcom_pull_many fetches XComs in one query and keeps them for later pulls.
+        """
+        ti = create_task_instance(dag_id='test_xcom', task_id='test_xcom_1')
+        ti.xcom_push(key='foo', value='bar')
+        for task_id, key, value in [('test_xcom_2', 'foo', 'baz'), ('test_xcom_2', 'other', [1, 2])]:
+            XCom.set(key=key, value=value, task_id=task_id, dag_id=ti.dag_id, run_id=ti.run_id)
+
+        with assert_queries_count(1):
+            result = ti.xcom_pull_many(
+                [('test_xcom_1', 'foo'), ('test_xcom_2', 'foo'), ('test_xcom_2', 'other'), ('missing', 'foo')]
+            )
+        assert result == {
+            ('test_xcom_1', 'foo'): 'bar',
+            ('test_xcom_2', 'foo'): 'baz',
+            ('test_xcom_2', 'other'): [1, 2],
+        }
+
+        with assert_queries_count(0):
+            assert ti.xcom_pull_many([('test_xcom_2', 'other')]) == {('test_xcom_2', 'other'): [1, 2]}
+
+        # Pushing replaces the kept value
+        ti.xcom_push(key='foo', value='qux')
+        assert ti.xcom_pull_many([('test_xcom_1', 'foo')]) == {('test_xcom_1', 'foo'): 'qux'}
+
+    def test_xcom_pull_is_not_kept(self, create_task_instance):
+        """
+        Test xcom_pull reads the current value of XComs another task updates while this one runs.
+        """
+        ti = create_task_instance(dag_id='test_xcom', task_id='test_xcom_1')
+        XCom.set(key='foo', value='bar', task_id='test_xcom_2', dag_id=ti.dag_id, run_id=ti.run_id)
+        assert ti.xcom_pull_many([('test_xcom_2', 'foo')]) == {('test_xcom_2', 'foo'): 'bar'}
+        assert ti.xcom_pull(task_ids='test_xcom_2', key='foo') == 'bar'
+
+        XCom.set(key='foo', value='baz', task_id='test_xcom_2', dag_id=ti.dag_id, run_id=ti.run_id)
+        assert ti.xcom_pull(task_ids='test_xcom_2', key='foo') == 'baz'
+        assert ti.xcom_pull(task_ids=['test_xcom_2'], key='foo') == ['baz']
+
     def test_xcom_pull_after_success(self, create_task_instance):
         """
         tests xcom set/clear relative to a task in a 'success' rerun scenario
@@ -2113,6 +2152,7 @@ class TestTaskInstance:
             "trigger_id": None,
             "next_kwargs": None,
             "next_method": None,
+            "updated_at": run_date + datetime.timedelta(hours=2),
         }
         # Make sure we aren't missing any new value in our expected_values list.
         expected_keys = {f"task_instance.{key.lstrip('_')}" for key in expected_values}
@@ -2485,6 +2525,38 @@ class TestMappedTaskInstanceReceiveValue:
             (2, ("c", "z")),
         ]
 
+    def test_map_product_pulls_xcoms_once(self, dag_maker, session):
+        """Test the XComs a mapped task is expanded over are fetched in one query."""
+        with dag_maker(dag_id="product_pull", session=session) as dag:
+
+            @dag.task
+            def emit_numbers():
+                return [1, 2]
+
+            @dag.task
+            def emit_letters():
+                return ["a", "b"]
+
+            @dag.task
+            def show(number, letter):
+                pass
+
+            show.apply(number=emit_numbers(), letter=emit_letters())
+
+        dag_run = dag_maker.create_dagrun()
+        for task_id in ["emit_numbers", "emit_letters"]:
+            ti = dag_run.get_task_instance(task_id, session=session)
+            ti.refresh_from_task(dag.get_task(task_id))
+            ti.run()
+
+        show_task = dag.get_task("show")
+        mapped_tis = show_task.expand_mapped_task(dag_run.run_id, session=session)
+        for ti in mapped_tis:
+            ti.refresh_from_task(show_task)
+            with mock.patch.object(XCom, "get_many", side_effect=XCom.get_many) as get_many:
+                ti.run()
+            get_many.assert_called_once()
+
     def test_map_product_same(self, dag_maker, session):
         """Test a mapped task can refer to the same source multiple times."""
         outputs = []
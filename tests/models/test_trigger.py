@@ -16,6 +16,7 @@
 # under the License.
 
 import datetime
+from unittest import mock
 
 import pytest
 
@@ -26,6 +27,7 @@ from airflow.triggers.base import TriggerEvent
 from airflow.utils import timezone
 from airflow.utils.session import create_session
 from airflow.utils.state import State
+from tests.test_utils.config import conf_vars
 
 
 @pytest.fixture
@@ -107,6 +109,67 @@ def test_submit_event(session, create_task_instance):
     assert updated_task_instance.next_kwargs == {"event": 42, "cheesecake": True}
 
 
+def test_submit_events(session, create_task_instance):
+    """
+    Tests that events of several triggers wake all their dependent task instances,
+    each with the first event of its trigger.
+    """
+    triggers = [Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}) for _ in range(2)]
+    session.add_all(triggers)
+    session.commit()
+    for trigger in triggers:
+        task_instance = create_task_instance(
+            session=session,
+            dag_id=f"test_submit_events_{trigger.id}",
+            execution_date=timezone.utcnow(),
+            state=State.DEFERRED,
+        )
+        task_instance.trigger_id = trigger.id
+    session.commit()
+
+    Trigger.submit_events(
+        [
+            (triggers[0].id, TriggerEvent(1)),
+            (triggers[1].id, TriggerEvent(2)),
+            (triggers[0].id, TriggerEvent(3)),
+        ],
+        session=session,
+    )
+
+    payloads = {ti.dag_id: (ti.state, ti.next_kwargs) for ti in session.query(TaskInstance)}
+    assert payloads == {
+        f"test_submit_events_{triggers[0].id}": (State.SCHEDULED, {"event": 1}),
+        f"test_submit_events_{triggers[1].id}": (State.SCHEDULED, {"event": 2}),
+    }
+
+
+def test_notify_created():
+    """Tests that the creation of triggers is only notified on PostgreSQL"""
+    session = mock.MagicMock()
+    session.get_bind.return_value.dialect.name = "sqlite"
+    Trigger.notify_created(42, session)
+    session.execute.assert_not_called()
+
+    session.get_bind.return_value.dialect.name = "postgresql"
+    Trigger.notify_created(42, session)
+    session.execute.assert_called_once_with(
+        mock.ANY, {"channel": Trigger.NOTIFICATION_CHANNEL, "payload": "42"}
+    )
+
+    session.reset_mock()
+    with conf_vars({("triggerer", "trigger_notifications"): "False"}):
+        Trigger.notify_created(42, session)
+    session.execute.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "payload, shard, expected",
+    [("6", 0, True), ("6", 1, False), ("7", 1, True), ("", 1, True)],
+)
+def test_is_for_shard(payload, shard, expected):
+    assert Trigger.is_for_shard(payload, shard, 2) is expected
+
+
 def test_submit_failure(session, create_task_instance):
     """
     Tests that failures submitted to a trigger fail their dependent
@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import datetime
+import io
 import operator
 import os
 from unittest import mock
@@ -25,7 +26,17 @@ import pytest
 from airflow.configuration import conf
 from airflow.models.dagrun import DagRun, DagRunType
 from airflow.models.taskinstance import TaskInstanceKey
-from airflow.models.xcom import IN_MEMORY_RUN_ID, XCOM_RETURN_KEY, BaseXCom, XCom, resolve_xcom_backend
+from airflow.models.xcom import (
+    IN_MEMORY_RUN_ID,
+    XCOM_RETURN_KEY,
+    BaseXCom,
+    ChunkedXCom,
+    XCom,
+    XComChunk,
+    XComChunkReader,
+    _new_chunk_session,
+    resolve_xcom_backend,
+)
 from airflow.settings import json
 from airflow.utils import timezone
 from airflow.utils.session import create_session
@@ -42,6 +53,7 @@ def reset_db():
     with create_session() as session:
         session.query(DagRun).delete()
         session.query(XCom).delete()
+        session.query(XComChunk).delete()
 
 
 @pytest.fixture()
@@ -209,6 +221,36 @@ class TestXCom:
         XCom.set(**kwargs)
         serialize_watcher.assert_called_once_with(value=kwargs['value'])
 
+    @mock.patch('airflow.models.xcom.conf.getimport')
+    def test_get_one_deserialize_call_old_signature(self, get_import, dag_run, session):
+        """
+        When XCom.deserialize_value takes only param ``result``, the session should not be passed.
+        """
+        deserialize_watcher = MagicMock()
+
+        class OldSignatureXCom(BaseXCom):
+            @staticmethod
+            def deserialize_value(result):
+                deserialize_watcher(result)
+                return BaseXCom.deserialize_value(result)
+
+        get_import.return_value = OldSignatureXCom
+
+        XCom = resolve_xcom_backend()
+        XCom.set(
+            key=XCOM_RETURN_KEY,
+            value={"key": "value"},
+            dag_id=dag_run.dag_id,
+            task_id="test_task",
+            run_id=dag_run.run_id,
+            session=session,
+        )
+        value = XCom.get_one(
+            dag_id=dag_run.dag_id, task_id="test_task", run_id=dag_run.run_id, session=session
+        )
+        assert value == {"key": "value"}
+        deserialize_watcher.assert_called_once()
+
     @conf_vars({("core", "enable_xcom_pickling"): 'False'})
     @mock.patch('airflow.models.xcom.conf.getimport')
     def test_set_serialize_call_current_signature(self, get_import, session):
@@ -571,3 +613,118 @@ class TestXComClear:
                 session=session,
             )
         assert session.query(XCom).count() == 1
+
+
+class TestXComChunks:
+    @conf_vars({("core", "xcom_chunk_threshold"): "100", ("core", "xcom_chunk_size"): "64"})
+    def test_large_value_is_chunked(self, session, dag_run):
+        value = {"numbers": list(range(100))}
+        XCom.set(key="xcom_1", value=value, dag_id=dag_run.dag_id, task_id="task_1", run_id=dag_run.run_id)
+
+        stored_length = len(json.dumps(value))
+        num_chunks = -(-stored_length // 64)
+        assert session.query(XComChunk).count() == num_chunks
+        assert XCom.get_one(key="xcom_1", task_id="task_1", run_id=dag_run.run_id) == value
+        expected = f"<ChunkedXCom: {stored_length} bytes in {num_chunks} chunks>"
+        assert session.query(XCom).one().value == expected
+
+    @conf_vars({("core", "xcom_chunk_threshold"): "100"})
+    def test_small_value_is_not_chunked(self, session, dag_run):
+        XCom.set(key="xcom_1", value=[1, 2], dag_id=dag_run.dag_id, task_id="task_1", run_id=dag_run.run_id)
+
+        assert session.query(XComChunk).count() == 0
+        assert session.query(XCom).one().value == [1, 2]
+
+    @conf_vars({("core", "xcom_chunk_size"): "10"})
+    def test_file_object_is_streamed(self, session, dag_run):
+        data = bytes(range(256)) * 3
+        XCom.set(
+            key="xcom_1",
+            value=io.BytesIO(data),
+            dag_id=dag_run.dag_id,
+            task_id="task_1",
+            run_id=dag_run.run_id,
+        )
+        assert session.query(XComChunk).count() == 77
+
+        reader = XCom.get_one(key="xcom_1", task_id="task_1", run_id=dag_run.run_id)
+        assert isinstance(reader, XComChunkReader)
+        assert reader.read(5) == data[:5]
+        assert reader.read() == data[5:]
+        assert reader.read() == b""
+
+    @conf_vars({("core", "xcom_chunk_threshold"): "10"})
+    def test_replace_and_clear_remove_chunks(self, session, dag_run):
+        for value in ["x" * 1000, "short"]:
+            XCom.set(
+                key="xcom_1", value=value, dag_id=dag_run.dag_id, task_id="task_1", run_id=dag_run.run_id
+            )
+            assert session.query(XComChunk).count() == (1 if len(value) > 10 else 0)
+
+        XCom.set(
+            key="xcom_1", value="x" * 1000, dag_id=dag_run.dag_id, task_id="task_1", run_id=dag_run.run_id
+        )
+        XCom.clear(dag_id=dag_run.dag_id, task_id="task_1", run_id=dag_run.run_id)
+        assert session.query(XComChunk).count() == 0
+
+    @conf_vars({("core", "xcom_chunk_threshold"): "10"})
+    def test_delete_removes_chunks(self, session, dag_run):
+        XCom.set(
+            key="xcom_1", value="x" * 1000, dag_id=dag_run.dag_id, task_id="task_1", run_id=dag_run.run_id
+        )
+        assert session.query(XComChunk).count() == 1
+
+        XCom.delete(session.query(XCom).all(), session=session)
+        assert session.query(XComChunk).count() == 0
+
+    @conf_vars({("core", "xcom_chunk_threshold"): "100", ("core", "xcom_chunk_size"): "64"})
+    def test_chunks_are_read_with_the_session_of_the_caller(self, session, dag_run):
+        value = {"numbers": list(range(100))}
+        XCom.set(
+            key="xcom_1",
+            value=value,
+            dag_id=dag_run.dag_id,
+            task_id="task_1",
+            run_id=dag_run.run_id,
+            session=session,
+        )
+
+        # The chunks are not committed yet
+        with mock.patch("airflow.models.xcom._new_chunk_session") as new_session:
+            assert (
+                XCom.get_one(key="xcom_1", task_id="task_1", run_id=dag_run.run_id, session=session) == value
+            )
+        new_session.assert_not_called()
+
+    @conf_vars({("core", "xcom_chunk_size"): "10"})
+    def test_file_object_is_read_without_keeping_a_session(self, session, dag_run):
+        data = bytes(range(100))
+        XCom.set(
+            key="xcom_1",
+            value=io.BytesIO(data),
+            dag_id=dag_run.dag_id,
+            task_id="task_1",
+            run_id=dag_run.run_id,
+        )
+        chunked = ChunkedXCom.from_bytes(session.query(XCom.value).scalar())
+
+        # A reader without a session closes the one of every chunk once it is read
+        chunk_sessions = []
+
+        def new_chunk_session():
+            chunk_session = _new_chunk_session()
+            chunk_sessions.append(mock.MagicMock(wraps=chunk_session))
+            chunk_sessions[-1].__enter__.return_value = chunk_sessions[-1]
+            chunk_sessions[-1].__exit__.side_effect = lambda *exc_info: chunk_session.close()
+            return chunk_sessions[-1]
+
+        with mock.patch("airflow.models.xcom._new_chunk_session", side_effect=new_chunk_session):
+            assert XComChunkReader(chunked).read() == data
+        assert len(chunk_sessions) == 10
+        for chunk_session in chunk_sessions:
+            chunk_session.__exit__.assert_called_once()
+
+        # A reader given a session reads with it, and leaves it open
+        with XComChunkReader(chunked, session=session) as reader:
+            assert reader.read() == data
+        assert session.is_active
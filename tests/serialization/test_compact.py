@@ -0,0 +1,113 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Unit tests for the compact serialized DAG format."""
+import copy
+import json
+import pickle
+import struct
+from datetime import datetime
+
+import pytest
+
+from airflow.models import DAG
+from airflow.operators.dummy import DummyOperator
+from airflow.serialization import compact
+from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.utils.task_group import TaskGroup
+from tests.serialization.test_dag_serialization import collect_dags
+
+
+def make_task_group_dag():
+    with DAG("compact_task_group", start_date=datetime(2020, 1, 1)) as dag:
+        task1 = DummyOperator(task_id="task1")
+        with TaskGroup("group234") as group234:
+            DummyOperator(task_id="task2")
+            with TaskGroup("group34") as group34:
+                DummyOperator(task_id="task3")
+                DummyOperator(task_id="task4")
+        task5 = DummyOperator(task_id="task5")
+        task1 >> group234
+        group34 >> task5
+    return dag
+
+
+def json_roundtrip(serialized_dag):
+    # What is stored in and read back from the serialized_dag table
+    return json.loads(json.dumps(serialized_dag))
+
+
+class TestCompactFormat:
+    @pytest.mark.parametrize(
+        "dag",
+        collect_dags(["airflow/example_dags"]).values(),
+        ids=lambda dag: dag.dag_id,
+    )
+    def test_roundtrip(self, dag):
+        serialized_dag = json_roundtrip(SerializedDAG.to_dict(dag))
+        encoded = compact.encode(serialized_dag)
+
+        assert compact.is_compact(encoded)
+        assert compact.CompactDagReader(encoded).to_dict() == serialized_dag
+
+        lazy_dag = SerializedDAG.from_compact(encoded)
+        eager_dag = SerializedDAG.from_dict(serialized_dag)
+        assert SerializedDAG.to_dict(lazy_dag) == SerializedDAG.to_dict(eager_dag)
+
+    def test_tasks_are_loaded_on_access(self):
+        dag = make_task_group_dag()
+        lazy_dag = SerializedDAG.from_compact(compact.encode(SerializedDAG.to_dict(dag)))
+
+        assert isinstance(lazy_dag.task_dict, compact.LazyTaskDict)
+        assert list(lazy_dag.task_dict) == list(dag.task_dict)
+        assert "group234.group34.task3" in lazy_dag.task_dict
+        assert lazy_dag.task_dict.num_loaded == 0
+
+        task3 = lazy_dag.get_task("group234.group34.task3")
+        assert lazy_dag.task_dict.num_loaded == 1
+        assert task3.dag is lazy_dag
+        assert task3.start_date == dag.start_date
+        assert task3.upstream_task_ids == {"task1"}
+        assert task3.downstream_task_ids == {"task5"}
+        assert task3.task_group.group_id == "group234.group34"
+
+        assert lazy_dag.task_group.get_child_by_label("task1").task_id == "task1"
+        assert len(lazy_dag.tasks) == len(dag.tasks)
+        assert lazy_dag.task_dict.num_loaded == len(dag.tasks)
+
+    def test_copy_gives_plain_dict(self):
+        dag = make_task_group_dag()
+        lazy_dag = SerializedDAG.from_compact(compact.encode(SerializedDAG.to_dict(dag)))
+
+        for copied in (copy.deepcopy(lazy_dag.task_dict), pickle.loads(pickle.dumps(lazy_dag.task_dict))):
+            assert type(copied) is dict
+            assert list(copied) == list(dag.task_dict)
+
+    def test_unknown_format_version(self):
+        encoded = compact.encode(SerializedDAG.to_dict(make_task_group_dag()))
+        offset = len(compact.MAGIC)
+        _, header_length = struct.unpack_from(">HI", encoded, offset)
+        encoded = encoded[:offset] + struct.pack(">HI", 999, header_length) + encoded[offset + 6 :]
+
+        with pytest.raises(ValueError, match="compact format version 999"):
+            SerializedDAG.from_compact(encoded)
+
+    def test_not_compact(self):
+        assert not compact.is_compact(None)
+        assert not compact.is_compact(b"x\x9c")
+        with pytest.raises(ValueError):
+            compact.CompactDagReader(b"{}")
@@ -161,6 +161,7 @@ serialized_simple_dag_ground_truth = {
             },
         },
         "edge_info": {},
+        "priority_weight_totals": {"bash_task": 1, "custom_task": 1},
         "dag_dependencies": [],
         "params": {},
     },
@@ -1040,6 +1041,7 @@ class TestStringifiedDAGs:
             "has_on_failure_callback",
             "dag_dependencies",
             "params",
+            "priority_weight_totals",
         }
 
         keys_for_backwards_compat: set = {
@@ -21,6 +21,7 @@ from airflow.models import (
     Connection,
     DagModel,
     DagRun,
+    DagStateStats,
     DagTag,
     Log,
     Pool,
@@ -48,6 +49,7 @@ def clear_db_runs():
         session.query(Trigger).delete()
         session.query(DagRun).delete()
         session.query(TaskInstance).delete()
+        session.query(DagStateStats).delete()
 
 
 def clear_db_dags():
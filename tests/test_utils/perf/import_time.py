@@ -0,0 +1,75 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measures how long ``python -c "import airflow"`` and some common CLI commands take, with the ORM
+configured when importing airflow and with ``[core] lazy_configure_orm``.
+
+Every command is run several times in a new interpreter and the median wall time is printed. When a
+budget in seconds is given, the script fails if the median time of ``import airflow`` with the lazy
+configuration of the ORM exceeds it, so it can be used to catch regressions.
+
+To Run:
+    $ python tests/test_utils/perf/import_time.py [repeat] [budget]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+from airflow.cli.commands.info_command import profile_import_times
+
+COMMANDS = {
+    "import airflow": [sys.executable, "-c", "import airflow"],
+    "airflow version": [sys.executable, "-m", "airflow", "version"],
+    "airflow config get-value": [sys.executable, "-m", "airflow", "config", "get-value", "core", "executor"],
+    "airflow tasks run --help": [sys.executable, "-m", "airflow", "tasks", "run", "--help"],
+}
+
+
+def median_time(command: List[str], env: dict, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.monotonic()
+        subprocess.run(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        times.append(time.monotonic() - start)
+    return statistics.median(times)
+
+
+def main(repeat: int = 5, budget: Optional[float] = None):
+    results = {}
+    for lazy in ("False", "True"):
+        env = {**os.environ, "AIRFLOW__CORE__LAZY_CONFIGURE_ORM": lazy}
+        print(f"lazy_configure_orm = {lazy}")
+        for label, command in COMMANDS.items():
+            results[label, lazy] = median_time(command, env, repeat)
+            print(f"  {label:<30} {results[label, lazy]:.3f}s")
+
+    os.environ["AIRFLOW__CORE__LAZY_CONFIGURE_ORM"] = "True"
+    _, package_times = profile_import_times()
+    print("Slowest packages to import with lazy_configure_orm = True:")
+    for package, seconds in package_times[:10]:
+        print(f"  {package:<30} {seconds:.3f}s")
+
+    if budget is not None and results["import airflow", "True"] > budget:
+        sys.exit(f"import airflow took {results['import airflow', 'True']:.3f}s, over the {budget}s budget")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]), *(float(arg) for arg in sys.argv[2:3]))
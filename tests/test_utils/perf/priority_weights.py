@@ -0,0 +1,80 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compares computing ``priority_weight_total`` of every task by walking the relatives of each task
+with computing all of them in one pass when the DAG is serialized, and with reading them from a
+deserialized DAG, for a chain of tasks and for a fan-out/fan-in DAG, with each weight rule.
+
+No database is needed. Walking the relatives of every task of a chain is quadratic, so it is only
+timed for DAGs of up to ``walk_limit`` tasks.
+
+To Run:
+    $ python tests/test_utils/perf/priority_weights.py [num_tasks] [walk_limit]
+"""
+import sys
+from datetime import datetime
+
+from airflow.models import DAG
+from airflow.operators.dummy import DummyOperator
+from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.utils.weight_rule import WeightRule
+from tests.test_utils.perf.perf_kit.repeat_and_time import timing
+
+
+def build_dag(shape: str, num_tasks: int, weight_rule: str) -> DAG:
+    """Build a chain of ``num_tasks`` tasks, or a task fanning out to tasks that fan in to a last one."""
+    with DAG(f"perf_priority_weights_{shape}", start_date=datetime(2022, 1, 1)) as dag:
+        tasks = [DummyOperator(task_id=f"task_{i}", weight_rule=weight_rule) for i in range(num_tasks)]
+    if shape == "chain":
+        for upstream, downstream in zip(tasks, tasks[1:]):
+            upstream >> downstream
+    else:
+        tasks[0] >> tasks[1:-1] >> tasks[-1]
+    return dag
+
+
+def main(num_tasks: int = 10000, walk_limit: int = 3000):
+    # Walking the relatives of a task is recursive
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 2 * num_tasks + 1000))
+
+    for shape in ("chain", "fan"):
+        for weight_rule in (WeightRule.DOWNSTREAM, WeightRule.UPSTREAM):
+            dag = build_dag(shape, num_tasks, weight_rule)
+            print(f"{shape} of {num_tasks} tasks, {weight_rule} weight rule")
+
+            walked = None
+            if num_tasks <= walk_limit:
+                print("  Walking the relatives of every task:")
+                with timing():
+                    walked = {task.task_id: task.priority_weight_total for task in dag.tasks}
+
+            print("  Computing all the weights when serializing:")
+            with timing():
+                stored = SerializedDAG._serialize_priority_weight_totals(dag)
+
+            deserialized = SerializedDAG.from_dict(SerializedDAG.to_dict(dag))
+            print("  Reading the weights from the deserialized DAG:")
+            with timing():
+                read = {task.task_id: task.priority_weight_total for task in deserialized.tasks}
+
+            assert stored == read, "The weights read must be the ones stored"
+            assert walked is None or walked == stored, "All the paths must give identical weights"
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,91 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compares the secrets masker engines, on a task that masks the passwords of ``num_secrets``
+connections one at a time and then logs ``num_records`` records.
+
+For each engine the time taken to add the secrets and to filter the records is printed. A few
+records contain a secret, the others only contain the usual log vocabulary, with some numbers and
+some upper case words.
+
+No database is needed -- the secrets masker is used on its own.
+
+To Run:
+    $ python tests/test_utils/perf/secrets_masker.py [num_secrets] [num_records]
+"""
+import logging
+import random
+import string
+import sys
+
+from airflow.utils.log.secrets_masker import MASKING_ENGINES, SecretsMasker
+from tests.test_utils.perf.perf_kit.repeat_and_time import timing
+
+WORDS = (
+    "Running task on host worker-3 for dag example_dag with try number and state success INFO "
+    "connection refused retrying in seconds Executing command output Marking as SUCCESS"
+).split()
+
+
+def build_secrets(num_secrets: int):
+    rand = random.Random(0)
+    alphabet = string.ascii_letters + string.digits
+    return ["".join(rand.choices(alphabet, k=rand.randint(12, 40))) for _ in range(num_secrets)]
+
+
+def build_records(num_records: int, secrets):
+    rand = random.Random(1)
+    records = []
+    for i in range(num_records):
+        message = " ".join(rand.choices(WORDS, k=rand.randint(5, 30)))
+        args = (rand.randint(0, 10000),)
+        if i % 100 == 0:
+            message += " using %s"
+            args = (f"user:{rand.choice(secrets)}@host",)
+        else:
+            message += " %d"
+        records.append(logging.LogRecord("airflow.task", logging.INFO, __file__, 1, message, args, None))
+    return records
+
+
+def main(num_secrets: int = 500, num_records: int = 50000):
+    secrets = build_secrets(num_secrets)
+    print(f"{num_secrets} secrets, {num_records} log records")
+
+    outputs = {}
+    for engine in MASKING_ENGINES:
+        records = build_records(num_records, secrets)
+        masker = SecretsMasker(engine=engine)
+        print(f"{engine}, adding the secrets:")
+        with timing():
+            for secret in secrets:
+                masker.add_mask(secret)
+                # A task logs as it goes, between the connections it fetches
+                masker.redact("Using connection to host")
+        print(f"{engine}, filtering the records:")
+        with timing():
+            for record in records:
+                masker.filter(record)
+        outputs[engine] = [record.getMessage() for record in records]
+
+    first, *others = outputs.values()
+    assert all(output == first for output in others), "All engines must mask the same way"
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
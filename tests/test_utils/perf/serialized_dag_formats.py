@@ -0,0 +1,89 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compares loading a serialized DAG stored as (compressed) JSON with loading it from the compact
+format, either accessing a single task or all of them.
+
+For each case the size of the stored data, the load time and the memory allocated while loading
+(the peak traced by ``tracemalloc``, a proxy for the RSS growth) are printed.
+
+No database is needed -- the DAG is serialized in memory.
+
+To Run:
+    $ python tests/test_utils/perf/serialized_dag_formats.py [num_tasks]
+"""
+import gc
+import sys
+import tracemalloc
+import zlib
+from datetime import datetime
+
+from airflow.models import DAG
+from airflow.operators.bash import BashOperator
+from airflow.serialization import compact
+from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.settings import json
+from tests.test_utils.perf.perf_kit.repeat_and_time import timing
+
+
+def build_dag(num_tasks: int) -> DAG:
+    """DAG of ``num_tasks`` BashOperators, each depending on the previous one."""
+    with DAG("perf_serialized_dag_formats", start_date=datetime(2022, 1, 1)) as dag:
+        previous = None
+        for i in range(num_tasks):
+            task = BashOperator(task_id=f"task_{i}", bash_command=f"echo {i}", retries=i % 3)
+            if previous:
+                previous >> task
+            previous = task
+    return dag
+
+
+def measure(label: str, stored: bytes, load):
+    gc.collect()
+    print(f"{label} ({len(stored) / 1024:.0f} KiB stored):")
+    tracemalloc.start()
+    with timing():
+        dag = load(stored)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {peak / 1024 / 1024:.1f} MiB allocated while loading")
+    return dag
+
+
+def main(num_tasks: int = 5000):
+    serialized_dag = SerializedDAG.to_dict(build_dag(num_tasks))
+    as_json = zlib.compress(json.dumps(serialized_dag, sort_keys=True).encode("utf-8"))
+    as_compact = compact.encode(serialized_dag)
+    some_task_id = f"task_{num_tasks // 2}"
+    print(f"DAG with {num_tasks} tasks")
+
+    measure(
+        "Compressed JSON, all tasks",
+        as_json,
+        lambda stored: SerializedDAG.from_dict(json.loads(zlib.decompress(stored))),
+    )
+    measure(
+        "Compact, one task",
+        as_compact,
+        lambda stored: SerializedDAG.from_compact(stored).get_task(some_task_id),
+    )
+    measure("Compact, all tasks", as_compact, lambda stored: SerializedDAG.from_compact(stored).tasks)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,84 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compares counting upstream states per task instance by scanning all finished task instances
+(``TriggerRuleDep._get_states_count_upstream_ti``) with counting from the per-task_id index
+built once per DagRun (``DepContext.ensure_finished_ti_states``).
+
+No database is needed -- the task instances are built in memory.
+
+To Run:
+    $ python tests/test_utils/perf/trigger_rule_evaluation.py [num_tasks] [fan_in]
+"""
+import sys
+from datetime import datetime
+
+from airflow.models import DAG
+from airflow.models.taskinstance import TaskInstance
+from airflow.operators.dummy import DummyOperator
+from airflow.ti_deps.dep_context import DepContext
+from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep
+from airflow.utils.state import State
+from tests.test_utils.perf.perf_kit.repeat_and_time import timing
+
+
+def build_tis(num_tasks: int, fan_in: int):
+    """
+    Build a DAG of ``num_tasks`` tasks where each task depends on the previous ``fan_in`` tasks,
+    with the first half of the task instances finished and the second half still to be scheduled.
+    """
+    with DAG("perf_trigger_rule_evaluation", start_date=datetime(2022, 1, 1)) as dag:
+        tasks = [DummyOperator(task_id=f"task_{i}") for i in range(num_tasks)]
+    for i, task in enumerate(tasks):
+        for upstream in tasks[max(0, i - fan_in) : i]:
+            upstream >> task
+
+    tis = []
+    for i, task in enumerate(dag.tasks):
+        ti = TaskInstance(task, run_id="perf")
+        ti.state = State.SUCCESS if i < num_tasks // 2 else State.SCHEDULED
+        tis.append(ti)
+    finished_tis = [ti for ti in tis if ti.state in State.finished]
+    schedulable_tis = [ti for ti in tis if ti.state not in State.finished]
+    return finished_tis, schedulable_tis
+
+
+def main(num_tasks: int = 3000, fan_in: int = 50):
+    finished_tis, schedulable_tis = build_tis(num_tasks, fan_in)
+    print(f"{num_tasks} tasks with a fan-in of {fan_in}, {len(schedulable_tis)} to schedule")
+
+    print("Scanning finished task instances for each task instance:")
+    with timing():
+        per_ti = [
+            TriggerRuleDep._get_states_count_upstream_ti(ti=ti, finished_tis=finished_tis)
+            for ti in schedulable_tis
+        ]
+
+    print("Counting from the per-DagRun index:")
+    with timing():
+        finished_ti_states = DepContext(finished_tis=finished_tis).ensure_finished_ti_states(None, None)
+        indexed = [
+            TriggerRuleDep._count_upstream_ti_states(ti=ti, finished_ti_states=finished_ti_states)
+            for ti in schedulable_tis
+        ]
+
+    assert per_ti == indexed, "Both evaluation paths must give identical results"
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
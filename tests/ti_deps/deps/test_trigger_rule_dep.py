@@ -667,5 +667,13 @@ class TestTriggerRuleDep:
         assert get_states_count_upstream_ti(finished_tis=finished_tis, ti=ti_op4) == (1, 0, 1, 0, 2)
         assert get_states_count_upstream_ti(finished_tis=finished_tis, ti=ti_op5) == (2, 0, 1, 0, 3)
 
+        # counting from the per-task_id index must give the same results
+        count_upstream_ti_states = TriggerRuleDep._count_upstream_ti_states
+        finished_ti_states = DepContext(finished_tis=finished_tis).ensure_finished_ti_states(dr, session)
+        for ti in (ti_op1, ti_op2, ti_op3, ti_op4, ti_op5):
+            assert count_upstream_ti_states(
+                finished_ti_states=finished_ti_states, ti=ti
+            ) == get_states_count_upstream_ti(finished_tis=finished_tis, ti=ti)
+
         dr.update_state()
         assert State.SUCCESS == dr.state
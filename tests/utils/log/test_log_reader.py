@@ -162,7 +162,6 @@ class TestLogView:
             "localhost\n*** Reading local file: "
             f"{self.log_dir}/dag_log_reader/task_log_reader/2017-09-01T00.00.00+00.00/1.log\n"
             "try_number=1.\n"
-            "\n"
         ] == list(stream)
 
     def test_test_test_read_log_stream_should_read_all_logs(self):
@@ -171,16 +170,13 @@ class TestLogView:
         assert [
             "localhost\n*** Reading local file: "
             f"{self.log_dir}/dag_log_reader/task_log_reader/2017-09-01T00.00.00+00.00/1.log\n"
-            "try_number=1.\n"
-            "\n",
+            "try_number=1.\n",
             "localhost\n*** Reading local file: "
             f"{self.log_dir}/dag_log_reader/task_log_reader/2017-09-01T00.00.00+00.00/2.log\n"
-            "try_number=2.\n"
-            "\n",
+            "try_number=2.\n",
             "localhost\n*** Reading local file: "
             f"{self.log_dir}/dag_log_reader/task_log_reader/2017-09-01T00.00.00+00.00/3.log\n"
-            "try_number=3.\n"
-            "\n",
+            "try_number=3.\n",
         ] == list(stream)
 
     @mock.patch("airflow.utils.log.file_task_handler.FileTaskHandler.read")
@@ -193,17 +189,29 @@ class TestLogView:
 
         task_log_reader = TaskLogReader()
         log_stream = task_log_reader.read_log_stream(ti=self.ti, try_number=1, metadata={})
-        assert ["\n1st line\n", "\n2nd line\n", "\n3rd line\n"] == list(log_stream)
+        # The host is only written before the first chunk
+        assert ["\n1st line\n", "2nd line\n", "3rd line\n"] == list(log_stream)
 
         mock_read.assert_has_calls(
             [
-                mock.call(self.ti, 1, metadata={}),
+                mock.call(self.ti, 1, metadata={"download_logs": True, "log_pos": 0}),
                 mock.call(self.ti, 1, metadata={}),
                 mock.call(self.ti, 1, metadata={"end_of_log": False}),
             ],
             any_order=False,
         )
 
+    @mock.patch("airflow.utils.log.file_task_handler.FileTaskHandler.read")
+    def test_read_log_stream_should_not_split_lines_longer_than_a_chunk(self, mock_read):
+        mock_read.side_effect = [
+            ([[('', "a line longer")]], [{"end_of_log": False, "end_of_file": False}]),
+            ([[('', " than a chunk\nlast line")]], [{"end_of_log": True, "end_of_file": True}]),
+        ]
+
+        task_log_reader = TaskLogReader()
+        log_stream = task_log_reader.read_log_stream(ti=self.ti, try_number=1, metadata={})
+        assert "\na line longer than a chunk\nlast line\n" == "".join(log_stream)
+
     @mock.patch("airflow.utils.log.file_task_handler.FileTaskHandler.read")
     def test_read_log_stream_should_read_each_try_in_turn(self, mock_read):
         first_return = ([[('', "try_number=1.")]], [{"end_of_log": True}])
@@ -218,9 +226,9 @@ class TestLogView:
 
         mock_read.assert_has_calls(
             [
-                mock.call(self.ti, 1, metadata={}),
-                mock.call(self.ti, 2, metadata={}),
-                mock.call(self.ti, 3, metadata={}),
+                mock.call(self.ti, 1, metadata={"download_logs": True, "log_pos": 0}),
+                mock.call(self.ti, 2, metadata={"log_pos": 0}),
+                mock.call(self.ti, 3, metadata={"log_pos": 0}),
             ],
             any_order=False,
         )
@@ -18,11 +18,19 @@ import inspect
 import logging
 import logging.config
 import os
+import random
 import textwrap
 
 import pytest
 
-from airflow.utils.log.secrets_masker import SecretsMasker, should_hide_value_for_key
+from airflow.exceptions import AirflowConfigException
+from airflow.utils.log.secrets_masker import (
+    MASKING_ENGINES,
+    AhoCorasickMaskingEngine,
+    RegexMaskingEngine,
+    SecretsMasker,
+    should_hide_value_for_key,
+)
 from tests.test_utils.config import conf_vars
 
 p = "password"
@@ -327,6 +335,74 @@ class TestShouldHideValueForKey:
         get_sensitive_variables_fields.cache_clear()
 
 
+class TestMaskingEngines:
+    @pytest.mark.parametrize("engine_class", MASKING_ENGINES.values())
+    @pytest.mark.parametrize(
+        ("secrets", "text", "expected"),
+        [
+            ([], "nothing to mask", "nothing to mask"),
+            (["secret"], "a secret, another secret", "a ***, another ***"),
+            # The leftmost secret wins, then the longest
+            (["abc", "abcdef", "cdefgh"], "abcdefgh", "***gh"),
+            (["bcd", "abcdef"], "xabcdefx", "x***x"),
+            (["bcd", "abc"], "abcd", "***d"),
+            (["aa"], "aaaaa", "******a"),
+            (["ab", "b"], "abb", "******"),
+            # Secrets are matched literally
+            (["p@ss.w*rd\\"], "login p@ss.w*rd\\ pass.word", "login *** pass.word"),
+            (["pässwörd"], "pässwörd", "***"),
+            (["longer secret"], "short", "short"),
+        ],
+    )
+    def test_mask(self, engine_class, secrets, text, expected):
+        engine = engine_class()
+        for secret in secrets:
+            engine.add(secret)
+
+        assert engine.mask(text, "***") == expected
+
+    @pytest.mark.parametrize("min_pending_secrets", [0, 16], ids=["automaton", "pending"])
+    def test_engines_agree(self, min_pending_secrets, monkeypatch):
+        # With no minimum, secrets are put in the automaton as soon as a string is masked, otherwise
+        # they are searched one by one
+        monkeypatch.setattr(AhoCorasickMaskingEngine, "MIN_PENDING_SECRETS", min_pending_secrets)
+        rand = random.Random(42)
+        for _ in range(100):
+            regex_engine = RegexMaskingEngine()
+            automaton_engine = AhoCorasickMaskingEngine()
+            for _ in range(5):
+                # A small alphabet, so secrets overlap and share prefixes and suffixes
+                for _ in range(rand.randint(1, 4)):
+                    secret = "".join(rand.choices("abc.", k=rand.randint(1, 5)))
+                    regex_engine.add(secret)
+                    automaton_engine.add(secret)
+                text = "".join(rand.choices("abc. ", k=rand.randint(0, 40)))
+
+                assert automaton_engine.mask(text, "*") == regex_engine.mask(text, "*"), text
+
+    @pytest.mark.parametrize("engine_class", MASKING_ENGINES.values())
+    def test_secrets_added_after_masking(self, engine_class):
+        engine = engine_class()
+        engine.add("first")
+        assert engine.mask("first second", "***") == "*** second"
+
+        engine.add("second")
+        assert engine.mask("first second", "***") == "*** ***"
+
+    @pytest.mark.parametrize("engine", MASKING_ENGINES)
+    def test_engine_from_config(self, engine):
+        with conf_vars({("core", "secrets_masker_engine"): engine}):
+            filt = SecretsMasker()
+        assert isinstance(filt.engine, MASKING_ENGINES[engine])
+
+        filt.add_mask("password")
+        assert filt.redact("user:password") == "user:***"
+
+    def test_unknown_engine(self):
+        with pytest.raises(AirflowConfigException, match="Unknown secrets masker engine 'other'"):
+            SecretsMasker(engine="other")
+
+
 class ShortExcFormatter(logging.Formatter):
     """Don't include full path in exc_info messages"""
 
@@ -19,6 +19,7 @@
 import json
 import os
 import sys
+import tempfile
 import unittest
 from argparse import Namespace
 from contextlib import contextmanager
@@ -32,6 +33,10 @@ from airflow import settings
 from airflow.exceptions import AirflowException
 from airflow.utils import cli, cli_action_loggers
 
+TEST_DAG_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), 'dags', 'test_example_bash_operator.py'
+)
+
 
 class TestCliUtil(unittest.TestCase):
     def test_metrics_build(self):
@@ -90,6 +95,98 @@ class TestCliUtil(unittest.TestCase):
         with pytest.raises(AirflowException):
             cli.get_dags(None, "foobar", True)
 
+    def test_get_dag_for_task_parses_only_the_dag_file(self):
+        fileloc = TEST_DAG_FILE
+        with mock.patch.dict(cli._task_dagbags, clear=True), mock.patch("airflow.models.DagBag") as dagbag:
+            dagbag.return_value.dags = {"test_example_bash_operator": mock.sentinel.dag}
+
+            assert cli.get_dag_for_task(fileloc, "test_example_bash_operator") is mock.sentinel.dag
+            assert cli.get_dag_for_task(fileloc, "test_example_bash_operator") is mock.sentinel.dag
+
+            # Parsed once, without the examples
+            dagbag.assert_called_once_with(
+                fileloc, include_examples=False, include_smart_sensor=False, safe_mode=False
+            )
+
+            # Parsed again once the file is modified
+            cli._task_dagbags[fileloc] = (0, *cli._task_dagbags[fileloc][1:])
+            cli.get_dag_for_task(fileloc, "test_example_bash_operator")
+            assert dagbag.call_count == 2
+
+    def test_get_dag_for_task_parses_again_when_a_helper_module_is_modified(self):
+        with tempfile.TemporaryDirectory() as dags_folder, mock.patch.dict(
+            cli._task_dagbags, clear=True
+        ), mock.patch.object(settings, "DAGS_FOLDER", dags_folder), mock.patch.object(
+            sys, "path", [dags_folder, *sys.path]
+        ):
+            helper_path = os.path.join(dags_folder, "task_dagbag_helper.py")
+            fileloc = os.path.join(dags_folder, "task_dagbag_dag.py")
+            with open(helper_path, "w") as f:
+                f.write("DESCRIPTION = 'first'\n")
+            with open(fileloc, "w") as f:
+                f.write(
+                    "from datetime import datetime\n"
+                    "from airflow import DAG\n"
+                    "import task_dagbag_helper\n"
+                    "dag = DAG('task_dagbag_dag', description=task_dagbag_helper.DESCRIPTION, "
+                    "start_date=datetime(2021, 1, 1))\n"
+                )
+            try:
+                assert cli.get_dag_for_task(fileloc, "task_dagbag_dag").description == "first"
+
+                with open(helper_path, "w") as f:
+                    f.write("DESCRIPTION = 'second one'\n")
+                os.utime(helper_path, (1, 1))
+                assert cli.get_dag_for_task(fileloc, "task_dagbag_dag").description == "second one"
+            finally:
+                sys.modules.pop("task_dagbag_helper", None)
+
+    def test_get_dag_for_task_keeps_the_most_recently_used_files(self):
+        dags_folder = os.path.dirname(TEST_DAG_FILE)
+        first, second, third = (
+            os.path.join(dags_folder, name)
+            for name in ("test_example_bash_operator.py", "test_subdag.py", "test_default_views.py")
+        )
+        with mock.patch.dict(cli._task_dagbags, clear=True), mock.patch.object(
+            cli, "_TASK_DAGBAGS_MAX_SIZE", 2
+        ), mock.patch("airflow.models.DagBag") as dagbag:
+            dagbag.return_value.dags = {"dag_id": mock.sentinel.dag}
+            for fileloc in (first, second, first, third):
+                cli.get_dag_for_task(fileloc, "dag_id")
+
+            assert dagbag.call_count == 3
+            # The least recently used file was dropped
+            assert list(cli._task_dagbags) == [first, third]
+
+    @mock.patch("airflow.utils.cli.get_dag")
+    def test_get_dag_for_task_falls_back_to_get_dag(self, mock_get_dag):
+        fileloc = TEST_DAG_FILE
+        with mock.patch.dict(cli._task_dagbags, clear=True):
+            assert cli.get_dag_for_task(fileloc, "not_in_this_file") is mock_get_dag.return_value
+        mock_get_dag.assert_called_once_with(fileloc, "not_in_this_file")
+
+    @mock.patch("airflow.utils.cli.get_dag_for_task")
+    def test_preload_dag_for_task(self, mock_get_dag_for_task):
+        fileloc = TEST_DAG_FILE
+        command = ["airflow", "tasks", "run", "dag_id", "task_id", "run_id", "--local", "--subdir"]
+
+        cli.preload_dag_for_task(command + [fileloc])
+        mock_get_dag_for_task.assert_called_once_with(fileloc, "dag_id")
+
+        # Without the DAG file, the database would be needed
+        mock_get_dag_for_task.reset_mock()
+        cli.preload_dag_for_task(command + [os.path.dirname(TEST_DAG_FILE)])
+        mock_get_dag_for_task.assert_not_called()
+
+    @mock.patch("airflow.utils.cli.get_dag_for_task")
+    def test_preload_dag_for_task_does_not_configure_the_orm(self, mock_get_dag_for_task):
+        command = ["airflow", "tasks", "run", "dag_id", "task_id", "run_id", "--local", "--subdir"]
+        with mock.patch.object(settings, "is_orm_configured", return_value=False), mock.patch.object(
+            settings, "engine"
+        ) as mock_engine:
+            cli.preload_dag_for_task(command + [TEST_DAG_FILE])
+        mock_engine.dispose.assert_not_called()
+
     @parameterized.expand(
         [
             (
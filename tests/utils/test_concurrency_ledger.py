@@ -0,0 +1,149 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import datetime
+
+import pytest
+
+from airflow.models.pool import Pool
+from airflow.operators.dummy import DummyOperator
+from airflow.utils import timezone
+from airflow.utils.concurrency_ledger import ConcurrencyLedger
+from airflow.utils.state import State
+from tests.test_utils.db import clear_db_pools, clear_db_runs
+
+
+class TestConcurrencyLedger:
+    @pytest.fixture(autouse=True)
+    def clean_db(self):
+        clear_db_runs()
+        clear_db_pools()
+        yield
+        clear_db_runs()
+        clear_db_pools()
+
+    def _create_tis(self, dag_maker, session):
+        with dag_maker('test_concurrency_ledger', session=session):
+            DummyOperator(task_id='op1', pool='test_pool', pool_slots=2)
+            DummyOperator(task_id='op2', pool='test_pool')
+        session.add(Pool(pool='test_pool', slots=10))
+        dr = dag_maker.create_dagrun()
+        return dr.get_task_instance('op1', session=session), dr.get_task_instance('op2', session=session)
+
+    def test_matches_slots_stats_after_reconcile(self, dag_maker, session):
+        ti1, ti2 = self._create_tis(dag_maker, session)
+        ti1.state = State.RUNNING
+        ti2.state = State.QUEUED
+        session.flush()
+
+        ledger = ConcurrencyLedger(reconcile_interval=30)
+        assert ledger.pool_stats(session=session) == Pool.slots_stats(session=session)
+
+        dag_map, task_map = ledger.concurrency_maps()
+        assert dag_map['test_concurrency_ledger'] == 2
+        assert task_map[('test_concurrency_ledger', 'op1')] == 1
+        assert task_map[('test_concurrency_ledger', 'op2')] == 1
+
+    def test_record_queued_and_finished(self, dag_maker, session):
+        ti1, ti2 = self._create_tis(dag_maker, session)
+        session.flush()
+
+        ledger = ConcurrencyLedger(reconcile_interval=30)
+        ledger.reconcile(session)
+        assert len(ledger) == 0
+
+        ledger.record_queued([ti1, ti2])
+        # Queuing the same TI again (e.g. for a retry) must not count it twice
+        ledger.record_queued([ti1])
+        stats = ledger.pool_stats(session=session)['test_pool']
+        assert stats['queued'] == 3
+        assert stats['open'] == 7
+        assert ledger.concurrency_maps()[0]['test_concurrency_ledger'] == 2
+
+        ledger.record_finished([ti1.key])
+        stats = ledger.pool_stats(session=session)['test_pool']
+        assert stats['queued'] == 1
+        assert stats['open'] == 9
+        dag_map, task_map = ledger.concurrency_maps()
+        assert dag_map['test_concurrency_ledger'] == 1
+        assert task_map[('test_concurrency_ledger', 'op1')] == 0
+
+        # Unknown keys are ignored
+        ledger.record_finished([ti1.key])
+        assert len(ledger) == 1
+
+    def test_reconcile_if_due(self, dag_maker, session):
+        ti1, _ = self._create_tis(dag_maker, session)
+        session.flush()
+
+        ledger = ConcurrencyLedger(reconcile_interval=3600)
+        assert ledger.needs_reconcile
+        ledger.reconcile_if_due(session)
+        assert not ledger.needs_reconcile
+
+        # Not due yet, so a state change made elsewhere and not recorded as recent is not picked up
+        ti1.state = State.RUNNING
+        ti1.updated_at = timezone.utcnow() - datetime.timedelta(hours=1)
+        session.flush()
+        ledger.reconcile_if_due(session)
+        assert len(ledger) == 0
+
+        ledger.reconcile(session)
+        assert len(ledger) == 1
+        assert ledger.pool_stats(session=session)['test_pool']['running'] == 2
+
+    def test_record_finished_ignores_earlier_tries(self, dag_maker, session):
+        ti1, _ = self._create_tis(dag_maker, session)
+        session.flush()
+
+        ledger = ConcurrencyLedger(reconcile_interval=30)
+        ledger.reconcile(session)
+        first_try_key = ti1.key
+        ti1.try_number += 1
+        ledger.record_queued([ti1])
+
+        # The finish event of the first try arrives after the retry was queued
+        ledger.record_finished([first_try_key])
+        assert len(ledger) == 1
+        assert ledger.pool_stats(session=session)['test_pool']['queued'] == 2
+
+        ledger.record_finished([ti1.key])
+        assert len(ledger) == 0
+
+    def test_sync_records_running_and_queued_elsewhere(self, dag_maker, session):
+        ti1, ti2 = self._create_tis(dag_maker, session)
+        session.flush()
+
+        ledger = ConcurrencyLedger(reconcile_interval=3600)
+        ledger.reconcile(session)
+        ledger.record_queued([ti1])
+
+        # The task moves itself to running, and another scheduler queues a TI
+        ti1.state = State.RUNNING
+        ti1.try_number += 1
+        ti1.start_date = timezone.utcnow()
+        ti2.state = State.QUEUED
+        ti2.queued_dttm = timezone.utcnow()
+        session.flush()
+
+        stats = ledger.pool_stats(session=session)['test_pool']
+        assert not ledger.needs_reconcile
+        assert stats['running'] == 2
+        assert stats['queued'] == 1
+        assert stats['open'] == 7
+        assert ledger.concurrency_maps()[0]['test_concurrency_ledger'] == 2
@@ -15,6 +15,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import csv
 from contextlib import suppress
 from importlib import import_module
 from pathlib import Path
@@ -200,6 +201,103 @@ class TestDBCleanup:
             else:
                 raise Exception("unexpected")
 
+    @pytest.mark.parametrize(
+        'table_name, date_add_kwargs, expected_to_delete, external_trigger',
+        [
+            param('task_instance', dict(days=4), 4, False, id='middle'),
+            param('task_instance', dict(days=9, microseconds=1), 10, False, id='beyond_end'),
+            param('dag_run', dict(days=9, microseconds=1), 9, False, id='beyond_end_dr'),
+            param('dag_run', dict(days=9, microseconds=1), 10, True, id='beyond_end_dr_external'),
+        ],
+    )
+    @pytest.mark.parametrize('batch_size', [1, 3, 100])
+    @patch('airflow.utils.db_cleanup.time.sleep')
+    def test__cleanup_table_in_batches(
+        self, sleep_mock, batch_size, table_name, date_add_kwargs, expected_to_delete, external_trigger
+    ):
+        """
+        Deleting the rows by batches deletes the same rows as deleting them at once, sleeping between
+        the batches.
+        """
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone('America/Los_Angeles'))
+        num_tis = 10
+        create_tis(
+            base_date=base_date,
+            num_tis=num_tis,
+            external_trigger=external_trigger,
+        )
+        with create_session() as session:
+            _cleanup_table(
+                **config_dict[table_name].__dict__,
+                clean_before_timestamp=base_date.add(**date_add_kwargs),
+                dry_run=False,
+                batch_size=batch_size,
+                sleep_between_batches=0.5,
+                session=session,
+            )
+            model = config_dict[table_name].orm_model
+            assert session.query(model).count() == num_tis - expected_to_delete
+
+        # There is no sleep after the last batch
+        assert sleep_mock.call_count == expected_to_delete // batch_size
+        if sleep_mock.call_count:
+            sleep_mock.assert_called_with(0.5)
+
+    @pytest.mark.parametrize('batch_size', [None, 3])
+    def test__cleanup_table_archive(self, batch_size, tmp_path):
+        """The deleted rows are appended to a CSV file per table, with a header only once."""
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone('America/Los_Angeles'))
+        create_tis(base_date=base_date, num_tis=10)
+        with create_session() as session:
+            for days in (2, 5):
+                _cleanup_table(
+                    **config_dict['task_instance'].__dict__,
+                    clean_before_timestamp=base_date.add(days=days),
+                    dry_run=False,
+                    batch_size=batch_size,
+                    archive_dir=str(tmp_path / 'archive'),
+                    session=session,
+                )
+            assert session.query(TaskInstance).count() == 5
+
+        with open(tmp_path / 'archive' / 'task_instance.csv', newline='') as archive_file:
+            rows = list(csv.DictReader(archive_file))
+        assert [row['run_id'] for row in rows] == [f'abc_{num}' for num in range(5)]
+        assert set(rows[0]) == {column.name for column in TaskInstance.__table__.columns}
+
+    @pytest.mark.parametrize('batch_size', [None, 3])
+    def test_run_cleanup_archives_cascaded_rows(self, batch_size, tmp_path):
+        """
+        The rows deleted by the foreign keys of other tables are archived too, and the referencing
+        tables are cleaned first.
+        """
+        base_date = pendulum.DateTime(2022, 1, 1, tzinfo=pendulum.timezone('America/Los_Angeles'))
+        create_tis(base_date=base_date, num_tis=10)
+        with create_session() as session:
+            # The task instances do not meet their own deletion criteria
+            session.query(TaskInstance).update(
+                {TaskInstance.start_date: base_date.add(days=20)}, synchronize_session=False
+            )
+        with patch('airflow.utils.db_cleanup._cleanup_table', wraps=_cleanup_table) as cleanup_table_mock:
+            run_cleanup(
+                clean_before_timestamp=base_date.add(days=4),
+                table_names=['dag_run', 'task_instance'],
+                dry_run=False,
+                confirm=False,
+                batch_size=batch_size,
+                archive_dir=str(tmp_path / 'archive'),
+            )
+        cleaned = [call.kwargs['orm_model'].__tablename__ for call in cleanup_table_mock.call_args_list]
+        assert cleaned == ['task_instance', 'dag_run']
+
+        with create_session() as session:
+            assert session.query(DagRun).count() == 6
+            assert session.query(TaskInstance).count() == 6
+        for table_name in ('dag_run', 'task_instance'):
+            with open(tmp_path / 'archive' / f'{table_name}.csv', newline='') as archive_file:
+                rows = list(csv.DictReader(archive_file))
+            assert sorted(row['run_id'] for row in rows) == [f'abc_{num}' for num in range(4)]
+
     def test_no_models_missing(self):
         """
         1. Verify that for all tables in `airflow.models`, we either have them enabled in db cleanup,
@@ -230,6 +328,7 @@ class TestDBCleanup:
             'dag_tag',  # not a significant source of data; age not indicative of staleness,
             'dag_pickle',  # unsure of consequences
             'dag_code',  # self-maintaining
+            'dag_state_stats',  # self-maintaining
             'connection',  # leave alone
             'slot_pool',  # leave alone
         }
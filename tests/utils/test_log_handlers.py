@@ -20,7 +20,9 @@ import logging
 import logging.config
 import os
 import re
+from unittest import mock
 
+import httpx
 import pytest
 
 from airflow.config_templates.airflow_local_settings import DEFAULT_LOGGING_CONFIG
@@ -32,6 +34,7 @@ from airflow.utils.session import create_session
 from airflow.utils.state import State
 from airflow.utils.timezone import datetime
 from airflow.utils.types import DagRunType
+from tests.test_utils.config import conf_vars
 
 DEFAULT_DATE = datetime(2016, 1, 1)
 TASK_LOGGER = 'airflow.task'
@@ -229,6 +232,120 @@ def filename_rendering_ti(session, create_task_instance):
     )
 
 
+class TestFileTaskLogHandlerChunkedRead:
+    @pytest.fixture(autouse=True)
+    def setup_handler(self, tmp_path, filename_rendering_ti):
+        self.file_handler = FileTaskHandler(str(tmp_path), '{{ ti.dag_id }}/{{ try_number }}.log')
+        self.ti = filename_rendering_ti
+        self.ti.try_number = 1
+        self.log_file = tmp_path / self.ti.dag_id / '1.log'
+        self.log_file.parent.mkdir()
+        self.header = f"*** Reading local file: {self.log_file}\n"
+        with conf_vars({('webserver', 'log_fetch_chunk_size'): '16'}):
+            yield
+
+    def test_finished_log_is_read_in_chunks(self):
+        self.ti.state = State.SUCCESS
+        content = "first line\na line longer than a chunk\nshort\nlast, no new line"
+        self.log_file.write_text(content)
+
+        chunks = []
+        metadata = {'log_pos': 0}
+        while not metadata.get('end_of_log'):
+            assert len(chunks) < 10
+            log, metadata = self.file_handler._read(self.ti, 1, metadata)
+            chunks.append(log)
+
+        assert [
+            self.header + "first line\n",
+            "a line longer th",
+            "an a chunk\n",
+            "short\n",
+            "last, no new lin",
+            "e",
+        ] == chunks
+        assert metadata == {'end_of_log': True, 'end_of_file': True, 'log_pos': len(content)}
+
+    def test_running_log_is_tailed(self):
+        self.ti.state = State.RUNNING
+        self.log_file.write_text("first\nsecond, b")
+
+        log, metadata = self.file_handler._read(self.ti, 1, {'log_pos': 0})
+        # The line still being written is left for the next read
+        assert self.header + "first\n" == log
+        assert metadata == {'end_of_log': False, 'end_of_file': True, 'log_pos': len("first\n")}
+
+        with self.log_file.open("a") as file:
+            file.write("eing written\n")
+        log, metadata = self.file_handler._read(self.ti, 1, metadata)
+        assert "second, being wr" == log
+        assert not metadata['end_of_file']
+        log, metadata = self.file_handler._read(self.ti, 1, metadata)
+        assert "itten\n" == log
+        assert metadata['end_of_file'] and not metadata['end_of_log']
+
+        self.ti.state = State.SUCCESS
+        log, metadata = self.file_handler._read(self.ti, 1, metadata)
+        assert "" == log
+        assert metadata['end_of_log']
+
+    def test_running_log_is_downloaded_as_is(self):
+        self.ti.state = State.RUNNING
+        self.log_file.write_text("first\nsecond")
+
+        log, metadata = self.file_handler._read(self.ti, 1, {'download_logs': True, 'log_pos': 6})
+
+        assert "second" == log
+        assert metadata == {'download_logs': True, 'end_of_log': True, 'end_of_file': True, 'log_pos': 12}
+
+    @pytest.mark.parametrize("metadata", [None, {}, {'download_logs': False}])
+    def test_whole_log_is_read_without_log_pos(self, metadata):
+        self.ti.state = State.RUNNING
+        content = "first line\na line longer than a chunk\npartial"
+        self.log_file.write_text(content)
+
+        assert (self.header + content, {'end_of_log': True}) == self.file_handler._read(self.ti, 1, metadata)
+
+    @pytest.mark.parametrize(
+        "status_code, content, content_range, expected_log, expected_metadata",
+        [
+            (
+                206,
+                b"chunk\nnext line",
+                "bytes 32-47/100",
+                "chunk\n",
+                {'end_of_log': False, 'end_of_file': False, 'log_pos': 38},
+            ),
+            # Nothing new
+            (416, b"", "bytes */32", "", {'end_of_log': False, 'end_of_file': True, 'log_pos': 32}),
+            # A worker not supporting ranges sends the whole file
+            (
+                200,
+                b"0" * 32 + b"chunk\n",
+                None,
+                "chunk\n",
+                {'end_of_log': False, 'end_of_file': True, 'log_pos': 38},
+            ),
+        ],
+    )
+    def test_log_is_fetched_from_worker_by_range(
+        self, status_code, content, content_range, expected_log, expected_metadata
+    ):
+        self.ti.state = State.RUNNING
+        self.ti.hostname = "worker"
+        headers = {'Content-Range': content_range} if content_range else {}
+        response = httpx.Response(
+            status_code, content=content, headers=headers, request=httpx.Request("GET", "http://worker")
+        )
+
+        with mock.patch("httpx.get", return_value=response) as mock_get:
+            log, metadata = self.file_handler._read(self.ti, 1, {'log_pos': 32})
+
+        assert "bytes=32-47" == mock_get.call_args[1]['headers']['Range']
+        assert expected_log == log
+        assert expected_metadata == metadata
+
+
 class TestFilenameRendering:
     def test_python_formatting(self, filename_rendering_ti):
         expected_filename = (
@@ -16,11 +16,13 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import importlib
+import sys
 import unittest
 
 import pytest
 
-from airflow.utils.module_loading import import_string
+from airflow.utils.module_loading import import_string, unload_modules_from
 
 
 class TestModuleImport(unittest.TestCase):
@@ -34,3 +36,16 @@ class TestModuleImport(unittest.TestCase):
         msg = 'Module "airflow.utils" does not define a "nonexistent" attribute'
         with pytest.raises(ImportError, match=msg):
             import_string('airflow.utils.nonexistent')
+
+
+def test_unload_modules_from(tmp_path, monkeypatch):
+    (tmp_path / "unload_helper.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert importlib.import_module("unload_helper").VALUE == 1
+
+    (tmp_path / "unload_helper.py").write_text("VALUE = 22\n")
+    assert unload_modules_from(str(tmp_path)) == 1
+    assert "unload_helper" not in sys.modules
+    assert "airflow.utils.module_loading" in sys.modules
+    assert importlib.import_module("unload_helper").VALUE == 22
+    del sys.modules["unload_helper"]
@@ -72,6 +72,25 @@ class TestServeLogs:
             ).data.decode()
         )
 
+    def test_should_serve_range(self, client: "FlaskClient", signer):
+        response = client.get(
+            '/log/sample.log',
+            headers={'Authorization': signer.dumps('sample.log'), 'Range': 'bytes=16-31'},
+        )
+
+        assert 206 == response.status_code
+        assert LOG_DATA[16:32] == response.data.decode()
+        assert f"bytes 16-31/{len(LOG_DATA)}" == response.headers['Content-Range']
+
+    def test_range_past_the_end(self, client: "FlaskClient", signer):
+        response = client.get(
+            '/log/sample.log',
+            headers={'Authorization': signer.dumps('sample.log'), 'Range': f'bytes={len(LOG_DATA)}-'},
+        )
+
+        assert 416 == response.status_code
+        assert f"bytes */{len(LOG_DATA)}" == response.headers['Content-Range']
+
     def test_forbidden_too_long_validity(self, client: "FlaskClient", signer):
         signer.expires_in = 3600
         assert (
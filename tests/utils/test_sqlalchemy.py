@@ -27,7 +27,7 @@ from sqlalchemy.exc import StatementError
 from airflow import settings
 from airflow.models import DAG
 from airflow.settings import Session
-from airflow.utils.sqlalchemy import nowait, prohibit_commit, skip_locked, with_row_locks
+from airflow.utils.sqlalchemy import lock_timeout, nowait, prohibit_commit, skip_locked, with_row_locks
 from airflow.utils.state import State
 from airflow.utils.timezone import utcnow
 
@@ -188,6 +188,31 @@ class TestSqlAlchemyUtils(unittest.TestCase):
             assert returned_value == query
             query.with_for_update.assert_not_called()
 
+    @parameterized.expand(
+        [
+            ("postgresql", 2.5, ["SELECT set_config('lock_timeout', :timeout, true)"]),
+            (
+                "mysql",
+                2.5,
+                [
+                    "SELECT @@innodb_lock_wait_timeout",
+                    "SET SESSION innodb_lock_wait_timeout = :timeout",
+                    "SET SESSION innodb_lock_wait_timeout = :timeout",
+                ],
+            ),
+            ("mssql", 2.5, ["SELECT @@LOCK_TIMEOUT", "SET LOCK_TIMEOUT 2500", "SET LOCK_TIMEOUT 5000"]),
+            ("sqlite", 2.5, []),
+            ("postgresql", 0, []),
+        ]
+    )
+    def test_lock_timeout(self, dialect, timeout, expected_statements):
+        session = mock.Mock()
+        session.bind.dialect.name = dialect
+        session.execute.return_value.scalar.return_value = 5000
+        with lock_timeout(session, timeout):
+            pass
+        assert [str(call.args[0]) for call in session.execute.call_args_list] == expected_statements
+
     def test_prohibit_commit(self):
         with prohibit_commit(self.session) as guard:
             self.session.execute('SELECT 1')
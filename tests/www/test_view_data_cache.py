@@ -0,0 +1,204 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import os
+import stat
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+
+from airflow.exceptions import AirflowConfigException
+from airflow.models import DagBag
+from airflow.utils import timezone
+from airflow.utils.session import create_session
+from airflow.utils.state import DagRunState, TaskInstanceState
+from airflow.utils.types import DagRunType
+from airflow.www.view_data_cache import (
+    FileSystemViewDataCache,
+    MemoryViewDataCache,
+    get_update_marker,
+    get_view_data_cache,
+)
+from tests.test_utils.config import conf_vars
+from tests.test_utils.db import clear_db_runs
+
+DEFAULT_DATE = timezone.datetime(2022, 1, 1)
+
+
+class TestMemoryViewDataCache:
+    def test_evicts_least_recently_used(self):
+        cache = MemoryViewDataCache(max_entries=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        assert cache.get('a') == 1
+        cache.set('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_entries_expire(self):
+        cache = MemoryViewDataCache(max_entries=2, ttl=60)
+        with mock.patch('airflow.www.view_data_cache.time.monotonic', return_value=0):
+            cache.set('a', 1)
+        with mock.patch('airflow.www.view_data_cache.time.monotonic', return_value=59):
+            assert cache.get('a') == 1
+        with mock.patch('airflow.www.view_data_cache.time.monotonic', return_value=61):
+            assert cache.get('a') is None
+
+    @mock.patch('airflow.www.view_data_cache.Stats')
+    def test_get_or_compute(self, mock_stats):
+        cache = MemoryViewDataCache(max_entries=2, ttl=60)
+        compute = mock.Mock(return_value={'data': 1})
+
+        assert cache.get_or_compute('grid', 'a', compute) == {'data': 1}
+        assert cache.get_or_compute('grid', 'a', compute) == {'data': 1}
+
+        compute.assert_called_once_with()
+        assert mock_stats.incr.call_args_list == [
+            mock.call('view_data_cache.grid.miss'),
+            mock.call('view_data_cache.grid.hit'),
+        ]
+
+
+class TestFileSystemViewDataCache:
+    def test_shared_by_the_caches_of_the_directory(self, tmp_path):
+        cache_dir = tmp_path / 'view_data_cache'
+        with conf_vars({('webserver', 'view_data_cache_dir'): str(cache_dir)}):
+            cache = FileSystemViewDataCache(max_entries=2, ttl=60)
+            cache.set('a', {'data': 1})
+
+            assert FileSystemViewDataCache(max_entries=2, ttl=60).get('a') == {'data': 1}
+            assert cache.get('b') is None
+        assert stat.S_IMODE(os.stat(cache_dir).st_mode) & 0o077 == 0
+
+    def test_refuses_directory_writable_by_others(self, tmp_path):
+        cache_dir = tmp_path / 'view_data_cache'
+        cache_dir.mkdir()
+        cache_dir.chmod(0o777)
+        with conf_vars({('webserver', 'view_data_cache_dir'): str(cache_dir)}):
+            with pytest.raises(AirflowConfigException):
+                FileSystemViewDataCache(max_entries=2, ttl=60)
+
+    def test_refuses_directory_owned_by_another_user(self, tmp_path):
+        with conf_vars({('webserver', 'view_data_cache_dir'): str(tmp_path)}), mock.patch(
+            'airflow.www.view_data_cache.os.getuid', return_value=os.getuid() + 1
+        ):
+            with pytest.raises(AirflowConfigException):
+                FileSystemViewDataCache(max_entries=2, ttl=60)
+
+
+@pytest.mark.parametrize(
+    "backend, cache_class",
+    [
+        ('none', None),
+        ('memory', MemoryViewDataCache),
+        ('filesystem', FileSystemViewDataCache),
+        ('airflow.www.view_data_cache.MemoryViewDataCache', MemoryViewDataCache),
+    ],
+)
+def test_get_view_data_cache(backend, cache_class, tmp_path):
+    with conf_vars(
+        {
+            ('webserver', 'view_data_cache'): backend,
+            ('webserver', 'view_data_cache_size'): '3',
+            ('webserver', 'view_data_cache_dir'): str(tmp_path),
+        }
+    ):
+        cache = get_view_data_cache()
+    if cache_class is None:
+        assert cache is None
+    else:
+        assert isinstance(cache, cache_class)
+        assert cache.max_entries == 3
+
+
+def test_get_view_data_cache_not_found():
+    with conf_vars({('webserver', 'view_data_cache'): 'airflow.www.not_a_cache'}):
+        with pytest.raises(AirflowConfigException):
+            get_view_data_cache()
+
+
+class TestGetUpdateMarker:
+    @classmethod
+    def setup_class(cls):
+        cls.dag = DagBag(include_examples=True, read_dags_from_db=False).get_dag('example_bash_operator')
+
+    def setup_method(self):
+        clear_db_runs()
+
+    def teardown_method(self):
+        clear_db_runs()
+
+    def test_changes_with_the_runs_and_task_instances(self):
+        with create_session() as session:
+            dag_run = self.dag.create_dagrun(
+                run_id='run',
+                run_type=DagRunType.SCHEDULED,
+                execution_date=DEFAULT_DATE,
+                state=DagRunState.RUNNING,
+                session=session,
+            )
+            session.flush()
+            marker = get_update_marker(self.dag.dag_id, session)
+            assert get_update_marker(self.dag.dag_id, session) == marker
+
+            ti, other_ti = dag_run.get_task_instances(session=session)[:2]
+            ti.state = TaskInstanceState.SUCCESS
+            other_ti.state = TaskInstanceState.FAILED
+            session.flush()
+            assert get_update_marker(self.dag.dag_id, session) != marker
+
+            # Marking task instances changes the marker even if no count nor date moves
+            marker = get_update_marker(self.dag.dag_id, session)
+            ti.state, other_ti.state = TaskInstanceState.FAILED, TaskInstanceState.SUCCESS
+            session.flush()
+            assert get_update_marker(self.dag.dag_id, session) != marker
+
+            # Only the runs of the window are summarized
+            marker = get_update_marker(self.dag.dag_id, session, end_date=DEFAULT_DATE)
+            self.dag.create_dagrun(
+                run_id='next_run',
+                run_type=DagRunType.SCHEDULED,
+                execution_date=DEFAULT_DATE + timedelta(days=1),
+                state=DagRunState.RUNNING,
+                session=session,
+            )
+            session.flush()
+            assert get_update_marker(self.dag.dag_id, session, end_date=DEFAULT_DATE) == marker
+            assert get_update_marker(self.dag.dag_id, session) != marker
+
+    def test_without_task_instances(self):
+        with create_session() as session:
+            dag_run = self.dag.create_dagrun(
+                run_id='run',
+                run_type=DagRunType.SCHEDULED,
+                execution_date=DEFAULT_DATE,
+                state=DagRunState.RUNNING,
+                session=session,
+            )
+            session.flush()
+            marker = get_update_marker(self.dag.dag_id, session, include_task_instances=False)
+
+            dag_run.get_task_instances(session=session)[0].state = TaskInstanceState.SUCCESS
+            session.flush()
+            assert get_update_marker(self.dag.dag_id, session, include_task_instances=False) == marker
+
+            dag_run.state = DagRunState.SUCCESS
+            session.flush()
+            assert get_update_marker(self.dag.dag_id, session, include_task_instances=False) != marker
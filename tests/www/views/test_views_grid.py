@@ -0,0 +1,213 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import datetime
+import json
+import urllib.parse
+from unittest import mock
+
+import pytest
+
+from airflow.models import TaskInstance
+from airflow.operators.dummy import DummyOperator
+from airflow.utils import timezone
+from airflow.utils.session import create_session
+from airflow.utils.state import DagRunState, TaskInstanceState
+from airflow.utils.task_group import TaskGroup
+from airflow.utils.types import DagRunType
+from airflow.www.view_data_cache import MemoryViewDataCache
+from airflow.www.views import get_changed_run_ids, get_grid_task_instances, task_group_to_tree
+from tests.test_utils.db import clear_db_runs
+from tests.test_utils.mock_operators import MockOperator
+
+DAG_ID = 'test_grid'
+START_DATE = timezone.datetime(2022, 1, 1)
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    clear_db_runs()
+    yield
+    clear_db_runs()
+
+
+@pytest.fixture
+def dag_with_mapped_task(dag_maker):
+    with dag_maker(DAG_ID, start_date=START_DATE, serialized=True) as dag:
+        with TaskGroup('group'):
+            DummyOperator(task_id='task') >> MockOperator.partial(task_id='mapped').apply(arg2=[1, 2, 3])
+    return dag
+
+
+def _create_runs(dag_maker, dag, session):
+    runs = []
+    for i in range(2):
+        execution_date = START_DATE + datetime.timedelta(days=i)
+        runs.append(
+            dag_maker.create_dagrun(
+                run_id=f'run_{i}',
+                run_type=DagRunType.SCHEDULED,
+                execution_date=execution_date,
+                state=DagRunState.RUNNING,
+                session=session,
+            )
+        )
+    for run in runs:
+        # The task instances of a mapped task are created when it is expanded
+        session.query(TaskInstance).filter_by(run_id=run.run_id, task_id='group.mapped').delete()
+        for map_index, state in enumerate([TaskInstanceState.SUCCESS] * 2 + [TaskInstanceState.RUNNING]):
+            ti = TaskInstance(dag.get_task('group.mapped'), run_id=run.run_id, map_index=map_index)
+            ti.state = state
+            ti.start_date = START_DATE + datetime.timedelta(minutes=map_index)
+            session.add(ti)
+    session.flush()
+    return runs
+
+
+def test_task_group_to_tree_summarizes_mapped_tasks(dag_maker, dag_with_mapped_task, session):
+    dag = dag_with_mapped_task
+    runs = _create_runs(dag_maker, dag, session)
+    for ti in runs[0].get_task_instances(session=session):
+        if ti.task_id == 'group.task':
+            ti.state = TaskInstanceState.FAILED
+
+    tis = get_grid_task_instances(dag, runs, session)
+    tree = task_group_to_tree(dag.task_group, dag, runs, tis, session)
+
+    group = tree['children'][0]
+    task, mapped = group['children']
+    assert [instance['state'] for instance in task['instances']] == ['failed', None]
+
+    # One summary of the mapped task instances by run
+    assert [instance['run_id'] for instance in mapped['instances']] == ['run_0', 'run_1']
+    for instance in mapped['instances']:
+        assert sorted(instance['mapped_states'], key=str) == ['running', 'success', 'success']
+        assert instance['state'] == 'running'
+        assert instance['start_date'] == START_DATE.isoformat()
+
+    # The states of the group are rolled up from its children
+    assert [instance['state'] for instance in group['instances']] == ['failed', 'running']
+    assert [instance['state'] for instance in tree['instances']] == ['failed', 'running']
+    assert group['instances'][1]['start_date'] == START_DATE.isoformat()
+
+
+def test_get_changed_run_ids(dag_maker, dag_with_mapped_task, session):
+    dag = dag_with_mapped_task
+    runs = _create_runs(dag_maker, dag, session)
+    for run in runs:
+        run.state = DagRunState.SUCCESS
+        run.start_date = START_DATE
+        run.end_date = START_DATE
+    session.query(TaskInstance).update(
+        {TaskInstance.start_date: START_DATE, TaskInstance.updated_at: START_DATE}, synchronize_session=False
+    )
+    since = START_DATE + datetime.timedelta(hours=1)
+
+    assert get_changed_run_ids(dag, runs, since, session) == set()
+
+    session.query(TaskInstance).filter_by(run_id='run_1', map_index=1).update(
+        {TaskInstance.end_date: since}, synchronize_session=False
+    )
+    assert get_changed_run_ids(dag, runs, since, session) == {'run_1'}
+
+    runs[0].state = DagRunState.RUNNING
+    assert get_changed_run_ids(dag, runs, since, session) == {'run_0', 'run_1'}
+
+
+def test_get_changed_run_ids_marked_task_instance(dag_maker, dag_with_mapped_task, session):
+    dag = dag_with_mapped_task
+    runs = _create_runs(dag_maker, dag, session)
+    for run in runs:
+        run.state = DagRunState.FAILED
+        run.start_date = START_DATE
+        run.end_date = START_DATE
+    session.flush()
+    session.query(TaskInstance).update(
+        {
+            TaskInstance.state: TaskInstanceState.FAILED,
+            TaskInstance.start_date: START_DATE,
+            TaskInstance.end_date: START_DATE,
+            TaskInstance.updated_at: START_DATE,
+        },
+        synchronize_session=False,
+    )
+    session.expire_all()
+    since = START_DATE + datetime.timedelta(hours=1)
+    assert get_changed_run_ids(dag, runs, since, session) == set()
+
+    # Marking a task instance keeps its end date
+    ti = session.query(TaskInstance).filter_by(run_id='run_0', task_id='group.task').one()
+    ti.set_state(TaskInstanceState.SUCCESS, session)
+    session.flush()
+    assert ti.end_date == START_DATE
+    assert get_changed_run_ids(dag, runs, since, session) == {'run_0'}
+
+
+@pytest.fixture
+def example_bash_operator(app):
+    dag = app.dag_bag.get_dag('example_bash_operator')
+    run = dag.create_dagrun(
+        run_id='run',
+        run_type=DagRunType.SCHEDULED,
+        execution_date=START_DATE,
+        data_interval=(START_DATE, START_DATE),
+        start_date=START_DATE,
+        state=DagRunState.SUCCESS,
+    )
+    return dag, run
+
+
+def test_tree_data_since(admin_client, example_bash_operator):
+    url = 'object/tree_data?' + urllib.parse.urlencode(
+        {'dag_id': 'example_bash_operator', 'base_date': START_DATE.isoformat()}
+    )
+
+    data = json.loads(admin_client.get(url, follow_redirects=True).data)
+    assert [run['run_id'] for run in data['dag_runs']] == ['run']
+    assert 'changed_run_ids' not in data
+    assert any(child['instances'] for child in data['groups']['children'])
+
+    # The only run finished before
+    since = urllib.parse.urlencode({'since': data['timestamp']})
+    data = json.loads(admin_client.get(f'{url}&{since}', follow_redirects=True).data)
+    assert [run['run_id'] for run in data['dag_runs']] == ['run']
+    assert data['changed_run_ids'] == []
+    assert not any(child['instances'] for child in data['groups']['children'])
+    assert [instance['run_id'] for instance in data['groups']['instances']] == []
+
+
+def test_tree_data_cached(app, admin_client, example_bash_operator):
+    url = 'object/tree_data?' + urllib.parse.urlencode(
+        {'dag_id': 'example_bash_operator', 'base_date': START_DATE.isoformat()}
+    )
+    cache = MemoryViewDataCache(max_entries=10, ttl=60)
+    with mock.patch.object(app, 'view_data_cache', cache), mock.patch.dict(
+        app.dag_bag.dags_hash, {'example_bash_operator': 'dag_hash'}
+    ), mock.patch('airflow.www.views.task_group_to_tree', wraps=task_group_to_tree) as mock_tree:
+        data = json.loads(admin_client.get(url, follow_redirects=True).data)
+        assert json.loads(admin_client.get(url, follow_redirects=True).data)['groups'] == data['groups']
+        assert mock_tree.call_count == 1
+
+        # The data is computed again once a task instance changes
+        with create_session() as session:
+            session.query(TaskInstance).filter_by(dag_id='example_bash_operator', task_id='runme_0').update(
+                {TaskInstance.state: TaskInstanceState.SUCCESS}, synchronize_session=False
+            )
+        data = json.loads(admin_client.get(url, follow_redirects=True).data)
+        assert mock_tree.call_count == 2
+        runme_0 = next(child for child in data['groups']['children'] if child['id'] == 'runme_0')
+        assert runme_0['instances'][0]['state'] == 'success'